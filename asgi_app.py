@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+SecurePassGen - API web asynchrone (ASGI)
+
+Variante asyncio des routes ``/generate`` et ``/analyze`` de ``web_app.py``,
+sans dépendance à un framework : ``app`` est une application ASGI 3 que
+tout serveur ASGI peut servir (``uvicorn asgi_app:app``).
+
+La boucle d'événements ne fait que le travail bon marché (petites
+générations, décodage JSON). Le reste est délégué à des pools bornés :
+
+* les lots de plus de ``INLINE_BATCH_LIMIT`` mots de passe partent dans un
+  pool de processus (``BATCH_WORKERS``), au plus ``MAX_PENDING_BATCHES``
+  à la fois ;
+* l'analyse (dictionnaire de mots de passe courants, motifs, entropie)
+  s'exécute dans un pool de threads, au plus ``MAX_PENDING_ANALYSES``
+  à la fois.
+
+Au-delà de ces limites, la requête est refusée immédiatement (503 avec
+``Retry-After``) plutôt que mise en file : quelques lots de 100 000 mots de
+passe ne peuvent plus affamer les requêtes interactives.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Ajouter le répertoire src au path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+from core.password_generator import PasswordGenerator
+from core.password_strength import PasswordStrengthAnalyzer
+from core.web_api import analyze_password_strength, generation_options
+from utils import metrics
+from utils.rate_limit import RequestCoalescer, analyze_limiter_from_environment, metric_families, retry_after_header
+
+# Au-delà, la génération quitte la boucle d'événements
+INLINE_BATCH_LIMIT = 100
+
+MAX_BATCH_SIZE = 100000
+MAX_PASSWORD_LENGTH = 1024
+MAX_BODY_BYTES = 64 * 1024
+
+BATCH_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+MAX_PENDING_BATCHES = 2 * BATCH_WORKERS
+
+ANALYSIS_WORKERS = 4
+MAX_PENDING_ANALYSES = 64
+
+# Attente avant d'analyser, pendant laquelle une frappe suivante du même
+# client remplace la requête (secondes)
+COALESCE_WINDOW = 0.05
+
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "index.html"
+
+# Variable du modèle (rendu Jinja par web_app.py) désignant la forme des
+# réponses de /analyze, pour que l'analyse locale du navigateur les reproduise
+ANALYZER_PLACEHOLDER = b"{{ analyzer }}"
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Fichiers statiques servis (moteur d'analyse côté navigateur)
+STATIC_FILES = {
+    "strength_engine.js": b"text/javascript; charset=utf-8",
+    "strength_data.bin": b"application/octet-stream",
+}
+
+_generator = PasswordGenerator()
+_analyzer = PasswordStrengthAnalyzer()
+
+
+class HTTPError(Exception):
+    """Erreur renvoyée au client avec un statut HTTP."""
+
+    def __init__(self, status: int, message: str, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or []
+
+
+def _generate_batch(count: int, options: Dict) -> List[str]:
+    """Génère un lot (exécuté dans un processus du pool)."""
+    return list(_generator.iter_passwords(count, **options))
+
+
+def _analyze(password: str) -> Dict:
+    """Analyse détaillée d'un mot de passe (exécutée dans un thread du pool)."""
+    analysis = analyze_password_strength(password)
+    detailed = _analyzer.analyze_password(password)
+    analysis['entropy'] = detailed['entropy']
+    analysis['time_to_crack'] = detailed['time_to_crack']
+    if password.lower() in _analyzer.common_passwords:
+        analysis['feedback'].append("✗ Mot de passe courant (dictionnaire)")
+    return analysis
+
+
+def _header(scope: Dict, name: bytes) -> str:
+    """Valeur d'un en-tête de la requête (chaîne vide s'il est absent)."""
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")[:128]
+    return ""
+
+
+class _Pool:
+    """Exécuteur borné : refuse le travail au-delà de ``max_pending`` tâches."""
+
+    def __init__(self, factory, max_pending: int):
+        self.factory = factory
+        self.max_pending = max_pending
+        self.executor = None
+        self.pending = 0
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPError(503, "Serveur occupé, réessayez plus tard", [(b"retry-after", b"1")])
+        if self.executor is None:
+            self.executor = self.factory()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+
+class SecurePassGenAPI:
+    """
+    Application ASGI 3 de l'API web.
+    """
+
+    def __init__(self, batch_workers: int = BATCH_WORKERS, max_pending_batches: int = MAX_PENDING_BATCHES,
+                 analysis_workers: int = ANALYSIS_WORKERS, max_pending_analyses: int = MAX_PENDING_ANALYSES):
+        self.batches = _Pool(lambda: ProcessPoolExecutor(max_workers=batch_workers), max_pending_batches)
+        self.analyses = _Pool(lambda: ThreadPoolExecutor(max_workers=analysis_workers,
+                                                         thread_name_prefix="analysis"),
+                              max_pending_analyses)
+        self.analyze_limiter = analyze_limiter_from_environment()
+        self.analyze_coalescer = RequestCoalescer()
+        self.coalesce_window = COALESCE_WINDOW
+        self._index_page: Optional[bytes] = None
+        self._static_cache: Dict[str, bytes] = {}
+        self.routes = {
+            ("GET", "/"): self.index,
+            ("GET", "/healthz"): self.healthz,
+            ("GET", "/metrics"): self.metrics_endpoint,
+            ("POST", "/generate"): self.generate,
+            ("POST", "/analyze"): self.analyze,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        handler = self.routes.get((scope["method"], scope["path"]))
+        if handler is None and scope["method"] == "GET" and scope["path"].startswith("/static/"):
+            handler = self.static
+        content_type = b"text/html; charset=utf-8"
+        try:
+            if handler is None:
+                raise HTTPError(404, "Route inconnue")
+            body = await self._read_json(receive) if scope["method"] == "POST" else {}
+            status, payload, *content_type_override = await handler(body, scope)
+            if content_type_override:
+                content_type = content_type_override[0]
+            headers = []
+        except HTTPError as e:
+            status, payload, headers = e.status, {'error': e.message}, e.headers
+        except Exception as e:
+            status, payload, headers = 500, {'error': f'Erreur interne: {e}'}, []
+        if isinstance(payload, bytes):
+            await self._send(send, status, payload, content_type, headers)
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            await self._send(send, status, body, b"application/json; charset=utf-8", headers)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def shutdown(self) -> None:
+        """Arrête les pools (travail en attente annulé)."""
+        self.batches.shutdown()
+        self.analyses.shutdown()
+
+    @staticmethod
+    async def _read_json(receive) -> Dict:
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "Requête interrompue")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HTTPError(413, "Requête trop volumineuse")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        try:
+            data = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise HTTPError(400, "JSON invalide")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Objet JSON attendu")
+        return data
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, content_type: bytes,
+                    headers: List[Tuple[bytes, bytes]]) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type),
+                        (b"content-length", str(len(body)).encode())] + headers,
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def index(self, data: Dict, scope: Dict):
+        if self._index_page is None:
+            # Page statique, lue une fois ; analyse locale = engine.analyzeDetailed
+            self._index_page = TEMPLATE_PATH.read_bytes().replace(ANALYZER_PLACEHOLDER, b"detailed")
+        return 200, self._index_page
+
+    async def static(self, data: Dict, scope: Dict):
+        name = scope["path"][len("/static/"):]
+        if name not in STATIC_FILES:
+            raise HTTPError(404, "Fichier inconnu")
+        if name not in self._static_cache:
+            self._static_cache[name] = (STATIC_DIR / name).read_bytes()
+        return 200, self._static_cache[name], STATIC_FILES[name]
+
+    async def healthz(self, data: Dict, scope: Dict):
+        return 200, {'status': 'ok'}
+
+    async def metrics_endpoint(self, data: Dict, scope: Dict):
+        body = metrics.render(metric_families('/analyze', self.analyze_limiter, self.analyze_coalescer))
+        return 200, body.encode("utf-8"), metrics.CONTENT_TYPE.encode("ascii")
+
+    async def generate(self, data: Dict, scope: Dict):
+        try:
+            options = generation_options(data)
+            count = int(data.get('count', 1))
+        except (TypeError, ValueError):
+            raise HTTPError(400, "Paramètres invalides")
+        if not 1 <= count <= MAX_BATCH_SIZE:
+            raise HTTPError(400, f"Le nombre doit être compris entre 1 et {MAX_BATCH_SIZE}")
+        if options['length'] > MAX_PASSWORD_LENGTH:
+            raise HTTPError(400, f"La longueur maximale est de {MAX_PASSWORD_LENGTH} caractères")
+
+        try:
+            if count <= INLINE_BATCH_LIMIT:
+                passwords = _generate_batch(count, options)
+            else:
+                passwords = await self.batches.run(_generate_batch, count, options)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+        if 'count' not in data:
+            # Réponse identique à web_app.py pour un mot de passe unique
+            return 200, {'password': passwords[0], 'strength': analyze_password_strength(passwords[0])}
+        return 200, {'passwords': passwords, 'count': len(passwords)}
+
+    async def analyze(self, data: Dict, scope: Dict):
+        password = data.get('password', '')
+        if not password or not isinstance(password, str):
+            raise HTTPError(400, "Mot de passe requis")
+        if len(password) > MAX_PASSWORD_LENGTH:
+            raise HTTPError(400, f"La longueur maximale est de {MAX_PASSWORD_LENGTH} caractères")
+
+        client_ip = (scope.get("client") or ("inconnu",))[0]
+        allowed, delay = self.analyze_limiter.acquire(client_ip) if self.analyze_limiter else (True, 0.0)
+        if not allowed:
+            raise HTTPError(429, "Trop de requêtes", [(b"retry-after", retry_after_header(delay).encode())])
+
+        # Regroupement : seulement pour un onglet identifié (plusieurs
+        # utilisateurs peuvent partager une adresse IP)
+        client_id = _header(scope, b"x-client-id")
+        if not client_id:
+            return 200, await self.analyses.run(_analyze, password)
+
+        client = (client_ip, client_id)
+        ticket = self.analyze_coalescer.begin(client)
+        try:
+            await asyncio.sleep(self.coalesce_window)
+            if not self.analyze_coalescer.is_latest(client, ticket):
+                return 409, {'error': "Requête remplacée par une plus récente", 'superseded': True}
+            return 200, await self.analyses.run(_analyze, password)
+        finally:
+            self.analyze_coalescer.finish(client, ticket)
+
+app = SecurePassGenAPI()
+
+
+if __name__ == '__main__':
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ uvicorn n'est pas installé : pip install uvicorn", file=sys.stderr)
+        sys.exit(1)
+
+    port = int(os.environ.get('SECUREPASSGEN_PORT', 8080))
+    print(f"🔐 SecurePassGen Web (ASGI) - http://localhost:{port}")
+    uvicorn.run("asgi_app:app", host='0.0.0.0', port=port)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark du codec binaire du coffre face à l'ancien chemin JSON.
+
+Compare, pour plusieurs tailles de coffre, le débit d'encodage et de
+décodage de ``record_codec`` avec ``json.dumps(indent=2)`` / ``json.loads``
+ainsi que la taille du texte clair produit (donc du texte chiffré).
+
+Usage:
+    python benchmarks/bench_record_codec.py [--sizes 1000 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import json
+import secrets
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.record_codec import encode_records, decode_records
+
+
+def make_records(count: int):
+    """Génère ``count`` enregistrements représentatifs d'un coffre."""
+    return [
+        {
+            "name": f"compte-{i}@exemple.com",
+            "password": secrets.token_urlsafe(15),
+            "description": "Généré par SecurePassGen" if i % 3 else "",
+            "date": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d} 12:{i % 60:02d}:00",
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, func, *args):
+    """Retourne le meilleur temps (secondes) et le résultat de ``func``."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes, repeat):
+    print(f"{'entrées':>8} | {'format':<7} | {'taille':>10} | {'encodage':>12} | {'décodage':>12}")
+    print("-" * 62)
+    for size in sizes:
+        records = make_records(size)
+
+        json_encode, json_blob = best_of(repeat, lambda r: json.dumps(r, indent=2).encode(), records)
+        json_decode, _ = best_of(repeat, json.loads, json_blob)
+        bin_encode, bin_blob = best_of(repeat, encode_records, records)
+        bin_decode, decoded = best_of(repeat, decode_records, bin_blob)
+        assert decoded == records
+
+        for label, blob, enc, dec in (
+            ("json", json_blob, json_encode, json_decode),
+            ("binaire", bin_blob, bin_encode, bin_decode),
+        ):
+            print(f"{size:>8} | {label:<7} | {len(blob):>10,} | "
+                  f"{size / enc:>9,.0f}/s | {size / dec:>9,.0f}/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks de SecurePassGen, avec référence et détection des régressions.
+
+Mesure, hors ligne et sans dépendance supplémentaire :
+
+* generator : débit de ``generate_password`` (appel unique) et d'``iter_passwords`` (lot) ;
+* analyzer  : latences p50 / p99 d'``analyze_password`` selon la longueur ;
+* vault     : sauvegarde, chargement et suppression pour 10 à 100 000 entrées ;
+* web       : débit de ``/generate`` et ``/analyze`` (Flask et ASGI, en processus).
+
+Chaque mesure est la médiane de ``--repeat`` répétitions. Les résultats sont
+écrits en JSON ; ``--save-baseline`` les enregistre comme référence et
+``--baseline`` compare à une référence : le code de sortie vaut 1 si une
+mesure se dégrade de plus de ``--threshold`` (25 % par défaut). Une
+référence n'a de sens que sur la machine qui l'a produite.
+
+Usage:
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json [--only vault web] [--quick]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import secrets
+import shutil
+import statistics
+import string
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from core.password_generator import PasswordGenerator
+from core.password_strength import PasswordStrengthAnalyzer
+from utils.file_manager import PasswordFileManager
+
+HIGHER = "higher"
+LOWER = "lower"
+
+DEFAULT_THRESHOLD = 0.25
+
+ANALYZER_LENGTHS = (8, 16, 32, 64, 128)
+VAULT_SIZES = (10, 100, 1000, 10000, 100000)
+QUICK_VAULT_SIZES = (10, 100, 1000)
+
+# Requêtes simultanées envoyées à l'application ASGI
+WEB_CONCURRENCY = 32
+
+
+class Metric(NamedTuple):
+    """Mesure : valeur, unité et sens de l'amélioration."""
+    value: float
+    unit: str
+    better: str
+
+
+class Settings(NamedTuple):
+    repeat: int
+    quick: bool
+
+
+SUITES: Dict[str, Callable[[Settings], Dict[str, Metric]]] = {}
+
+
+def suite(name: str):
+    """Enregistre une famille de benchmarks."""
+    def register(func):
+        SUITES[name] = func
+        return func
+    return register
+
+
+def median_time(repeat: int, func: Callable[[], object]) -> float:
+    """Durée médiane (secondes) de ``func`` sur ``repeat`` exécutions, après un appel d'échauffement."""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+@suite("generator")
+def bench_generator(settings: Settings) -> Dict[str, Metric]:
+    generator = PasswordGenerator()
+    calls = 2000 if settings.quick else 10000
+    batch = 10000 if settings.quick else 100000
+
+    def single():
+        for _ in range(calls):
+            generator.generate_password(16)
+
+    def many():
+        for _ in generator.iter_passwords(batch, length=16):
+            pass
+
+    return {
+        "generator.single.ops_per_s": Metric(calls / median_time(settings.repeat, single), "ops/s", HIGHER),
+        "generator.batch.ops_per_s": Metric(batch / median_time(settings.repeat, many), "ops/s", HIGHER),
+    }
+
+
+@suite("analyzer")
+def bench_analyzer(settings: Settings) -> Dict[str, Metric]:
+    analyzer = PasswordStrengthAnalyzer()
+    samples = 500 if settings.quick else 2000
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    metrics = {}
+
+    for length in ANALYZER_LENGTHS:
+        passwords = ["".join(secrets.choice(alphabet) for _ in range(length)) for _ in range(samples)]
+        runs = []
+        for _ in range(settings.repeat):
+            latencies = []
+            for password in passwords:
+                start = time.perf_counter_ns()
+                analyzer.analyze_password(password)
+                latencies.append((time.perf_counter_ns() - start) / 1000)
+            latencies.sort()
+            runs.append((percentile(latencies, 0.50), percentile(latencies, 0.99)))
+        metrics[f"analyzer.len{length}.p50_us"] = Metric(statistics.median(r[0] for r in runs), "µs", LOWER)
+        metrics[f"analyzer.len{length}.p99_us"] = Metric(statistics.median(r[1] for r in runs), "µs", LOWER)
+
+    return metrics
+
+
+@suite("vault")
+def bench_vault(settings: Settings) -> Dict[str, Metric]:
+    sizes = QUICK_VAULT_SIZES if settings.quick else VAULT_SIZES
+    metrics = {}
+
+    for size in sizes:
+        data_dir = tempfile.mkdtemp(prefix="spg-bench-")
+        try:
+            manager = PasswordFileManager(data_dir, password_prompt=lambda: "benchmark-master")
+            start = time.perf_counter()
+            manager.import_entries({"name": f"compte-{i}", "password": secrets.token_urlsafe(12),
+                                    "description": "benchmark"} for i in range(size))
+            metrics[f"vault.{size}.import_ms"] = Metric((time.perf_counter() - start) * 1000, "ms", LOWER)
+            manager.checkpoint()
+
+            counter = iter(range(10 ** 9))
+            save = median_time(settings.repeat,
+                               lambda: manager.save_password(f"nouveau-{next(counter)}", "secret"))
+            load = median_time(settings.repeat, manager.load_passwords)
+            victims = iter(range(size))
+            delete = median_time(min(settings.repeat, size),
+                                 lambda: manager.delete_password(f"compte-{next(victims)}"))
+
+            metrics[f"vault.{size}.save_ms"] = Metric(save * 1000, "ms", LOWER)
+            metrics[f"vault.{size}.load_ms"] = Metric(load * 1000, "ms", LOWER)
+            metrics[f"vault.{size}.delete_ms"] = Metric(delete * 1000, "ms", LOWER)
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    return metrics
+
+
+@suite("web")
+def bench_web(settings: Settings) -> Dict[str, Metric]:
+    import web_app
+    import asgi_app
+
+    requests = 300 if settings.quick else 1500
+    bodies = {"/generate": {"length": 16}, "/analyze": {"password": "Tr0ub4dor&3-benchmark"}}
+    metrics = {}
+
+    # La limitation de débit fausserait la mesure (un seul client)
+    limiter, web_app.analyze_limiter = web_app.analyze_limiter, None
+    try:
+        client = web_app.app.test_client()
+
+        def post_all(route, body):
+            for _ in range(requests):
+                status = client.post(route, json=body).status_code
+                if status != 200:
+                    raise RuntimeError(f"{route} : statut {status}")
+
+        for route, body in bodies.items():
+            elapsed = median_time(settings.repeat, lambda: post_all(route, body))
+            metrics[f"web.flask{route.replace('/', '.')}.req_per_s"] = Metric(requests / elapsed, "req/s", HIGHER)
+    finally:
+        web_app.analyze_limiter = limiter
+
+    app = asgi_app.SecurePassGenAPI()
+    app.analyze_limiter = None
+
+    async def drive(route, payload):
+        async def receive():
+            return {"type": "http.request", "body": payload, "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start" and message["status"] != 200:
+                raise RuntimeError(f"{route} : statut {message['status']}")
+
+        scope = {"type": "http", "method": "POST", "path": route, "headers": [], "client": ("127.0.0.1", 1)}
+        # Concurrence bornée, sous les limites des pools de l'application
+        for start in range(0, requests, WEB_CONCURRENCY):
+            await asyncio.gather(*(app(scope, receive, send)
+                                   for _ in range(min(WEB_CONCURRENCY, requests - start))))
+
+    try:
+        for route, body in bodies.items():
+            payload = json.dumps(body).encode()
+            elapsed = median_time(settings.repeat, lambda: asyncio.run(drive(route, payload)))
+            metrics[f"web.asgi{route.replace('/', '.')}.req_per_s"] = Metric(requests / elapsed, "req/s", HIGHER)
+    finally:
+        app.shutdown()
+
+    return metrics
+
+
+def machine_info() -> Dict[str, object]:
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def run_suites(names: List[str], settings: Settings, log=print) -> Dict:
+    """
+    Exécute les familles ``names``.
+
+    Returns:
+        Résultats sérialisables (machine, date, mesures)
+    """
+    metrics = {}
+    for name in names:
+        start = time.perf_counter()
+        results = SUITES[name](settings)
+        log(f"  {name:<10} {len(results):>3} mesures en {time.perf_counter() - start:.1f} s")
+        metrics.update({key: metric._asdict() for key, metric in results.items()})
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "settings": settings._asdict(),
+        "metrics": metrics,
+    }
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+    change: float      # Variation relative, positive = amélioration
+    regressed: bool
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """
+    Compare deux résultats mesure par mesure (mesures communes uniquement).
+
+    Args:
+        baseline: Résultats de référence
+        current: Résultats courants
+        threshold: Dégradation relative tolérée
+
+    Returns:
+        Une comparaison par mesure commune
+    """
+    comparisons = []
+    for name, reference in sorted(baseline["metrics"].items()):
+        measured = current["metrics"].get(name)
+        if measured is None or not reference["value"]:
+            continue
+        ratio = measured["value"] / reference["value"]
+        if reference["better"] == HIGHER:
+            change, regressed = ratio - 1, ratio < 1 - threshold
+        else:
+            change, regressed = 1 - ratio, ratio > 1 + threshold
+        comparisons.append(Comparison(name, reference["value"], measured["value"], change, regressed))
+    return comparisons
+
+
+def print_report(results: Dict, comparisons: Optional[List[Comparison]] = None) -> None:
+    by_name = {c.name: c for c in comparisons or []}
+    print(f"{'mesure':<36} {'valeur':>14} {'unité':<5}  {'référence':>14} {'écart':>7}")
+    print("-" * 84)
+    for name, metric in sorted(results["metrics"].items()):
+        line = f"{name:<36} {metric['value']:>14,.2f} {metric['unit']:<5}"
+        comparison = by_name.get(name)
+        if comparison:
+            flag = "  ✗ RÉGRESSION" if comparison.regressed else ""
+            line += f"  {comparison.baseline:>14,.2f} {comparison.change:>+7.0%}{flag}"
+        print(line.rstrip())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), default=list(SUITES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="Tailles réduites (coffre jusqu'à 1000 entrées)")
+    parser.add_argument("--output", type=Path, help="Écrire les résultats JSON dans ce fichier")
+    parser.add_argument("--save-baseline", type=Path, help="Enregistrer les résultats comme référence")
+    parser.add_argument("--baseline", type=Path, help="Comparer à cette référence")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Dégradation relative tolérée (0.25 = 25 %%)")
+    args = parser.parse_args(argv)
+
+    print(f"SecurePassGen - benchmarks ({', '.join(args.only)})")
+    results = run_suites(args.only, Settings(repeat=args.repeat, quick=args.quick))
+
+    comparisons = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("machine") != results["machine"]:
+            print("⚠️  Référence produite sur une autre machine : comparaison indicative", file=sys.stderr)
+        comparisons = compare(baseline, results, args.threshold)
+
+    print()
+    print_report(results, comparisons)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            print(f"\nRésultats enregistrés dans {path}")
+
+    regressions = [c for c in comparisons or [] if c.regressed]
+    if regressions:
+        print(f"\n✗ {len(regressions)} régression(s) au-delà de {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
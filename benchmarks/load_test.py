@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test de charge des routes ``/generate`` et ``/analyze`` du serveur web.
+
+Envoie des requêtes concurrentes (un thread par connexion simultanée) et
+affiche, pour chaque route, le débit en requêtes par seconde ainsi que les
+latences p50 / p99.
+
+La limitation de débit de ``/analyze`` doit être désactivée côté serveur
+(toutes les requêtes viennent de la même adresse).
+
+Usage:
+    SECUREPASSGEN_ANALYZE_RATE=0 python serve.py --port 8080 --workers 4 &
+    python benchmarks/load_test.py [--url http://127.0.0.1:8080] [--requests 2000] [--concurrency 16]
+"""
+
+import argparse
+import json
+import secrets
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Percentile (plus proche rang) d'une liste triée."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def payload_for(route: str) -> dict:
+    if route == "/generate":
+        return {"length": 16, "lowercase": True, "uppercase": True, "digits": True, "special": True}
+    return {"password": secrets.token_urlsafe(12)}
+
+
+def post(url: str, body: dict, timeout: float) -> float:
+    """Envoie une requête POST JSON et retourne sa latence (secondes)."""
+    data = json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"statut {response.status}")
+    return time.perf_counter() - start
+
+
+def load(base_url: str, route: str, requests: int, concurrency: int, timeout: float):
+    """
+    Lance ``requests`` requêtes sur ``route`` avec ``concurrency`` connexions.
+
+    Returns:
+        (latences triées, nombre d'erreurs, durée totale)
+    """
+    url = base_url.rstrip("/") + route
+    bodies = [payload_for(route) for _ in range(requests)]
+    latencies, errors = [], 0
+
+    def one(body):
+        try:
+            return post(url, body, timeout)
+        except Exception:
+            return None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for latency in pool.map(one, bodies):
+            if latency is None:
+                errors += 1
+            else:
+                latencies.append(latency)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return latencies, errors, elapsed
+
+
+def run(base_url, routes, requests, concurrency, timeout):
+    print(f"{'route':<10} | {'requêtes':>8} | {'erreurs':>7} | {'req/s':>9} | {'p50 ms':>8} | {'p99 ms':>8}")
+    print("-" * 66)
+    for route in routes:
+        # Quelques requêtes d'échauffement (connexions, caches) non comptées
+        load(base_url, route, min(concurrency * 2, requests), concurrency, timeout)
+        latencies, errors, elapsed = load(base_url, route, requests, concurrency, timeout)
+        print(f"{route:<10} | {requests:>8} | {errors:>7} | {len(latencies) / elapsed:>9,.0f} | "
+              f"{percentile(latencies, 0.50) * 1000:>8.2f} | {percentile(latencies, 0.99) * 1000:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--routes", nargs="+", default=["/generate", "/analyze"])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+    run(args.url, args.routes, args.requests, args.concurrency, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Tests statistiques du caractère aléatoire des générateurs de SecurePassGen.
+
+Avant d'adopter un moteur de génération plus rapide, il faut montrer qu'il
+ne biaise pas la distribution. Ce banc génère un grand nombre d'échantillons
+avec un moteur (``generate_password``, ``iter_passwords``,
+``generate_passphrase``, une implémentation de référence ou tout
+``module:fonction``) et les confronte à la loi exacte du générateur :
+
+* position : un khi-deux par position (mot de passe) ou par mot (phrase) ;
+* classe : un khi-deux par classe de caractères sur le nombre de caractères
+  de la classe dans chaque mot de passe (loi binomiale de Poisson exacte) ;
+* série : khi-deux sur les paires adjacentes d'un même échantillon et sur la
+  paire (fin d'un échantillon, début du suivant), plus un test de la
+  corrélation sérielle d'ordre 1 ;
+* couverture : chaque mot de passe contient un caractère de chaque classe
+  obligatoire (chaque phrase de passe a la structure demandée).
+
+La loi attendue n'est pas uniforme : les caractères imposés par les classes
+obligatoires sur-représentent les petites classes (chiffres). Elle est
+calculée exactement à partir de ``PasswordGenerator._prepare_charset``.
+
+Les comptages sont faits par tranches de chaînes (découpage, ``translate``,
+``Counter``), en C, sans boucle Python par caractère : le coût est dominé
+par la génération. Les p-valeurs sont corrigées par Bonferroni ; le code de
+sortie vaut 1 si un test échoue. ``--compare`` ajoute un test
+d'homogénéité entre deux moteurs, tableau par tableau.
+
+Usage:
+    python benchmarks/randomness.py --engine batch --samples 1000000
+    python benchmarks/randomness.py --engine reference --compare batch --samples 200000
+    python benchmarks/randomness.py --engine passphrase --words 5
+    python benchmarks/randomness.py --engine monmodule:generer --kind password
+"""
+
+import argparse
+import importlib
+import json
+import math
+import secrets
+import sys
+import time
+from collections import Counter
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Mapping, NamedTuple, Sequence, Tuple
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.password_generator import PASSPHRASE_WORDS, PasswordGenerator
+
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_ALPHA = 0.001
+
+# Taille des tranches générées puis comptées (mémoire bornée)
+CHUNK_SIZE = 100_000
+
+# Effectif attendu minimal d'une case du khi-deux (les autres sont regroupées)
+MIN_EXPECTED = 5.0
+
+COMPLETE = "complet"
+
+Tables = Dict[str, Counter]
+
+
+class TestResult(NamedTuple):
+    """Résultat d'un test : statistique, degrés de liberté et p-valeur."""
+    name: str
+    statistic: float
+    df: int
+    p_value: float
+
+
+# ---------------------------------------------------------------------------
+# Lois du khi-deux et de la normale
+# ---------------------------------------------------------------------------
+
+def _gamma_p_series(a: float, x: float) -> float:
+    term = total = 1.0 / a
+    n = a
+    for _ in range(100000):
+        n += 1.0
+        term *= x / n
+        total += term
+        if abs(term) < abs(total) * 1e-15:
+            break
+    return total * math.exp(-x + a * math.log(x) - math.lgamma(a))
+
+
+def _gamma_q_fraction(a: float, x: float) -> float:
+    # Fraction continue de Legendre, évaluée par la méthode de Lentz
+    tiny = 1e-300
+    b = x + 1.0 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 100000):
+        an = -i * (i - a)
+        b += 2.0
+        d = an * d + b
+        d = d if abs(d) > tiny else tiny
+        c = b + an / c
+        c = c if abs(c) > tiny else tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return math.exp(-x + a * math.log(x) - math.lgamma(a)) * h
+
+
+def chi2_sf(statistic: float, df: int) -> float:
+    """P(X >= statistic) pour X suivant une loi du khi-deux à ``df`` degrés de liberté."""
+    if math.isinf(statistic):
+        return 0.0
+    if df <= 0 or statistic <= 0:
+        return 1.0
+    a, x = df / 2.0, statistic / 2.0
+    if x < a + 1.0:
+        return max(0.0, 1.0 - _gamma_p_series(a, x))
+    return _gamma_q_fraction(a, x)
+
+
+def normal_two_sided(z: float) -> float:
+    """P(|Z| >= |z|) pour Z normale centrée réduite."""
+    return math.erfc(abs(z) / math.sqrt(2.0))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def chi_square(observed: Mapping[Hashable, int], probabilities: Mapping[Hashable, float],
+               min_expected: float = MIN_EXPECTED) -> Tuple[float, int]:
+    """
+    Khi-deux d'adéquation des effectifs ``observed`` à la loi ``probabilities``.
+
+    Les cases d'effectif attendu inférieur à ``min_expected`` sont
+    regroupées. Un symbole observé de probabilité nulle donne une
+    statistique infinie.
+
+    Returns:
+        Tuple (statistique, degrés de liberté)
+    """
+    total = sum(observed.values())
+    if any(count and probabilities.get(symbol, 0.0) <= 0.0 for symbol, count in observed.items()):
+        return math.inf, max(1, len(probabilities) - 1)
+
+    statistic, cells = 0.0, 0
+    pooled_observed = pooled_expected = 0.0
+    for symbol, probability in probabilities.items():
+        if probability <= 0.0:
+            continue
+        expected = total * probability
+        count = observed.get(symbol, 0)
+        if expected < min_expected:
+            pooled_observed += count
+            pooled_expected += expected
+        else:
+            statistic += (count - expected) ** 2 / expected
+            cells += 1
+    if pooled_expected > 0.0:
+        statistic += (pooled_observed - pooled_expected) ** 2 / pooled_expected
+        cells += 1
+    return statistic, cells - 1
+
+
+def homogeneity(first: Mapping[Hashable, int], second: Mapping[Hashable, int],
+                min_expected: float = MIN_EXPECTED) -> Tuple[float, int]:
+    """
+    Khi-deux d'homogénéité : les deux tableaux d'effectifs suivent-ils la même loi ?
+
+    Returns:
+        Tuple (statistique, degrés de liberté)
+    """
+    first_total, second_total = sum(first.values()), sum(second.values())
+    total = first_total + second_total
+    if not first_total or not second_total:
+        return 0.0, 0
+
+    statistic, cells = 0.0, 0
+    pooled = [0, 0]
+    for symbol in set(first) | set(second):
+        a, b = first.get(symbol, 0), second.get(symbol, 0)
+        expected_a = (a + b) * first_total / total
+        expected_b = (a + b) * second_total / total
+        if min(expected_a, expected_b) < min_expected:
+            pooled[0] += a
+            pooled[1] += b
+        else:
+            statistic += (a - expected_a) ** 2 / expected_a + (b - expected_b) ** 2 / expected_b
+            cells += 1
+    if sum(pooled):
+        expected_a = sum(pooled) * first_total / total
+        expected_b = sum(pooled) * second_total / total
+        statistic += (pooled[0] - expected_a) ** 2 / expected_a + (pooled[1] - expected_b) ** 2 / expected_b
+        cells += 1
+    return statistic, cells - 1
+
+
+def pair_correlation(pairs: Mapping[Tuple[Hashable, Hashable], float], order: Mapping[Hashable, int]) -> float:
+    """
+    Corrélation entre les rangs (selon ``order``) des deux éléments des
+    paires, pondérées par ``pairs`` (effectifs ou probabilités).
+    """
+    weight = sum(pairs.values())
+    mean_x = sum(w * order[x] for (x, _), w in pairs.items()) / weight
+    mean_y = sum(w * order[y] for (_, y), w in pairs.items()) / weight
+    covariance = sum(w * (order[x] - mean_x) * (order[y] - mean_y) for (x, y), w in pairs.items()) / weight
+    variance_x = sum(w * (order[x] - mean_x) ** 2 for (x, _), w in pairs.items()) / weight
+    variance_y = sum(w * (order[y] - mean_y) ** 2 for (_, y), w in pairs.items()) / weight
+    if variance_x <= 0.0 or variance_y <= 0.0:
+        return 0.0
+    return covariance / math.sqrt(variance_x * variance_y)
+
+
+def poisson_binomial(probabilities: Sequence[float]) -> Dict[int, float]:
+    """Loi du nombre de succès d'épreuves indépendantes de probabilités ``probabilities``."""
+    distribution = [1.0]
+    for p in probabilities:
+        p = min(1.0, max(0.0, round(p, 12)))  # 0.999…9 d'une somme de flottants : certain
+        shifted = [0.0] + [q * p for q in distribution]
+        distribution = [q * (1.0 - p) for q in distribution] + [0.0]
+        distribution = [a + b for a, b in zip(distribution, shifted)]
+    return {count: q for count, q in enumerate(distribution) if q > 0.0}
+
+
+def _uniform(symbols: Sequence[Hashable]) -> Dict[Hashable, float]:
+    """Loi d'un tirage uniforme dans ``symbols`` (les doublons pèsent plus)."""
+    return {symbol: count / len(symbols) for symbol, count in Counter(symbols).items()}
+
+
+def _product(first: Mapping[Hashable, float], second: Mapping[Hashable, float]) -> Dict[Tuple, float]:
+    return {(a, b): p * q for a, p in first.items() for b, q in second.items()}
+
+
+# ---------------------------------------------------------------------------
+# Lois attendues
+# ---------------------------------------------------------------------------
+
+class PasswordModel:
+    """
+    Loi exacte d'un mot de passe de ``generate_password`` : un caractère par
+    classe obligatoire, le reste tiré dans le jeu complet, puis un mélange
+    uniforme. Chaque position est donc un tirage uniforme parmi les
+    ``length`` « emplacements », indépendants entre eux.
+    """
+
+    kind = "password"
+
+    CLASS_NAMES = ("minuscules", "majuscules", "chiffres", "spéciaux")
+
+    def __init__(self, length: int = 16, use_lowercase: bool = True, use_uppercase: bool = True,
+                 use_digits: bool = True, use_special: bool = True, exclude_ambiguous: bool = False,
+                 custom_chars: str = ""):
+        self.options = dict(length=length, use_lowercase=use_lowercase, use_uppercase=use_uppercase,
+                            use_digits=use_digits, use_special=use_special,
+                            exclude_ambiguous=exclude_ambiguous, custom_chars=custom_chars)
+        charset, required_sets = PasswordGenerator()._prepare_charset(**self.options)
+        enabled = [name for name, flag in zip(self.CLASS_NAMES, (use_lowercase, use_uppercase,
+                                                                  use_digits, use_special)) if flag]
+
+        self.length = length
+        self.classes = list(zip(enabled, required_sets))
+        self.slots = [_uniform(chars) for chars in required_sets]
+        self.slots += [_uniform(charset)] * (length - len(required_sets))
+        self.alphabet = sorted(set(charset))
+        self.order = {symbol: rank for rank, symbol in enumerate(self.alphabet)}
+
+        self.position = {c: sum(slot.get(c, 0.0) for slot in self.slots) / length for c in self.alphabet}
+        self.expected = {f"position.{p}": self.position for p in range(length)}
+        for name, chars in self.classes:
+            members = set(chars)
+            self.expected[f"class.{name}"] = poisson_binomial(
+                [sum(p for c, p in slot.items() if c in members) for slot in self.slots])
+        self.expected["serial.adjacent"] = self._adjacent_pairs()
+        self.expected["serial.successive"] = _product(self.position, self.position)
+        self.expected["coverage"] = {COMPLETE: 1.0}
+
+    def _adjacent_pairs(self) -> Dict[Tuple[str, str], float]:
+        # Deux positions distinctes = deux emplacements distincts a != b :
+        # P(c, d) = (S(c) S(d) - somme_a p_a(c) p_a(d)) / (L (L - 1))
+        length = self.length
+        distinct = Counter(id(slot) for slot in self.slots)
+        slots = {id(slot): slot for slot in self.slots}
+        totals = {c: self.position[c] * length for c in self.alphabet}
+        pairs = {}
+        for c in self.alphabet:
+            for d in self.alphabet:
+                same = sum(weight * slots[key].get(c, 0.0) * slots[key].get(d, 0.0)
+                           for key, weight in distinct.items())
+                probability = (totals[c] * totals[d] - same) / (length * (length - 1))
+                if probability > 1e-15:
+                    pairs[(c, d)] = probability
+        return pairs
+
+    def count(self, samples: List[str]) -> Tables:
+        """Tableaux d'effectifs d'une tranche d'échantillons."""
+        length = self.length
+        lengths = Counter(map(len, samples))
+        if set(lengths) != {length}:
+            raise ValueError(f"Longueurs inattendues : {dict(lengths)} (attendu : {length})")
+
+        joined = "".join(samples)
+        columns = [joined[p::length] for p in range(length)]
+        tables = {f"position.{p}": Counter(column) for p, column in enumerate(columns)}
+
+        adjacent = Counter()
+        for left, right in zip(columns, columns[1:]):
+            adjacent.update(zip(left, right))
+        tables["serial.adjacent"] = adjacent
+        tables["serial.successive"] = Counter(zip(columns[-1], columns[0][1:]))
+
+        offsets = range(0, len(joined), length)
+        per_class = []
+        for name, chars in self.classes:
+            members = set(chars)
+            flags = joined.translate({ord(c): "1" if c in members else "0" for c in self.alphabet})
+            counts = list(map(str.count, (flags[i:i + length] for i in offsets), repeat("1")))
+            tables[f"class.{name}"] = Counter(counts)
+            per_class.append(counts)
+        incomplete = sum(1 for counts in zip(*per_class) if 0 in counts)
+        tables["coverage"] = Counter({COMPLETE: len(samples) - incomplete, "incomplet": incomplete})
+        return tables
+
+
+class PassphraseModel:
+    """
+    Loi exacte d'une phrase de ``generate_passphrase`` : mots indépendants et
+    uniformes dans ``PASSPHRASE_WORDS``, puis 2 ou 3 chiffres uniformes.
+    """
+
+    kind = "passphrase"
+
+    def __init__(self, word_count: int = 4, separator: str = "-", capitalize: bool = True,
+                 add_numbers: bool = True):
+        self.options = dict(word_count=word_count, separator=separator, capitalize=capitalize,
+                            add_numbers=add_numbers)
+        self.word_count = word_count
+        self.separator = separator
+        self.add_numbers = add_numbers
+        words = [w.capitalize() if capitalize else w for w in PASSPHRASE_WORDS]
+        self.word = _uniform(words)
+        self.order = {symbol: rank for rank, symbol in enumerate(sorted(self.word))}
+
+        self.expected = {f"word.{i}": self.word for i in range(word_count)}
+        if word_count > 1:
+            self.expected["serial.adjacent"] = _product(self.word, self.word)
+            self.expected["serial.successive"] = _product(self.word, self.word)
+        if add_numbers:
+            self.expected["digits.length"] = {2: 0.5, 3: 0.5}
+            digit = _uniform("0123456789")
+            for j in range(3):
+                self.expected[f"digit.{j}"] = digit
+        self.expected["coverage"] = {COMPLETE: 1.0}
+
+    def count(self, samples: List[str]) -> Tables:
+        """Tableaux d'effectifs d'une tranche d'échantillons."""
+        parts = [sample.split(self.separator) for sample in samples]
+        expected_parts = self.word_count + (1 if self.add_numbers else 0)
+        well_formed = [p for p in parts if len(p) == expected_parts]
+
+        columns = list(zip(*well_formed)) or [() for _ in range(expected_parts)]
+        tables = {f"word.{i}": Counter(columns[i]) for i in range(self.word_count)}
+        if self.word_count > 1:
+            adjacent = Counter()
+            for left, right in zip(columns[:self.word_count], columns[1:self.word_count]):
+                adjacent.update(zip(left, right))
+            tables["serial.adjacent"] = adjacent
+            tables["serial.successive"] = Counter(zip(columns[self.word_count - 1], columns[0][1:]))
+
+        numbers_ok = len(well_formed)
+        if self.add_numbers:
+            numbers = columns[-1]
+            tables["digits.length"] = Counter(map(len, numbers))
+            numbers_ok = sum(1 for n in numbers if n.isdigit() and n.isascii())
+            for j in range(3):
+                tables[f"digit.{j}"] = Counter("".join(n[j:j + 1] for n in numbers))
+        tables["coverage"] = Counter({COMPLETE: numbers_ok, "incomplet": len(samples) - numbers_ok})
+        return tables
+
+
+# ---------------------------------------------------------------------------
+# Moteurs
+# ---------------------------------------------------------------------------
+
+class Engine(NamedTuple):
+    """Moteur : type d'échantillon et fonction ``sample(count, options) -> liste``."""
+    kind: str
+    sample: Callable[[int, Dict], List[str]]
+
+
+def _reference_passwords(count: int, options: Dict) -> List[str]:
+    """Implémentation de référence, volontairement directe (``secrets.SystemRandom``)."""
+    charset, required_sets = PasswordGenerator()._prepare_charset(**options)
+    rng = secrets.SystemRandom()
+    passwords = []
+    for _ in range(count):
+        chars = [rng.choice(s) for s in required_sets]
+        chars += [rng.choice(charset) for _ in range(options["length"] - len(required_sets))]
+        rng.shuffle(chars)
+        passwords.append("".join(chars))
+    return passwords
+
+
+def _builtin_engines() -> Dict[str, Engine]:
+    generator = PasswordGenerator()
+    return {
+        "password": Engine("password", lambda count, options: [
+            generator.generate_password(**options) for _ in range(count)]),
+        "batch": Engine("password", lambda count, options: list(generator.iter_passwords(count, **options))),
+        "reference": Engine("password", _reference_passwords),
+        "passphrase": Engine("passphrase", lambda count, options: [
+            generator.generate_passphrase(**options) for _ in range(count)]),
+    }
+
+
+ENGINES = _builtin_engines()
+
+
+def resolve_engine(spec: str, kind: str = "password") -> Engine:
+    """
+    Moteur intégré (``batch``, ``password``…) ou ``module:fonction``
+    appelée comme ``fonction(count, options)``.
+    """
+    if spec in ENGINES:
+        return ENGINES[spec]
+    module_name, _, function_name = spec.partition(":")
+    if not function_name:
+        raise ValueError(f"Moteur inconnu : {spec} (intégrés : {', '.join(sorted(ENGINES))})")
+    return Engine(kind, getattr(importlib.import_module(module_name), function_name))
+
+
+def collect(engine: Engine, model, samples: int, chunk_size: int = CHUNK_SIZE) -> Tables:
+    """Génère ``samples`` échantillons par tranches et cumule leurs tableaux d'effectifs."""
+    tables: Tables = {}
+    remaining = samples
+    while remaining > 0:
+        count = min(chunk_size, remaining)
+        for name, table in model.count(engine.sample(count, model.options)).items():
+            tables.setdefault(name, Counter()).update(table)
+        remaining -= count
+    return tables
+
+
+# ---------------------------------------------------------------------------
+# Analyse et rapport
+# ---------------------------------------------------------------------------
+
+def goodness_of_fit(model, tables: Tables) -> List[TestResult]:
+    """Tests d'adéquation de chaque tableau à la loi du modèle, plus la corrélation sérielle."""
+    results = []
+    for name, probabilities in model.expected.items():
+        statistic, df = chi_square(tables.get(name, Counter()), probabilities)
+        results.append(TestResult(name, statistic, df, chi2_sf(statistic, df)))
+
+    pairs = tables.get("serial.adjacent")
+    if pairs and all(x in model.order and y in model.order for x, y in pairs):
+        observed = pair_correlation(pairs, model.order)
+        expected = pair_correlation(model.expected["serial.adjacent"], model.order)
+        z = (observed - expected) * math.sqrt(sum(pairs.values()))
+        results.append(TestResult("serial.correlation", z, 0, normal_two_sided(z)))
+    return results
+
+
+def compare_tables(first: Tables, second: Tables) -> List[TestResult]:
+    """Tests d'homogénéité entre les tableaux de deux moteurs."""
+    results = []
+    for name in first:
+        if name in second and name != "coverage":
+            statistic, df = homogeneity(first[name], second[name])
+            results.append(TestResult(name, statistic, df, chi2_sf(statistic, df)))
+    return results
+
+
+def failures(results: List[TestResult], alpha: float) -> List[TestResult]:
+    """Tests rejetés au seuil global ``alpha`` (correction de Bonferroni)."""
+    threshold = alpha / max(1, len(results))
+    return [r for r in results if r.p_value < threshold]
+
+
+def _print_results(title: str, results: List[TestResult], alpha: float) -> None:
+    rejected = {r.name for r in failures(results, alpha)}
+    print(title)
+    print(f"{'test':<26} | {'statistique':>12} | {'ddl':>5} | {'p-valeur':>9} |")
+    print("-" * 64)
+    for r in results:
+        verdict = "✗" if r.name in rejected else "✓"
+        print(f"{r.name:<26} | {r.statistic:>12.2f} | {r.df:>5} | {r.p_value:>9.2e} | {verdict}")
+    print()
+
+
+def build_model(kind: str, args) -> object:
+    if kind == "passphrase":
+        return PassphraseModel(word_count=args.words, separator=args.separator)
+    return PasswordModel(length=args.length, exclude_ambiguous=args.exclude_ambiguous,
+                         custom_chars=args.custom_chars)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--engine", default="batch", help="Moteur testé (intégré ou module:fonction)")
+    parser.add_argument("--compare", help="Second moteur, comparé au premier")
+    parser.add_argument("--kind", choices=("password", "passphrase"), default="password",
+                        help="Type d'échantillon d'un moteur module:fonction")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                        help="Seuil global de rejet (corrigé par Bonferroni)")
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--exclude-ambiguous", action="store_true")
+    parser.add_argument("--custom-chars", default="")
+    parser.add_argument("--words", type=int, default=4)
+    parser.add_argument("--separator", default="-")
+    parser.add_argument("--output", type=Path, help="Écrire le rapport JSON dans ce fichier")
+    args = parser.parse_args(argv)
+
+    engines = [(args.engine, resolve_engine(args.engine, args.kind))]
+    if args.compare:
+        engines.append((args.compare, resolve_engine(args.compare, args.kind)))
+    kinds = {engine.kind for _, engine in engines}
+    if len(kinds) != 1:
+        parser.error("Les moteurs comparés doivent produire le même type d'échantillon")
+    model = build_model(kinds.pop(), args)
+
+    report, failed = {"samples": args.samples, "alpha": args.alpha, "options": model.options}, 0
+    all_tables = []
+    for name, engine in engines:
+        start = time.perf_counter()
+        tables = collect(engine, model, args.samples)
+        elapsed = time.perf_counter() - start
+        results = goodness_of_fit(model, tables)
+        _print_results(f"Moteur {name} : {args.samples:,} échantillons en {elapsed:.1f} s", results, args.alpha)
+        failed += len(failures(results, args.alpha))
+        report[name] = [r._asdict() for r in results]
+        all_tables.append(tables)
+
+    if args.compare:
+        results = compare_tables(*all_tables)
+        _print_results(f"Homogénéité {args.engine} / {args.compare}", results, args.alpha)
+        failed += len(failures(results, args.alpha))
+        report["comparison"] = [r._asdict() for r in results]
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str) + "\n",
+                               encoding="utf-8")
+
+    if failed:
+        print(f"✗ {failed} test(s) rejeté(s) au seuil global {args.alpha}")
+        return 1
+    print("✓ Aucun biais détecté")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,14 @@
 
 import sys
 import os
+import subprocess
 from pathlib import Path
 
+# --profile-startup : durée de chaque phase du démarrage
+# --importtime : modules les plus coûteux à importer (python -X importtime)
+if "--profile-startup" in sys.argv:
+    os.environ["SECUREPASSGEN_PROFILE_STARTUP"] = "1"
+
 print("=== DEBUG SECUREPASSGEN ===")
 print(f"Python version: {sys.version}")
 print(f"Working directory: {os.getcwd()}")
@@ -13,6 +19,19 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 print(f"Added to path: {src_path}")
 
+if "--importtime" in sys.argv:
+    from utils.startup_profile import summarize_importtime
+    
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; sys.path.insert(0, {str(src_path)!r}); import gui.main_window"],
+        capture_output=True, text=True
+    )
+    print(f"{'Module':<50} {'propre (ms)':>12} {'cumulé (ms)':>12}")
+    for module, self_us, cumulative_us in summarize_importtime(result.stderr):
+        print(f"{module:<50} {self_us / 1000:>12.1f} {cumulative_us / 1000:>12.1f}")
+    sys.exit(result.returncode)
+
 try:
     print("Importing tkinter...")
     import tkinter as tk
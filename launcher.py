@@ -4,6 +4,7 @@ SecurePassGen - Lanceur Universel
 Détecte automatiquement le système d'exploitation et lance l'interface appropriée
 """
 
+import os
 import sys
 import platform
 import subprocess
@@ -11,9 +12,20 @@ import tkinter as tk
 from tkinter import messagebox
 import webbrowser
 import time
-import threading
 from pathlib import Path
 
+# Ajouter le répertoire src au path
+sys.path.append(str(Path(__file__).parent / "src"))
+from utils.readiness import wait_for_http
+
+WEB_PORT = 8080
+
+# Délai maximal d'attente du serveur web avant d'abandonner (secondes)
+WEB_READY_TIMEOUT = 30.0
+
+# Délai laissé au serveur web pour s'arrêter avant de le tuer (secondes)
+WEB_STOP_TIMEOUT = 5.0
+
 class SecurePassGenLauncher:
     def __init__(self):
         self.system = platform.system().lower()
@@ -66,34 +78,53 @@ class SecurePassGenLauncher:
             return False
     
     def launch_web_app(self):
-        """Lance l'application web Flask"""
+        """Lance l'application web Flask et ouvre le navigateur dès qu'elle répond"""
         print("🌐 Lancement de l'application web...")
         
-        def run_flask():
-            try:
-                subprocess.run([
-                    self.python_executable, 
-                    str(self.base_dir / "web_app.py")
-                ])
-            except Exception as e:
-                print(f"❌ Erreur lors du lancement web: {e}")
+        base_url = f"http://localhost:{WEB_PORT}"
+        started = time.perf_counter()
+        try:
+            env = {**os.environ, 'SECUREPASSGEN_PORT': str(WEB_PORT)}
+            process = subprocess.Popen([
+                self.python_executable, 
+                str(self.base_dir / "web_app.py")
+            ], env=env)
+        except Exception as e:
+            print(f"❌ Erreur lors du lancement web: {e}")
+            return False
         
-        # Lancer Flask dans un thread séparé
-        flask_thread = threading.Thread(target=run_flask, daemon=True)
-        flask_thread.start()
+        # Sonder /healthz (backoff exponentiel) plutôt qu'une pause fixe
+        result = wait_for_http(f"http://127.0.0.1:{WEB_PORT}/healthz",
+                               timeout=WEB_READY_TIMEOUT, process=process)
+        if not result.ready:
+            print(f"❌ Le serveur web n'a pas répondu: {result.reason}")
+            # Ne pas laisser un serveur orphelin occuper le port
+            self.stop_process(process)
+            return False
         
-        # Attendre que le serveur démarre
-        time.sleep(3)
+        print(f"⏱️  Serveur prêt en {result.elapsed * 1000:.0f} ms ({result.attempts} sondes)")
         
         # Ouvrir le navigateur
         try:
-            webbrowser.open("http://localhost:8080")
-            print("🚀 Application web lancée sur http://localhost:8080")
+            webbrowser.open(base_url)
+            print(f"🚀 Application web lancée sur {base_url} "
+                  f"({(time.perf_counter() - started) * 1000:.0f} ms depuis le lancement)")
             return True
         except Exception as e:
             print(f"❌ Erreur ouverture navigateur: {e}")
             return False
     
+    def stop_process(self, process):
+        """Arrête un processus enfant (terminate, puis kill s'il ne s'arrête pas)"""
+        if process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=WEB_STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
     def launch_desktop_app(self):
         """Lance l'application desktop Tkinter"""
         print("🖥️  Lancement de l'application desktop...")
@@ -101,7 +132,7 @@ class SecurePassGenLauncher:
         try:
             if self.system == "darwin":
                 # Configuration spéciale pour macOS
-                env = {**subprocess.os.environ, 'TK_SILENCE_DEPRECATION': '1'}
+                env = {**os.environ, 'TK_SILENCE_DEPRECATION': '1'}
                 subprocess.run([
                     self.python_executable,
                     str(self.base_dir / "main.py")
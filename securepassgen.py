@@ -0,0 +1,569 @@
+#!/usr/bin/env python3
+"""
+SecurePassGen - Outil en ligne de commande
+
+Pour les scripts, les tâches cron et les pipelines, sans interface Tk :
+
+    python securepassgen.py gen   -n 1000000 --length 20 > secrets.txt
+    python securepassgen.py gen   -n 10 --passphrase --words 5
+    python securepassgen.py audit mots_de_passe.txt --workers 4 --fail-under 60
+    python securepassgen.py index rockyou.txt -o data/breached.idx
+    python securepassgen.py audit liste.txt --summary --dictionary hibp=data/breached.idx
+    cat export.ndjson | python securepassgen.py audit - --input-format ndjson
+    python securepassgen.py vault --data-dir data export --format csv -o export.csv
+    python securepassgen.py vault --data-dir data list
+    python securepassgen.py vault --data-dir data verify --no-authenticate
+    python securepassgen.py vault --data-dir data search github
+    python securepassgen.py vault --data-dir data passwd
+    python securepassgen.py vault --data-dir data backup sauvegardes --keep 30
+    python securepassgen.py vault --data-dir data restore sauvegardes --before "2024-06-01 00:00:00"
+
+Les données vont sur la sortie standard (ou ``-o``), une ligne par élément,
+au fil de l'eau ; le débit est affiché sur la sortie d'erreur (``--quiet``
+pour le taire). Les modules de SecurePassGen ne sont importés que par la
+commande qui en a besoin : ``gen`` ne charge pas la cryptographie.
+
+Le mot de passe maître du coffre est lu dans la variable d'environnement
+SECUREPASSGEN_MASTER_PASSWORD, sinon dans le fichier désigné par
+SECUREPASSGEN_PASSWORD_FILE (accessible à son seul propriétaire), sinon
+demandé sur le terminal ou lu sur l'entrée standard redirigée.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ajouter le répertoire src au path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+MASTER_PASSWORD_ENV_VAR = "SECUREPASSGEN_MASTER_PASSWORD"
+NEW_MASTER_PASSWORD_ENV_VAR = "SECUREPASSGEN_NEW_MASTER_PASSWORD"
+
+# Mots de passe générés ou analysés par bloc d'écriture / par tâche
+GEN_CHUNK_SIZE = 10000
+AUDIT_CHUNK_SIZE = 2000
+
+# Tâches d'analyse en attente par processus (mémoire bornée sur une entrée infinie)
+AUDIT_PENDING_PER_WORKER = 4
+
+_analyzer = None
+
+
+class Report:
+    """Compte les éléments traités et affiche le débit sur la sortie d'erreur."""
+
+    def __init__(self, label: str, quiet: bool = False):
+        self.label = label
+        self.quiet = quiet
+        self.count = 0
+        self.started = time.perf_counter()
+
+    def done(self) -> None:
+        if self.quiet:
+            return
+        elapsed = time.perf_counter() - self.started
+        rate = self.count / elapsed if elapsed > 0 else float("inf")
+        print(f"✓ {self.count:,} {self.label} en {elapsed:.2f} s ({rate:,.0f}/s)", file=sys.stderr)
+
+
+def _open_output(path: str, newline=None):
+    """Fichier de sortie (``-`` : sortie standard, laissée ouverte)."""
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", encoding="utf-8", newline=newline)
+
+
+def _open_input(path: str, newline=None):
+    """Fichier d'entrée (``-`` : entrée standard)."""
+    if path == "-":
+        return sys.stdin
+    return open(path, "r", encoding="utf-8", newline=newline)
+
+
+# ---------------------------------------------------------------------------
+# gen
+# ---------------------------------------------------------------------------
+
+def _chunked(iterable, size: int):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def cmd_gen(args) -> int:
+    from core.password_generator import PasswordGenerator
+
+    generator = PasswordGenerator()
+    if args.passphrase:
+        secrets_iter = (generator.generate_passphrase(word_count=args.words, separator=args.separator,
+                                                      capitalize=not args.no_capitalize,
+                                                      add_numbers=not args.no_numbers)
+                        for _ in range(args.count))
+    else:
+        secrets_iter = generator.iter_passwords(
+            args.count, length=args.length, use_lowercase=not args.no_lowercase,
+            use_uppercase=not args.no_uppercase, use_digits=not args.no_digits,
+            use_special=not args.no_special, exclude_ambiguous=args.exclude_ambiguous,
+            custom_chars=args.custom_chars
+        )
+
+    report = Report("secrets générés", args.quiet)
+    out = _open_output(args.output)
+    try:
+        for chunk in _chunked(secrets_iter, GEN_CHUNK_SIZE):
+            out.write("\n".join(chunk) + "\n")
+            report.count += len(chunk)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    report.done()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# audit
+# ---------------------------------------------------------------------------
+
+def _read_audit_input(f, input_format: str):
+    """Entrées ``(nom, mot de passe)`` : une ligne par mot de passe ou un export du coffre."""
+    if input_format == "lines":
+        for line_number, line in enumerate(f, 1):
+            password = line.rstrip("\r\n")
+            if password:
+                yield str(line_number), password
+        return
+
+    from utils import import_export
+
+    reader = {"ndjson": import_export.read_ndjson, "csv": import_export.read_csv,
+              "json": import_export.read_json}[input_format]
+    for entry in reader(f):
+        yield entry["name"], entry["password"]
+
+
+def _audit_chunk(chunk, output_format: str = "text", fail_under=None):
+    """
+    Analyse un bloc de ``(nom, mot de passe)`` (exécuté dans un processus de
+    travail) et le met en forme : seul du texte revient au processus principal.
+
+    Returns:
+        Tuple (lignes de sortie, nombre d'éléments, nombre sous ``fail_under``)
+    """
+    import json
+
+    global _analyzer
+    if _analyzer is None:
+        from core.password_strength import PasswordStrengthAnalyzer
+        _analyzer = PasswordStrengthAnalyzer()
+
+    lines, weak = [], 0
+    for name, password in chunk:
+        analysis = _analyzer.analyze_password(password)
+        if fail_under is not None and analysis['score'] < fail_under:
+            weak += 1
+        if output_format == "ndjson":
+            lines.append(json.dumps({
+                'name': name,
+                'score': analysis['score'],
+                'strength': analysis['strength'],
+                'entropy': analysis['entropy'],
+                'time_to_crack': analysis['time_to_crack'],
+                'feedback': analysis['feedback'],
+            }, ensure_ascii=False) + "\n")
+        else:
+            lines.append(f"{analysis['score']:>3}  {analysis['strength']:<11}  "
+                         f"{analysis['entropy']:>7.2f}  {name}\n")
+    return "".join(lines), len(chunk), weak
+
+
+def _audit_results(chunks, workers: int, *options):
+    """Blocs analysés dans l'ordre d'entrée, avec au plus quelques blocs en attente par processus."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield _audit_chunk(chunk, *options)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_audit_chunk, chunk, *options))
+            if len(pending) >= workers * AUDIT_PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _print_summary(summary, out, output_format: str) -> None:
+    if output_format == "ndjson":
+        import json
+        out.write(json.dumps(summary.to_dict(), ensure_ascii=False) + "\n")
+        return
+
+    out.write(f"Lignes : {summary.lines:,}   analysées : {summary.analyzed:,}\n\nScores :\n")
+    largest = max(summary.score_histogram().values()) or 1
+    for bucket, count in summary.score_histogram().items():
+        out.write(f"  {bucket:>7}  {count:>12,}  {'█' * round(40 * count / largest)}\n")
+    out.write("\nForce :\n")
+    for strength, count in summary.strengths.most_common():
+        out.write(f"  {strength:<11}  {count:>12,}\n")
+    if summary.dictionary_hits:
+        out.write("\nDictionnaires :\n")
+        for name, count in summary.dictionary_hits.most_common():
+            out.write(f"  {name:<11}  {count:>12,}\n")
+    out.write("\nPires mots de passe :\n")
+    for offender in summary.worst:
+        found = f"  [{', '.join(offender.dictionaries)}]" if offender.dictionaries else ""
+        out.write(f"  ligne {offender.line:>10,}  {offender.score:>3}  {offender.strength:<11}  "
+                  f"{offender.preview}{found}\n")
+
+
+def cmd_audit_summary(args) -> int:
+    from core.audit import AuditPipeline
+
+    dictionaries = {}
+    for spec in args.dictionary:
+        name, _, path = spec.rpartition("=")
+        dictionaries[name or Path(path).stem] = path
+
+    pipeline = AuditPipeline(workers=args.workers, dictionaries=dictionaries, worst=args.worst,
+                             show_passwords=args.show_passwords)
+    report = Report("mots de passe analysés", args.quiet)
+    summary = pipeline.run(sys.stdin.buffer if args.input == "-" else args.input)
+    report.count = summary.analyzed
+
+    out = _open_output(args.output)
+    try:
+        _print_summary(summary, out, args.output_format)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    report.done()
+
+    weak = summary.count_below(args.fail_under) if args.fail_under is not None else 0
+    if weak:
+        print(f"✗ {weak:,} mot(s) de passe sous le score {args.fail_under}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_audit(args) -> int:
+    if args.summary:
+        if args.input_format != "lines":
+            raise ValueError("--summary n'accepte qu'un mot de passe par ligne")
+        return cmd_audit_summary(args)
+
+    report = Report("mots de passe analysés", args.quiet)
+    weak = 0
+    source = _open_input(args.input, newline="" if args.input_format == "csv" else None)
+    out = _open_output(args.output)
+    try:
+        chunks = _chunked(_read_audit_input(source, args.input_format), args.chunk_size)
+        for text, count, chunk_weak in _audit_results(chunks, args.workers, args.output_format, args.fail_under):
+            out.write(text)
+            report.count += count
+            weak += chunk_weak
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    report.done()
+
+    if weak:
+        print(f"✗ {weak:,} mot(s) de passe sous le score {args.fail_under}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_index(args) -> int:
+    from utils.breach_index import build_breach_index
+
+    report = Report("empreintes indexées", args.quiet)
+    report.count = build_breach_index(args.source, args.output)
+    report.done()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# vault
+# ---------------------------------------------------------------------------
+
+def master_password_prompt():
+    """
+    Fournisseur du mot de passe maître : variable d'environnement, fichier
+    désigné par SECUREPASSGEN_PASSWORD_FILE, sinon terminal ou entrée
+    standard redirigée (une seule saisie pour toute la commande, jamais de
+    boîte de dialogue).
+    """
+    from utils.credentials import CachedProvider, default_provider
+
+    return CachedProvider(default_provider(gui=False))
+
+
+def _open_vault(args):
+    from utils.file_manager import PasswordFileManager
+
+    if not Path(args.data_dir).is_dir():
+        raise SystemExit(f"Coffre introuvable : {args.data_dir}")
+    return PasswordFileManager(args.data_dir, password_prompt=master_password_prompt())
+
+
+def cmd_vault_export(args) -> int:
+    manager = _open_vault(args)
+    report = Report("entrées exportées", args.quiet)
+    out = _open_output(args.output, newline="" if args.format == "csv" else None)
+    try:
+        report.count = manager.export_to(out, args.include_passwords, args.format, args.layout)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    report.done()
+    return 0
+
+
+def cmd_vault_list(args) -> int:
+    manager = _open_vault(args)
+    report = Report("entrées", args.quiet)
+    for page in manager.iter_pages():
+        sys.stdout.write("".join(f"{entry['name']}\n" for entry in page))
+        report.count += len(page)
+    report.done()
+    return 0
+
+
+def cmd_vault_search(args) -> int:
+    manager = _open_vault(args)
+    report = Report("entrées trouvées", args.quiet)
+    entries = manager.search_passwords(args.query, prefix=args.prefix)
+    sys.stdout.write("".join(f"{entry['name']}\n" for entry in entries))
+    report.count = len(entries)
+    report.done()
+    return 0 if entries else 1
+
+
+def _new_password() -> str:
+    """Nouveau mot de passe : variable d'environnement, sinon deux saisies identiques."""
+    password = os.environ.get(NEW_MASTER_PASSWORD_ENV_VAR)
+    if password:
+        return password
+
+    import getpass
+    password = getpass.getpass("Nouveau mot de passe : ")
+    if getpass.getpass("Confirmation : ") != password:
+        raise ValueError("Les mots de passe ne correspondent pas")
+    return password
+
+
+def cmd_vault_passwd(args) -> int:
+    manager = _open_vault(args)
+    manager.change_master_password(_new_password(), args.slot)
+    if not args.quiet:
+        print("✅ Mot de passe changé (entrées non rechiffrées)", file=sys.stderr)
+    return 0
+
+
+def cmd_vault_recovery_key(args) -> int:
+    manager = _open_vault(args)
+    print(manager.add_recovery_key(args.label))
+    if not args.quiet:
+        print("⚠️ Conservez cette clé hors ligne : elle ouvre le coffre comme le mot de passe maître",
+              file=sys.stderr)
+    return 0
+
+
+def cmd_vault_slots(args) -> int:
+    manager = _open_vault(args)
+    for slot in manager.key_slots():
+        print(f"{slot['label']}\t{slot['date'] or '-'}")
+    return 0
+
+
+def cmd_vault_verify(args) -> int:
+    import json
+
+    manager = _open_vault(args)
+    report = manager.verify(not args.no_authenticate, args.workers, args.file)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False))
+    else:
+        for damaged in report["corrupted"]:
+            records = damaged["records"]
+            where = f" (enregistrements {records[0]} à {records[1] - 1})" if records else ""
+            print(f"Segment {damaged['segment']} corrompu{where}")
+        if report["header"] == "tampered":
+            print("En-tête altéré : empreintes ou compteurs modifiés")
+        for sequence in report["journal_corrupted"]:
+            print(f"Trame {sequence} du journal altérée")
+        if report["journal_ignored_bytes"]:
+            print(f"{report['journal_ignored_bytes']} octet(s) ignoré(s) en fin de journal")
+        if report["ok"] and not args.quiet:
+            print(f"✅ {report['segments']} segment(s) et {report['journal_frames']} trame(s) vérifiés",
+                  file=sys.stderr)
+    return 0 if report["ok"] else 1
+
+
+def cmd_vault_backup(args) -> int:
+    manager = _open_vault(args)
+    manifest = manager.backup_incremental(args.backup_dir)
+    files = manifest["files"].values()
+    print(manifest["id"])
+    if not args.quiet:
+        written = sum(f["written"] for f in files)
+        size = sum(f["size"] for f in files)
+        print(f"✅ Sauvegarde {manifest['id']} : {written} octet(s) écrit(s) sur {size}", file=sys.stderr)
+    if args.keep:
+        removed, orphans = manager.prune_backups(args.backup_dir, args.keep)
+        if not args.quiet and removed:
+            print(f"{removed} ancienne(s) sauvegarde(s) supprimée(s), {orphans} morceau(x) libéré(s)",
+                  file=sys.stderr)
+    return 0
+
+
+def cmd_vault_restore(args) -> int:
+    from datetime import datetime
+
+    manager = _open_vault(args)
+    before = datetime.strptime(args.before, "%Y-%m-%d %H:%M:%S") if args.before else None
+    manifest = manager.restore_incremental(args.backup_dir, args.snapshot, before)
+    if not args.quiet:
+        print(f"✅ Sauvegarde {manifest['id']} du {manifest['date']} restaurée", file=sys.stderr)
+    return 0
+
+
+def cmd_vault_backups(args) -> int:
+    manager = _open_vault(args)
+    for manifest in manager.list_backups(args.backup_dir):
+        size = sum(f["size"] for f in manifest["files"].values())
+        print(f"{manifest['id']}\t{manifest['date']}\tversion {manifest['version']}\t{size} octets")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Ligne de commande
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="securepassgen", description="SecurePassGen en ligne de commande")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher le débit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    gen = commands.add_parser("gen", help="Générer des mots de passe ou des phrases de passe")
+    gen.add_argument("-n", "--count", type=int, default=1, help="Nombre de secrets")
+    gen.add_argument("-o", "--output", default="-", help="Fichier de sortie (- : sortie standard)")
+    gen.add_argument("--length", type=int, default=16)
+    gen.add_argument("--no-lowercase", action="store_true")
+    gen.add_argument("--no-uppercase", action="store_true")
+    gen.add_argument("--no-digits", action="store_true")
+    gen.add_argument("--no-special", action="store_true")
+    gen.add_argument("--exclude-ambiguous", action="store_true")
+    gen.add_argument("--custom-chars", default="")
+    gen.add_argument("--passphrase", action="store_true", help="Phrases de passe au lieu de mots de passe")
+    gen.add_argument("--words", type=int, default=4)
+    gen.add_argument("--separator", default="-")
+    gen.add_argument("--no-capitalize", action="store_true")
+    gen.add_argument("--no-numbers", action="store_true")
+    gen.set_defaults(func=cmd_gen)
+
+    audit = commands.add_parser("audit", help="Analyser la force d'une liste de mots de passe")
+    audit.add_argument("input", nargs="?", default="-", help="Fichier à analyser (- : entrée standard)")
+    audit.add_argument("--input-format", choices=("lines", "ndjson", "csv", "json"), default="lines",
+                       help="Un mot de passe par ligne, ou un export du coffre")
+    audit.add_argument("-o", "--output", default="-", help="Fichier de sortie (- : sortie standard)")
+    audit.add_argument("--output-format", choices=("text", "ndjson"), default="text")
+    audit.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processus d'analyse")
+    audit.add_argument("--chunk-size", type=int, default=AUDIT_CHUNK_SIZE, help="Mots de passe par tâche")
+    audit.add_argument("--fail-under", type=int, help="Code de sortie 1 si un score est inférieur")
+    audit.add_argument("--summary", action="store_true",
+                       help="Résumé agrégé (histogrammes, pires mots de passe) au lieu d'une ligne par mot de passe")
+    audit.add_argument("--dictionary", action="append", default=[], metavar="[NOM=]INDEX",
+                       help="Index de mots de passe compromis à consulter (voir la commande index)")
+    audit.add_argument("--worst", type=int, default=20, help="Nombre de pires mots de passe du résumé")
+    audit.add_argument("--show-passwords", action="store_true", help="Pires mots de passe en clair")
+    audit.set_defaults(func=cmd_audit)
+
+    index = commands.add_parser("index", help="Construire un index de mots de passe compromis")
+    index.add_argument("source", help="Un mot de passe ou une ligne SHA1:compte (HIBP) par ligne")
+    index.add_argument("-o", "--output", required=True, help="Fichier d'index à écrire")
+    index.set_defaults(func=cmd_index)
+
+    vault = commands.add_parser("vault", help="Lire et sauvegarder le coffre chiffré")
+    vault.add_argument("--data-dir", default="data", help="Dossier du coffre")
+    vault_commands = vault.add_subparsers(dest="vault_command", required=True)
+    export = vault_commands.add_parser("export", help="Exporter les entrées du coffre")
+    export.add_argument("-o", "--output", default="-", help="Fichier de sortie (- : sortie standard)")
+    export.add_argument("--format", choices=("ndjson", "csv", "json"), default="ndjson")
+    export.add_argument("--layout", default="securepassgen", help="Disposition des colonnes du CSV")
+    export.add_argument("--include-passwords", action="store_true", help="Mots de passe en clair")
+    export.set_defaults(func=cmd_vault_export)
+    listing = vault_commands.add_parser("list", help="Lister les noms des entrées")
+    listing.set_defaults(func=cmd_vault_list)
+    search = vault_commands.add_parser("search", help="Rechercher par nom ou description (index aveugle)")
+    search.add_argument("query", help="Texte recherché (sans distinction de casse)")
+    search.add_argument("--prefix", action="store_true", help="Début du nom ou de la description")
+    search.set_defaults(func=cmd_vault_search)
+    passwd = vault_commands.add_parser("passwd", help="Changer le mot de passe maître sans rechiffrer")
+    passwd.add_argument("--slot", help="Emplacement à remplacer (master : avec une clé de récupération)")
+    passwd.set_defaults(func=cmd_vault_passwd)
+    recovery = vault_commands.add_parser("recovery-key", help="Créer une clé de récupération")
+    recovery.add_argument("--label", default="recovery", help="Libellé de l'emplacement de clé")
+    recovery.set_defaults(func=cmd_vault_recovery_key)
+    slots = vault_commands.add_parser("slots", help="Lister les emplacements de clé")
+    slots.set_defaults(func=cmd_vault_slots)
+    verify = vault_commands.add_parser("verify", help="Vérifier l'intégrité du coffre sans le déchiffrer")
+    verify.add_argument("--no-authenticate", action="store_true",
+                        help="Sans mot de passe maître : corruption accidentelle seulement")
+    verify.add_argument("--workers", type=int, default=None, help="Threads de hachage (défaut : tous les cœurs)")
+    verify.add_argument("--file", help="Vérifier une sauvegarde complète plutôt que le coffre")
+    verify.add_argument("--json", action="store_true", help="Rapport JSON")
+    verify.set_defaults(func=cmd_vault_verify)
+    backup = vault_commands.add_parser("backup", help="Sauvegarde incrémentale du coffre")
+    backup.add_argument("backup_dir", help="Dossier des sauvegardes")
+    backup.add_argument("--keep", type=int, default=0, help="Ne garder que les N dernières sauvegardes")
+    backup.set_defaults(func=cmd_vault_backup)
+    restore = vault_commands.add_parser("restore", help="Restaurer une sauvegarde incrémentale")
+    restore.add_argument("backup_dir", help="Dossier des sauvegardes")
+    restore.add_argument("--snapshot", help="Identifiant de la sauvegarde (la plus récente par défaut)")
+    restore.add_argument("--before", help="État du coffre à cette date (AAAA-MM-JJ HH:MM:SS)")
+    restore.set_defaults(func=cmd_vault_restore)
+    backups = vault_commands.add_parser("backups", help="Lister les sauvegardes incrémentales")
+    backups.add_argument("backup_dir", help="Dossier des sauvegardes")
+    backups.set_defaults(func=cmd_vault_backups)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "count", 1) < 0:
+        parser.error("--count doit être positif")
+    workers = getattr(args, "workers", None)
+    if (workers is not None and workers < 1) or getattr(args, "chunk_size", 1) < 1:
+        parser.error("--workers et --chunk-size doivent être au moins 1")
+
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # Lecteur fermé (``| head``) : arrêt silencieux
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except KeyboardInterrupt:
+        return 130
+    except Exception as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
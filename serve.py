@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+SecurePassGen - Serveur web de production
+
+Sert ``web_app.app`` avec plusieurs processus de travail pré-forkés, au lieu
+du serveur de développement de Flask (``python web_app.py``, débogueur et
+rechargement automatique activés).
+
+Utilise gunicorn s'il est installé, sinon le serveur pre-fork de la
+bibliothèque standard (``utils.prefork``). Dans les deux cas chaque
+processus est préchauffé après le fork et SIGTERM / Ctrl+C arrête le
+serveur en laissant les requêtes en cours se terminer.
+
+Usage:
+    python serve.py [--host 0.0.0.0] [--port 8080] [--workers 4] [--backend auto|gunicorn|prefork]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire src au path
+sys.path.append(str(Path(__file__).parent / "src"))
+
+import web_app
+from utils.prefork import PreforkServer
+
+WORKERS_ENV_VAR = "SECUREPASSGEN_WORKERS"
+
+
+def default_workers() -> int:
+    """Nombre de processus par défaut : variable d'environnement ou nombre de CPU."""
+    return int(os.environ.get(WORKERS_ENV_VAR, 0)) or (os.cpu_count() or 1)
+
+
+def run_gunicorn(host: str, port: int, workers: int, graceful_timeout: float) -> None:
+    """Sert l'application avec gunicorn."""
+    from gunicorn.app.base import BaseApplication
+
+    class _Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{host}:{port}")
+            self.cfg.set('workers', workers)
+            self.cfg.set('graceful_timeout', graceful_timeout)
+            self.cfg.set('post_fork', lambda server, worker: web_app.warm_up())
+
+        def load(self):
+            return web_app.app
+
+    _Application().run()
+
+
+def run_prefork(host: str, port: int, workers: int, graceful_timeout: float) -> None:
+    """Sert l'application avec le serveur pre-fork de la bibliothèque standard."""
+    server = PreforkServer(web_app.app, host=host, port=port, workers=workers,
+                           post_fork=web_app.warm_up, graceful_timeout=graceful_timeout)
+    port = server.bind()
+    print(f"🔐 SecurePassGen Web - {workers} processus sur http://{host}:{port}", flush=True)
+    server.serve()
+    print("👋 Serveur arrêté", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Serveur web de production de SecurePassGen")
+    parser.add_argument("--host", default="0.0.0.0", help="Adresse d'écoute")
+    parser.add_argument("--port", type=int, default=web_app.PORT, help="Port d'écoute")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Nombre de processus")
+    parser.add_argument("--backend", choices=("auto", "gunicorn", "prefork"), default="auto",
+                        help="Serveur à utiliser (auto : gunicorn s'il est installé)")
+    parser.add_argument("--graceful-timeout", type=float, default=30.0,
+                        help="Délai laissé aux requêtes en cours à l'arrêt (secondes)")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers doit être au moins 1")
+
+    backend = args.backend
+    if backend == "auto":
+        try:
+            import gunicorn  # noqa: F401
+            backend = "gunicorn"
+        except ImportError:
+            backend = "prefork"
+
+    if backend == "prefork" and not hasattr(os, "fork"):
+        print("❌ Le serveur pre-fork nécessite un système POSIX ; installez gunicorn "
+              "ou utilisez python web_app.py", file=sys.stderr)
+        return 1
+
+    run = run_gunicorn if backend == "gunicorn" else run_prefork
+    run(args.host, args.port, args.workers, args.graceful_timeout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+Audit parallèle de très grandes listes de mots de passe.
+
+Le processus principal ne fait que découper l'entrée : pour un fichier, il
+distribue des plages d'octets alignées sur les fins de ligne et chaque
+processus de travail lit lui-même sa plage ; seule l'entrée standard est
+lue par le processus principal et envoyée par blocs. Chaque processus
+ouvre une fois l'analyseur et les dictionnaires (index ``BreachIndex``
+projetés en mémoire, dont les pages sont partagées entre processus) puis
+renvoie un résumé partiel : histogrammes des scores et des niveaux de
+force, nombre de mots de passe trouvés dans chaque dictionnaire et pires
+mots de passe. Les résumés sont fusionnés dans l'ordre de l'entrée, au
+fil de l'eau.
+
+    pipeline = AuditPipeline(workers=8, dictionaries={"hibp": "data/breached.idx"})
+    summary = pipeline.run("mots_de_passe.txt")
+    print(summary.to_dict())
+"""
+
+import heapq
+import os
+from collections import Counter, deque
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from core.password_strength import PasswordStrengthAnalyzer
+
+# Taille d'une tâche (octets d'entrée)
+CHUNK_BYTES = 4 * 1024 * 1024
+
+# Tâches en attente par processus (mémoire bornée sur une entrée infinie)
+PENDING_PER_WORKER = 4
+
+DEFAULT_WORST = 20
+
+# Largeur des classes de l'histogramme des scores (0-9, 10-19, …, 100)
+SCORE_BUCKET = 10
+
+
+class Offender(NamedTuple):
+    """Mot de passe faible : score, ligne, niveau, aperçu et dictionnaires où il figure."""
+    score: int
+    line: int
+    strength: str
+    preview: str
+    dictionaries: Tuple[str, ...]
+
+    def sort_key(self):
+        # Les mots de passe compromis d'abord, puis les scores les plus bas
+        return (not self.dictionaries, self.score, self.line)
+
+
+class AuditSummary:
+    """Résultat agrégé d'un audit (ou d'une partie)."""
+
+    def __init__(self, worst: int = DEFAULT_WORST):
+        self.max_worst = worst
+        self.lines = 0
+        self.analyzed = 0
+        self.scores: Counter = Counter()  # score exact -> nombre (101 valeurs au plus)
+        self.strengths: Counter = Counter()
+        self.dictionary_hits: Counter = Counter()
+        self.worst: List[Offender] = []
+        self._bound = (False, -1, -1)  # Plus grande clé parmi les pires, une fois la liste pleine
+
+    def add(self, line: int, password: str, analysis: Dict, dictionaries: Tuple[str, ...],
+            show_passwords: bool = False) -> None:
+        """Compte un mot de passe analysé."""
+        score = analysis['score']
+        self.analyzed += 1
+        self.scores[score] += 1
+        self.strengths[analysis['strength']] += 1
+        for name in dictionaries:
+            self.dictionary_hits[name] += 1
+
+        if len(self.worst) >= self.max_worst and (not dictionaries, score, line) >= self._bound:
+            return
+        self.worst.append(Offender(score, line, analysis['strength'],
+                                   password if show_passwords else mask(password), dictionaries))
+        if len(self.worst) > self.max_worst:
+            self.worst = heapq.nsmallest(self.max_worst, self.worst, key=Offender.sort_key)
+        if len(self.worst) >= self.max_worst:
+            self._bound = max(o.sort_key() for o in self.worst)
+
+    def merge(self, other: "AuditSummary", line_offset: int = 0) -> None:
+        """Ajoute un résumé partiel dont les lignes sont numérotées à partir de ``line_offset``."""
+        self.lines += other.lines
+        self.analyzed += other.analyzed
+        self.scores.update(other.scores)
+        self.strengths.update(other.strengths)
+        self.dictionary_hits.update(other.dictionary_hits)
+        shifted = [o._replace(line=o.line + line_offset) for o in other.worst]
+        self.worst = heapq.nsmallest(self.max_worst, self.worst + shifted, key=Offender.sort_key)
+
+    def count_below(self, threshold: int) -> int:
+        """Nombre de mots de passe dont le score est inférieur à ``threshold``."""
+        return sum(count for score, count in self.scores.items() if score < threshold)
+
+    def score_histogram(self) -> Dict[str, int]:
+        """Histogramme des scores par classes de ``SCORE_BUCKET`` points."""
+        buckets = Counter()
+        for score, count in self.scores.items():
+            buckets[min(score // SCORE_BUCKET * SCORE_BUCKET, 100)] += count
+        return {(f"{low}-{low + SCORE_BUCKET - 1}" if low + SCORE_BUCKET <= 100 else str(low)): buckets[low]
+                for low in range(0, 101, SCORE_BUCKET)}
+
+    def to_dict(self) -> Dict:
+        return {
+            'lines': self.lines,
+            'analyzed': self.analyzed,
+            'scores': self.score_histogram(),
+            'strengths': dict(self.strengths.most_common()),
+            'dictionary_hits': dict(self.dictionary_hits),
+            'worst': [o._asdict() for o in self.worst],
+        }
+
+
+def mask(password: str) -> str:
+    """Aperçu d'un mot de passe : premier et dernier caractères seulement."""
+    if len(password) <= 2:
+        return "*" * len(password)
+    return password[0] + "*" * (len(password) - 2) + password[-1]
+
+
+# ---------------------------------------------------------------------------
+# Processus de travail
+# ---------------------------------------------------------------------------
+
+class _WorkerState:
+    analyzer: Optional[PasswordStrengthAnalyzer] = None
+    dictionaries: List = []
+    worst: int = DEFAULT_WORST
+    show_passwords: bool = False
+
+
+def _init_worker(dictionaries: Dict[str, str], worst: int, show_passwords: bool) -> None:
+    """Ouvre l'analyseur et les index une fois par processus."""
+    from utils.breach_index import BreachIndex
+
+    _WorkerState.analyzer = PasswordStrengthAnalyzer()
+    _WorkerState.dictionaries = [(name, BreachIndex(path)) for name, path in dictionaries.items()]
+    _WorkerState.worst = worst
+    _WorkerState.show_passwords = show_passwords
+
+
+def _audit_block(data: bytes) -> AuditSummary:
+    """Analyse un bloc de lignes complètes ; les lignes sont numérotées à partir de 1."""
+    from utils.breach_index import password_key
+
+    summary = AuditSummary(_WorkerState.worst)
+    analyze = _WorkerState.analyzer.analyze_password
+    dictionaries = _WorkerState.dictionaries
+    show_passwords = _WorkerState.show_passwords
+
+    lines = data.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    summary.lines = len(lines)
+
+    for number, raw in enumerate(lines, 1):
+        raw = raw.rstrip(b"\r")
+        if not raw:
+            continue
+        password = raw.decode("utf-8", errors="replace")
+        key = password_key(raw) if dictionaries else 0
+        hits = tuple(name for name, index in dictionaries if index.contains_key(key))
+        summary.add(number, password, analyze(password), hits, show_passwords)
+    return summary
+
+
+def _audit_range(path: str, start: int, end: int) -> AuditSummary:
+    """Lit et analyse la plage ``[start, end)`` d'un fichier."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        return _audit_block(f.read(end - start))
+
+
+# ---------------------------------------------------------------------------
+# Découpage de l'entrée
+# ---------------------------------------------------------------------------
+
+def split_ranges(path: Union[str, Path], chunk_bytes: int = CHUNK_BYTES) -> Iterator[Tuple[int, int]]:
+    """
+    Plages d'octets ``(début, fin)`` d'un fichier, d'environ ``chunk_bytes``,
+    dont chaque fin suit un saut de ligne (ou la fin du fichier).
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = start + chunk_bytes
+            if end >= size:
+                end = size
+            else:
+                f.seek(end)
+                f.readline()  # Aller jusqu'à la fin de la ligne en cours
+                end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def read_blocks(stream: BinaryIO, chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """Blocs de lignes complètes d'un flux (entrée standard)."""
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            return
+        if not block.endswith(b"\n"):
+            block += stream.readline()
+        yield block
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class AuditPipeline:
+    """
+    Répartit l'analyse d'une liste de mots de passe (un par ligne) sur
+    plusieurs processus.
+    """
+
+    def __init__(self, workers: Optional[int] = None, dictionaries: Optional[Dict[str, str]] = None,
+                 worst: int = DEFAULT_WORST, chunk_bytes: int = CHUNK_BYTES, show_passwords: bool = False):
+        """
+        Args:
+            workers: Nombre de processus (tous les cœurs si None ; 1 : dans ce processus)
+            dictionaries: Index ``BreachIndex`` à consulter, par nom
+            worst: Nombre de pires mots de passe conservés
+            chunk_bytes: Taille d'une tâche en octets
+            show_passwords: Montrer les pires mots de passe en clair (masqués sinon)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.dictionaries = {name: str(path) for name, path in (dictionaries or {}).items()}
+        self.worst = worst
+        self.chunk_bytes = chunk_bytes
+        self.show_passwords = show_passwords
+
+    def run(self, source: Union[str, Path, BinaryIO],
+            on_progress: Optional[Callable[[AuditSummary], None]] = None) -> AuditSummary:
+        """
+        Audite un fichier (chemin) ou un flux binaire.
+
+        Args:
+            source: Chemin du fichier, ou flux binaire ouvert (entrée standard)
+            on_progress: Appelée avec le résumé cumulé après chaque tâche
+
+        Returns:
+            Résumé de l'audit
+        """
+        if isinstance(source, (str, Path)):
+            path = str(source)
+            tasks = ((_audit_range, (path, start, end)) for start, end in split_ranges(path, self.chunk_bytes))
+        else:
+            tasks = ((_audit_block, (block,)) for block in read_blocks(source, self.chunk_bytes))
+
+        summary = AuditSummary(self.worst)
+        for partial in self._execute(tasks):
+            summary.merge(partial, line_offset=summary.lines)
+            if on_progress is not None:
+                on_progress(summary)
+        return summary
+
+    def _execute(self, tasks) -> Iterator[AuditSummary]:
+        """Résumés partiels dans l'ordre des tâches."""
+        initargs = (self.dictionaries, self.worst, self.show_passwords)
+        if self.workers <= 1:
+            _init_worker(*initargs)
+            try:
+                for func, args in tasks:
+                    yield func(*args)
+            finally:
+                for _, index in _WorkerState.dictionaries:
+                    index.close()
+                _WorkerState.dictionaries = []
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            pending = deque()
+            for func, args in tasks:
+                pending.append(pool.submit(func, *args))
+                if len(pending) >= self.workers * PENDING_PER_WORKER:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
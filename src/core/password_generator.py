@@ -2,10 +2,76 @@
 Générateur de mots de passe sécurisé avec algorithmes cryptographiques.
 """
 
+import os
 import secrets
 import string
 import random
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+
+from utils import metrics
+
+ENTROPY_DRAWS = metrics.counter("securepassgen_entropy_draws_total",
+                                "Lectures de la source d'aléa du système par le générateur")
+ENTROPY_BYTES = metrics.counter("securepassgen_entropy_bytes_total",
+                                "Octets d'aléa lus par le générateur")
+PASSWORDS_GENERATED = metrics.counter("securepassgen_passwords_generated_total",
+                                      "Mots de passe générés", ("method",))
+GENERATION_SECONDS = metrics.histogram("securepassgen_generation_seconds",
+                                       "Durée des appels de génération", ("method",))
+
+# Liste de mots courants des phrases de passe (version simplifiée)
+PASSPHRASE_WORDS = (
+    "apple", "banana", "cherry", "dragon", "eagle", "forest", "guitar", "house",
+    "island", "jungle", "kitten", "lemon", "mountain", "ocean", "piano", "queen",
+    "river", "sunset", "tiger", "umbrella", "violet", "wizard", "yellow", "zebra",
+    "bridge", "castle", "diamond", "elephant", "flower", "garden", "harmony", "ice",
+    "journey", "kingdom", "liberty", "melody", "nature", "orange", "paradise", "quiet",
+    "rainbow", "silver", "thunder", "universe", "victory", "wisdom", "crystal", "dream"
+)
+
+class _ByteSampler:
+    """
+    Tirages uniformes à partir d'un tampon d'octets de ``os.urandom``.
+    
+    ``SystemRandom`` fait un appel système par tirage ; pour les grands lots,
+    les octets sont lus par blocs et les tirages se font par rejet (sans
+    biais) : un octet ``b`` n'est accepté que s'il est inférieur au plus grand
+    multiple de ``n`` ne dépassant pas 256.
+    """
+    
+    def __init__(self, block_size: int = 4096):
+        self.block_size = block_size
+        self._buffer = b""
+        self._position = 0
+    
+    def below(self, n: int) -> int:
+        """Retourne un entier uniforme dans [0, n)."""
+        if n > 256:
+            ENTROPY_DRAWS.inc()
+            return secrets.randbelow(n)
+        
+        limit = 256 - 256 % n
+        while True:
+            if self._position >= len(self._buffer):
+                self._buffer = os.urandom(self.block_size)
+                self._position = 0
+                ENTROPY_DRAWS.inc()
+                ENTROPY_BYTES.inc(self.block_size)
+            byte = self._buffer[self._position]
+            self._position += 1
+            if byte < limit:
+                return byte % n
+    
+    def choice(self, sequence):
+        """Élément choisi uniformément dans ``sequence``."""
+        return sequence[self.below(len(sequence))]
+    
+    def shuffle(self, items: List) -> None:
+        """Mélange ``items`` en place (Fisher-Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = self.below(i + 1)
+            items[i], items[j] = items[j], items[i]
+
 
 class PasswordGenerator:
     """
@@ -42,6 +108,28 @@ class PasswordGenerator:
         Returns:
             Mot de passe généré
             
+        Raises:
+            ValueError: Si les paramètres sont invalides
+        """
+        start = metrics.start()
+        charset, required_sets = self._prepare_charset(
+            length, use_lowercase, use_uppercase, use_digits, use_special,
+            exclude_ambiguous, custom_chars
+        )
+        password = self._build_password(charset, required_sets, length, _ByteSampler(block_size=2 * length))
+        metrics.observe_since(GENERATION_SECONDS, start, ("generate_password",))
+        PASSWORDS_GENERATED.inc(labels=("generate_password",))
+        return password
+    
+    def _prepare_charset(self, length: int, use_lowercase: bool, use_uppercase: bool,
+                         use_digits: bool, use_special: bool, exclude_ambiguous: bool,
+                         custom_chars: str):
+        """
+        Construit le jeu de caractères et les jeux obligatoires.
+        
+        Returns:
+            Tuple (jeu complet, liste des jeux dont un caractère est imposé)
+            
         Raises:
             ValueError: Si les paramètres sont invalides
         """
@@ -50,48 +138,41 @@ class PasswordGenerator:
             
         # Construction du jeu de caractères
         charset = ""
-        required_chars = []
+        required_sets = []
         
-        if use_lowercase:
-            chars = self.lowercase
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            charset += chars
-            required_chars.append(secrets.choice(chars))
-            
-        if use_uppercase:
-            chars = self.uppercase
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            charset += chars
-            required_chars.append(secrets.choice(chars))
-            
-        if use_digits:
-            chars = self.digits
-            if exclude_ambiguous:
-                chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
-            charset += chars
-            required_chars.append(secrets.choice(chars))
+        for enabled, chars in ((use_lowercase, self.lowercase),
+                               (use_uppercase, self.uppercase),
+                               (use_digits, self.digits)):
+            if enabled:
+                if exclude_ambiguous:
+                    chars = ''.join(c for c in chars if c not in self.ambiguous_chars)
+                charset += chars
+                required_sets.append(chars)
             
         if use_special:
             charset += self.special_chars
-            required_chars.append(secrets.choice(self.special_chars))
+            required_sets.append(self.special_chars)
             
         if custom_chars:
             charset += custom_chars
             
         if not charset:
             raise ValueError("Au moins un type de caractère doit être sélectionné")
-            
-        # Génération du mot de passe
-        password_chars = required_chars.copy()
+        
+        return charset, required_sets
+    
+    @staticmethod
+    def _build_password(charset: str, required_sets: List[str], length: int,
+                        rng: _ByteSampler) -> str:
+        """Tire un mot de passe contenant un caractère de chaque jeu obligatoire."""
+        password_chars = [rng.choice(chars) for chars in required_sets]
         
         # Compléter avec des caractères aléatoires
-        for _ in range(length - len(required_chars)):
-            password_chars.append(secrets.choice(charset))
+        choice = rng.choice
+        password_chars.extend([choice(charset) for _ in range(length - len(password_chars))])
             
         # Mélanger les caractères de manière sécurisée
-        secrets.SystemRandom().shuffle(password_chars)
+        rng.shuffle(password_chars)
         
         return ''.join(password_chars)
     
@@ -112,19 +193,11 @@ class PasswordGenerator:
         Returns:
             Phrase de passe générée
         """
-        # Liste de mots courants (version simplifiée)
-        words = [
-            "apple", "banana", "cherry", "dragon", "eagle", "forest", "guitar", "house",
-            "island", "jungle", "kitten", "lemon", "mountain", "ocean", "piano", "queen",
-            "river", "sunset", "tiger", "umbrella", "violet", "wizard", "yellow", "zebra",
-            "bridge", "castle", "diamond", "elephant", "flower", "garden", "harmony", "ice",
-            "journey", "kingdom", "liberty", "melody", "nature", "orange", "paradise", "quiet",
-            "rainbow", "silver", "thunder", "universe", "victory", "wisdom", "crystal", "dream"
-        ]
+        start = metrics.start()
         
         selected_words = []
         for _ in range(word_count):
-            word = secrets.choice(words)
+            word = secrets.choice(PASSPHRASE_WORDS)
             if capitalize:
                 word = word.capitalize()
             selected_words.append(word)
@@ -135,7 +208,9 @@ class PasswordGenerator:
             # Ajouter 2-3 chiffres à la fin
             numbers = ''.join(secrets.choice(self.digits) for _ in range(secrets.randbelow(2) + 2))
             passphrase += separator + numbers
-            
+        
+        metrics.observe_since(GENERATION_SECONDS, start, ("generate_passphrase",))
+        PASSWORDS_GENERATED.inc(labels=("generate_passphrase",))
         return passphrase
     
     def generate_multiple(self, count: int, **kwargs) -> List[str]:
@@ -149,4 +224,35 @@ class PasswordGenerator:
         Returns:
             Liste de mots de passe
         """
-        return [self.generate_password(**kwargs) for _ in range(count)]
+        return list(self.iter_passwords(count, **kwargs))
+    
+    def iter_passwords(self, count: int, length: int = 12, use_lowercase: bool = True,
+                       use_uppercase: bool = True, use_digits: bool = True,
+                       use_special: bool = True, exclude_ambiguous: bool = False,
+                       custom_chars: str = "") -> Iterator[str]:
+        """
+        Génère des mots de passe à la demande (grands lots, export en flux).
+        
+        Le jeu de caractères n'est construit qu'une fois pour tout le lot.
+        
+        Args:
+            count: Nombre de mots de passe à générer
+            Les autres arguments sont ceux de ``generate_password``
+            
+        Yields:
+            Mots de passe générés
+        """
+        charset, required_sets = self._prepare_charset(
+            length, use_lowercase, use_uppercase, use_digits, use_special,
+            exclude_ambiguous, custom_chars
+        )
+        rng = _ByteSampler()
+        start = metrics.start()
+        produced = 0
+        try:
+            for produced in range(1, count + 1):
+                yield self._build_password(charset, required_sets, length, rng)
+        finally:
+            # Lot entier (ou interrompu) : une seule observation
+            metrics.observe_since(GENERATION_SECONDS, start, ("iter_passwords",))
+            PASSWORDS_GENERATED.inc(produced, ("iter_passwords",))
@@ -6,6 +6,11 @@ import re
 import math
 from typing import Dict, List, Tuple
 
+from utils import metrics
+
+ANALYZER_PHASE_SECONDS = metrics.histogram("securepassgen_analyzer_phase_seconds",
+                                           "Durée de chaque phase de l'analyse de force", ("phase",))
+
 class PasswordStrengthAnalyzer:
     """
     Analyse la force et la sécurité des mots de passe.
@@ -48,32 +53,38 @@ class PasswordStrengthAnalyzer:
         
         score = 0
         feedback = []
+        start = metrics.start()
         
         # Analyse de la longueur
         length_score, length_feedback = self._analyze_length(password)
         score += length_score
         feedback.extend(length_feedback)
+        start = metrics.lap(ANALYZER_PHASE_SECONDS, start, ("length",))
         
         # Analyse de la complexité
         complexity_score, complexity_feedback = self._analyze_complexity(password)
         score += complexity_score
         feedback.extend(complexity_feedback)
+        start = metrics.lap(ANALYZER_PHASE_SECONDS, start, ("complexity",))
         
         # Analyse des patterns
         pattern_score, pattern_feedback = self._analyze_patterns(password)
         score += pattern_score
         feedback.extend(pattern_feedback)
+        start = metrics.lap(ANALYZER_PHASE_SECONDS, start, ("patterns",))
         
         # Vérification des mots de passe communs
         common_score, common_feedback = self._check_common_passwords(password)
         score += common_score
         feedback.extend(common_feedback)
+        start = metrics.lap(ANALYZER_PHASE_SECONDS, start, ("common",))
         
         # Calcul de l'entropie
         entropy = self._calculate_entropy(password)
         
         # Estimation du temps de crack
         time_to_crack = self._estimate_crack_time(entropy)
+        metrics.observe_since(ANALYZER_PHASE_SECONDS, start, ("entropy",))
         
         # Détermination de la force
         strength = self._determine_strength(score)
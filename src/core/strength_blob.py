@@ -0,0 +1,210 @@
+"""
+Données du moteur d'analyse embarqué dans le navigateur.
+
+``static/strength_engine.js`` reproduit ``PasswordStrengthAnalyzer`` et
+l'analyse de l'API web côté client. Tout ce que ce moteur ne doit pas
+réécrire à la main est produit ici, à partir du code Python, dans un blob
+binaire compact (``static/strength_data.bin``) :
+
+* le dictionnaire des mots de passe courants ;
+* les motifs dangereux, traduits en expressions régulières JavaScript ;
+* log2 de la taille du jeu de caractères pour chaque combinaison de
+  classes (l'entropie est ainsi identique au bit près) ;
+* les classes de caractères Unicode telles que Python les voit
+  (``str.islower``, ``str.isupper``, ``str.isdigit``, ``\\d``), sous forme
+  de plages : le navigateur peut avoir une autre version d'Unicode.
+
+Format (petit-boutiste) : ``SPGS``, version (u8), puis des sections
+``tag (u8) | longueur (u32) | contenu``. Les plages sont encodées en
+varints : nombre de plages, puis pour chacune l'écart depuis la fin de la
+précédente et la longueur.
+
+Régénération après une modification de l'analyseur :
+
+    python src/core/strength_blob.py
+"""
+
+import math
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.password_strength import PasswordStrengthAnalyzer
+from core.web_api import SPECIAL_CHARS
+
+BLOB_MAGIC = b"SPGS"
+BLOB_VERSION = 1
+
+TAG_COMMON = 1
+TAG_PATTERNS = 2
+TAG_LOG2 = 3
+TAG_LOWER = 4
+TAG_UPPER = 5
+TAG_DIGIT = 6
+TAG_DECIMAL = 7
+TAG_SPECIAL = 8
+
+# Tailles des classes de caractères de _calculate_entropy, dans l'ordre des
+# bits du masque : minuscules, majuscules, chiffres, spéciaux
+CHARSET_SIZES = (26, 26, 10, 32)
+
+DEFAULT_BLOB_PATH = Path(__file__).parent.parent.parent / "static" / "strength_data.bin"
+
+Range = Tuple[int, int]
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def char_ranges(predicate: Callable[[str], bool]) -> List[Range]:
+    """Plages (début, longueur) des points de code vérifiant ``predicate``."""
+    ranges = []
+    start = None
+    for code_point in range(sys.maxunicode + 1):
+        if predicate(chr(code_point)):
+            if start is None:
+                start = code_point
+        elif start is not None:
+            ranges.append((start, code_point - start))
+            start = None
+    if start is not None:
+        ranges.append((start, sys.maxunicode + 1 - start))
+    return ranges
+
+
+def _encode_ranges(ranges: List[Range]) -> bytes:
+    out = bytearray(_encode_varint(len(ranges)))
+    previous_end = 0
+    for start, length in ranges:
+        out += _encode_varint(start - previous_end)
+        out += _encode_varint(length)
+        previous_end = start + length
+    return bytes(out)
+
+
+def _decode_ranges(data: bytes) -> List[Range]:
+    count, offset = _decode_varint(data, 0)
+    ranges = []
+    previous_end = 0
+    for _ in range(count):
+        gap, offset = _decode_varint(data, offset)
+        length, offset = _decode_varint(data, offset)
+        start = previous_end + gap
+        ranges.append((start, length))
+        previous_end = start + length
+    return ranges
+
+
+def to_js_regex(pattern: str) -> str:
+    """
+    Traduit un motif ``re`` en source d'expression régulière JavaScript
+    (drapeau ``u``) de même sens.
+
+    Raises:
+        ValueError: Si le motif utilise une syntaxe non prise en charge
+    """
+    # JavaScript exclut aussi \r, U+2028 et U+2029 de « . » ; Python seulement \n
+    translated = pattern.replace("(.)", "([^\\n])").replace("\\d", "\\p{Nd}")
+    if "." in translated.replace("[^\\n]", "").replace("\\.", ""):
+        raise ValueError(f"Motif non pris en charge par le moteur JavaScript : {pattern}")
+    return translated
+
+
+def log2_table() -> List[float]:
+    """log2 de la taille du jeu de caractères pour chaque masque de classes."""
+    table = []
+    for mask in range(1 << len(CHARSET_SIZES)):
+        size = sum(size for bit, size in enumerate(CHARSET_SIZES) if mask & (1 << bit))
+        table.append(math.log2(size) if size else 0.0)
+    return table
+
+
+def build_strength_blob(analyzer: PasswordStrengthAnalyzer = None) -> bytes:
+    """
+    Construit le blob de données du moteur JavaScript.
+
+    Args:
+        analyzer: Analyseur dont on reprend le dictionnaire et les motifs
+
+    Returns:
+        Blob binaire
+    """
+    analyzer = analyzer or PasswordStrengthAnalyzer()
+    sections = [
+        (TAG_COMMON, "\0".join(sorted(analyzer.common_passwords)).encode("utf-8")),
+        (TAG_PATTERNS, "\0".join(to_js_regex(p) for p in analyzer.dangerous_patterns).encode("utf-8")),
+        (TAG_LOG2, struct.pack(f"<{1 << len(CHARSET_SIZES)}d", *log2_table())),
+        (TAG_LOWER, _encode_ranges(char_ranges(str.islower))),
+        (TAG_UPPER, _encode_ranges(char_ranges(str.isupper))),
+        (TAG_DIGIT, _encode_ranges(char_ranges(str.isdigit))),
+        (TAG_DECIMAL, _encode_ranges(char_ranges(str.isdecimal))),
+        (TAG_SPECIAL, SPECIAL_CHARS.encode("utf-8")),
+    ]
+    out = bytearray(BLOB_MAGIC + bytes([BLOB_VERSION]))
+    for tag, payload in sections:
+        out += struct.pack("<BI", tag, len(payload)) + payload
+    return bytes(out)
+
+
+def decode_strength_blob(blob: bytes) -> Dict:
+    """
+    Décode un blob (vérification et tests).
+
+    Raises:
+        ValueError: Si le blob n'est pas reconnu
+    """
+    if blob[:4] != BLOB_MAGIC or blob[4] != BLOB_VERSION:
+        raise ValueError("Blob de données du moteur d'analyse non reconnu")
+
+    decoded = {}
+    offset = 5
+    while offset < len(blob):
+        tag, length = struct.unpack_from("<BI", blob, offset)
+        offset += 5
+        payload = blob[offset:offset + length]
+        offset += length
+        if tag == TAG_COMMON:
+            decoded['common'] = set(payload.decode("utf-8").split("\0"))
+        elif tag == TAG_PATTERNS:
+            decoded['patterns'] = payload.decode("utf-8").split("\0")
+        elif tag == TAG_LOG2:
+            decoded['log2'] = list(struct.unpack(f"<{length // 8}d", payload))
+        elif tag == TAG_SPECIAL:
+            decoded['special'] = payload.decode("utf-8")
+        else:
+            name = {TAG_LOWER: 'lower', TAG_UPPER: 'upper', TAG_DIGIT: 'digit', TAG_DECIMAL: 'decimal'}.get(tag)
+            if name:
+                decoded[name] = _decode_ranges(payload)
+    return decoded
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BLOB_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    blob = build_strength_blob()
+    path.write_bytes(blob)
+    print(f"{path} : {len(blob)} octets")
@@ -0,0 +1,80 @@
+"""
+Logique commune aux API web (Flask et ASGI).
+"""
+
+from typing import Dict
+
+SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+
+def generation_options(data: Dict) -> Dict:
+    """
+    Convertit le corps JSON d'une requête ``/generate`` en arguments de
+    ``PasswordGenerator.generate_password``.
+
+    Raises:
+        ValueError: Si la longueur n'est pas un entier
+    """
+    return {
+        'length': int(data.get('length', 12)),
+        'use_lowercase': bool(data.get('lowercase', True)),
+        'use_uppercase': bool(data.get('uppercase', True)),
+        'use_digits': bool(data.get('digits', True)),
+        'use_special': bool(data.get('special', True)),
+        'exclude_ambiguous': bool(data.get('exclude_ambiguous', False)),
+    }
+
+
+def analyze_password_strength(password):
+    """Analyse la force d'un mot de passe"""
+    score = 0
+    feedback = []
+    
+    # Longueur
+    if len(password) >= 12:
+        score += 2
+        feedback.append("✓ Longueur excellente (12+ caractères)")
+    elif len(password) >= 8:
+        score += 1
+        feedback.append("✓ Longueur correcte (8+ caractères)")
+    else:
+        feedback.append("✗ Longueur insuffisante (moins de 8 caractères)")
+    
+    # Types de caractères
+    if any(c.islower() for c in password):
+        score += 1
+        feedback.append("✓ Contient des minuscules")
+    
+    if any(c.isupper() for c in password):
+        score += 1
+        feedback.append("✓ Contient des majuscules")
+    
+    if any(c.isdigit() for c in password):
+        score += 1
+        feedback.append("✓ Contient des chiffres")
+    
+    if any(c in SPECIAL_CHARS for c in password):
+        score += 1
+        feedback.append("✓ Contient des caractères spéciaux")
+    
+    # Évaluation finale
+    if score >= 5:
+        strength = "Très fort"
+        color = "success"
+    elif score >= 3:
+        strength = "Fort"
+        color = "warning"
+    elif score >= 2:
+        strength = "Moyen"
+        color = "info"
+    else:
+        strength = "Faible"
+        color = "danger"
+    
+    return {
+        'strength': strength,
+        'score': score,
+        'max_score': 6,
+        'color': color,
+        'feedback': feedback
+    }
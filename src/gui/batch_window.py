@@ -0,0 +1,241 @@
+"""
+Fenêtre de génération de mots de passe par lots.
+
+Les mots de passe sont générés (et analysés si demandé) dans un thread de
+travail, par blocs. Chaque bloc est ensuite affiché en une seule insertion
+dans le widget texte, étape planifiée par ``after`` : la boucle Tk reste
+réactive même pour des dizaines de milliers de lignes. L'export « vers un
+fichier » écrit directement depuis le thread de travail, sans passer par
+le widget, dans un fichier temporaire qui ne remplace le fichier choisi
+qu'une fois l'export terminé : un export annulé ou en échec ne laisse pas
+de fichier tronqué.
+"""
+
+import csv
+import io
+import tkinter as tk
+from collections import deque
+from pathlib import Path
+from tkinter import ttk, messagebox, filedialog
+from typing import Callable, Dict, List, Optional
+
+from utils.vault_storage import atomic_writer
+
+# Mots de passe générés (et analysés) par bloc dans le thread de travail
+GENERATION_CHUNK = 500
+
+# Délai entre deux blocs affichés, pour laisser passer les événements (ms)
+RENDER_INTERVAL_MS = 1
+
+MAX_BATCH_SIZE = 100000
+
+
+class BatchGenerationWindow:
+    """
+    Fenêtre de génération par lots, avec affichage progressif et export en flux.
+    """
+
+    def __init__(self, app, options: Dict, count: int = 5):
+        """
+        Args:
+            app: Application principale (générateur, analyseur, exécuteur,
+                presse-papiers)
+            options: Options de ``PasswordGenerator.generate_password``
+            count: Nombre de mots de passe proposé
+        """
+        self.app = app
+        self.options = options
+        self.passwords: List[str] = []
+        self.task = None
+        self._pending = deque()
+        self._render_scheduled = False
+
+        self.window = tk.Toplevel(app.root)
+        self.window.title("🔄 Mots de Passe Multiples")
+        self.window.geometry("650x500")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        frame = ttk.Frame(self.window, padding="20")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        controls = ttk.Frame(frame)
+        controls.pack(fill=tk.X, pady=(0, 10))
+
+        ttk.Label(controls, text="Nombre:").pack(side=tk.LEFT, padx=(0, 10))
+        self.count_var = tk.IntVar(value=count)
+        ttk.Spinbox(controls, from_=1, to=MAX_BATCH_SIZE, textvariable=self.count_var, width=8).pack(side=tk.LEFT)
+        self.analyze_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(controls, text="Analyser la force", variable=self.analyze_var).pack(side=tk.LEFT, padx=(10, 0))
+
+        ttk.Button(controls, text="🎲 Générer", command=self.generate).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Button(controls, text="💾 Générer vers un fichier…", command=self.export_to_file).pack(side=tk.LEFT, padx=(10, 0))
+
+        self.text_widget = tk.Text(frame, wrap=tk.NONE, font=('Courier', 11), state=tk.DISABLED)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.text_widget.yview)
+        self.text_widget.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_widget.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+
+        footer = ttk.Frame(frame)
+        footer.pack(fill=tk.X)
+        self.status_var = tk.StringVar()
+        ttk.Label(footer, textvariable=self.status_var).pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(footer, text="✖ Annuler", command=self.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT)
+        ttk.Button(footer, text="📋 Copier Tout", command=self.copy_all).pack(side=tk.RIGHT, padx=(0, 10))
+
+    def _read_count(self) -> Optional[int]:
+        try:
+            count = self.count_var.get()
+        except tk.TclError:
+            count = 0
+        if not 1 <= count <= MAX_BATCH_SIZE:
+            messagebox.showwarning("Attention", f"Le nombre doit être compris entre 1 et {MAX_BATCH_SIZE}.",
+                                   parent=self.window)
+            return None
+        return count
+
+    def _start(self, work: Callable, description: str, on_done: Callable) -> None:
+        self.cancel()
+        self.cancel_button.config(state=tk.NORMAL)
+        self.status_var.set(description)
+        self.task = self.app.executor.submit(
+            work,
+            on_done=on_done,
+            on_error=lambda e: messagebox.showerror("Erreur", f"Erreur lors de la génération: {e}",
+                                                    parent=self.window),
+            description=description
+        )
+
+    def generate(self) -> None:
+        """Génère le lot et l'affiche au fur et à mesure."""
+        count = self._read_count()
+        if count is None:
+            return
+
+        analyze = self.analyze_var.get()
+        self.passwords = []
+        self._pending.clear()
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.delete(1.0, tk.END)
+        self.text_widget.config(state=tk.DISABLED)
+
+        def work(task):
+            passwords = self.app.generator.iter_passwords(count, **self.options)
+            analyzer = self.app.analyzer if analyze else None
+            done = 0
+            while done < count:
+                task.check_cancelled()
+                chunk = [next(passwords) for _ in range(min(GENERATION_CHUNK, count - done))]
+                analyses = [analyzer.analyze_password(p) for p in chunk] if analyzer else None
+                task.post(self._queue_chunk, done, chunk, analyses)
+                done += len(chunk)
+                task.report_progress(done / count, f"{done} / {count} mots de passe générés…")
+            return count
+
+        self._start(work, "Génération des mots de passe…", lambda count: self._finished(f"{count} mots de passe"))
+
+    def export_to_file(self) -> None:
+        """Génère le lot directement dans un fichier, sans l'afficher."""
+        count = self._read_count()
+        if count is None:
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=self.window, title="Exporter les mots de passe",
+            defaultextension=".txt", filetypes=[("Texte", "*.txt"), ("CSV", "*.csv")]
+        )
+        if not path:
+            return
+
+        analyze = self.analyze_var.get()
+        as_csv = Path(path).suffix.lower() == ".csv"
+
+        def work(task):
+            passwords = self.app.generator.iter_passwords(count, **self.options)
+            analyzer = self.app.analyzer if analyze else None
+            with atomic_writer(path) as raw:
+                f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+                writer = csv.writer(f) if as_csv else None
+                if writer:
+                    writer.writerow(["password", "strength", "score"] if analyzer else ["password"])
+                done = 0
+                while done < count:
+                    task.check_cancelled()
+                    chunk = [next(passwords) for _ in range(min(GENERATION_CHUNK, count - done))]
+                    if writer:
+                        writer.writerows(self._csv_rows(chunk, analyzer))
+                    else:
+                        f.write("".join(f"{p}\n" for p in chunk))
+                    done += len(chunk)
+                    task.report_progress(done / count, f"{done} / {count} mots de passe exportés…")
+                f.flush()
+                f.detach()  # ``atomic_writer`` synchronise et ferme le fichier
+            return count
+
+        self._start(work, "Export des mots de passe…",
+                    lambda count: self._finished(f"{count} mots de passe exportés dans {Path(path).name}"))
+
+    @staticmethod
+    def _csv_rows(chunk: List[str], analyzer) -> List[List]:
+        if analyzer is None:
+            return [[p] for p in chunk]
+        rows = []
+        for password in chunk:
+            analysis = analyzer.analyze_password(password)
+            rows.append([password, analysis['strength'], analysis['score']])
+        return rows
+
+    def _queue_chunk(self, offset: int, chunk: List[str], analyses: Optional[List[Dict]]) -> None:
+        """Reçoit un bloc généré (thread Tk) et planifie son affichage."""
+        self.passwords.extend(chunk)
+        self._pending.append((offset, chunk, analyses))
+        if not self._render_scheduled:
+            self._render_scheduled = True
+            self.window.after(RENDER_INTERVAL_MS, self._render_next)
+
+    def _render_next(self) -> None:
+        """Affiche un bloc en une seule insertion, puis planifie le suivant."""
+        self._render_scheduled = False
+        if not self._pending or not self.window.winfo_exists():
+            return
+
+        offset, chunk, analyses = self._pending.popleft()
+        if analyses is None:
+            lines = [f"{offset + i}. {password}\n" for i, password in enumerate(chunk, 1)]
+        else:
+            lines = [
+                f"{offset + i}. {password}\n   Force: {analysis['strength']} (Score: {analysis['score']}/100)\n"
+                for i, (password, analysis) in enumerate(zip(chunk, analyses), 1)
+            ]
+
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.insert(tk.END, "".join(lines))
+        self.text_widget.config(state=tk.DISABLED)
+
+        if self._pending:
+            self._render_scheduled = True
+            self.window.after(RENDER_INTERVAL_MS, self._render_next)
+
+    def _finished(self, message: str) -> None:
+        self.task = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_var.set(f"✓ {message}")
+
+    def cancel(self) -> None:
+        """Annule la génération ou l'export en cours."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+            self.status_var.set("Annulé")
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def copy_all(self) -> None:
+        """Copie tous les mots de passe générés."""
+        if self.passwords:
+            self.app.copy_text('\n'.join(self.passwords))
+
+    def close(self) -> None:
+        """Ferme la fenêtre en annulant la tâche en cours."""
+        self.cancel()
+        self.window.destroy()
@@ -1,19 +1,26 @@
 """
 Interface graphique principale de SecurePassGen.
+
+Les modules coûteux (pile ``cryptography`` du coffre, analyseur de force,
+presse-papiers) ne sont importés qu'à leur première utilisation, le plus
+souvent dans un thread de travail : la fenêtre s'affiche sans les attendre.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import pyperclip
+from tkinter import ttk, messagebox, filedialog, simpledialog
 from pathlib import Path
 import sys
 import platform
+import threading
 
 # Import des modules locaux
 sys.path.append(str(Path(__file__).parent.parent))
 from core.password_generator import PasswordGenerator
-from core.password_strength import PasswordStrengthAnalyzer
-from utils.file_manager import PasswordFileManager
+from gui.task_executor import TaskExecutor
+from utils.startup_profile import startup_profiler
+
+# Nombre d'entrées transmises à la fenêtre des mots de passe à chaque page
+LOAD_PAGE_SIZE = 1000
 
 class SecurePassGenApp:
     """
@@ -22,37 +29,85 @@ class SecurePassGenApp:
     
     def __init__(self):
         print("Initializing SecurePassGenApp...")
-        self.root = tk.Tk()
+        with startup_profiler.phase("tk_root"):
+            self.root = tk.Tk()
         print("✓ Tkinter root created")
         
+        # Tâches longues (KDF, coffre, génération) hors de la boucle Tk
+        self.executor = TaskExecutor(self.root, on_progress=self._on_task_progress)
+        self.current_task = None
+        self._analysis_task = None
+        self._analysis_after = None
+        
+        # Analyseur et coffre sont créés à la première utilisation
         self.generator = PasswordGenerator()
-        self.analyzer = PasswordStrengthAnalyzer()
-        self.file_manager = PasswordFileManager()
+        self._analyzer = None
+        self._file_manager = None
+        self._lazy_lock = threading.Lock()
         print("✓ Core components initialized")
         
         # Configuration cross-platform
         print("Setting up cross-platform configuration...")
-        self.setup_cross_platform()
+        with startup_profiler.phase("cross_platform"):
+            self.setup_cross_platform()
         print("✓ Cross-platform setup complete")
         
         print("Setting up window...")
-        self.setup_window()
+        with startup_profiler.phase("window"):
+            self.setup_window()
         print("✓ Window setup complete")
         
         print("Setting up styles...")
-        self.setup_styles()
+        with startup_profiler.phase("styles"):
+            self.setup_styles()
         print("✓ Styles setup complete")
         
         print("Creating widgets...")
-        self.create_widgets()
+        with startup_profiler.phase("widgets"):
+            self.create_widgets()
         print("✓ Widgets created successfully")
         
-        print("✓ SecurePassGenApp initialization complete")
-        
-        # Forcer le rafraîchissement de l'affichage
-        self.root.update_idletasks()
-        self.root.update()
+        # L'affichage a lieu à l'entrée dans la boucle Tk, sans update() forcé
+        self.root.after_idle(self._on_first_idle)
         print("Application initialization complete!")
+    
+    def _on_first_idle(self):
+        """Appelé une fois la fenêtre affichée (fin du démarrage)."""
+        startup_profiler.mark("first_frame")
+        startup_profiler.report()
+    
+    @property
+    def analyzer(self):
+        """Analyseur de force, importé à la première analyse."""
+        with self._lazy_lock:
+            if self._analyzer is None:
+                from core.password_strength import PasswordStrengthAnalyzer
+                self._analyzer = PasswordStrengthAnalyzer()
+            return self._analyzer
+    
+    @property
+    def file_manager(self):
+        """Gestionnaire du coffre ; ``cryptography`` n'est importé qu'au premier accès."""
+        with self._lazy_lock:
+            if self._file_manager is None:
+                from utils.file_manager import PasswordFileManager
+                self._file_manager = PasswordFileManager(password_prompt=self._ask_master_password)
+            return self._file_manager
+    
+    def copy_text(self, text):
+        """
+        Copie du texte dans le presse-papiers.
+        
+        ``pyperclip`` n'est importé qu'à la première copie ; s'il est absent,
+        le presse-papiers de Tk est utilisé.
+        """
+        try:
+            import pyperclip
+        except ImportError:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
+            return
+        pyperclip.copy(text)
         
     def setup_cross_platform(self):
         """Configuration spécifique pour la compatibilité cross-platform."""
@@ -121,11 +176,6 @@ class SecurePassGenApp:
         except Exception as e:
             print(f"  Warning: Could not set icon: {e}")
             
-        print("  Final refresh...")
-        try:
-            self.root.update()
-        except Exception as e:
-            print(f"  Warning: Could not update: {e}")
     
     def setup_styles(self):
         """Configure les styles de l'interface."""
@@ -188,10 +238,6 @@ class SecurePassGenApp:
             self.root.rowconfigure(0, weight=1)
             main_frame.columnconfigure(1, weight=1)
             
-            print("  Updating display...")
-            # Forcer l'affichage du frame principal
-            self.root.update_idletasks()
-            
             row = 0
             
             print("  Creating title...")
@@ -304,9 +350,18 @@ class SecurePassGenApp:
             ttk.Button(save_button_frame, text="📂 Charger", command=self.load_passwords).pack(side=tk.LEFT, padx=(0, 10))
             ttk.Button(save_button_frame, text="📋 Voir Sauvegardés", command=self.view_saved_passwords).pack(side=tk.LEFT)
             
-            # Finaliser l'affichage
-            self.root.update_idletasks()
-            self.root.update()
+            # Barre d'état des tâches en arrière-plan
+            status_frame = ttk.Frame(main_frame)
+            status_frame.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+            status_frame.columnconfigure(0, weight=1)
+            row += 1
+            
+            self.status_var = tk.StringVar(value="Prêt")
+            ttk.Label(status_frame, textvariable=self.status_var).grid(row=0, column=0, sticky=tk.W)
+            self.progress_bar = ttk.Progressbar(status_frame, length=150, mode='indeterminate')
+            self.progress_bar.grid(row=0, column=1, padx=(10, 10))
+            self.cancel_button = ttk.Button(status_frame, text="✖ Annuler", command=self.cancel_current_task, state=tk.DISABLED)
+            self.cancel_button.grid(row=0, column=2)
             
         except Exception as e:
             # En cas d'erreur, afficher un message et créer une interface minimale
@@ -343,81 +398,66 @@ class SecurePassGenApp:
         except Exception:
             self.simple_result.set("Erreur de génération")
     
+    def _generation_options(self):
+        """Lit les options de génération (dans le thread Tk)."""
+        return dict(
+            length=self.length_var.get(),
+            use_lowercase=self.use_lowercase.get(),
+            use_uppercase=self.use_uppercase.get(),
+            use_digits=self.use_digits.get(),
+            use_special=self.use_special.get(),
+            exclude_ambiguous=self.exclude_ambiguous.get(),
+            custom_chars=self.custom_chars_var.get()
+        )
+    
+    def _show_error(self, message):
+        """Retourne un rappel d'erreur affichant ``message``."""
+        return lambda e: messagebox.showerror("Erreur", f"{message}: {e}")
+    
+    def _show_generated(self, password):
+        """Affiche un mot de passe généré et lance son analyse."""
+        self.result_var.set(password)
+        self.test_var.set(password)
+        self.analyze_password()
+    
     def generate_password(self):
         """Génère un nouveau mot de passe."""
         try:
-            password = self.generator.generate_password(
-                length=self.length_var.get(),
-                use_lowercase=self.use_lowercase.get(),
-                use_uppercase=self.use_uppercase.get(),
-                use_digits=self.use_digits.get(),
-                use_special=self.use_special.get(),
-                exclude_ambiguous=self.exclude_ambiguous.get(),
-                custom_chars=self.custom_chars_var.get()
-            )
-            self.result_var.set(password)
-            self.test_var.set(password)
-            self.analyze_password()
+            options = self._generation_options()
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de la génération: {e}")
+            return
+        
+        self.executor.submit(
+            lambda task: self.generator.generate_password(**options),
+            on_done=self._show_generated,
+            on_error=self._show_error("Erreur lors de la génération")
+        )
     
     def generate_passphrase(self):
         """Génère une phrase de passe."""
-        try:
-            passphrase = self.generator.generate_passphrase()
-            self.result_var.set(passphrase)
-            self.test_var.set(passphrase)
-            self.analyze_password()
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de la génération: {e}")
+        self.executor.submit(
+            lambda task: self.generator.generate_passphrase(),
+            on_done=self._show_generated,
+            on_error=self._show_error("Erreur lors de la génération")
+        )
     
     def generate_multiple(self):
-        """Génère plusieurs mots de passe."""
+        """Ouvre la génération par lots (5 mots de passe par défaut)."""
         try:
-            passwords = self.generator.generate_multiple(
-                count=5,
-                length=self.length_var.get(),
-                use_lowercase=self.use_lowercase.get(),
-                use_uppercase=self.use_uppercase.get(),
-                use_digits=self.use_digits.get(),
-                use_special=self.use_special.get(),
-                exclude_ambiguous=self.exclude_ambiguous.get(),
-                custom_chars=self.custom_chars_var.get()
-            )
-            
-            # Afficher dans une nouvelle fenêtre
-            self.show_multiple_passwords(passwords)
+            options = self._generation_options()
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de la génération: {e}")
-    
-    def show_multiple_passwords(self, passwords):
-        """Affiche plusieurs mots de passe dans une nouvelle fenêtre."""
-        window = tk.Toplevel(self.root)
-        window.title("🔄 Mots de Passe Multiples")
-        window.geometry("600x400")
-        
-        frame = ttk.Frame(window, padding="20")
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        ttk.Label(frame, text="Mots de passe générés:", font=('Arial', 12, 'bold')).pack(pady=(0, 10))
-        
-        text_widget = tk.Text(frame, wrap=tk.WORD, font=('Courier', 11))
-        text_widget.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        for i, password in enumerate(passwords, 1):
-            analysis = self.analyzer.analyze_password(password)
-            text_widget.insert(tk.END, f"{i}. {password}\n")
-            text_widget.insert(tk.END, f"   Force: {analysis['strength']} (Score: {analysis['score']}/100)\n\n")
-        
-        text_widget.config(state=tk.DISABLED)
+            return
         
-        ttk.Button(frame, text="📋 Copier Tout", command=lambda: pyperclip.copy('\n'.join(passwords))).pack()
+        from gui.batch_window import BatchGenerationWindow
+        BatchGenerationWindow(self, options).generate()
     
     def copy_to_clipboard(self):
         """Copie le résultat dans le presse-papiers."""
         password = self.result_var.get()
         if password:
-            pyperclip.copy(password)
+            self.copy_text(password)
             messagebox.showinfo("Succès", "Mot de passe copié dans le presse-papiers !")
         else:
             messagebox.showwarning("Attention", "Aucun mot de passe à copier.")
@@ -431,19 +471,35 @@ class SecurePassGenApp:
     
     def on_password_change(self, event=None):
         """Appelé quand le mot de passe de test change."""
-        # Auto-analyse après une courte pause
-        self.root.after(500, self.analyze_password)
+        # Auto-analyse après une courte pause (seule la dernière frappe compte)
+        if self._analysis_after is not None:
+            self.root.after_cancel(self._analysis_after)
+        self._analysis_after = self.root.after(500, self.analyze_password)
     
     def analyze_password(self):
         """Analyse le mot de passe de test."""
+        self._analysis_after = None
+        if self._analysis_task is not None:
+            self._analysis_task.cancel()  # Résultat devenu obsolète
+        
         password = self.test_var.get()
         if not password:
+            self.analysis_text.config(state=tk.NORMAL)
             self.analysis_text.delete(1.0, tk.END)
             return
         
-        analysis = self.analyzer.analyze_password(password)
+        self._analysis_task = self.executor.submit(
+            lambda task: self.analyzer.analyze_password(password),
+            on_done=self._show_analysis,
+            on_error=self._show_error("Erreur lors de l'analyse")
+        )
+    
+    def _show_analysis(self, analysis):
+        """Affiche le résultat d'une analyse."""
+        self._analysis_task = None
         
         # Effacer le texte précédent
+        self.analysis_text.config(state=tk.NORMAL)
         self.analysis_text.delete(1.0, tk.END)
         
         # Afficher les résultats
@@ -476,6 +532,48 @@ class SecurePassGenApp:
         }
         return colors.get(strength, "#34495e")
     
+    def _ask_master_password(self):
+        """Demande le mot de passe maître (appelé depuis une tâche du coffre)."""
+        return self.executor.call_in_main_thread(
+            lambda: simpledialog.askstring(
+                "Mot de passe maître",
+                "Entrez votre mot de passe maître pour chiffrer/déchiffrer:",
+                show='*', parent=self.root
+            )
+        )
+    
+    def _on_task_progress(self, task, fraction, text):
+        """Met à jour la barre d'état (dans le thread Tk)."""
+        if task is None:
+            self.current_task = None
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='indeterminate', value=0)
+            self.status_var.set("Prêt")
+            self.cancel_button.config(state=tk.DISABLED)
+            return
+        
+        if not task.description:
+            return  # Tâche brève (analyse, génération simple)
+        
+        if task is not self.current_task:
+            self.current_task = task
+            self.cancel_button.config(state=tk.NORMAL if task.cancellable else tk.DISABLED)
+        
+        self.status_var.set(text or task.description)
+        if fraction is None:
+            if self.progress_bar.cget('mode') != 'indeterminate':
+                self.progress_bar.config(mode='indeterminate', value=0)
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate', value=fraction * 100)
+    
+    def cancel_current_task(self):
+        """Annule la tâche affichée dans la barre d'état."""
+        if self.current_task is not None and self.current_task.cancel():
+            self.status_var.set("Annulation…")
+            self.cancel_button.config(state=tk.DISABLED)
+    
     def save_password(self):
         """Sauvegarde le mot de passe actuel."""
         password = self.result_var.get()
@@ -484,31 +582,73 @@ class SecurePassGenApp:
             return
         
         # Demander un nom/description
-        name = tk.simpledialog.askstring("Sauvegarde", "Nom/Description pour ce mot de passe:")
+        name = simpledialog.askstring("Sauvegarde", "Nom/Description pour ce mot de passe:")
         if name:
-            try:
-                self.file_manager.save_password(name, password)
-                messagebox.showinfo("Succès", "Mot de passe sauvegardé avec succès !")
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur lors de la sauvegarde: {e}")
+            # Une écriture validée ne peut pas être annulée
+            self.executor.submit(
+                lambda task: self.file_manager.save_password(name, password),
+                on_done=lambda _: messagebox.showinfo("Succès", "Mot de passe sauvegardé avec succès !"),
+                on_error=self._show_error("Erreur lors de la sauvegarde"),
+                description="Sauvegarde du mot de passe…",
+                cancellable=False
+            )
     
     def load_passwords(self):
-        """Charge les mots de passe sauvegardés."""
-        try:
-            passwords = self.file_manager.load_passwords()
-            if passwords:
-                self.show_saved_passwords(passwords)
-            else:
+        """Charge les mots de passe sauvegardés, page par page."""
+        from gui.password_index import PasswordIndex
+        index = PasswordIndex()
+        view = None
+        
+        def load(task):
+            total = 0
+            for page in self.file_manager.iter_pages(LOAD_PAGE_SIZE):
+                task.check_cancelled()
+                # Les mots de passe sont scellés avant de quitter le thread de travail
+                rows = index.seal(page)
+                total += len(rows)
+                task.post(add_page, rows)
+                task.report_progress(text=f"{total} mots de passe chargés…")
+            return total
+        
+        def add_page(rows):
+            nonlocal view
+            if view is None:
+                view = self.show_saved_passwords(index, task)
+            if view.winfo_exists():
+                view.append_rows(index.extend(rows))
+                view.event_generate('<<RowsChanged>>')
+        
+        def done(total):
+            if not total:
                 messagebox.showinfo("Information", "Aucun mot de passe sauvegardé trouvé.")
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors du chargement: {e}")
+        
+        task = self.executor.submit(
+            load,
+            on_done=done,
+            on_error=self._show_error("Erreur lors du chargement"),
+            description="Chargement du coffre…"
+        )
     
     def view_saved_passwords(self):
         """Affiche les mots de passe sauvegardés."""
         self.load_passwords()
     
-    def show_saved_passwords(self, passwords):
-        """Affiche les mots de passe sauvegardés dans une nouvelle fenêtre."""
+    def show_saved_passwords(self, index, loading_task=None):
+        """
+        Affiche les mots de passe sauvegardés dans une nouvelle fenêtre.
+        
+        Seules les lignes visibles sont créées ; les mots de passe restent
+        scellés dans ``index`` tant qu'ils ne sont ni affichés ni copiés.
+        
+        Args:
+            index: Index (``PasswordIndex``) en cours de remplissage
+            loading_task: Tâche de chargement, annulée à la fermeture
+            
+        Returns:
+            La liste virtualisée
+        """
+        from gui.virtual_list import VirtualPasswordList
+        
         window = tk.Toplevel(self.root)
         window.title("💾 Mots de Passe Sauvegardés")
         window.geometry("700x500")
@@ -518,52 +658,80 @@ class SecurePassGenApp:
         
         ttk.Label(frame, text="Mots de passe sauvegardés:", font=('Arial', 12, 'bold')).pack(pady=(0, 10))
         
-        # Treeview pour afficher les mots de passe
-        columns = ('Name', 'Password', 'Date')
-        tree = ttk.Treeview(frame, columns=columns, show='headings', height=15)
+        # Recherche au fil de la frappe (nom et description)
+        search_frame = ttk.Frame(frame)
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(search_frame, text="🔍 Rechercher:").pack(side=tk.LEFT, padx=(0, 10))
+        search_var = tk.StringVar()
+        ttk.Entry(search_frame, textvariable=search_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        count_var = tk.StringVar()
+        ttk.Label(search_frame, textvariable=count_var).pack(side=tk.LEFT, padx=(10, 0))
         
-        tree.heading('Name', text='Nom/Description')
-        tree.heading('Password', text='Mot de passe')
-        tree.heading('Date', text='Date de création')
+        view = VirtualPasswordList(frame, index, on_activate=lambda i: view.toggle_reveal(i))
+        view.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        tree.column('Name', width=200)
-        tree.column('Password', width=300)
-        tree.column('Date', width=150)
+        def update_count(event=None):
+            count_var.set(f"{len(view.rows)} / {len(index)}")
         
-        for entry in passwords:
-            tree.insert('', tk.END, values=(entry['name'], entry['password'], entry['date']))
+        def filter_rows(*args):
+            view.set_rows(index.search(search_var.get()))
+            update_count()
         
-        tree.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        search_var.trace_add('write', filter_rows)
+        view.bind('<<RowsChanged>>', update_count)
         
         # Boutons
         button_frame = ttk.Frame(frame)
         button_frame.pack()
         
+        def reveal_selected():
+            if view.selected is not None:
+                view.toggle_reveal(view.selected)
+        
         def copy_selected():
-            selection = tree.selection()
-            if selection:
-                item = tree.item(selection[0])
-                password = item['values'][1]
-                pyperclip.copy(password)
+            if view.selected is not None:
+                # Déchiffré uniquement au moment de la copie
+                self.copy_text(index.reveal(view.selected))
                 messagebox.showinfo("Succès", "Mot de passe copié !")
         
+        def close():
+            if loading_task is not None:
+                loading_task.cancel()
+            window.destroy()
+        
+        window.protocol("WM_DELETE_WINDOW", close)
+        
+        ttk.Button(button_frame, text="👁️ Afficher/Masquer", command=reveal_selected).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="📋 Copier Sélectionné", command=copy_selected).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="🗑️ Supprimer Tout", command=lambda: self.clear_saved_passwords(window)).pack(side=tk.LEFT)
+        
+        return view
     
     def clear_saved_passwords(self, parent_window):
         """Supprime tous les mots de passe sauvegardés."""
         if messagebox.askyesno("Confirmation", "Êtes-vous sûr de vouloir supprimer tous les mots de passe sauvegardés ?"):
-            try:
-                self.file_manager.clear_passwords()
+            def done(_):
                 messagebox.showinfo("Succès", "Tous les mots de passe ont été supprimés.")
                 parent_window.destroy()
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur lors de la suppression: {e}")
+            
+            self.executor.submit(
+                lambda task: self.file_manager.clear_passwords(),
+                on_done=done,
+                on_error=self._show_error("Erreur lors de la suppression"),
+                description="Suppression des mots de passe…",
+                cancellable=False
+            )
+    
+    def _on_close(self):
+        """Ferme la fenêtre en abandonnant les tâches en attente."""
+        self.executor.shutdown()
+        self.root.destroy()
     
     def run(self):
         """Lance l'application."""
         try:
             print("Starting application run...")
+            self.root.protocol("WM_DELETE_WINDOW", self._on_close)
             
             # Configuration spéciale pour macOS
             if sys.platform == "darwin":
@@ -0,0 +1,120 @@
+"""
+Index en mémoire des mots de passe affichés par l'interface.
+
+Le coffre est chargé page par page ; chaque page est ajoutée à l'index dont
+les mots de passe restent scellés (chiffrés avec une clé de session
+aléatoire, jamais écrite sur disque). Un mot de passe n'est déchiffré que
+lorsque sa ligne est affichée en clair ou copiée.
+
+La recherche porte sur le nom et la description (sous-chaîne, sans
+distinction de casse). Lorsque la requête prolonge la précédente (frappe
+d'un caractère supplémentaire), seuls les résultats précédents sont
+réexaminés.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple
+
+from cryptography.fernet import Fernet
+
+
+class IndexedEntry(NamedTuple):
+    """Ligne de l'index : métadonnées en clair, mot de passe scellé."""
+    name: str
+    description: str
+    date: str
+    sealed_password: bytes
+
+
+class PasswordIndex:
+    """
+    Index des entrées du coffre avec recherche incrémentale.
+
+    ``seal`` peut être appelé depuis un thread de travail ; les autres
+    méthodes sont destinées au thread Tk.
+    """
+
+    def __init__(self):
+        self._fernet = Fernet(Fernet.generate_key())
+        self.entries: List[IndexedEntry] = []
+        self._haystacks: List[str] = []
+        self._query = ""
+        self._matches: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def seal(self, page: Iterable[Dict]) -> List[IndexedEntry]:
+        """
+        Scelle les mots de passe d'une page d'entrées du coffre.
+
+        Args:
+            page: Entrées (``name``, ``password``, ``description``, ``date``)
+
+        Returns:
+            Lignes prêtes à être ajoutées avec ``extend``
+        """
+        return [
+            IndexedEntry(entry['name'], entry.get('description', ""), entry.get('date', ""),
+                         self._fernet.encrypt(entry['password'].encode('utf-8')))
+            for entry in page
+        ]
+
+    def extend(self, rows: List[IndexedEntry]) -> List[int]:
+        """
+        Ajoute des lignes scellées (la recherche en cours les prend en compte).
+
+        Args:
+            rows: Lignes produites par ``seal``
+
+        Returns:
+            Indices des nouvelles lignes correspondant à la recherche en cours
+        """
+        start = len(self.entries)
+        self.entries.extend(rows)
+        self._haystacks.extend(f"{row.name}\n{row.description}".lower() for row in rows)
+        if not self._query:
+            return list(range(start, len(self.entries)))
+
+        query = self._query
+        haystacks = self._haystacks
+        new_matches = [i for i in range(start, len(haystacks)) if query in haystacks[i]]
+        self._matches.extend(new_matches)
+        return new_matches
+
+    def search(self, query: str) -> List[int]:
+        """
+        Filtre les lignes dont le nom ou la description contient ``query``.
+
+        Args:
+            query: Texte recherché (vide : toutes les lignes)
+
+        Returns:
+            Indices des lignes correspondantes, dans l'ordre du coffre
+        """
+        query = query.lower()
+        if not query:
+            self._query = ""
+            self._matches = []
+            return list(range(len(self.entries)))
+
+        haystacks = self._haystacks
+        if self._query and query.startswith(self._query):
+            candidates = self._matches  # Affinage : les résultats précédents suffisent
+        else:
+            candidates = range(len(haystacks))
+
+        self._query = query
+        self._matches = [i for i in candidates if query in haystacks[i]]
+        return list(self._matches)
+
+    def reveal(self, index: int) -> str:
+        """
+        Déchiffre le mot de passe d'une ligne.
+
+        Args:
+            index: Indice de la ligne dans l'index
+
+        Returns:
+            Mot de passe en clair
+        """
+        return self._fernet.decrypt(self.entries[index].sealed_password).decode('utf-8')
@@ -0,0 +1,269 @@
+"""
+Exécution des tâches longues de l'interface hors de la boucle Tk.
+
+Tkinter n'est pas thread-safe : seules les fonctions du thread principal
+peuvent toucher aux widgets. ``TaskExecutor`` exécute les tâches (dérivation
+de clé, accès au coffre, génération, analyse) dans un pool de threads et
+rapporte progression et résultats au thread principal via une file,
+relevée périodiquement par ``root.after``.
+"""
+
+import queue
+import sys
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Intervalle de relève de la file des résultats (ms)
+POLL_INTERVAL_MS = 30
+
+
+class TaskCancelled(Exception):
+    """Levée dans une tâche qui constate son annulation."""
+
+
+class Task:
+    """
+    Tâche soumise à un ``TaskExecutor``.
+
+    La fonction exécutée reçoit la tâche en premier argument : elle peut
+    signaler sa progression avec ``report_progress`` et doit consulter
+    ``cancelled`` (ou appeler ``check_cancelled``) entre deux étapes.
+    L'annulation est coopérative : une tâche annulée n'est pas interrompue,
+    mais son résultat est ignoré.
+    """
+
+    def __init__(self, executor: "TaskExecutor", description: str, cancellable: bool):
+        self.executor = executor
+        self.description = description
+        self.cancellable = cancellable
+        self._cancel_event = threading.Event()
+        self._finished = False
+        self.future: Optional[Future] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Indique si l'annulation a été demandée."""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> bool:
+        """
+        Demande l'annulation de la tâche.
+
+        Returns:
+            True si la demande a été prise en compte
+        """
+        if not self.cancellable:
+            return False
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()  # Sans effet si la tâche a démarré
+        return True
+
+    def check_cancelled(self) -> None:
+        """Lève ``TaskCancelled`` si l'annulation a été demandée."""
+        if self.cancelled:
+            raise TaskCancelled(self.description)
+
+    def report_progress(self, fraction: Optional[float] = None, text: str = "") -> None:
+        """
+        Signale la progression (appelable depuis le thread de la tâche).
+
+        Args:
+            fraction: Avancement entre 0 et 1 (None si inconnu)
+            text: Message d'état
+        """
+        self.executor._post(self.executor._progress, self, fraction, text)
+
+    def post(self, callback: Callable[..., Any], *args) -> None:
+        """
+        Exécute ``callback(*args)`` dans le thread Tk, sans attendre.
+
+        Permet de livrer des résultats partiels (pages chargées) ; ignoré
+        si la tâche a été annulée entre-temps.
+        """
+        self.executor._post(lambda: None if self.cancelled else callback(*args))
+
+
+class TaskExecutor:
+    """
+    Pool de threads dont les rappels sont exécutés dans le thread Tk.
+
+    Exemple::
+
+        executor = TaskExecutor(root)
+        executor.submit(lambda task: manager.load_passwords(),
+                        on_done=afficher, on_error=signaler,
+                        description="Chargement du coffre")
+    """
+
+    def __init__(self, root, max_workers: int = 2,
+                 on_progress: Optional[Callable[[Optional[Task], Optional[float], str], None]] = None):
+        """
+        Args:
+            root: Fenêtre Tk (seules ses méthodes ``after`` et
+                ``report_callback_exception`` sont utilisées)
+            max_workers: Nombre de threads du pool
+            on_progress: Rappel ``(tâche, fraction, texte)`` exécuté dans le
+                thread Tk à chaque étape ; tâche à None quand plus rien ne
+                s'exécute
+        """
+        self.root = root
+        self.on_progress = on_progress
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="securepassgen")
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        self._main_thread = threading.current_thread()
+        self._pending = 0
+        self._polling = False
+        self._closed = False
+        self._main_calls = set()
+
+    def submit(self, function: Callable[[Task], Any],
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               description: str = "", cancellable: bool = True) -> Task:
+        """
+        Exécute ``function(task)`` dans le pool (à appeler depuis le thread Tk).
+
+        Args:
+            function: Fonction à exécuter, recevant la tâche
+            on_done: Rappel recevant le résultat, dans le thread Tk
+            on_error: Rappel recevant l'exception, dans le thread Tk
+            description: Libellé affiché pendant l'exécution
+            cancellable: Si faux, ``cancel`` est sans effet (écritures)
+
+        Returns:
+            La tâche soumise
+        """
+        task = Task(self, description, cancellable)
+
+        def run():
+            try:
+                if task.cancelled:
+                    return
+                result = function(task)
+            except TaskCancelled:
+                return
+            except Exception as e:
+                if not task.cancelled:
+                    self._post(on_error, e)
+            else:
+                if not task.cancelled:
+                    self._post(on_done, result)
+            finally:
+                self._post(self._finished, task)
+
+        self._pending += 1
+        self._progress(task, None, description)
+        task.future = self._pool.submit(run)
+        task.future.add_done_callback(
+            lambda future: future.cancelled() and self._post(self._finished, task)
+        )
+        self._schedule_poll()
+        return task
+
+    def call_in_main_thread(self, function: Callable[..., Any], *args) -> Any:
+        """
+        Exécute ``function`` dans le thread Tk et attend son résultat.
+
+        Permet à une tâche d'ouvrir une boîte de dialogue (mot de passe
+        maître) ; appelée depuis le thread Tk, la fonction est exécutée
+        directement.
+
+        Returns:
+            Le résultat de ``function``
+
+        Raises:
+            TaskCancelled: Si l'exécuteur est arrêté avant l'appel
+        """
+        if threading.current_thread() is self._main_thread:
+            return function(*args)
+
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+
+        def call():
+            try:
+                result = function(*args)
+            except BaseException as e:
+                self._resolve(future, exception=e)
+            else:
+                self._resolve(future, result=result)
+
+        self._main_calls.add(future)
+        try:
+            if self._closed:
+                raise TaskCancelled("Application fermée")
+            self._post(call)
+            return future.result()
+        finally:
+            self._main_calls.discard(future)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Arrête le pool (les tâches en attente sont abandonnées).
+
+        Args:
+            wait: Attendre la fin des tâches en cours
+        """
+        self._closed = True
+        # Débloquer les tâches qui attendent une boîte de dialogue
+        for future in list(self._main_calls):
+            self._resolve(future, exception=TaskCancelled("Application fermée"))
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    @staticmethod
+    def _resolve(future: Future, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass  # Déjà résolu (arrêt concurrent)
+
+    def _post(self, callback: Optional[Callable], *args) -> None:
+        """Transmet un rappel au thread Tk (appelable depuis tout thread)."""
+        if callback is not None:
+            self._results.put((callback, args))
+
+    def _schedule_poll(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """
+        Exécute les rappels en attente, dans le thread Tk.
+
+        L'erreur d'un rappel (widget détruit entre-temps) est signalée par
+        ``report_callback_exception`` sans empêcher les rappels suivants ni
+        la relève suivante : une tâche peut attendre l'un d'eux
+        (``call_in_main_thread``).
+        """
+        self._polling = False
+        try:
+            while True:
+                try:
+                    callback, args = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(*args)
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            if self._pending > 0:
+                self._schedule_poll()
+
+    def _progress(self, task: Optional[Task], fraction: Optional[float], text: str) -> None:
+        if self.on_progress is not None and (task is None or not task.cancelled):
+            self.on_progress(task, fraction, text)
+
+    def _finished(self, task: Task) -> None:
+        if task._finished:
+            return  # Déjà comptée
+        task._finished = True
+        self._pending -= 1
+        if self._pending == 0:
+            self._progress(None, None, "")
@@ -0,0 +1,189 @@
+"""
+Liste virtualisée des mots de passe sauvegardés.
+
+Un ``ttk.Treeview`` ne supporte pas des dizaines de milliers de lignes :
+chaque ``insert`` crée un élément Tk. ``VirtualPasswordList`` ne crée que
+les lignes visibles et les remplace au défilement ; la barre de défilement
+est pilotée à partir du nombre total de lignes filtrées.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+from gui.password_index import PasswordIndex
+
+MASKED_PASSWORD = "••••••••"
+
+# Hauteur d'une ligne si le thème ne la précise pas (pixels)
+DEFAULT_ROW_HEIGHT = 20
+
+# Hauteur de la ligne d'en-têtes (pixels)
+HEADING_HEIGHT = 25
+
+
+class VirtualPasswordList(ttk.Frame):
+    """
+    Vue des lignes d'un ``PasswordIndex`` ne matérialisant que les lignes visibles.
+    """
+
+    def __init__(self, parent, index: PasswordIndex, on_activate: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            parent: Widget parent
+            index: Index des entrées à afficher
+            on_activate: Rappel recevant l'indice d'une ligne double-cliquée
+        """
+        super().__init__(parent)
+        self.index = index
+        self.on_activate = on_activate
+        self.rows: List[int] = []  # Indices (dans l'index) des lignes filtrées
+        self.revealed = set()
+        self.first = 0
+        self.visible_count = 15
+        self.selected: Optional[int] = None
+
+        style = ttk.Style()
+        try:
+            self.row_height = int(style.lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        except (TypeError, ValueError):
+            self.row_height = DEFAULT_ROW_HEIGHT
+
+        columns = ('Name', 'Password', 'Date')
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', height=self.visible_count,
+                                 selectmode='browse')
+        self.tree.heading('Name', text='Nom/Description')
+        self.tree.heading('Password', text='Mot de passe')
+        self.tree.heading('Date', text='Date de création')
+        self.tree.column('Name', width=200)
+        self.tree.column('Password', width=300)
+        self.tree.column('Date', width=150)
+
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Double-1>', self._on_double_click)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self.visible_count))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self.visible_count))
+
+    def set_rows(self, rows: List[int]) -> None:
+        """
+        Remplace les lignes affichées (nouveau filtre) et revient en haut.
+
+        Args:
+            rows: Indices des lignes, dans l'ordre d'affichage
+        """
+        self.rows = rows
+        self.first = 0
+        if self.selected is not None and self.selected not in set(rows):
+            self.selected = None
+        self.render()
+
+    def append_rows(self, rows: List[int]) -> None:
+        """
+        Ajoute des lignes en fin de liste sans déplacer la vue (chargement).
+
+        Args:
+            rows: Indices des nouvelles lignes
+        """
+        self.rows.extend(rows)
+        if self.first + self.visible_count > len(self.rows) - len(rows):
+            self.render()  # La fin de liste est visible
+        else:
+            self._update_scrollbar()
+
+    def toggle_reveal(self, index: int) -> None:
+        """Affiche ou masque le mot de passe d'une ligne."""
+        if index in self.revealed:
+            self.revealed.discard(index)
+        else:
+            self.revealed.add(index)
+        self.render()
+
+    def scroll(self, delta: int) -> None:
+        """Fait défiler la vue de ``delta`` lignes."""
+        self._scroll_to(self.first + delta)
+
+    def render(self) -> None:
+        """Recrée les seules lignes visibles."""
+        self.tree.delete(*self.tree.get_children())
+
+        for index in self.rows[self.first:self.first + self.visible_count]:
+            entry = self.index.entries[index]
+            password = self.index.reveal(index) if index in self.revealed else MASKED_PASSWORD
+            self.tree.insert('', tk.END, iid=str(index), values=(entry.name, password, entry.date))
+
+        if self.selected is not None and self.tree.exists(str(self.selected)):
+            self.tree.selection_set(str(self.selected))
+        self._update_scrollbar()
+
+    def _scroll_to(self, first: int) -> None:
+        first = max(0, min(first, len(self.rows) - self.visible_count))
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def _update_scrollbar(self) -> None:
+        total = len(self.rows)
+        if total <= self.visible_count:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.visible_count) / total)
+
+    def _on_scrollbar(self, action, *args) -> None:
+        if action == 'moveto':
+            self._scroll_to(round(float(args[0]) * len(self.rows)))
+        elif action == 'scroll':
+            amount = int(args[0])
+            if args[1] == 'pages':
+                amount *= self.visible_count
+            self.scroll(amount)
+
+    def _on_resize(self, event) -> None:
+        count = max(1, (event.height - HEADING_HEIGHT) // self.row_height)
+        if count != self.visible_count:
+            self.visible_count = count
+            self._scroll_to(self.first)
+            self.render()
+
+    def _on_mousewheel(self, event) -> None:
+        self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_select(self, event=None) -> None:
+        selection = self.tree.selection()
+        if selection:
+            self.selected = int(selection[0])
+
+    def _on_double_click(self, event) -> None:
+        item = self.tree.identify_row(event.y)
+        if item and self.on_activate is not None:
+            self.on_activate(int(item))
+
+    def _move_selection(self, delta: int) -> str:
+        """Déplace la sélection au clavier, en faisant défiler si besoin."""
+        if not self.rows:
+            return "break"
+
+        try:
+            position = self.rows.index(self.selected) + delta
+        except ValueError:
+            position = self.first
+        position = max(0, min(position, len(self.rows) - 1))
+
+        if position < self.first:
+            self._scroll_to(position)
+        elif position >= self.first + self.visible_count:
+            self._scroll_to(position - self.visible_count + 1)
+
+        self.selected = self.rows[position]
+        self.render()
+        self.tree.focus(str(self.selected))
+        return "break"
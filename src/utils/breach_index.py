@@ -0,0 +1,168 @@
+"""
+Index de mots de passe compromis, projeté en mémoire.
+
+Un index contient les empreintes de mots de passe (64 premiers bits du SHA-1
+de leur encodage UTF-8, comme les listes « Have I Been Pwned »), triées, dans
+un fichier binaire :
+
+    ``SPGB`` | version (u8) | taille d'enregistrement (u8) | 2 octets nuls
+    | nombre d'empreintes (u64, petit-boutiste) | empreintes (u64, petit-boutiste)
+
+Le fichier est ouvert avec ``mmap`` : plusieurs processus qui ouvrent le
+même index partagent les pages du cache du système au lieu d'en charger
+chacun une copie, et seules les pages visitées par la recherche
+dichotomique sont lues. 64 bits suffisent : la probabilité d'un faux
+positif est de l'ordre de n / 2^64.
+
+Construction (la liste source peut contenir des mots de passe en clair, un
+par ligne, ou des lignes ``SHA1:compte`` au format HIBP) :
+
+    build_breach_index("rockyou.txt", "data/breached.idx")
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterable, Union
+
+INDEX_MAGIC = b"SPGB"
+INDEX_VERSION = 1
+RECORD_SIZE = 8
+
+_INDEX_HEADER = struct.Struct("<4sBB2xQ")
+
+_HEX_DIGITS = frozenset(b"0123456789abcdefABCDEF")
+
+
+def password_key(password: Union[str, bytes]) -> int:
+    """Empreinte 64 bits d'un mot de passe (début de son SHA-1)."""
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    return int.from_bytes(hashlib.sha1(password).digest()[:RECORD_SIZE], "big")
+
+
+def _line_key(line: bytes) -> int:
+    """Empreinte d'une ligne source : ``SHA1[:compte]`` (HIBP) ou mot de passe en clair."""
+    if len(line) >= 40 and (len(line) == 40 or line[40:41] == b":") and _HEX_DIGITS.issuperset(line[:40]):
+        return int(line[:2 * RECORD_SIZE], 16)
+    return password_key(line)
+
+
+def write_breach_index(keys: Iterable[int], f: BinaryIO) -> int:
+    """
+    Écrit un index à partir d'empreintes quelconques (triées et dédoublonnées ici).
+
+    Returns:
+        Nombre d'empreintes écrites
+    """
+    records = array("Q", sorted(set(keys)))
+    if sys.byteorder != "little":
+        records.byteswap()
+    f.write(_INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, RECORD_SIZE, len(records)))
+    records.tofile(f)
+    return len(records)
+
+
+def build_breach_index(source: Union[str, Path], index_path: Union[str, Path]) -> int:
+    """
+    Construit un index à partir d'une liste de mots de passe ou d'empreintes.
+
+    Les empreintes sont triées en mémoire (8 octets par entrée, plus la
+    structure de tri) ; pour les très grandes listes, construire des index
+    partiels et les fusionner en amont.
+
+    Args:
+        source: Fichier texte, un mot de passe ou une ligne ``SHA1:compte`` par ligne
+        index_path: Fichier d'index à écrire (remplacé de manière atomique)
+
+    Returns:
+        Nombre d'empreintes distinctes
+    """
+    from utils.vault_storage import atomic_writer
+
+    def keys():
+        with open(source, "rb") as f:
+            for line in f:
+                line = line.rstrip(b"\r\n")
+                if line:
+                    yield _line_key(line)
+
+    with atomic_writer(index_path) as f:
+        return write_breach_index(keys(), f)
+
+
+class BreachIndex:
+    """
+    Index ouvert en lecture seule, projeté en mémoire.
+
+    Utilisable comme un ensemble : ``password in index``. Un processus de
+    travail qui ouvre le même fichier partage les pages déjà chargées.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header = f.read(_INDEX_HEADER.size)
+            if len(header) < _INDEX_HEADER.size:
+                raise ValueError(f"Index tronqué : {self.path}")
+            magic, version, record_size, count = _INDEX_HEADER.unpack(header)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"Index de mots de passe non reconnu : {self.path}")
+            if os.fstat(f.fileno()).st_size != _INDEX_HEADER.size + count * RECORD_SIZE:
+                raise ValueError(f"Index tronqué : {self.path}")
+            self._count = count
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if count else None
+
+        if self._mmap is None:
+            self._keys = ()
+        elif sys.byteorder == "little":
+            self._keys = memoryview(self._mmap)[_INDEX_HEADER.size:].cast("Q")
+        else:
+            # Hôte gros-boutiste : décodage à la volée (même recherche dichotomique)
+            self._keys = _SwappedKeys(self._mmap, count)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def contains_key(self, key: int) -> bool:
+        """Vrai si l'empreinte ``key`` (voir ``password_key``) est dans l'index."""
+        position = bisect.bisect_left(self._keys, key)
+        return position < self._count and self._keys[position] == key
+
+    def __contains__(self, password: Union[str, bytes]) -> bool:
+        return self.contains_key(password_key(password))
+
+    def close(self) -> None:
+        if isinstance(self._keys, memoryview):
+            self._keys.release()
+        self._keys = ()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _SwappedKeys:
+    """Vue séquence des empreintes petit-boutistes, pour ``bisect`` sur un hôte gros-boutiste."""
+
+    def __init__(self, buffer: mmap.mmap, count: int):
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        offset = _INDEX_HEADER.size + index * RECORD_SIZE
+        return int.from_bytes(self._buffer[offset:offset + RECORD_SIZE], "little")
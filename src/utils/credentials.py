@@ -0,0 +1,216 @@
+"""
+Fournisseurs du mot de passe maître du coffre.
+
+``PasswordFileManager`` obtient le mot de passe maître d'un fournisseur :
+n'importe quel appelable sans argument qui retourne le mot de passe (ou
+None). Ce module en propose un pour chaque contexte :
+
+- ``EnvironmentProvider`` : variable d'environnement (serveurs, CI) ;
+- ``FileProvider`` : fichier local lisible par son seul propriétaire, à la
+  manière d'un trousseau ;
+- ``StdinProvider`` : saisie au terminal, ou ligne lue sur l'entrée
+  standard quand elle est redirigée ;
+- ``TkDialogProvider`` : boîte de dialogue Tk, chargée à son premier appel ;
+- ``CachedProvider`` : garde le mot de passe le temps d'une session ;
+- ``ChainProvider`` : le premier fournisseur qui donne un mot de passe.
+
+Une fonction quelconque (la boîte de dialogue d'une application, par
+exemple) est aussi un fournisseur. ``default_provider()`` n'utilise Tk que
+si aucune autre source n'est disponible et qu'un affichage existe :
+
+    manager = PasswordFileManager("data", password_prompt=CachedProvider(default_provider()))
+
+Un fournisseur peut définir ``forget()`` : le coffre l'appelle lorsque le
+mot de passe fourni est refusé, pour qu'un cache ne le redonne pas.
+"""
+
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional, TextIO, Union
+
+MASTER_PASSWORD_ENV_VAR = "SECUREPASSGEN_MASTER_PASSWORD"
+PASSWORD_FILE_ENV_VAR = "SECUREPASSGEN_PASSWORD_FILE"
+
+DEFAULT_PROMPT = "Mot de passe maître : "
+
+Provider = Callable[[], Optional[str]]
+
+
+class CredentialProvider(ABC):
+    """Fournisseur de mot de passe maître (appelable)."""
+
+    @abstractmethod
+    def __call__(self) -> Optional[str]:
+        """Retourne le mot de passe maître, ou None s'il n'est pas disponible."""
+
+    def forget(self) -> None:
+        """Oublie un mot de passe refusé (rien à oublier par défaut)."""
+
+
+class EnvironmentProvider(CredentialProvider):
+    """Mot de passe lu dans une variable d'environnement."""
+
+    def __init__(self, variable: str = MASTER_PASSWORD_ENV_VAR):
+        self.variable = variable
+
+    def __call__(self) -> Optional[str]:
+        return os.environ.get(self.variable) or None
+
+
+class FileProvider(CredentialProvider):
+    """
+    Mot de passe lu dans la première ligne d'un fichier local.
+
+    Comme pour une clé SSH, le fichier est refusé s'il est accessible au
+    groupe ou aux autres utilisateurs (POSIX).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def __call__(self) -> Optional[str]:
+        if os.name == "posix" and self.path.stat().st_mode & 0o077:
+            raise PermissionError(f"{self.path} est accessible à d'autres utilisateurs (chmod 600)")
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.readline().rstrip("\r\n") or None
+
+    def store(self, password: str) -> None:
+        """Enregistre le mot de passe dans le fichier, lisible par son seul propriétaire."""
+        fd = os.open(str(self.path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(password + "\n")
+        if os.name == "posix":
+            os.chmod(self.path, 0o600)  # Fichier existant créé avec d'autres droits
+
+
+class StdinProvider(CredentialProvider):
+    """
+    Saisie au terminal (sans écho), ou ligne lue sur un flux redirigé
+    (``echo "$MOT_DE_PASSE" | securepassgen.py vault list``).
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, prompt: str = DEFAULT_PROMPT):
+        self.stream = stream
+        self.prompt = prompt
+
+    def __call__(self) -> Optional[str]:
+        stream = self.stream or sys.stdin
+        if stream.isatty():
+            import getpass
+            return getpass.getpass(self.prompt) or None
+        return stream.readline().rstrip("\r\n") or None
+
+
+class TkDialogProvider(CredentialProvider):
+    """
+    Boîte de dialogue Tk. Tk n'est importé qu'au premier appel ; sans
+    fenêtre parente, une racine cachée est créée puis détruite.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+
+    def __call__(self) -> Optional[str]:
+        import tkinter as tk
+        from tkinter import simpledialog
+
+        root = None
+        if self.parent is None:
+            root = tk.Tk()
+            root.withdraw()  # Cacher la fenêtre principale
+        try:
+            return simpledialog.askstring(
+                "Mot de passe maître",
+                "Entrez votre mot de passe maître pour chiffrer/déchiffrer:",
+                show='*', parent=self.parent or root
+            ) or None
+        finally:
+            if root is not None:
+                root.destroy()
+
+
+class CachedProvider(CredentialProvider):
+    """
+    Garde le mot de passe donné par un autre fournisseur pendant une
+    session (``ttl`` secondes, ou jusqu'à ``forget()``).
+    """
+
+    def __init__(self, provider: Provider, ttl: Optional[float] = None):
+        self.provider = provider
+        self.ttl = ttl
+        self._password: Optional[str] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Optional[str]:
+        with self._lock:
+            if self._password is not None and (self.ttl is None or time.monotonic() < self._expires):
+                return self._password
+            password = self.provider()
+            if password:
+                self._password = password
+                self._expires = time.monotonic() + (self.ttl or 0.0)
+            return password
+
+    def forget(self) -> None:
+        with self._lock:
+            self._password = None
+        _forget(self.provider)
+
+
+class ChainProvider(CredentialProvider):
+    """Essaie des fournisseurs dans l'ordre ; le premier mot de passe non vide l'emporte."""
+
+    def __init__(self, *providers: Provider):
+        self.providers = providers
+
+    def __call__(self) -> Optional[str]:
+        for provider in self.providers:
+            password = provider()
+            if password:
+                return password
+        return None
+
+    def forget(self) -> None:
+        for provider in self.providers:
+            _forget(provider)
+
+
+def _forget(provider: Provider) -> None:
+    forget = getattr(provider, "forget", None)
+    if forget is not None:
+        forget()
+
+
+def gui_available() -> bool:
+    """Indique si une boîte de dialogue peut s'afficher (affichage présent)."""
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def default_provider(gui: bool = True, stream: Optional[TextIO] = None) -> ChainProvider:
+    """
+    Fournisseur par défaut : variable d'environnement, puis fichier désigné
+    par ``SECUREPASSGEN_PASSWORD_FILE``, puis terminal ou entrée standard
+    redirigée, et enfin (``gui`` et affichage présent) boîte de dialogue Tk.
+
+    Args:
+        gui: Autoriser la boîte de dialogue en dernier recours
+        stream: Flux à lire à la place de l'entrée standard
+    """
+    providers = [EnvironmentProvider()]
+    if os.environ.get(PASSWORD_FILE_ENV_VAR):
+        providers.append(FileProvider(os.environ[PASSWORD_FILE_ENV_VAR]))
+
+    stream = stream or sys.stdin
+    interactive = stream is not None and stream.isatty()
+    if gui and gui_available() and not interactive:
+        providers.append(TkDialogProvider())
+    elif stream is not None:
+        providers.append(StdinProvider(stream))
+    return ChainProvider(*providers)
@@ -2,27 +2,173 @@
 Gestionnaire de fichiers pour la sauvegarde sécurisée des mots de passe.
 """
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import getpass
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, TextIO, Tuple, Union
+
+from utils import import_export, metrics
+from utils.credentials import default_provider
+from utils.record_codec import encode_records, decode_records
+from utils.vault_backup import BLOCK_BYTES, BackupStore, iter_vault_chunks
+from utils.vault_integrity import (
+    describe_segment, integrity_payload, iter_digests, record_ranges, segment_digest
+)
+from utils.vault_search import SegmentIndex, Tokenizer, build_segment_index, entry_matches
+from utils.vault_stats import STRENGTH_KEY, VaultStats, annotate_operations
+from utils.vault_storage import (
+    CONTAINER_MAGIC, VAULT_IO_SECONDS, VaultFormatError, VaultJournal, VaultLock, atomic_write,
+    atomic_writer, encode_container, iter_container_segments, read_container_header, write_container
+)
+
+# Nombre d'enregistrements par segment chiffré de l'instantané
+SEGMENT_RECORDS = 1024
+
+# Seuils au-delà desquels le journal est intégré dans un nouvel instantané
+JOURNAL_MAX_FRAMES = 32
+JOURNAL_MIN_CHECKPOINT_BYTES = 64 * 1024
+JOURNAL_MAX_CHECKPOINT_BYTES = 8 * 1024 * 1024
+
+VAULT_KDF_SECONDS = metrics.histogram(
+    "securepassgen_vault_kdf_seconds",
+    "Durée de la dérivation de la clé du coffre (PBKDF2)"
+)
+VAULT_CRYPTO_SECONDS = metrics.histogram(
+    "securepassgen_vault_crypto_seconds",
+    "Durée du chiffrement et du déchiffrement des données du coffre",
+    ("op",)
+)
+VAULT_CRYPTO_BYTES = metrics.counter(
+    "securepassgen_vault_crypto_bytes_total",
+    "Octets en clair chiffrés ou déchiffrés",
+    ("op",)
+)
+
+
+class _TimedFernet(Fernet):
+    """Fernet mesuré, utilisé seulement quand l'instrumentation est active."""
+
+    def encrypt(self, data: bytes) -> bytes:
+        started = metrics.start()
+        token = super().encrypt(data)
+        metrics.observe_since(VAULT_CRYPTO_SECONDS, started, ("encrypt",))
+        VAULT_CRYPTO_BYTES.inc(len(data), ("encrypt",))
+        return token
+
+    def decrypt(self, token: Union[bytes, str], ttl: Optional[int] = None) -> bytes:
+        started = metrics.start()
+        data = super().decrypt(token, ttl)
+        metrics.observe_since(VAULT_CRYPTO_SECONDS, started, ("decrypt",))
+        VAULT_CRYPTO_BYTES.inc(len(data), ("decrypt",))
+        return data
+
+
+def _fernet(key: bytes) -> Fernet:
+    """Instance Fernet pour ``key``, mesurée si l'instrumentation est active."""
+    return _TimedFernet(key) if metrics.state.enabled else Fernet(key)
+
+# Taille des lots validés pendant un import au fil de l'eau
+IMPORT_BATCH_SIZE = 5000
+
+# Nombre de tentatives d'une écriture concurrente avant d'abandonner
+MAX_COMMIT_RETRIES = 5
+
+# Valeur chiffrée dans l'en-tête pour vérifier le mot de passe maître
+_KEY_CHECK = b"SecurePassGen"
+
+# Libellés des emplacements de clé créés par défaut
+MASTER_SLOT = "master"
+RECOVERY_SLOT = "recovery"
+
+
+class VaultConflictError(RuntimeError):
+    """Erreur levée lorsqu'une écriture échoue à cause d'accès concurrents répétés."""
+
+
+def _new_entry(name: str, password: str, description: str = "", date: Optional[str] = None) -> Dict:
+    """Construit une entrée du coffre (horodatée maintenant par défaut)."""
+    return {
+        "name": name,
+        "password": password,
+        "description": description,
+        "date": date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def _key_id(header: Dict) -> str:
+    """Identifiant de la clé de données d'un coffre (son salt s'il n'a pas d'emplacements de clé)."""
+    return header.get("key_id") or header["salt"]
+
+
+def _key_fields(header: Dict) -> Dict:
+    """Champs de l'en-tête décrivant la clé, repris tels quels d'un instantané au suivant."""
+    return {name: header[name] for name in ("salt", "key_id", "slots") if name in header}
+
+
+class VaultTransaction:
+    """
+    Modifications du coffre regroupées en une seule transaction.
+    
+    Obtenue via ``PasswordFileManager.transaction()`` : les opérations sont
+    accumulées en mémoire puis validées ensemble à la sortie du bloc ``with``,
+    avec une seule dérivation de clé et une seule écriture durable. Si le bloc
+    lève une exception, rien n'est écrit.
+    """
+    
+    def __init__(self):
+        self.operations: List[Dict] = []
+    
+    def save(self, name: str, password: str, description: str = "") -> None:
+        """
+        Ajoute un mot de passe à la transaction.
+        
+        Args:
+            name: Nom/identifiant du mot de passe
+            password: Mot de passe à sauvegarder
+            description: Description optionnelle
+        """
+        self.operations.append({"_op": "put", **_new_entry(name, password, description)})
+    
+    def delete(self, name: str) -> None:
+        """
+        Supprime un mot de passe (toutes les entrées portant ce nom).
+        
+        Args:
+            name: Nom du mot de passe à supprimer
+        """
+        self.operations.append({"_op": "delete", "name": name})
+
 
 class PasswordFileManager:
     """
     Gestionnaire pour la sauvegarde et le chargement sécurisé des mots de passe.
     """
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", password_prompt: Optional[Callable[[], Optional[str]]] = None):
+        """
+        Args:
+            data_dir: Dossier du coffre
+            password_prompt: Fournisseur du mot de passe maître (voir
+                ``utils.credentials`` ; ``default_provider()`` si None, qui
+                n'ouvre une boîte de dialogue Tk qu'en dernier recours). Il
+                est appelé depuis le thread qui accède au coffre.
+        """
+        self.password_prompt = password_prompt if password_prompt is not None else default_provider()
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.passwords_file = self.data_dir / "passwords.enc"
         self.key_file = self.data_dir / "key.key"
+        self.journal = VaultJournal(self.data_dir / "passwords.journal")
+        self.lock = VaultLock(self.data_dir / "passwords.lock")
+        self.index_file = self.data_dir / "passwords.idx"
+        # Index de recherche déjà déchiffrés : (clé de recherche, index par empreinte de segment)
+        self._search_cache: Tuple[Optional[bytes], Dict[str, SegmentIndex]] = (None, {})
         
     def _generate_key(self, password: str, salt: bytes = None) -> bytes:
         """
@@ -38,6 +184,7 @@ class PasswordFileManager:
         if salt is None:
             salt = os.urandom(16)
             
+        started = metrics.start()
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
@@ -45,31 +192,25 @@ class PasswordFileManager:
             iterations=100000,
         )
         key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        metrics.observe_since(VAULT_KDF_SECONDS, started)
         return key, salt
     
     def _get_master_password(self) -> str:
         """
-        Demande le mot de passe maître à l'utilisateur.
+        Demande le mot de passe maître au fournisseur.
         
         Returns:
             Mot de passe maître
         """
-        import tkinter as tk
-        from tkinter import simpledialog
-        
-        root = tk.Tk()
-        root.withdraw()  # Cacher la fenêtre principale
-        
-        password = simpledialog.askstring(
-            "Mot de passe maître",
-            "Entrez votre mot de passe maître pour chiffrer/déchiffrer:",
-            show='*'
-        )
-        
-        root.destroy()
-        return password or ""
+        return self.password_prompt() or ""
+    
+    def _forget_master_password(self) -> None:
+        """Signale au fournisseur que le mot de passe donné a été refusé."""
+        forget = getattr(self.password_prompt, "forget", None)
+        if forget is not None:
+            forget()
     
-    def _encrypt_data(self, data: str) -> bytes:
+    def _encrypt_data(self, data: Union[str, bytes]) -> bytes:
         """
         Chiffre les données avec le mot de passe maître.
         
@@ -79,6 +220,9 @@ class PasswordFileManager:
         Returns:
             Données chiffrées
         """
+        if isinstance(data, str):
+            data = data.encode()
+        
         master_password = self._get_master_password()
         if not master_password:
             raise ValueError("Mot de passe maître requis")
@@ -87,13 +231,13 @@ class PasswordFileManager:
         key, salt = self._generate_key(master_password)
         
         # Chiffrer les données
-        fernet = Fernet(key)
-        encrypted_data = fernet.encrypt(data.encode())
+        fernet = _fernet(key)
+        encrypted_data = fernet.encrypt(data)
         
         # Combiner salt et données chiffrées
         return salt + encrypted_data
     
-    def _decrypt_data(self, encrypted_data: bytes) -> str:
+    def _decrypt_data(self, encrypted_data: bytes) -> bytes:
         """
         Déchiffre les données avec le mot de passe maître.
         
@@ -115,10 +259,621 @@ class PasswordFileManager:
         key, _ = self._generate_key(master_password, salt)
         
         # Déchiffrer
-        fernet = Fernet(key)
-        decrypted_data = fernet.decrypt(data)
+        fernet = _fernet(key)
+        return fernet.decrypt(data)
+    
+    def _require_master_password(self) -> str:
+        """Demande le mot de passe maître (erreur s'il est vide)."""
+        master_password = self._get_master_password()
+        if not master_password:
+            raise ValueError("Mot de passe maître requis")
+        return master_password
+    
+    def _new_slot(self, data_key: bytes, password: str, label: str) -> Dict:
+        """
+        Emplacement de clé : la clé de données chiffrée avec une clé dérivée
+        de ``password`` (nouveau salt).
+        """
+        key, salt = self._generate_key(password)
+        return {
+            "label": label,
+            "salt": base64.b64encode(salt).decode('ascii'),
+            "wrapped": _fernet(key).encrypt(data_key).decode('ascii'),
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+    
+    def _new_key_fields(self) -> Tuple[Dict, Fernet]:
+        """
+        Clé d'un nouveau coffre : une clé de données aléatoire chiffre les
+        enregistrements, le mot de passe maître ne fait que la protéger.
+        
+        Returns:
+            Tuple (champs de l'en-tête, instance Fernet de la clé de données)
+        """
+        data_key = Fernet.generate_key()
+        slot = self._new_slot(data_key, self._require_master_password(), MASTER_SLOT)
+        return {"key_id": base64.b64encode(os.urandom(16)).decode('ascii'), "slots": [slot]}, _fernet(data_key)
+    
+    def _read_vault(self, with_segments: bool = True) -> Optional[Tuple[Dict, Optional[List[bytes]], List[Tuple[int, bytes]]]]:
+        """
+        Lit l'instantané et le journal du coffre sans les déchiffrer.
+        
+        L'appelant doit détenir le verrou du coffre (partagé ou exclusif) pour
+        obtenir un instantané et un journal cohérents entre eux. Les coffres à
+        l'ancien format (salt + jeton unique) sont présentés comme un
+        instantané d'un seul segment, marqué ``legacy``.
+        
+        Args:
+            with_segments: Si faux, seul l'en-tête de l'instantané est lu
+                (segments à None), ce qui suffit pour ajouter au journal
+        
+        Returns:
+            Tuple (en-tête, segments chiffrés, trames du journal) ou None si
+            le coffre n'existe pas
+        """
+        started = metrics.start()
+        try:
+            with open(self.passwords_file, 'rb') as f:
+                if f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC:
+                    f.seek(0)
+                    header = read_container_header(f)
+                    segments = list(iter_container_segments(f)) if with_segments else None
+                else:
+                    f.seek(0)
+                    data = f.read()
+                    header = {
+                        "seq": 0,
+                        "salt": base64.b64encode(data[:16]).decode('ascii'),
+                        "legacy": True
+                    }
+                    segments = [data[16:]]
+        except FileNotFoundError:
+            return None
+        metrics.observe_since(VAULT_IO_SECONDS, started, ("snapshot_read",))
+        
+        return header, segments, self.journal.frames()
+    
+    def _snapshot(self, with_segments: bool = True) -> Optional[Tuple[Dict, Optional[List[bytes]], List[Tuple[int, bytes]]]]:
+        """Lit le coffre sous verrou partagé (voir ``_read_vault``)."""
+        with self.lock.shared():
+            return self._read_vault(with_segments)
+    
+    @staticmethod
+    def _version(header: Dict, frames: List[Tuple[int, bytes]]) -> int:
+        """Numéro de la dernière transaction validée (compteur de version)."""
+        return max([header["seq"]] + [sequence for sequence, _ in frames])
+    
+    def _unlock_key(self, header: Dict, segments: Optional[List[bytes]]) -> Tuple[bytes, Optional[int]]:
+        """
+        Obtient la clé de données du coffre à partir du mot de passe maître.
+        
+        Le mot de passe est essayé sur chaque emplacement de clé, dans
+        l'ordre ; un coffre sans emplacements utilise directement la clé
+        dérivée du mot de passe.
+        
+        Args:
+            header: En-tête de l'instantané
+            segments: Segments chiffrés de l'instantané
+            
+        Returns:
+            Tuple (clé de données, indice de l'emplacement ouvert ou None)
+            
+        Raises:
+            ValueError: Si le mot de passe maître est incorrect
+        """
+        master_password = self._require_master_password()
+        
+        if "slots" in header:
+            for index, slot in enumerate(header["slots"]):
+                key, _ = self._generate_key(master_password, base64.b64decode(slot["salt"]))
+                try:
+                    data_key, slot_index = _fernet(key).decrypt(slot["wrapped"].encode('ascii')), index
+                    break
+                except InvalidToken:
+                    continue
+            else:
+                self._forget_master_password()
+                raise ValueError("Mot de passe maître incorrect")
+        else:
+            data_key, _ = self._generate_key(master_password, base64.b64decode(header["salt"]))
+            slot_index = None
+        
+        check = header.get("check", "").encode() or (segments[0] if segments else b"")
+        try:
+            if check:
+                _fernet(data_key).decrypt(check)
+        except InvalidToken:
+            self._forget_master_password()
+            raise ValueError("Mot de passe maître incorrect")
+        
+        return data_key, slot_index
+    
+    def _unlock(self, header: Dict, segments: Optional[List[bytes]]) -> Fernet:
+        """
+        Obtient la clé du coffre et vérifie le mot de passe maître.
+        
+        Args:
+            header: En-tête de l'instantané
+            segments: Segments chiffrés de l'instantané
+            
+        Returns:
+            Instance Fernet du coffre
+            
+        Raises:
+            ValueError: Si le mot de passe maître est incorrect
+        """
+        data_key, _ = self._unlock_key(header, segments)
+        return _fernet(data_key)
+    
+    def _apply_operations(self, entries: List[Dict], operations: List[Dict]) -> None:
+        """
+        Applique des opérations du journal à une liste d'entrées.
+        
+        Args:
+            entries: Entrées à modifier (en place)
+            operations: Opérations ``put`` / ``delete`` décodées
+        """
+        deleted = set()
+        
+        def flush_deletes():
+            if deleted:
+                entries[:] = [e for e in entries if e['name'] not in deleted]
+                deleted.clear()
+        
+        for operation in operations:
+            entry = dict(operation)
+            kind = entry.pop("_op")
+            entry.pop(STRENGTH_KEY, None)  # Annotation du résumé statistique
+            if kind == "put":
+                flush_deletes()
+                entries.append(entry)
+            elif kind == "delete":
+                deleted.add(entry["name"])
+            else:
+                raise ValueError(f"Opération de journal inconnue: {kind}")
+        
+        flush_deletes()
+    
+    def _read_entries(self, fernet: Fernet, header: Dict, segments: List[bytes],
+                      frames: List[Tuple[int, bytes]]) -> List[Dict]:
+        """
+        Déchiffre l'instantané et rejoue le journal par-dessus.
+        
+        Args:
+            fernet: Clé du coffre
+            header: En-tête de l'instantané
+            segments: Segments chiffrés de l'instantané
+            frames: Trames du journal
+            
+        Returns:
+            Liste des entrées
+        """
+        entries = []
+        for segment in segments:
+            entries.extend(decode_records(fernet.decrypt(segment)))
+        
+        for sequence, payload in frames:
+            if sequence <= header["seq"]:
+                continue  # Déjà intégrée à l'instantané
+            self._apply_operations(entries, decode_records(fernet.decrypt(payload)))
+        
+        return entries
+    
+    def _snapshot_header(self, fernet: Fernet, key_fields: Dict, sequence: int, counts: List[int],
+                         stats: VaultStats, leaves: List[bytes]) -> Dict:
+        """
+        Construit l'en-tête d'un instantané (``key_fields`` : salt ou
+        emplacements de clé, ``counts`` : entrées par segment, ``stats`` :
+        résumé des entrées, ``leaves`` : empreintes des segments, voir
+        ``vault_integrity``).
+        """
+        return {
+            "seq": sequence,
+            **key_fields,
+            "check": fernet.encrypt(_KEY_CHECK).decode('ascii'),
+            "counts": counts,
+            "stats": fernet.encrypt(stats.to_json().encode('utf-8')).decode('ascii'),
+            "leaves": [leaf.hex() for leaf in leaves],
+            "merkle": fernet.encrypt(integrity_payload(leaves, sequence, counts)).decode('ascii')
+        }
+    
+    def _current_stats(self, fernet: Fernet, header: Dict, operations: List[Dict]) -> Optional[VaultStats]:
+        """
+        Résumé de l'instantané mis à jour avec les opérations du journal.
+        
+        Returns:
+            Le résumé, ou None s'il faut le recalculer (instantané antérieur
+            aux statistiques, ou suppression du journal sans résumé)
+        """
+        if "stats" not in header:
+            return None
+        
+        stats = VaultStats.from_json(fernet.decrypt(header["stats"].encode('ascii')).decode('utf-8'))
+        return stats if stats.apply_operations(operations) else None
+    
+    def _write_snapshot(self, fernet: Fernet, key_fields: Dict, entries: List[Dict], sequence: int,
+                        stats: Optional[VaultStats] = None) -> None:
+        """
+        Écrit atomiquement un nouvel instantané puis vide le journal.
+        
+        L'appelant doit détenir le verrou exclusif.
+        
+        Args:
+            fernet: Clé du coffre
+            key_fields: Salt ou emplacements de clé (voir ``_key_fields``)
+            entries: Liste complète des entrées
+            sequence: Dernière transaction intégrée à l'instantané
+            stats: Résumé des entrées s'il est déjà connu (calculé sinon)
+        """
+        chunks = [entries[i:i + SEGMENT_RECORDS] for i in range(0, len(entries), SEGMENT_RECORDS)]
+        segments = [fernet.encrypt(encode_records(chunk)) for chunk in chunks]
+        leaves = [segment_digest(s) for s in segments]
+        header = self._snapshot_header(fernet, key_fields, sequence, [len(chunk) for chunk in chunks],
+                                       stats or VaultStats.of(entries), leaves)
+        
+        atomic_write(self.passwords_file, encode_container(header, segments))
+        # Les trames restantes ont une séquence <= ``sequence`` et seraient
+        # ignorées : les supprimer n'est qu'un nettoyage.
+        self.journal.clear()
+        self._reindex(fernet, header["leaves"], dict(zip(header["leaves"], chunks)))
+    
+    def _read_search_index(self, fernet: Fernet) -> Tuple[Optional[bytes], Dict[str, bytes]]:
+        """
+        Lit l'index de recherche sans déchiffrer les index de segment.
+        
+        Returns:
+            Tuple (clé de recherche, index chiffrés par empreinte de segment) ;
+            (None, {}) si l'index n'existe pas ou appartient à une autre clé
+            de données (coffre recréé)
+        """
+        try:
+            with open(self.index_file, 'rb') as f:
+                header = read_container_header(f)
+                key = fernet.decrypt(header["key"].encode('ascii'))
+                return key, dict(zip(header["leaves"], iter_container_segments(f)))
+        except (OSError, KeyError, VaultFormatError, InvalidToken):
+            return None, {}
+    
+    def _write_search_index(self, fernet: Fernet, key: bytes, leaves: List[str],
+                            blobs: Dict[str, bytes]) -> None:
+        """
+        Écrit l'index de recherche des segments ``leaves`` de l'instantané
+        (les index d'anciens segments sont abandonnés). L'appelant doit
+        détenir le verrou exclusif.
+        
+        Args:
+            fernet: Clé du coffre
+            key: Clé de recherche
+            leaves: Empreintes (hexadécimales) des segments de l'instantané
+            blobs: Index chiffrés par empreinte de segment
+        """
+        indexed = [leaf for leaf in leaves if leaf in blobs]
+        header = {"key": fernet.encrypt(key).decode('ascii'), "leaves": indexed}
+        with atomic_writer(self.index_file) as out:
+            write_container(out, header, (blobs[leaf] for leaf in indexed))
+    
+    def _reindex(self, fernet: Fernet, leaves: List[str], fresh: Dict[str, List[Dict]]) -> None:
+        """
+        Tient l'index de recherche à jour après l'écriture d'un instantané.
+        
+        Rien n'est fait tant que l'index n'existe pas (créé par la première
+        recherche). L'appelant doit détenir le verrou exclusif.
+        
+        Args:
+            fernet: Clé du coffre
+            leaves: Empreintes (hexadécimales) des segments du nouvel instantané
+            fresh: Entrées des segments nouveaux ou réécrits, par empreinte
+        """
+        key, blobs = self._read_search_index(fernet)
+        if key is None:
+            return
+        
+        tokenizer = Tokenizer(key)
+        for leaf, entries in fresh.items():
+            blobs[leaf] = fernet.encrypt(build_segment_index(tokenizer, entries))
+        self._write_search_index(fernet, key, leaves, blobs)
+    
+    def _commit(self, fernet: Fernet, header: Dict, frames: List[Tuple[int, bytes]],
+                operations: List[Dict]) -> None:
+        """
+        Valide une transaction : une seule trame durable dans le journal.
+        
+        Le journal est intégré dans un nouvel instantané lorsqu'il devient
+        trop long ou plus volumineux que l'instantané lui-même. L'appelant
+        doit détenir le verrou exclusif.
+        
+        Args:
+            fernet: Clé du coffre
+            header: En-tête de l'instantané courant
+            frames: Trames courantes du journal
+            operations: Opérations ``put`` / ``delete`` à valider
+        """
+        sequence = self._version(header, frames) + 1
+        self.journal.append(sequence, fernet.encrypt(encode_records(operations)))
+        
+        # Le journal rejoué est gardé en mémoire : sa taille reste bornée
+        snapshot_size = self.passwords_file.stat().st_size
+        journal_limit = min(max(snapshot_size, JOURNAL_MIN_CHECKPOINT_BYTES), JOURNAL_MAX_CHECKPOINT_BYTES)
+        if len(frames) + 1 >= JOURNAL_MAX_FRAMES or self.journal.size() > journal_limit:
+            self._checkpoint(fernet)
+    
+    def _journal_operations(self, fernet: Fernet, header: Dict,
+                            frames: List[Tuple[int, bytes]]) -> List[Dict]:
+        """Déchiffre les opérations du journal postérieures à l'instantané."""
+        operations = []
+        for sequence, payload in frames:
+            if sequence > header["seq"]:
+                operations.extend(decode_records(fernet.decrypt(payload)))
+        return operations
+    
+    def _checkpoint(self, fernet: Fernet) -> bool:
+        """
+        Intègre le journal dans un nouvel instantané (même clé).
+        
+        L'instantané est réécrit au fil de l'eau : les segments que le journal
+        ne touche pas sont recopiés tels quels (sans déchiffrement), seuls les
+        segments contenant un nom supprimé sont rechiffrés, et les ajouts sont
+        écrits dans de nouveaux segments. Le résumé statistique est mis à jour
+        avec le journal ; s'il manque, tous les segments sont relus pour le
+        recalculer. Les empreintes des segments recopiés sont reprises de
+        l'ancien en-tête (une corruption reste détectable) ou calculées si
+        elles manquent. Un instantané sans résumé ou sans empreintes est
+        réécrit même sans journal. L'appelant doit détenir le verrou exclusif.
+        
+        Args:
+            fernet: Clé du coffre
+            
+        Returns:
+            True si un instantané a été écrit
+        """
+        vault = self._read_vault(with_segments=False)
+        if vault is None:
+            return False
+        
+        header, segments, frames = vault
+        if header.get("legacy"):
+            entries = self._read_entries(fernet, header, segments, frames)
+            self._write_snapshot(fernet, _key_fields(header), entries,
+                                 self._version(header, frames))
+            return True
+        
+        operations = self._journal_operations(fernet, header, frames)
+        stats = self._current_stats(fernet, header, operations)
+        old_leaves = [bytes.fromhex(leaf) for leaf in header.get("leaves", [])]
+        if not operations and stats is not None and "leaves" in header:
+            return False
+        
+        deleted = {op["name"] for op in operations if op["_op"] == "delete"}
+        added: List[Dict] = []
+        self._apply_operations(added, operations)
+        counts = list(header.get("counts") or [])
+        
+        rebuild_stats = stats is None
+        if rebuild_stats:
+            stats = VaultStats.of(added)
+        
+        with open(self.passwords_file, 'rb') as f:
+            read_container_header(f)
+            start = f.tell()
+            
+            # Passe 1 : segments modifiés par des suppressions (ou non dénombrés)
+            replaced: Dict[int, Optional[bytes]] = {}
+            rewritten: Dict[int, List[Dict]] = {}
+            leaves: List[bytes] = []
+            last_segment = None
+            for index, segment in enumerate(iter_container_segments(f)):
+                last_segment = segment
+                leaves.append(old_leaves[index] if index < len(old_leaves) else segment_digest(segment))
+                if index >= len(counts):
+                    counts.append(None)  # Instantané antérieur aux compteurs
+                if not deleted and counts[index] is not None and not rebuild_stats:
+                    continue
+                entries = decode_records(fernet.decrypt(segment))
+                kept = [e for e in entries if e['name'] not in deleted]
+                counts[index] = len(kept)
+                if rebuild_stats:
+                    stats.update(VaultStats.of(kept))
+                if len(kept) != len(entries):
+                    replaced[index] = fernet.encrypt(encode_records(kept)) if kept else None
+                    rewritten[index] = kept
+            
+            # Compléter le dernier segment s'il est petit plutôt que d'en créer un
+            last = len(counts) - 1
+            if added and last >= 0 and counts[last] < SEGMENT_RECORDS:
+                segment = replaced.get(last, last_segment)
+                if segment is not None:
+                    added = decode_records(fernet.decrypt(segment)) + added
+                replaced[last] = None
+            
+            new_chunks = [added[i:i + SEGMENT_RECORDS] for i in range(0, len(added), SEGMENT_RECORDS)]
+            # Chiffrés dès maintenant (taille bornée par le journal) : leurs
+            # empreintes doivent figurer dans l'en-tête, écrit en premier
+            new_segments = [fernet.encrypt(encode_records(chunk)) for chunk in new_chunks]
+            kept = [index for index in range(len(counts)) if replaced.get(index, b"") is not None]
+            new_counts = [counts[index] for index in kept] + [len(chunk) for chunk in new_chunks]
+            new_leaves = [
+                segment_digest(replaced[index]) if index in replaced else leaves[index]
+                for index in kept
+            ] + [segment_digest(segment) for segment in new_segments]
+            
+            def segments_to_write():
+                # Passe 2 : recopie des segments intacts, sans déchiffrement
+                f.seek(start)
+                for index, segment in enumerate(iter_container_segments(f)):
+                    segment = replaced.get(index, segment)
+                    if segment is not None:
+                        yield segment
+                yield from new_segments
+            
+            new_header = self._snapshot_header(fernet, _key_fields(header), self._version(header, frames),
+                                               new_counts, stats, new_leaves)
+            with atomic_writer(self.passwords_file) as out:
+                write_container(out, new_header, segments_to_write())
+        
+        self.journal.clear()
+        
+        # Index de recherche : seuls les segments réécrits ou ajoutés sont indexés
+        fresh = {segment_digest(replaced[index]).hex(): rewritten[index]
+                 for index in kept if replaced.get(index) is not None}
+        fresh.update((segment_digest(segment).hex(), chunk) for segment, chunk in zip(new_segments, new_chunks))
+        self._reindex(fernet, new_header["leaves"], fresh)
+        return True
+    
+    def _update(self, plan: Callable[[Optional[List[Dict]]], Tuple[Optional[List[Dict]], object]],
+                needs_entries: bool = True, keys: Optional[Dict[str, Fernet]] = None):
+        """
+        Cycle lecture-modification-écriture avec contrôle de version optimiste.
+        
+        Le coffre est lu sous verrou partagé, la clé est dérivée et ``plan``
+        est appelé hors verrou. Les opérations sont ensuite validées sous
+        verrou exclusif, à condition que la version du coffre n'ait pas changé
+        entre-temps ; sinon le cycle recommence (sans redemander le mot de
+        passe maître tant que la clé est la même).
+        
+        Args:
+            plan: Fonction recevant les entrées actuelles (ou None si
+                ``needs_entries`` est faux) et retournant (opérations,
+                résultat). Des opérations à None vident le coffre (instantané
+                vide, même clé et mêmes emplacements de clé).
+            needs_entries: Si faux, les opérations ne dépendent pas de l'état
+                du coffre : elles sont ajoutées sans contrôle de version et
+                seul l'en-tête de l'instantané est lu.
+            keys: Cache des clés par identifiant, à partager entre plusieurs appels
+                pour ne dériver la clé qu'une fois (import par lots)
+            
+        Returns:
+            Le résultat retourné par ``plan``
+            
+        Raises:
+            VaultConflictError: Si le coffre change à chaque tentative
+        """
+        if keys is None:
+            keys = {}
+        
+        for _ in range(MAX_COMMIT_RETRIES):
+            vault = self._snapshot(with_segments=needs_entries)
+            
+            if vault is None:
+                operations, result = plan([] if needs_entries else None)
+                if not operations:
+                    return result
+                operations = annotate_operations([], operations)
+                stats = VaultStats()
+                stats.apply_operations(operations)
+                
+                # Nouveau coffre : instantané initial avec une nouvelle clé
+                key_fields, fernet = self._new_key_fields()
+                keys[_key_id(key_fields)] = fernet
+                with self.lock.exclusive():
+                    if self._read_vault(with_segments=False) is None:
+                        entries = []
+                        self._apply_operations(entries, operations)
+                        self._write_snapshot(fernet, key_fields, entries, 1, stats)
+                        return result
+                continue  # Créé entre-temps par un autre écrivain
+            
+            header, segments, frames = vault
+            fernet = keys.get(_key_id(header)) or self._unlock(header, segments)
+            keys[_key_id(header)] = fernet
+            
+            version = self._version(header, frames)
+            entries = self._read_entries(fernet, header, segments, frames) if needs_entries else None
+            operations, result = plan(entries)
+            if operations is not None and not operations:
+                return result
+            if operations:
+                # Force des ajouts et résumé de ce que retirent les suppressions
+                operations = annotate_operations(entries, operations)
+            
+            with self.lock.exclusive():
+                current = self._read_vault(with_segments=False)
+                if current is None or _key_id(current[0]) != _key_id(header):
+                    continue  # Coffre supprimé ou recréé
+                
+                current_header, current_segments, current_frames = current
+                if needs_entries and self._version(current_header, current_frames) != version:
+                    continue  # Modifié entre la lecture et l'écriture
+                
+                if operations is None:
+                    # Instantané vide sous la même clé : les emplacements (clé
+                    # de récupération comprise) restent valables
+                    self._write_snapshot(fernet, _key_fields(current_header), [],
+                                         self._version(current_header, current_frames) + 1)
+                elif current_header.get("legacy"):
+                    # Ancien format : migration vers un instantané au passage
+                    entries = self._read_entries(fernet, *current)
+                    self._apply_operations(entries, operations)
+                    self._write_snapshot(fernet, _key_fields(current_header), entries,
+                                         self._version(current_header, current_frames) + 1)
+                else:
+                    self._commit(fernet, current_header, current_frames, operations)
+                return result
+        
+        raise VaultConflictError("Le coffre a été modifié pendant l'écriture, réessayez")
+    
+    @contextmanager
+    def transaction(self) -> Iterator[VaultTransaction]:
+        """
+        Regroupe plusieurs modifications en une seule transaction durable.
+        
+        Exemple::
+        
+            with manager.transaction() as tx:
+                tx.save("github", "...")
+                tx.delete("ancien-compte")
+        
+        Yields:
+            Transaction à remplir
+        """
+        transaction = VaultTransaction()
+        yield transaction
+        
+        if transaction.operations:
+            # Des ajouts seuls ne dépendent pas de l'état du coffre ; les
+            # suppressions ont besoin des entrées retirées pour les statistiques
+            needs_entries = any(op["_op"] == "delete" for op in transaction.operations)
+            self._update(lambda _: (transaction.operations, None), needs_entries=needs_entries)
+    
+    def save_many(self, entries: Iterable[Dict]) -> int:
+        """
+        Sauvegarde plusieurs mots de passe en une seule transaction.
+        
+        Args:
+            entries: Dictionnaires avec ``name``, ``password`` et
+                optionnellement ``description``
+            
+        Returns:
+            Nombre de mots de passe sauvegardés
+        """
+        with self.transaction() as transaction:
+            for entry in entries:
+                transaction.save(entry['name'], entry['password'], entry.get('description', ""))
+        
+        return len(transaction.operations)
+    
+    def delete_many(self, names: Iterable[str]) -> int:
+        """
+        Supprime plusieurs mots de passe en une seule transaction.
+        
+        Args:
+            names: Noms des mots de passe à supprimer
+            
+        Returns:
+            Nombre de noms trouvés et supprimés
+        """
+        names = list(dict.fromkeys(names))
         
-        return decrypted_data.decode()
+        def plan(passwords):
+            existing = {p['name'] for p in passwords}
+            found = [name for name in names if name in existing]
+            if not found:
+                return [], 0  # Pas trouvé
+            if existing.issubset(found):
+                # Plus de mots de passe : instantané vide (sans rejouer de suppressions)
+                return None, len(found)
+            return [{"_op": "delete", "name": name} for name in found], len(found)
+        
+        return self._update(plan)
     
     def save_password(self, name: str, password: str, description: str = "") -> None:
         """
@@ -129,28 +884,91 @@ class PasswordFileManager:
             password: Mot de passe à sauvegarder
             description: Description optionnelle
         """
-        # Charger les mots de passe existants
+        new_entry = _new_entry(name, password, description)
+        
+        # Une seule trame ajoutée au journal, sans réécrire le coffre
+        self._update(lambda _: ([{"_op": "put", **new_entry}], None), needs_entries=False)
+    
+    def _iter_entries(self, keys: Dict[str, Fernet]) -> Iterator[Dict]:
+        """
+        Parcourt les entrées du coffre segment par segment.
+        
+        Le verrou partagé n'est tenu que le temps d'ouvrir l'instantané et de
+        lire le journal : un checkpoint concurrent remplace le fichier par
+        renommage, le descripteur ouvert continue donc de désigner
+        l'instantané correspondant au journal lu.
+        
+        Args:
+            keys: Cache des clés par identifiant
+            
+        Yields:
+            Entrées de l'instantané encore présentes, puis celles du journal
+        """
+        with self.lock.shared():
+            try:
+                f = open(self.passwords_file, 'rb')
+            except FileNotFoundError:
+                return
+            frames = self.journal.frames()
+        
+        with f:
+            if f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC:
+                f.seek(0)
+                header = read_container_header(f)
+                segments = iter_container_segments(f)
+                check_segments = None
+            else:
+                f.seek(0)
+                data = f.read()
+                header = {"seq": 0, "salt": base64.b64encode(data[:16]).decode('ascii')}
+                segments = check_segments = [data[16:]]
+            
+            fernet = keys.get(_key_id(header)) or self._unlock(header, check_segments)
+            keys[_key_id(header)] = fernet
+            
+            operations = self._journal_operations(fernet, header, frames)
+            deleted = {op["name"] for op in operations if op["_op"] == "delete"}
+            
+            for segment in segments:
+                for entry in decode_records(fernet.decrypt(segment)):
+                    if entry['name'] not in deleted:
+                        yield entry
+        
+        added: List[Dict] = []
+        self._apply_operations(added, operations)
+        yield from added
+    
+    def iter_passwords(self) -> Iterator[Dict]:
+        """
+        Parcourt les mots de passe sans charger tout le coffre en mémoire.
+        
+        Yields:
+            Mots de passe, dans l'ordre de ``load_passwords``
+        """
         try:
-            passwords = self.load_passwords()
-        except:
-            passwords = []
-        
-        # Ajouter le nouveau mot de passe
-        new_entry = {
-            "name": name,
-            "password": password,
-            "description": description,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
+            yield from self._iter_entries({})
+        except Exception as e:
+            raise Exception(f"Erreur lors du déchiffrement: {e}")
+    
+    def iter_pages(self, page_size: int = SEGMENT_RECORDS) -> Iterator[List[Dict]]:
+        """
+        Parcourt les mots de passe par pages (chargement progressif).
         
-        passwords.append(new_entry)
+        Args:
+            page_size: Nombre maximal d'entrées par page
         
-        # Sauvegarder
-        data = json.dumps(passwords, indent=2)
-        encrypted_data = self._encrypt_data(data)
+        Yields:
+            Listes d'entrées, dans l'ordre de ``load_passwords``
+        """
+        page = []
+        for entry in self.iter_passwords():
+            page.append(entry)
+            if len(page) >= page_size:
+                yield page
+                page = []
         
-        with open(self.passwords_file, 'wb') as f:
-            f.write(encrypted_data)
+        if page:
+            yield page
     
     def load_passwords(self) -> List[Dict]:
         """
@@ -159,19 +977,145 @@ class PasswordFileManager:
         Returns:
             Liste des mots de passe
         """
-        if not self.passwords_file.exists():
-            return []
+        # Le verrou partagé ne couvre que la lecture des fichiers :
+        # dérivation de clé et déchiffrement se font sans bloquer personne
+        return list(self.iter_passwords())
+    
+    def search_passwords(self, query: str, prefix: bool = False) -> List[Dict]:
+        """
+        Recherche les mots de passe dont le nom ou la description contient
+        ``query`` (ou commence par ``query`` si ``prefix``), sans distinction
+        de casse.
+        
+        Seuls l'index de recherche et les segments contenant un candidat sont
+        déchiffrés (voir ``vault_search``). Un segment pas encore indexé est
+        parcouru puis indexé pour les recherches suivantes. Une sous-chaîne de
+        moins de trois caractères ne peut pas utiliser l'index : tout le
+        coffre est alors parcouru.
         
+        Args:
+            query: Texte recherché (vide : tous les mots de passe)
+            prefix: Rechercher un début de nom ou de description
+            
+        Returns:
+            Mots de passe correspondants, dans l'ordre de ``load_passwords``
+        """
         try:
-            with open(self.passwords_file, 'rb') as f:
-                encrypted_data = f.read()
+            return self._search(query, prefix)
+        except Exception as e:
+            raise Exception(f"Erreur lors de la recherche: {e}")
+    
+    def _search_indexes(self, fernet: Fernet, leaves: List[str]) -> Tuple[bytes, Dict[str, SegmentIndex]]:
+        """
+        Clé de recherche (nouvelle s'il n'y a pas encore d'index) et index des
+        segments ``leaves`` déjà indexés ; un index n'est déchiffré qu'une fois
+        tant que son segment reste dans l'instantané.
+        """
+        key, blobs = self._read_search_index(fernet)
+        if key is None:
+            return os.urandom(32), {}
+        
+        cached_key, cached = self._search_cache
+        if cached_key != key:
+            cached = {}
+        indexes = {
+            leaf: cached.get(leaf) or SegmentIndex(fernet.decrypt(blobs[leaf]))
+            for leaf in leaves if leaf in blobs
+        }
+        self._search_cache = (key, indexes)
+        return key, indexes
+    
+    def _search(self, query: str, prefix: bool) -> List[Dict]:
+        """Recherche (voir ``search_passwords``)."""
+        with self.lock.shared():
+            try:
+                f = open(self.passwords_file, 'rb')
+            except FileNotFoundError:
+                return []
+            frames = self.journal.frames()
+        
+        with f:
+            header = None
+            if f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC:
+                f.seek(0)
+                header = read_container_header(f)
+            if header is None or "leaves" not in header:
+                # Ancien format ou instantané sans empreintes : pas d'index
+                f.close()
+                return [entry for entry in self._iter_entries({}) if entry_matches(entry, query, prefix)]
             
-            decrypted_data = self._decrypt_data(encrypted_data)
-            passwords = json.loads(decrypted_data)
+            fernet = self._unlock(header, None)
+            leaves = header["leaves"]
+            key, indexes = self._search_indexes(fernet, leaves)
+            tokenizer = Tokenizer(key)
+            tokens = tokenizer.query_tokens(query, prefix)
             
-            return passwords
-        except Exception as e:
-            raise Exception(f"Erreur lors du déchiffrement: {e}")
+            operations = self._journal_operations(fernet, header, frames)
+            deleted = {op["name"] for op in operations if op["_op"] == "delete"}
+            
+            results = []
+            built: Dict[str, bytes] = {}
+            for position, segment in enumerate(iter_container_segments(f)):
+                leaf = leaves[position] if position < len(leaves) else None
+                index = indexes.get(leaf)
+                candidates = None
+                if index is not None and tokens is not None:
+                    candidates = index.candidates(tokens)
+                    if not candidates:
+                        continue  # Aucun candidat : segment non déchiffré
+                
+                entries = decode_records(fernet.decrypt(segment))
+                if index is None and leaf is not None:
+                    data = build_segment_index(tokenizer, entries)
+                    built[leaf] = fernet.encrypt(data)
+                    indexes[leaf] = SegmentIndex(data)
+                results.extend(
+                    entry for i, entry in enumerate(entries)
+                    if (candidates is None or i in candidates) and entry['name'] not in deleted
+                    and entry_matches(entry, query, prefix)
+                )
+        
+        added: List[Dict] = []
+        self._apply_operations(added, operations)
+        results.extend(entry for entry in added if entry_matches(entry, query, prefix))
+        
+        if built:
+            self._search_cache = (key, indexes)
+            self._save_search_index(fernet, header, key, built)
+        return results
+    
+    def _save_search_index(self, fernet: Fernet, header: Dict, key: bytes, built: Dict[str, bytes]) -> None:
+        """
+        Ajoute à l'index les segments indexés pendant une recherche, s'ils
+        font toujours partie de l'instantané et si l'index n'a pas été
+        recréé entre-temps avec une autre clé.
+        """
+        with self.lock.exclusive():
+            current = self._read_vault(with_segments=False)
+            if current is None or _key_id(current[0]) != _key_id(header) or "leaves" not in current[0]:
+                return
+            current_key, blobs = self._read_search_index(fernet)
+            if current_key is not None and current_key != key:
+                return
+            blobs.update(built)
+            self._write_search_index(fernet, key, current[0]["leaves"], blobs)
+    
+    def get_version(self) -> int:
+        """
+        Retourne le compteur de version du coffre, sans le déchiffrer.
+        
+        Le compteur augmente à chaque transaction validée ; il permet de
+        savoir si le coffre a changé depuis une lecture précédente.
+        
+        Returns:
+            Numéro de la dernière transaction (0 si le coffre est vide)
+        """
+        vault = self._snapshot()
+        if vault is None:
+            return 0
+        
+        header, _, frames = vault
+        return self._version(header, frames)
     
     def delete_password(self, name: str) -> bool:
         """
@@ -183,89 +1127,342 @@ class PasswordFileManager:
         Returns:
             True si supprimé, False si non trouvé
         """
-        passwords = self.load_passwords()
+        return self.delete_many([name]) == 1
+    
+    def checkpoint(self) -> bool:
+        """
+        Intègre le journal des transactions dans l'instantané du coffre.
         
-        # Filtrer le mot de passe à supprimer
-        new_passwords = [p for p in passwords if p['name'] != name]
+        Le checkpoint a lieu automatiquement lorsque le journal grossit ; cette
+        méthode permet de le forcer (par exemple avant une sauvegarde).
         
-        if len(new_passwords) == len(passwords):
-            return False  # Pas trouvé
+        Returns:
+            True si un nouvel instantané a été écrit
+        """
+        vault = self._snapshot(with_segments=False)
+        if vault is None:
+            return False
         
-        # Sauvegarder la nouvelle liste
-        if new_passwords:
-            data = json.dumps(new_passwords, indent=2)
-            encrypted_data = self._encrypt_data(data)
+        header, segments, _ = vault
+        fernet = self._unlock(header, segments)
+        
+        with self.lock.exclusive():
+            current = self._read_vault(with_segments=False)
+            if current is None or _key_id(current[0]) != _key_id(header):
+                return False
+            return self._checkpoint(fernet)
+    
+    def migrate_vault(self) -> bool:
+        """
+        Convertit un coffre à l'ancien format vers le format actuel.
+        
+        La lecture des anciens coffres reste possible sans migration : la
+        conversion a lieu d'elle-même à la prochaine écriture. Cette méthode
+        permet de la forcer.
+        
+        Returns:
+            True si le coffre a été converti, False s'il l'était déjà
+        """
+        vault = self._snapshot()
+        if vault is None or not vault[0].get("legacy"):
+            return False
+        
+        return self.checkpoint()
+    
+    def _rewrite_key_slots(self, change: Callable[[List[Dict], bytes, int], List[Dict]]) -> None:
+        """
+        Modifie les emplacements de clé sans rechiffrer le coffre.
+        
+        Seul l'en-tête change : les segments sont recopiés tels quels et le
+        journal, chiffré avec la clé de données, reste valable. Un coffre
+        sans emplacements (clé dérivée directement du mot de passe) est
+        converti au passage : sa clé dérivée devient la clé de données,
+        protégée par un premier emplacement au même salt.
+        
+        Args:
+            change: Reçoit les emplacements actuels, la clé de données et
+                l'indice de l'emplacement ouvert par le mot de passe saisi ;
+                retourne les nouveaux emplacements
             
-            with open(self.passwords_file, 'wb') as f:
-                f.write(encrypted_data)
-        else:
-            # Supprimer le fichier s'il n'y a plus de mots de passe
-            self.passwords_file.unlink(missing_ok=True)
+        Raises:
+            FileNotFoundError: Si le coffre n'existe pas
+            VaultConflictError: Si les clés ont changé entre-temps
+        """
+        vault = self._snapshot(with_segments=False)
+        if vault is None:
+            raise FileNotFoundError("Aucun coffre à modifier")
         
-        return True
+        header, segments, _ = vault
+        data_key, index = self._unlock_key(header, segments)
+        
+        with self.lock.exclusive():
+            current = self._read_vault(with_segments=False)
+            if current is None or _key_fields(current[0]) != _key_fields(header):
+                raise VaultConflictError("Les clés du coffre ont changé pendant la modification, réessayez")
+            if current[0].get("legacy"):
+                # Ancien format : conversion en instantané (même clé) d'abord
+                self._checkpoint(_fernet(data_key))
+                current = self._read_vault(with_segments=False)
+            
+            header = current[0]
+            slots = header.get("slots")
+            if slots is None:
+                slots = [{
+                    "label": MASTER_SLOT,
+                    "salt": header["salt"],
+                    "wrapped": _fernet(data_key).encrypt(data_key).decode('ascii'),
+                    "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }]
+                index = 0
+            
+            new_header = {name: value for name, value in header.items() if name != "salt"}
+            new_header["key_id"] = _key_id(header)
+            new_header["slots"] = change(list(slots), data_key, index)
+            
+            with open(self.passwords_file, 'rb') as f:
+                read_container_header(f)
+                with atomic_writer(self.passwords_file) as out:
+                    write_container(out, new_header, iter_container_segments(f))
+    
+    def change_master_password(self, new_password: str, label: Optional[str] = None) -> None:
+        """
+        Change le mot de passe maître sans rechiffrer les entrées.
+        
+        Le mot de passe actuel (demandé comme d'habitude) ouvre un
+        emplacement de clé ; seul l'emplacement visé est remplacé.
+        
+        Args:
+            new_password: Nouveau mot de passe
+            label: Emplacement à remplacer (par défaut celui ouvert par le
+                mot de passe saisi ; ``"master"`` pour redéfinir le mot de
+                passe maître avec une clé de récupération)
+        """
+        if not new_password:
+            raise ValueError("Mot de passe maître requis")
+        
+        def change(slots, data_key, index):
+            if label is not None:
+                index = self._slot_index(slots, label)
+            slots[index] = self._new_slot(data_key, new_password, slots[index]["label"])
+            return slots
+        
+        self._rewrite_key_slots(change)
+    
+    def add_key_slot(self, password: str, label: str) -> None:
+        """
+        Ajoute un emplacement de clé : ``password`` ouvrira aussi le coffre.
+        
+        Args:
+            password: Mot de passe de l'emplacement
+            label: Libellé unique de l'emplacement
+        """
+        if not password:
+            raise ValueError("Mot de passe requis")
+        
+        def change(slots, data_key, index):
+            if any(slot["label"] == label for slot in slots):
+                raise ValueError(f"Emplacement de clé déjà utilisé : {label}")
+            return slots + [self._new_slot(data_key, password, label)]
+        
+        self._rewrite_key_slots(change)
+    
+    def add_recovery_key(self, label: str = RECOVERY_SLOT) -> str:
+        """
+        Génère une clé de récupération et l'ajoute comme emplacement de clé.
+        
+        Saisie à la place du mot de passe maître, elle ouvre le coffre ;
+        ``change_master_password(..., label="master")`` redéfinit alors le
+        mot de passe oublié.
+        
+        Returns:
+            Clé de récupération (160 bits, en groupes de 4 caractères)
+        """
+        raw = base64.b32encode(os.urandom(20)).decode('ascii')
+        recovery_key = "-".join(raw[i:i + 4] for i in range(0, len(raw), 4))
+        self.add_key_slot(recovery_key, label)
+        return recovery_key
+    
+    def remove_key_slot(self, label: str) -> None:
+        """
+        Supprime un emplacement de clé (pas le dernier).
+        
+        La clé de données ne change pas : un détenteur qui l'aurait déjà
+        extraite garde l'accès aux données existantes.
+        """
+        def change(slots, data_key, index):
+            position = self._slot_index(slots, label)
+            if len(slots) == 1:
+                raise ValueError("Impossible de supprimer le dernier emplacement de clé")
+            return slots[:position] + slots[position + 1:]
+        
+        self._rewrite_key_slots(change)
+    
+    @staticmethod
+    def _slot_index(slots: List[Dict], label: str) -> int:
+        for index, slot in enumerate(slots):
+            if slot["label"] == label:
+                return index
+        raise ValueError(f"Emplacement de clé introuvable : {label}")
+    
+    def key_slots(self) -> List[Dict]:
+        """
+        Liste les emplacements de clé, sans mot de passe.
+        
+        Returns:
+            Libellé et date de chaque emplacement (un seul emplacement
+            ``master`` sans date pour un coffre qui n'en a pas encore)
+        """
+        vault = self._snapshot(with_segments=False)
+        if vault is None:
+            return []
+        
+        slots = vault[0].get("slots")
+        if slots is None:
+            return [{"label": MASTER_SLOT, "date": None}]
+        return [{"label": slot["label"], "date": slot.get("date")} for slot in slots]
+    
+    def _clear_locked(self) -> None:
+        """Supprime instantané, journal et index de recherche (verrou exclusif requis)."""
+        self.passwords_file.unlink(missing_ok=True)
+        self.journal.clear()
+        self.index_file.unlink(missing_ok=True)
     
     def clear_passwords(self) -> None:
         """
         Supprime tous les mots de passe sauvegardés.
+        
+        Le coffre est effacé avec sa clé : les emplacements de clé (clés de
+        récupération comprises) sont perdus, la sauvegarde suivante crée une
+        nouvelle clé avec le seul mot de passe maître.
         """
-        self.passwords_file.unlink(missing_ok=True)
+        with self.lock.exclusive():
+            self._clear_locked()
     
-    def export_passwords(self, export_path: str, include_passwords: bool = False) -> None:
+    def export_passwords(self, export_path: str, include_passwords: bool = False,
+                         format: Optional[str] = None, layout: str = "securepassgen") -> int:
         """
-        Exporte les mots de passe vers un fichier.
+        Exporte les mots de passe vers un fichier, au fil de l'eau.
         
         Args:
             export_path: Chemin du fichier d'export
             include_passwords: Inclure les mots de passe en clair
+            format: ``"json"``, ``"ndjson"`` ou ``"csv"`` (déduit de
+                l'extension si None)
+            layout: Disposition des colonnes pour le CSV
+                (voir ``import_export.CSV_LAYOUTS``)
+            
+        Returns:
+            Nombre de mots de passe exportés
+        """
+        format = format or import_export.detect_format(export_path)
+        if format not in import_export.FORMATS:
+            raise ValueError(f"Format d'export inconnu: {format}")
+        
+        with open(export_path, 'w', encoding='utf-8', newline='' if format == "csv" else None) as f:
+            return self.export_to(f, include_passwords, format, layout)
+    
+    def export_to(self, f: TextIO, include_passwords: bool = False, format: str = "ndjson",
+                  layout: str = "securepassgen") -> int:
+        """
+        Exporte les mots de passe dans un fichier texte déjà ouvert (sortie
+        standard par exemple), au fil de l'eau.
+        
+        Args:
+            f: Fichier texte ouvert en écriture (``newline=''`` pour le CSV)
+            include_passwords: Inclure les mots de passe en clair
+            format: ``"json"``, ``"ndjson"`` ou ``"csv"``
+            layout: Disposition des colonnes pour le CSV
+            
+        Returns:
+            Nombre de mots de passe exportés
         """
-        passwords = self.load_passwords()
+        if format not in import_export.FORMATS:
+            raise ValueError(f"Format d'export inconnu: {format}")
         
+        entries = self.iter_passwords()
         if not include_passwords:
             # Masquer les mots de passe
-            for entry in passwords:
-                entry['password'] = '*' * len(entry['password'])
-        
-        export_data = {
-            "export_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "total_passwords": len(passwords),
-            "passwords": passwords
-        }
+            entries = ({**entry, 'password': '*' * len(entry['password'])} for entry in entries)
         
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        if format == "csv":
+            return import_export.write_csv(entries, f, layout)
+        if format == "ndjson":
+            return import_export.write_ndjson(entries, f)
+        return import_export.write_json(entries, f, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     
-    def import_passwords(self, import_path: str) -> int:
+    def import_entries(self, entries: Iterable[Dict], batch_size: int = IMPORT_BATCH_SIZE) -> int:
         """
-        Importe des mots de passe depuis un fichier.
+        Importe des entrées par lots, en ignorant les noms déjà présents.
+        
+        Chaque lot est une transaction du journal : un import interrompu
+        conserve les lots déjà validés. La clé n'est dérivée qu'une fois.
         
         Args:
-            import_path: Chemin du fichier d'import
+            entries: Entrées (``name``, ``password``, ...) à importer
+            batch_size: Nombre d'entrées par transaction
             
         Returns:
             Nombre de mots de passe importés
         """
-        with open(import_path, 'r', encoding='utf-8') as f:
-            import_data = json.load(f)
+        keys: Dict[str, Fernet] = {}
+        try:
+            existing_names = {entry['name'] for entry in self._iter_entries(keys)}
+        except Exception as e:
+            raise Exception(f"Erreur lors du déchiffrement: {e}")
+        
+        imported = 0
+        batch = []
+        
+        def commit(operations):
+            # Ajouts sans contrôle de version : seul l'en-tête du coffre est relu
+            self._update(lambda _: (operations, None), needs_entries=False, keys=keys)
         
-        if 'passwords' not in import_data:
-            raise ValueError("Format de fichier invalide")
+        for entry in entries:
+            # Fusionner les mots de passe (éviter les doublons par nom)
+            if entry['name'] in existing_names:
+                continue
+            existing_names.add(entry['name'])
+            batch.append({"_op": "put", **entry})
+            if len(batch) >= batch_size:
+                commit(batch)
+                imported += len(batch)
+                batch = []
         
-        imported_passwords = import_data['passwords']
-        existing_passwords = self.load_passwords()
+        if batch:
+            commit(batch)
+            imported += len(batch)
         
-        # Fusionner les mots de passe (éviter les doublons par nom)
-        existing_names = {p['name'] for p in existing_passwords}
-        new_passwords = [p for p in imported_passwords if p['name'] not in existing_names]
+        return imported
+    
+    def import_passwords(self, import_path: str, format: Optional[str] = None,
+                         layout: Optional[str] = None) -> int:
+        """
+        Importe des mots de passe depuis un fichier.
         
-        if new_passwords:
-            all_passwords = existing_passwords + new_passwords
-            data = json.dumps(all_passwords, indent=2)
-            encrypted_data = self._encrypt_data(data)
+        Les exports CSV de Chrome, Firefox, Bitwarden, LastPass, KeePass et
+        1Password sont reconnus d'après leur ligne d'en-tête.
+        
+        Args:
+            import_path: Chemin du fichier d'import
+            format: ``"json"``, ``"ndjson"`` ou ``"csv"`` (déduit de
+                l'extension si None)
+            layout: Disposition du CSV (détectée si None)
             
-            with open(self.passwords_file, 'wb') as f:
-                f.write(encrypted_data)
+        Returns:
+            Nombre de mots de passe importés
+        """
+        format = format or import_export.detect_format(import_path)
+        if format not in import_export.FORMATS:
+            raise ValueError(f"Format d'import inconnu: {format}")
         
-        return len(new_passwords)
+        with open(import_path, 'r', encoding='utf-8-sig', newline='' if format == "csv" else None) as f:
+            if format == "csv":
+                entries = import_export.read_csv(f, layout)
+            elif format == "ndjson":
+                entries = import_export.read_ndjson(f)
+            else:
+                entries = import_export.read_json(f)
+            return self.import_entries(entries)
     
     def backup_passwords(self, backup_path: str) -> None:
         """
@@ -274,11 +1471,19 @@ class PasswordFileManager:
         Args:
             backup_path: Chemin de la sauvegarde
         """
-        if self.passwords_file.exists():
-            import shutil
-            shutil.copy2(self.passwords_file, backup_path)
-        else:
-            raise FileNotFoundError("Aucun fichier de mots de passe à sauvegarder")
+        with self.lock.shared():
+            if self.passwords_file.exists():
+                import shutil
+                shutil.copy2(self.passwords_file, backup_path)
+                
+                # Le journal accompagne l'instantané pour ne perdre aucune transaction
+                backup_journal = Path(f"{backup_path}.journal")
+                if self.journal.path.exists():
+                    shutil.copy2(self.journal.path, backup_journal)
+                else:
+                    backup_journal.unlink(missing_ok=True)
+            else:
+                raise FileNotFoundError("Aucun fichier de mots de passe à sauvegarder")
     
     def restore_passwords(self, backup_path: str) -> None:
         """
@@ -290,35 +1495,239 @@ class PasswordFileManager:
         if not Path(backup_path).exists():
             raise FileNotFoundError("Fichier de sauvegarde introuvable")
         
-        import shutil
-        shutil.copy2(backup_path, self.passwords_file)
+        with self.lock.exclusive():
+            # Vider le journal d'abord : ses trames ne concernent pas la sauvegarde
+            self.journal.clear()
+            atomic_write(self.passwords_file, Path(backup_path).read_bytes())
+            
+            backup_journal = Path(f"{backup_path}.journal")
+            if backup_journal.exists():
+                atomic_write(self.journal.path, backup_journal.read_bytes())
     
-    def get_statistics(self) -> Dict:
+    def backup_incremental(self, backup_dir: str) -> Dict:
         """
-        Retourne des statistiques sur les mots de passe sauvegardés.
+        Sauvegarde incrémentale dans un dépôt dédupliqué (voir ``BackupStore``).
+        
+        Seuls les morceaux absents du dépôt sont écrits : après un
+        checkpoint, l'en-tête et les segments modifiés ; entre deux
+        checkpoints, la fin du journal. Le verrou du coffre n'est tenu que
+        le temps d'ouvrir l'instantané et de lire le journal.
+        
+        Args:
+            backup_dir: Dossier du dépôt de sauvegardes (créé au besoin)
+            
+        Returns:
+            Manifeste de la sauvegarde (``id``, ``date``, ``version``,
+            ``files`` avec, par fichier, sa taille et les octets écrits)
+        """
+        store = BackupStore(backup_dir)
+        
+        with self.lock.shared():
+            vault = self._read_vault(with_segments=False)
+            if vault is None:
+                raise FileNotFoundError("Aucun fichier de mots de passe à sauvegarder")
+            version = self._version(vault[0], vault[2])
+            f = open(self.passwords_file, 'rb')
+            try:
+                journal = self.journal.path.read_bytes()
+            except FileNotFoundError:
+                journal = b""
+        
+        # Un checkpoint concurrent remplace l'instantané par renommage :
+        # le descripteur ouvert désigne toujours celui qui va avec le journal lu
+        with store.lock.shared():
+            with f:
+                files = {self.passwords_file.name: store.store(iter_vault_chunks(f))}
+            if journal:
+                files[self.journal.path.name] = store.store(
+                    journal[i:i + BLOCK_BYTES] for i in range(0, len(journal), BLOCK_BYTES))
+            return store.add_snapshot(files, version)
+    
+    def list_backups(self, backup_dir: str) -> List[Dict]:
+        """
+        Liste les sauvegardes incrémentales d'un dépôt.
         
         Returns:
-            Dictionnaire avec les statistiques
+            Manifestes, du plus ancien au plus récent
         """
-        try:
-            passwords = self.load_passwords()
-        except:
-            passwords = []
+        return BackupStore(backup_dir).snapshots()
+    
+    def restore_incremental(self, backup_dir: str, snapshot_id: Optional[str] = None,
+                            before: Optional[datetime] = None) -> Dict:
+        """
+        Restaure une sauvegarde incrémentale (à une date donnée si besoin).
+        
+        Tous les morceaux sont vérifiés avant de toucher au coffre : une
+        sauvegarde incomplète ou altérée laisse le coffre intact.
+        
+        Args:
+            backup_dir: Dossier du dépôt de sauvegardes
+            snapshot_id: Identifiant de la sauvegarde
+            before: Restaurer l'état du coffre à cette date (dernière
+                sauvegarde antérieure) ; la plus récente si les deux sont None
+            
+        Returns:
+            Manifeste de la sauvegarde restaurée
+            
+        Raises:
+            FileNotFoundError: Si aucune sauvegarde ne correspond
+            BackupCorruptedError: Si un morceau manque ou est altéré
+        """
+        store = BackupStore(backup_dir)
+        
+        with store.lock.shared():
+            manifest = store.find(snapshot_id, before)
+            files = manifest["files"]
+            journal = files.get(self.journal.path.name)
+            journal_data = store.read(journal) if journal else b""
+            
+            with self.lock.exclusive():
+                with atomic_writer(self.passwords_file) as out:
+                    store.write_to(files[self.passwords_file.name], out)
+                    # Vider le journal avant le remplacement : ses trames ne
+                    # concernent pas la sauvegarde
+                    self.journal.clear()
+                if journal_data:
+                    atomic_write(self.journal.path, journal_data)
+        
+        return manifest
+    
+    def prune_backups(self, backup_dir: str, keep: int) -> Tuple[int, int]:
+        """
+        Ne garde que les ``keep`` sauvegardes incrémentales les plus récentes.
+        
+        Returns:
+            Tuple (sauvegardes supprimées, morceaux libérés)
+        """
+        return BackupStore(backup_dir).prune(keep)
+    
+    def verify(self, authenticate: bool = True, workers: Optional[int] = None,
+               path: Optional[str] = None) -> Dict:
+        """
+        Vérifie l'intégrité du coffre sans déchiffrer ses segments.
         
-        if not passwords:
-            return {
-                "total": 0,
-                "oldest_date": None,
-                "newest_date": None,
-                "average_length": 0
-            }
+        Les segments sont lus au fil de l'eau et hachés en parallèle, puis
+        comparés aux empreintes de l'en-tête (voir ``vault_integrity``).
         
-        dates = [datetime.strptime(p['date'], "%Y-%m-%d %H:%M:%S") for p in passwords]
-        lengths = [len(p['password']) for p in passwords]
+        Args:
+            authenticate: Authentifier aussi l'en-tête et le journal avec le
+                mot de passe maître (une dérivation de clé) ; sinon seule la
+                corruption accidentelle est détectée, sans mot de passe
+            workers: Threads de hachage (tous les cœurs si None)
+            path: Fichier à vérifier à la place du coffre, par exemple une
+                sauvegarde de ``backup_passwords`` (avec son ``.journal``)
+            
+        Returns:
+            Dictionnaire : ``ok``, nombre de ``segments``, segments
+            ``corrupted`` (avec les enregistrements qu'ils contiennent),
+            état de l'en-tête (``"authenticated"``, ``"tampered"`` ou
+            ``"unchecked"``), trames du journal ``journal_frames``, séquences
+            altérées ``journal_corrupted`` et ``journal_ignored_bytes``
+            (trame tronquée ou altérée en fin de journal)
+            
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+            ValueError: Coffre à l'ancien format ou sans empreintes
+                (``checkpoint`` les ajoute), ou mot de passe maître incorrect
+        """
+        vault_path = Path(path) if path else self.passwords_file
+        journal = VaultJournal(f"{path}.journal") if path else self.journal
+        
+        with self.lock.shared():
+            try:
+                f = open(vault_path, 'rb')
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Coffre introuvable : {vault_path}")
+            frames, ignored_bytes = journal.inspect()
+        
+        with f:
+            if f.read(len(CONTAINER_MAGIC)) != CONTAINER_MAGIC:
+                raise ValueError("Coffre à l'ancien format : migrez-le avant de le vérifier")
+            f.seek(0)
+            header = read_container_header(f)
+            if "leaves" not in header:
+                raise ValueError("Coffre sans empreintes d'intégrité : un checkpoint les ajoute")
+            leaves = [bytes.fromhex(leaf) for leaf in header["leaves"]]
+            
+            def segments():
+                try:
+                    yield from iter_container_segments(f)
+                except VaultFormatError:
+                    return  # Fichier tronqué : les segments absents sont signalés
+            
+            corrupted = []
+            found = 0
+            for index, digest in enumerate(iter_digests(segments(), workers)):
+                found += 1
+                if index >= len(leaves) or digest != leaves[index]:
+                    corrupted.append(index)
+            corrupted.extend(range(found, len(leaves)))
+        
+        header_state = "unchecked"
+        journal_corrupted = []
+        if authenticate:
+            fernet = self._unlock(header, None)
+            try:
+                payload = fernet.decrypt(header["merkle"].encode('ascii'))
+            except InvalidToken:
+                payload = None
+            expected = integrity_payload(leaves, header["seq"], header.get("counts"))
+            header_state = "authenticated" if payload == expected else "tampered"
+            
+            # Signature des trames vérifiée sans déchiffrer leur contenu
+            for sequence, token in frames:
+                try:
+                    fernet.extract_timestamp(token)
+                except InvalidToken:
+                    journal_corrupted.append(sequence)
         
+        ranges = record_ranges(header.get("counts") or [])
         return {
-            "total": len(passwords),
-            "oldest_date": min(dates).strftime("%Y-%m-%d %H:%M:%S"),
-            "newest_date": max(dates).strftime("%Y-%m-%d %H:%M:%S"),
-            "average_length": round(sum(lengths) / len(lengths), 1)
+            "ok": not corrupted and header_state != "tampered" and not journal_corrupted
+                  and not ignored_bytes,
+            "segments": max(found, len(leaves)),
+            "corrupted": [describe_segment(index, ranges) for index in corrupted],
+            "header": header_state,
+            "journal_frames": len(frames),
+            "journal_corrupted": journal_corrupted,
+            "journal_ignored_bytes": ignored_bytes,
         }
+    
+    def _load_stats(self) -> VaultStats:
+        """
+        Résumé statistique du coffre, sans déchiffrer ses segments.
+        
+        Pour un coffre écrit avant l'introduction des statistiques (ou dont
+        le journal ne permet pas de les tenir à jour), le résumé est calculé
+        en mémoire en parcourant les entrées ; la lecture n'écrit rien, le
+        prochain checkpoint complète l'instantané.
+        """
+        vault = self._snapshot(with_segments=False)
+        if vault is None:
+            return VaultStats()
+        
+        header, segments, frames = vault
+        fernet = self._unlock(header, segments)
+        stats = self._current_stats(fernet, header, self._journal_operations(fernet, header, frames))
+        if stats is not None:
+            return stats
+        
+        return VaultStats.of(self._iter_entries({_key_id(header): fernet}))
+    
+    def get_statistics(self) -> Dict:
+        """
+        Retourne des statistiques sur les mots de passe sauvegardés.
+        
+        Les statistiques proviennent du résumé chiffré tenu à jour à chaque
+        écriture : seuls l'en-tête du coffre et le journal sont déchiffrés
+        (tout le coffre s'il n'a pas encore de résumé, voir ``_load_stats``).
+        
+        Returns:
+            Dictionnaire avec les statistiques (voir ``VaultStats.report``)
+        """
+        try:
+            stats = self._load_stats()
+        except Exception:
+            stats = VaultStats()
+        
+        return stats.report()
@@ -0,0 +1,284 @@
+"""
+Import et export des mots de passe au fil de l'eau (NDJSON, CSV, JSON).
+
+Les lecteurs produisent des entrées une par une et les écrivains les
+consomment une par une : aucun format ne nécessite de garder l'ensemble des
+données en mémoire, à l'exception de l'ancien export JSON en lecture
+(``json.load`` n'a pas de mode incrémental).
+
+Les fichiers CSV exportés par les gestionnaires de mots de passe courants
+(Chrome, Firefox, Bitwarden, LastPass, KeePass, 1Password) sont reconnus
+automatiquement d'après leur ligne d'en-tête.
+"""
+
+import csv
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+from urllib.parse import urlparse
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Correspondance champ du coffre -> colonne CSV, dans l'ordre des colonnes
+CSV_LAYOUTS: Dict[str, Dict[str, str]] = {
+    "securepassgen": {
+        "name": "name", "password": "password", "description": "description",
+        "date": "date", "username": "username", "url": "url",
+    },
+    "chrome": {
+        "name": "name", "url": "url", "username": "username",
+        "password": "password", "description": "note",
+    },
+    "firefox": {
+        "url": "url", "username": "username", "password": "password", "date": "timeCreated",
+    },
+    "bitwarden": {
+        "name": "name", "description": "notes", "url": "login_uri",
+        "username": "login_username", "password": "login_password",
+    },
+    "lastpass": {
+        "url": "url", "username": "username", "password": "password",
+        "description": "extra", "name": "name",
+    },
+    "keepass": {
+        "name": "Title", "username": "Username", "password": "Password",
+        "url": "URL", "description": "Notes",
+    },
+    "1password": {
+        "name": "Title", "url": "Url", "username": "Username",
+        "password": "Password", "description": "Notes",
+    },
+}
+
+# Champs optionnels conservés dans le coffre lorsqu'ils sont renseignés
+_OPTIONAL_FIELDS = ("username", "url")
+
+# Champs dont la colonne peut manquer sans empêcher la détection du format
+_OPTIONAL_COLUMNS = ("description", "date", "username", "url")
+
+FORMATS = ("json", "ndjson", "csv")
+
+
+def detect_format(path: str) -> str:
+    """
+    Déduit le format d'un fichier d'après son extension.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        ``"ndjson"``, ``"csv"`` ou ``"json"`` (par défaut)
+    """
+    suffix = str(path).lower().rsplit(".", 1)[-1]
+    if suffix in ("ndjson", "jsonl"):
+        return "ndjson"
+    if suffix == "csv":
+        return "csv"
+    return "json"
+
+
+def detect_csv_layout(columns: List[str]) -> str:
+    """
+    Reconnaît la disposition d'un CSV d'après sa ligne d'en-tête.
+
+    Args:
+        columns: Noms des colonnes
+
+    Returns:
+        Nom de la disposition (clé de ``CSV_LAYOUTS``)
+
+    Raises:
+        ValueError: Si aucune disposition connue ne correspond
+    """
+    present = set(columns)
+    candidates = [
+        (sum(column in present for column in mapping.values()), name)
+        for name, mapping in CSV_LAYOUTS.items()
+        if all(column in present for field, column in mapping.items()
+               if field not in _OPTIONAL_COLUMNS)
+    ]
+    if not candidates:
+        raise ValueError(f"Format CSV non reconnu (colonnes: {', '.join(columns)})")
+
+    return max(candidates)[1]
+
+
+def _normalize_date(value: str) -> str:
+    """Convertit un horodatage (epoch en s ou ms) au format du coffre."""
+    if value.isdigit():
+        timestamp = int(value)
+        if timestamp > 10 ** 11:
+            timestamp //= 1000  # millisecondes (Firefox)
+        return datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+    return value
+
+
+def normalize_entry(raw: Dict, now: Optional[str] = None) -> Optional[Dict]:
+    """
+    Ramène une entrée importée au format du coffre.
+
+    Sans nom explicite, le nom est dérivé de l'URL (et de l'identifiant).
+
+    Args:
+        raw: Entrée avec au moins ``password`` et ``name`` ou ``url``
+        now: Date à utiliser si l'entrée n'en a pas
+
+    Returns:
+        Entrée normalisée, ou None si elle est inutilisable
+    """
+    password = raw.get("password") or ""
+    name = raw.get("name") or ""
+    url = raw.get("url") or ""
+    username = raw.get("username") or ""
+
+    if not name and url:
+        name = urlparse(url).hostname or url
+        if username:
+            name = f"{name} ({username})"
+    if not name or not password:
+        return None
+
+    entry = {
+        "name": name,
+        "password": password,
+        "description": raw.get("description") or "",
+        "date": _normalize_date(raw.get("date") or "") or now or datetime.now().strftime(DATE_FORMAT),
+    }
+    for field in _OPTIONAL_FIELDS:
+        if raw.get(field):
+            entry[field] = raw[field]
+    return entry
+
+
+def read_ndjson(f: TextIO) -> Iterator[Dict]:
+    """
+    Lit un fichier NDJSON (un objet JSON par ligne).
+
+    Args:
+        f: Fichier texte ouvert en lecture
+
+    Yields:
+        Entrées normalisées (les lignes vides ou inutilisables sont ignorées)
+    """
+    now = datetime.now().strftime(DATE_FORMAT)
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            raw = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Ligne {line_number} invalide: {e}")
+        entry = normalize_entry(raw, now) if isinstance(raw, dict) else None
+        if entry is not None:
+            yield entry
+
+
+def read_csv(f: TextIO, layout: Optional[str] = None) -> Iterator[Dict]:
+    """
+    Lit un fichier CSV (SecurePassGen ou gestionnaire de mots de passe).
+
+    Args:
+        f: Fichier texte ouvert en lecture (``newline=''``)
+        layout: Disposition à utiliser (détectée si None)
+
+    Yields:
+        Entrées normalisées
+    """
+    reader = csv.DictReader(f)
+    if reader.fieldnames is None:
+        return
+
+    mapping = CSV_LAYOUTS[layout or detect_csv_layout(reader.fieldnames)]
+    now = datetime.now().strftime(DATE_FORMAT)
+    for row in reader:
+        raw = {field: row.get(column) for field, column in mapping.items()}
+        entry = normalize_entry(raw, now)
+        if entry is not None:
+            yield entry
+
+
+def read_json(f: TextIO) -> Iterator[Dict]:
+    """
+    Lit un export JSON SecurePassGen (document unique, chargé en entier).
+
+    Args:
+        f: Fichier texte ouvert en lecture
+
+    Yields:
+        Entrées telles qu'exportées
+    """
+    import_data = json.load(f)
+
+    if 'passwords' not in import_data:
+        raise ValueError("Format de fichier invalide")
+
+    yield from import_data['passwords']
+
+
+def write_ndjson(entries: Iterable[Dict], f: TextIO) -> int:
+    """
+    Écrit des entrées au format NDJSON.
+
+    Args:
+        entries: Entrées à écrire
+        f: Fichier texte ouvert en écriture
+
+    Returns:
+        Nombre d'entrées écrites
+    """
+    count = 0
+    for entry in entries:
+        f.write(json.dumps(entry, ensure_ascii=False))
+        f.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(entries: Iterable[Dict], f: TextIO, layout: str = "securepassgen") -> int:
+    """
+    Écrit des entrées au format CSV.
+
+    Args:
+        entries: Entrées à écrire
+        f: Fichier texte ouvert en écriture (``newline=''``)
+        layout: Disposition des colonnes (clé de ``CSV_LAYOUTS``)
+
+    Returns:
+        Nombre d'entrées écrites
+    """
+    mapping = CSV_LAYOUTS[layout]
+    writer = csv.writer(f)
+    writer.writerow(list(mapping.values()))
+
+    count = 0
+    for entry in entries:
+        writer.writerow([entry.get(field, "") for field in mapping])
+        count += 1
+    return count
+
+
+def write_json(entries: Iterable[Dict], f: TextIO, export_date: str) -> int:
+    """
+    Écrit des entrées au format d'export JSON SecurePassGen, au fil de l'eau.
+
+    Le total est écrit après la liste, une fois connu.
+
+    Args:
+        entries: Entrées à écrire
+        f: Fichier texte ouvert en écriture
+        export_date: Date de l'export
+
+    Returns:
+        Nombre d'entrées écrites
+    """
+    f.write('{\n  "export_date": %s,\n  "passwords": [' % json.dumps(export_date))
+
+    count = 0
+    for entry in entries:
+        f.write(",\n    " if count else "\n    ")
+        f.write(json.dumps(entry, ensure_ascii=False))
+        count += 1
+
+    f.write('\n  ],\n  "total_passwords": %d\n}\n' % count if count else '],\n  "total_passwords": 0\n}\n')
+    return count
@@ -0,0 +1,284 @@
+"""
+Instrumentation des chemins critiques : compteurs et histogrammes de latence.
+
+Désactivée par défaut ; activée par la variable d'environnement
+``SECUREPASSGEN_METRICS=1`` ou par ``enable()``. Désactivée, chaque point de
+mesure se réduit à un test booléen (``state.enabled``) : aucun appel
+d'horloge, aucun verrou.
+
+Points de mesure typiques::
+
+    start = metrics.start()
+    ...
+    start = metrics.lap(PHASE_SECONDS, start, ("length",))   # observe et repart
+    ...
+    metrics.observe_since(PHASE_SECONDS, start, ("patterns",))
+
+L'export se fait au format texte de Prometheus (``render``), par exemple via
+la route ``/metrics`` de ``web_app.py``. Les valeurs sont propres au
+processus : avec plusieurs processus de travail, chaque réponse ne reflète
+que le processus qui l'a servie.
+"""
+
+import bisect
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+ENV_VAR = "SECUREPASSGEN_METRICS"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bornes des histogrammes de latence (secondes), de 5 µs à 10 s
+DEFAULT_BUCKETS = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = Tuple[str, ...]
+
+# (nom, type, aide, [(étiquettes, valeur)]) produit par un collecteur
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+class _State:
+    """Interrupteur global, lu à chaque point de mesure."""
+    __slots__ = ("enabled",)
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+
+
+state = _State(os.environ.get(ENV_VAR, "") not in ("", "0"))
+
+
+def enable() -> None:
+    """Active l'instrumentation."""
+    state.enabled = True
+
+
+def disable() -> None:
+    """Désactive l'instrumentation (les valeurs déjà mesurées sont gardées)."""
+    state.enabled = False
+
+
+def is_enabled() -> bool:
+    return state.enabled
+
+
+class Counter:
+    """Compteur monotone, éventuellement étiqueté."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, labels: Labels = ()) -> None:
+        """Incrémente le compteur (sans effet si l'instrumentation est désactivée)."""
+        if not state.enabled:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in values]
+
+
+class Histogram:
+    """Histogramme cumulatif (compatible Prometheus), éventuellement étiqueté."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # étiquettes -> [effectifs par borne (+ dépassement), somme, nombre]
+        self._series: Dict[Labels, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Enregistre une observation (sans effet si l'instrumentation est désactivée)."""
+        if not state.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, labels: Labels = ()) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def sum(self, labels: Labels = ()) -> float:
+        series = self._series.get(labels)
+        return series[1] if series else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def _render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, ([*counts], total, count))
+                            for labels, (counts, total, count) in self._series.items())
+        lines = []
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(self.labelnames + ("le",), labels + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class Registry:
+    """
+    Ensemble des métriques d'un processus.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"La métrique {name} existe déjà avec un autre type")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Compteur ``name`` (créé au premier appel)."""
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Histogramme ``name`` (créé au premier appel)."""
+        return self._get_or_create(Histogram, name, help, labelnames, buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """
+        Ajoute une fonction appelée à chaque export, pour des valeurs tenues
+        ailleurs (par exemple les compteurs du limiteur de débit).
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def reset(self) -> None:
+        """Remet toutes les métriques à zéro (tests)."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def render(self, extra: Iterable[Family] = ()) -> str:
+        """
+        Export au format texte de Prometheus (version 0.0.4).
+
+        Args:
+            extra: Familles supplémentaires propres à l'appelant (par exemple
+                les compteurs d'une instance d'application)
+        """
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines.extend(metric._render())
+        families = [family for collector in list(self._collectors) for family in collector()]
+        for name, kind, help, samples in families + list(extra):
+            lines.append(f"# HELP {name} {_escape_help(help)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                names = tuple(labels)
+                lines.append(f"{name}{_format_labels(names, tuple(labels[n] for n in names))} "
+                             f"{_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+    """Compteur du registre global."""
+    return REGISTRY.counter(name, help, labelnames)
+
+
+def histogram(name: str, help: str, labelnames: Sequence[str] = (),
+              buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    """Histogramme du registre global."""
+    return REGISTRY.histogram(name, help, labelnames, buckets)
+
+
+def render(extra: Iterable[Family] = ()) -> str:
+    """Export du registre global au format Prometheus."""
+    return REGISTRY.render(extra)
+
+
+def start() -> Optional[float]:
+    """Début d'une mesure : instant courant, ou None si l'instrumentation est désactivée."""
+    return time.perf_counter() if state.enabled else None
+
+
+def observe_since(histogram: Histogram, started: Optional[float], labels: Labels = ()) -> None:
+    """Observe la durée écoulée depuis ``start()`` (sans effet si None)."""
+    if started is not None:
+        histogram.observe(time.perf_counter() - started, labels)
+
+
+def lap(histogram: Histogram, started: Optional[float], labels: Labels = ()) -> Optional[float]:
+    """Observe la durée écoulée depuis ``started`` et retourne le nouvel instant de départ."""
+    if started is None:
+        return None
+    now = time.perf_counter()
+    histogram.observe(now - started, labels)
+    return now
@@ -0,0 +1,193 @@
+"""
+Serveur WSGI multi-processus « pre-fork » (bibliothèque standard seulement).
+
+Le processus maître ouvre la socket d'écoute puis crée ``workers``
+processus fils qui acceptent les connexions sur cette socket partagée.
+Chaque fils exécute ``post_fork`` (préchauffage) avant de servir, et le
+maître relance un fils qui meurt de façon inattendue.
+
+Arrêt en douceur : sur SIGTERM ou SIGINT, le maître transmet SIGTERM aux
+fils, qui terminent la requête en cours puis quittent ; ceux qui n'ont pas
+fini après ``graceful_timeout`` secondes reçoivent SIGKILL.
+
+Réservé aux systèmes POSIX (``os.fork``).
+"""
+
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Callable, Dict, Optional
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+
+# Délai d'attente d'une connexion avant de revérifier le signal d'arrêt (s)
+ACCEPT_POLL_INTERVAL = 0.5
+
+# Intervalle de surveillance des fils par le maître (s)
+SUPERVISE_INTERVAL = 0.2
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Gestionnaire de requêtes sans journal d'accès sur stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _WorkerServer(WSGIServer):
+    """Serveur WSGI d'un fils, branché sur la socket d'écoute du maître."""
+
+    def __init__(self, listener: socket.socket, app, handler_class):
+        super().__init__(listener.getsockname()[:2], handler_class, bind_and_activate=False)
+        self.socket.close()
+        self.socket = listener
+        host, port = listener.getsockname()[:2]
+        self.server_name = socket.getfqdn(host)
+        self.server_port = port
+        self.setup_environ()
+        self.set_app(app)
+        self.timeout = ACCEPT_POLL_INTERVAL
+
+    def get_request(self):
+        # La socket d'écoute est non bloquante (plusieurs fils s'y disputent
+        # chaque connexion) ; la connexion acceptée, elle, doit bloquer.
+        conn, address = self.socket.accept()
+        conn.setblocking(True)
+        return conn, address
+
+    def server_close(self):
+        pass  # La socket d'écoute appartient au maître
+
+
+class PreforkServer:
+    """
+    Maître d'un groupe de processus WSGI.
+    """
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 8000, workers: int = 2,
+                 post_fork: Optional[Callable[[], None]] = None, graceful_timeout: float = 30.0,
+                 backlog: int = 128, access_log: bool = False):
+        """
+        Args:
+            app: Application WSGI
+            host: Adresse d'écoute
+            port: Port d'écoute (0 : port libre choisi par le système)
+            workers: Nombre de processus fils
+            post_fork: Appelé dans chaque fils avant de servir (préchauffage)
+            graceful_timeout: Délai laissé aux fils pour terminer à l'arrêt
+            backlog: File d'attente des connexions
+            access_log: Journaliser chaque requête sur stderr
+        """
+        if workers < 1:
+            raise ValueError("Il faut au moins un processus de travail")
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.post_fork = post_fork
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.handler_class = WSGIRequestHandler if access_log else _QuietHandler
+        self.socket: Optional[socket.socket] = None
+        self.children: Dict[int, int] = {}  # pid -> numéro du fils
+        self._stopping = False
+
+    def bind(self) -> int:
+        """
+        Ouvre la socket d'écoute.
+
+        Returns:
+            Port effectivement utilisé
+        """
+        if self.socket is None:
+            self.socket = socket.create_server((self.host, self.port), backlog=self.backlog)
+            self.socket.setblocking(False)
+            self.port = self.socket.getsockname()[1]
+        return self.port
+
+    def serve(self) -> None:
+        """Lance les fils et les surveille jusqu'au signal d'arrêt."""
+        self.bind()
+        self._stopping = False
+        previous = {sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            for number in range(self.workers):
+                self._spawn(number)
+            while not self._stopping:
+                self._reap(respawn=True)
+                time.sleep(SUPERVISE_INTERVAL)
+        finally:
+            self._shutdown_children()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self.socket.close()
+            self.socket = None
+
+    def _request_stop(self, signum, frame) -> None:
+        self._stopping = True
+
+    def _spawn(self, number: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self._run_worker()
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        self.children[pid] = number
+
+    def _reap(self, respawn: bool) -> None:
+        """Récupère les fils terminés et, si demandé, les remplace."""
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            number = self.children.pop(pid, None)
+            if number is not None and respawn and not self._stopping:
+                print(f"⚠️  Processus {pid} terminé (statut {status}), relance", file=sys.stderr)
+                self._spawn(number)
+
+    def _shutdown_children(self) -> None:
+        """Arrêt en douceur des fils, puis SIGKILL après le délai."""
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.children and time.monotonic() < deadline:
+            self._reap(respawn=False)
+            time.sleep(0.05)
+
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self.children.clear()
+
+    def _run_worker(self) -> None:
+        """Boucle d'un fils : préchauffage, puis une requête à la fois."""
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # Le maître gère Ctrl+C
+
+        if self.post_fork is not None:
+            self.post_fork()
+
+        server = _WorkerServer(self.socket, self.app, self.handler_class)
+        while not stopping:
+            server.handle_request()
@@ -0,0 +1,218 @@
+"""
+Limitation de débit et regroupement des requêtes, en mémoire.
+
+``TokenBucketLimiter`` : un seau de jetons par client (adresse IP), qui se
+remplit de ``rate`` jetons par seconde jusqu'à ``burst``. Les clients sont
+répartis sur plusieurs verrous (``STRIPES``) pour que des requêtes de
+clients différents ne se disputent pas un verrou unique.
+
+``RequestCoalescer`` : chaque requête d'un client reçoit un ticket ; une
+requête plus récente du même client rend les précédentes obsolètes, qui
+sont abandonnées au lieu d'être traitées (frappe au clavier dans le testeur
+de force : seule la dernière valeur compte).
+
+Les deux classes comptent leurs décisions (``stats``), exportables au
+format de ``utils.metrics`` avec ``metric_families``. L'état est propre au
+processus : avec plusieurs processus de travail, chaque processus limite et
+regroupe les requêtes qu'il reçoit.
+"""
+
+import itertools
+import math
+import os
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+STRIPES = 16
+
+# Débit de /analyze par adresse IP (requêtes par seconde, 0 : pas de limite)
+ANALYZE_RATE_ENV_VAR = "SECUREPASSGEN_ANALYZE_RATE"
+DEFAULT_ANALYZE_RATE = 20.0
+
+
+class TokenBucketLimiter:
+    """
+    Limiteur de débit par client (seau de jetons).
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 100000, clock=time.monotonic):
+        """
+        Args:
+            rate: Jetons ajoutés par seconde
+            burst: Capacité du seau (rafale autorisée)
+            max_clients: Nombre de clients suivis au-delà duquel les seaux
+                pleins (clients inactifs) sont oubliés
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("Le débit doit être positif et la rafale d'au moins un jeton")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._max_per_stripe = max(1, max_clients // STRIPES)
+        self._locks = [threading.Lock() for _ in range(STRIPES)]
+        self._buckets: List[Dict[Hashable, List[float]]] = [{} for _ in range(STRIPES)]
+        self._allowed = [0] * STRIPES
+        self._dropped = [0] * STRIPES
+
+    def acquire(self, client: Hashable, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        Consomme ``cost`` jetons du seau de ``client``.
+
+        Returns:
+            (requête autorisée, secondes avant qu'elle le soit)
+        """
+        stripe = hash(client) % STRIPES
+        with self._locks[stripe]:
+            buckets = self._buckets[stripe]
+            now = self.clock()
+            bucket = buckets.get(client)
+            if bucket is None:
+                if len(buckets) >= self._max_per_stripe:
+                    self._evict_idle(buckets, now)
+                bucket = buckets[client] = [self.burst, now]
+
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens >= cost:
+                bucket[0] = tokens - cost
+                self._allowed[stripe] += 1
+                return True, 0.0
+            bucket[0] = tokens
+            self._dropped[stripe] += 1
+            return False, (cost - tokens) / self.rate
+
+    def allow(self, client: Hashable, cost: float = 1.0) -> bool:
+        """Comme ``acquire``, sans le délai d'attente."""
+        return self.acquire(client, cost)[0]
+
+    def _evict_idle(self, buckets: Dict[Hashable, List[float]], now: float) -> None:
+        """Oublie les clients dont le seau serait de nouveau plein."""
+        refill = self.burst / self.rate
+        idle = [client for client, (tokens, last) in buckets.items() if now - last >= refill]
+        for client in idle:
+            del buckets[client]
+        if len(buckets) >= self._max_per_stripe:
+            # Tous actifs : oublier le plus ancien plutôt que grossir sans fin
+            del buckets[min(buckets, key=lambda client: buckets[client][1])]
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs : requêtes autorisées, rejetées, clients suivis."""
+        return {
+            'allowed': sum(self._allowed),
+            'dropped': sum(self._dropped),
+            'clients': sum(len(buckets) for buckets in self._buckets),
+        }
+
+
+def analyze_limiter_from_environment() -> Optional[TokenBucketLimiter]:
+    """
+    Limiteur de ``/analyze`` selon ``SECUREPASSGEN_ANALYZE_RATE`` (rafale :
+    deux secondes de débit).
+
+    Returns:
+        Limiteur, ou None si la limitation est désactivée (débit 0)
+    """
+    rate = float(os.environ.get(ANALYZE_RATE_ENV_VAR, DEFAULT_ANALYZE_RATE))
+    if rate <= 0:
+        return None
+    return TokenBucketLimiter(rate, burst=max(1.0, 2 * rate))
+
+
+def retry_after_header(delay: float) -> str:
+    """Valeur de l'en-tête ``Retry-After`` (secondes entières, au moins 1)."""
+    return str(max(1, math.ceil(delay)))
+
+
+class RequestCoalescer:
+    """
+    Regroupe les requêtes successives d'un même client : seule la plus
+    récente est traitée.
+    """
+
+    def __init__(self):
+        self._tickets = itertools.count(1)
+        self._locks = [threading.Lock() for _ in range(STRIPES)]
+        self._latest: List[Dict[Hashable, int]] = [{} for _ in range(STRIPES)]
+        self._started = [0] * STRIPES
+        self._merged = [0] * STRIPES
+
+    def begin(self, client: Hashable) -> int:
+        """
+        Enregistre une nouvelle requête de ``client``.
+
+        Returns:
+            Ticket de la requête (rend obsolètes les tickets précédents)
+        """
+        ticket = next(self._tickets)
+        stripe = hash(client) % STRIPES
+        with self._locks[stripe]:
+            self._latest[stripe][client] = ticket
+            self._started[stripe] += 1
+        return ticket
+
+    def is_latest(self, client: Hashable, ticket: int) -> bool:
+        """
+        Indique si ``ticket`` est toujours la requête la plus récente.
+
+        Une réponse négative compte comme un regroupement : l'appelant
+        abandonne la requête.
+        """
+        stripe = hash(client) % STRIPES
+        with self._locks[stripe]:
+            if self._latest[stripe].get(client) == ticket:
+                return True
+            self._merged[stripe] += 1
+            return False
+
+    def finish(self, client: Hashable, ticket: int) -> None:
+        """Oublie le client si ``ticket`` était sa dernière requête."""
+        stripe = hash(client) % STRIPES
+        with self._locks[stripe]:
+            latest = self._latest[stripe]
+            if latest.get(client) == ticket:
+                del latest[client]
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs : requêtes reçues, requêtes remplacées, clients en cours."""
+        return {
+            'started': sum(self._started),
+            'merged': sum(self._merged),
+            'in_flight': sum(len(latest) for latest in self._latest),
+        }
+
+
+def metric_families(route: str, limiter: Optional[TokenBucketLimiter] = None,
+                    coalescer: Optional[RequestCoalescer] = None) -> List[Tuple]:
+    """
+    Compteurs d'un limiteur et d'un regroupeur sous forme de familles
+    ``utils.metrics`` (voir ``Registry.render``).
+
+    Args:
+        route: Route concernée (étiquette ``route``)
+        limiter: Limiteur de débit de la route, s'il y en a un
+        coalescer: Regroupeur de requêtes de la route, s'il y en a un
+
+    Returns:
+        Liste de familles (nom, type, aide, échantillons)
+    """
+    families = []
+    if limiter is not None:
+        stats = limiter.stats()
+        families.append(("securepassgen_rate_limit_requests_total", "counter",
+                         "Requêtes vues par le limiteur de débit",
+                         [({'route': route, 'outcome': 'allowed'}, stats['allowed']),
+                          ({'route': route, 'outcome': 'dropped'}, stats['dropped'])]))
+        families.append(("securepassgen_rate_limit_clients", "gauge",
+                         "Clients suivis par le limiteur de débit",
+                         [({'route': route}, stats['clients'])]))
+    if coalescer is not None:
+        stats = coalescer.stats()
+        families.append(("securepassgen_coalesced_requests_total", "counter",
+                         "Requêtes reçues et requêtes remplacées par une plus récente",
+                         [({'route': route, 'outcome': 'started'}, stats['started']),
+                          ({'route': route, 'outcome': 'merged'}, stats['merged'])]))
+        families.append(("securepassgen_coalesced_in_flight", "gauge",
+                         "Clients dont une requête est en cours",
+                         [({'route': route}, stats['in_flight'])]))
+    return families
@@ -0,0 +1,80 @@
+"""
+Attente active de la disponibilité d'un serveur HTTP.
+
+Plutôt qu'une pause fixe après le lancement du serveur web, le lanceur
+interroge ``/healthz`` avec un délai croissant (backoff exponentiel) : le
+navigateur s'ouvre dès que le serveur répond, sans attendre inutilement
+sur une machine rapide ni trop tôt sur une machine chargée.
+"""
+
+import time
+import urllib.error
+import urllib.request
+from typing import Iterator, NamedTuple
+
+
+class ReadinessResult(NamedTuple):
+    """Résultat de l'attente : prêt ou non, durée écoulée, nombre de sondes."""
+    ready: bool
+    elapsed: float
+    attempts: int
+    reason: str = ""
+
+
+def backoff_delays(initial: float = 0.01, factor: float = 2.0, maximum: float = 0.5) -> Iterator[float]:
+    """
+    Délais successifs entre deux sondes.
+
+    Args:
+        initial: Premier délai (secondes)
+        factor: Facteur multiplicatif
+        maximum: Délai maximal
+
+    Yields:
+        Délais en secondes
+    """
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * factor, maximum)
+
+
+def wait_for_http(url: str, timeout: float = 30.0, process=None,
+                  initial_delay: float = 0.01, max_delay: float = 0.5,
+                  clock=time.monotonic, sleep=time.sleep) -> ReadinessResult:
+    """
+    Attend qu'une URL réponde avec un statut 2xx.
+
+    Args:
+        url: URL de la sonde (par exemple ``http://127.0.0.1:8080/healthz``)
+        timeout: Durée maximale d'attente (secondes)
+        process: Processus du serveur (``subprocess.Popen``) ; l'attente
+            s'arrête s'il se termine
+        initial_delay: Premier délai entre deux sondes
+        max_delay: Délai maximal entre deux sondes
+
+    Returns:
+        ``ReadinessResult``
+    """
+    start = clock()
+    attempts = 0
+
+    for delay in backoff_delays(initial_delay, maximum=max_delay):
+        attempts += 1
+        try:
+            with urllib.request.urlopen(url, timeout=max(max_delay, 1.0)) as response:
+                if 200 <= response.status < 300:
+                    return ReadinessResult(True, clock() - start, attempts)
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass  # Pas encore à l'écoute
+
+        if process is not None and process.poll() is not None:
+            return ReadinessResult(False, clock() - start, attempts,
+                                   f"le serveur s'est arrêté (code {process.returncode})")
+
+        remaining = timeout - (clock() - start)
+        if remaining <= 0:
+            return ReadinessResult(False, clock() - start, attempts, "délai dépassé")
+        sleep(min(delay, remaining))
+
+    raise AssertionError("unreachable")  # pragma: no cover
@@ -0,0 +1,266 @@
+"""
+Codec binaire compact pour les enregistrements du coffre de mots de passe.
+
+Le texte clair du coffre était auparavant un document ``json.dumps(indent=2)``.
+Ce module le remplace par un format colonne, préfixé par sa longueur :
+
+    MAGIC (4 octets) | version (1 octet) | nb_enregistrements (u32) | nb_colonnes (u16)
+    puis, pour chaque colonne :
+        longueur_clé (u16) | clé UTF-8 | type (1 octet) | contenu
+
+Une colonne de type ``COLUMN_DELIMITED`` stocke la liste des enregistrements
+qui n'ont pas ce champ puis un unique bloc UTF-8 contenant les valeurs
+séparées par ``\x1f`` (séparateur d'unité ASCII). Le décodage se résume à un
+``bytes.decode`` et un ``str.split`` par colonne, tous deux exécutés en C.
+Si une valeur contient elle-même le séparateur, la colonne est écrite en
+``COLUMN_TEXT`` : les longueurs (en caractères) sont alors stockées dans un
+tableau u32 et le bloc est découpé par tranches.
+
+Les colonnes contenant autre chose que des chaînes (imports exotiques)
+utilisent ``COLUMN_JSON`` : une liste compacte ``[[index, valeur], ...]``.
+
+Les anciens coffres (JSON) restent lisibles : ``decode_records`` reconnaît
+l'absence de l'en-tête binaire et retombe sur ``json.loads``.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from itertools import accumulate, repeat
+from typing import Dict, List
+
+MAGIC = b"SPGR"
+FORMAT_VERSION = 1
+
+COLUMN_TEXT = 1
+COLUMN_JSON = 2
+COLUMN_DELIMITED = 3
+
+_SEPARATOR = "\x1f"
+
+_HEADER = struct.Struct("<4sBIH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+# Les tableaux sont stockés en little-endian quelle que soit la plateforme
+_SWAP_BYTES = sys.byteorder == "big"
+
+_ABSENT = object()
+
+
+class RecordCodecError(ValueError):
+    """Erreur levée lorsqu'un bloc d'enregistrements est illisible."""
+
+
+def _u32_array(values) -> array:
+    """Construit un tableau d'entiers non signés 32 bits."""
+    data = array("I", values)
+    if data.itemsize != 4:  # pragma: no cover - plateformes exotiques
+        data = array("L", values)
+    return data
+
+
+def _array_to_bytes(data: array) -> bytes:
+    if _SWAP_BYTES:
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def _array_from_bytes(raw: bytes) -> array:
+    data = _u32_array([])
+    data.frombytes(raw)
+    if _SWAP_BYTES:
+        data.byteswap()
+    return data
+
+
+def _take(view: memoryview, position: int, size: int) -> memoryview:
+    """Extrait ``size`` octets à partir de ``position`` (erreur si tronqué)."""
+    chunk = view[position:position + size]
+    if len(chunk) != size:
+        raise RecordCodecError("Données tronquées")
+    return chunk
+
+
+def is_binary_payload(payload: bytes) -> bool:
+    """Indique si ``payload`` est au format binaire (et non JSON)."""
+    return payload[:len(MAGIC)] == MAGIC
+
+
+def encode_records(records: List[Dict]) -> bytes:
+    """
+    Encode une liste d'enregistrements au format binaire.
+
+    Args:
+        records: Liste de dictionnaires (clés de type str)
+
+    Returns:
+        Données encodées
+    """
+    keys: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            if key not in keys:
+                keys[key] = None
+
+    count = len(records)
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, count, len(keys))]
+
+    for key in keys:
+        raw_key = key.encode("utf-8")
+        parts.append(_U16.pack(len(raw_key)))
+        parts.append(raw_key)
+
+        values = [record.get(key, _ABSENT) for record in records]
+        absent = [i for i, value in enumerate(values) if value is _ABSENT]
+        present = [value for value in values if value is not _ABSENT] if absent else values
+
+        if all(type(value) is str for value in present):
+            joined = _SEPARATOR.join(present)
+            delimited = joined.count(_SEPARATOR) == max(len(present) - 1, 0)
+
+            parts.append(bytes((COLUMN_DELIMITED if delimited else COLUMN_TEXT,)))
+            parts.append(_U32.pack(len(absent)))
+            parts.append(_array_to_bytes(_u32_array(absent)))
+            if not delimited:
+                parts.append(_array_to_bytes(_u32_array(map(len, present))))
+                joined = "".join(present)
+
+            blob = joined.encode("utf-8", "surrogatepass")
+            parts.append(_U32.pack(len(blob)))
+            parts.append(blob)
+        else:
+            pairs = [[i, value] for i, value in enumerate(values) if value is not _ABSENT]
+            blob = json.dumps(pairs, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+
+            parts.append(bytes((COLUMN_JSON,)))
+            parts.append(_U32.pack(len(blob)))
+            parts.append(blob)
+
+    return b"".join(parts)
+
+
+def _decode_binary(payload: bytes) -> List[Dict]:
+    view = memoryview(payload)
+    try:
+        _, version, count, column_count = _HEADER.unpack_from(view, 0)
+    except struct.error as e:
+        raise RecordCodecError(f"En-tête tronqué: {e}")
+
+    if version != FORMAT_VERSION:
+        raise RecordCodecError(f"Version de format non supportée: {version}")
+
+    position = _HEADER.size
+    keys = []
+    columns = []
+    missing = []  # Colonnes absentes d'au moins un enregistrement
+
+    try:
+        for column_index in range(column_count):
+            (key_length,) = _U16.unpack_from(view, position)
+            position += _U16.size
+            keys.append(str(_take(view, position, key_length), "utf-8"))
+            position += key_length
+
+            kind = view[position]
+            position += 1
+
+            if kind in (COLUMN_TEXT, COLUMN_DELIMITED):
+                (absent_count,) = _U32.unpack_from(view, position)
+                position += _U32.size
+                absent = _array_from_bytes(_take(view, position, 4 * absent_count))
+                position += 4 * absent_count
+                present_count = count - absent_count
+                if kind == COLUMN_TEXT:
+                    lengths = _array_from_bytes(_take(view, position, 4 * present_count))
+                    position += 4 * present_count
+                (blob_length,) = _U32.unpack_from(view, position)
+                position += _U32.size
+                text = str(_take(view, position, blob_length), "utf-8", "surrogatepass")
+                position += blob_length
+
+                if kind == COLUMN_DELIMITED:
+                    present = text.split(_SEPARATOR) if present_count > 0 else []
+                else:
+                    ends = list(accumulate(lengths))
+                    starts = [0]
+                    starts.extend(ends[:-1])
+                    present = list(map(text.__getitem__, map(slice, starts, ends)))
+
+                if len(absent) != absent_count or len(present) != present_count:
+                    raise RecordCodecError("Colonne tronquée")
+
+                if absent_count:
+                    values = [_ABSENT] * count
+                    absent_set = set(absent)
+                    present_iter = iter(present)
+                    for i in range(count):
+                        if i not in absent_set:
+                            values[i] = next(present_iter)
+                    missing.append(column_index)
+                else:
+                    values = present
+            elif kind == COLUMN_JSON:
+                (blob_length,) = _U32.unpack_from(view, position)
+                position += _U32.size
+                pairs = json.loads(str(_take(view, position, blob_length), "utf-8", "surrogatepass"))
+                position += blob_length
+
+                values = [_ABSENT] * count
+                for i, value in pairs:
+                    values[i] = value
+                if len(pairs) != count:
+                    missing.append(column_index)
+            else:
+                raise RecordCodecError(f"Type de colonne inconnu: {kind}")
+
+            columns.append(values)
+
+        if position != len(view):
+            raise RecordCodecError("Données inattendues après le dernier champ")
+    except RecordCodecError:
+        raise
+    except (struct.error, IndexError, ValueError) as e:
+        raise RecordCodecError(f"Données corrompues: {e}")
+
+    if not columns:
+        return [{} for _ in range(count)]
+
+    # Construction des dictionnaires entièrement en C (paires clé/valeur)
+    records = list(map(dict, zip(*[zip(repeat(key), values) for key, values in zip(keys, columns)])))
+    if missing:
+        for column_index in missing:
+            key = keys[column_index]
+            for record in records:
+                if record[key] is _ABSENT:
+                    del record[key]
+    return records
+
+
+def decode_records(payload: bytes) -> List[Dict]:
+    """
+    Décode un bloc d'enregistrements (binaire ou ancien format JSON).
+
+    Args:
+        payload: Données produites par ``encode_records`` ou ``json.dumps``
+
+    Returns:
+        Liste des enregistrements
+
+    Raises:
+        RecordCodecError: Si les données sont illisibles
+    """
+    if is_binary_payload(payload):
+        return _decode_binary(payload)
+
+    # Ancien format : document JSON
+    try:
+        records = json.loads(payload)
+    except ValueError as e:
+        raise RecordCodecError(f"Données illisibles: {e}")
+
+    if not isinstance(records, list):
+        raise RecordCodecError("Le document JSON doit être une liste")
+    return records
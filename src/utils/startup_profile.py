@@ -0,0 +1,127 @@
+"""
+Mesure du temps de démarrage de l'application.
+
+Activée par la variable d'environnement ``SECUREPASSGEN_PROFILE_STARTUP=1``
+(ou ``debug_main.py --profile-startup``), l'instrumentation chronomètre
+chaque phase du démarrage et liste les modules importés pendant chacune,
+pour repérer un import coûteux réintroduit par mégarde. Désactivée, elle
+ne coûte qu'un test booléen par phase.
+
+``summarize_importtime`` résume la sortie de ``python -X importtime``
+(modules triés par temps cumulé).
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+ENV_VAR = "SECUREPASSGEN_PROFILE_STARTUP"
+
+
+class PhaseTiming(NamedTuple):
+    """Durée d'une phase et modules importés pendant celle-ci."""
+    name: str
+    seconds: float
+    modules: List[str]
+
+
+class StartupProfiler:
+    """
+    Chronomètre des phases de démarrage.
+    """
+
+    def __init__(self, enabled: bool = False, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.started = clock()
+        self.phases: List[PhaseTiming] = []
+        self.marks: List[Tuple[str, float]] = []
+
+    @classmethod
+    def from_environment(cls) -> "StartupProfiler":
+        """Crée un profileur activé selon ``SECUREPASSGEN_PROFILE_STARTUP``."""
+        return cls(enabled=os.environ.get(ENV_VAR, "") not in ("", "0"))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Chronomètre le bloc ``with`` sous le nom ``name``.
+
+        Args:
+            name: Nom de la phase
+        """
+        if not self.enabled:
+            yield
+            return
+
+        modules_before = set(sys.modules)
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            imported = sorted(set(sys.modules) - modules_before)
+            self.phases.append(PhaseTiming(name, elapsed, imported))
+
+    def mark(self, name: str) -> None:
+        """Enregistre un instant (par exemple le premier affichage)."""
+        if self.enabled:
+            self.marks.append((name, self.clock() - self.started))
+
+    def report(self, file: Optional[TextIO] = None) -> None:
+        """
+        Affiche la durée de chaque phase et les paquets importés.
+
+        Args:
+            file: Flux de sortie (stderr par défaut)
+        """
+        if not self.enabled:
+            return
+
+        file = file or sys.stderr
+        total = sum(phase.seconds for phase in self.phases) or 1e-9
+
+        print("=== Démarrage de SecurePassGen ===", file=file)
+        print(f"{'Phase':<24} {'ms':>9} {'%':>6}  Modules importés", file=file)
+        for phase in self.phases:
+            packages = sorted({module.split(".")[0] for module in phase.modules})
+            shown = ", ".join(packages[:8]) + (" …" if len(packages) > 8 else "")
+            print(f"{phase.name:<24} {phase.seconds * 1000:>9.1f} {phase.seconds / total * 100:>5.1f}%"
+                  f"  {len(phase.modules)} ({shown})", file=file)
+        for name, seconds in self.marks:
+            print(f"{name:<24} {seconds * 1000:>9.1f} ms depuis le lancement", file=file)
+
+
+def summarize_importtime(output: str, top: int = 15) -> List[Tuple[str, int, int]]:
+    """
+    Résume la sortie de ``python -X importtime``.
+
+    Args:
+        output: Sortie d'erreur du processus lancé avec ``-X importtime``
+        top: Nombre de modules à retourner
+
+    Returns:
+        Liste de (module, temps propre en µs, temps cumulé en µs) triée par
+        temps cumulé décroissant
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Ligne d'en-tête
+        modules.append((fields[2].strip(), self_us, cumulative_us))
+
+    modules.sort(key=lambda module: module[2], reverse=True)
+    return modules[:top]
+
+
+# Profileur du processus courant
+startup_profiler = StartupProfiler.from_environment()
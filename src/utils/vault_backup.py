@@ -0,0 +1,226 @@
+"""
+Sauvegardes incrémentales du coffre, dédupliquées par contenu.
+
+Chaque fichier du coffre est découpé en morceaux rangés sous leur empreinte
+SHA-256 ; un morceau déjà présent dans le dépôt n'est pas réécrit. Le
+fichier de coffre est découpé selon sa structure (en-tête, puis un morceau
+par segment chiffré) : un checkpoint recopiant à l'identique les segments
+qu'il ne touche pas, une nouvelle sauvegarde n'écrit que l'en-tête et les
+segments modifiés. Le journal, qui ne fait que grossir entre deux
+checkpoints, est découpé en blocs de taille fixe.
+
+Chaque sauvegarde est décrite par un manifeste (liste des morceaux de
+chaque fichier), écrit après ses morceaux : un arrêt brutal laisse au pire
+des morceaux orphelins, jamais un manifeste incomplet.
+
+    backups/
+        objects/3f/3fa2…        morceaux, nommés par leur SHA-256
+        snapshots/<id>.json     un manifeste par sauvegarde
+        backup.lock
+
+Les morceaux sont des données déjà chiffrées : le dépôt ne contient rien
+de plus que les fichiers du coffre.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from utils.vault_storage import CONTAINER_MAGIC, VaultLock, atomic_write, iter_container_chunks
+
+# Taille des blocs pour les fichiers sans structure (journal, ancien format)
+BLOCK_BYTES = 1024 * 1024
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class BackupCorruptedError(ValueError):
+    """Erreur levée lorsqu'un morceau de sauvegarde manque ou ne correspond pas à son empreinte."""
+
+
+def iter_blocks(f: BinaryIO, block_bytes: int = BLOCK_BYTES) -> Iterator[bytes]:
+    """Découpe un fichier en blocs de taille fixe."""
+    while True:
+        block = f.read(block_bytes)
+        if not block:
+            return
+        yield block
+
+
+def iter_vault_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """Découpe un fichier de coffre : par segment (conteneur) ou par blocs (ancien format)."""
+    is_container = f.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+    f.seek(0)
+    return iter_container_chunks(f) if is_container else iter_blocks(f)
+
+
+class BackupStore:
+    """
+    Dépôt de sauvegardes incrémentales.
+
+    Les sauvegardes et restaurations prennent le verrou partagé du dépôt,
+    ``prune`` le verrou exclusif : un morceau écrit par une sauvegarde en
+    cours n'est jamais supprimé avant que son manifeste existe.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(exist_ok=True)
+        self.lock = VaultLock(self.root / "backup.lock")
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def put(self, data: bytes) -> Tuple[str, bool]:
+        """
+        Range un morceau s'il n'est pas déjà présent.
+
+        Returns:
+            Tuple (empreinte, True si le morceau a été écrit)
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+        path.parent.mkdir(exist_ok=True)
+        atomic_write(path, data)
+        return digest, True
+
+    def get(self, digest: str) -> bytes:
+        """
+        Lit un morceau et vérifie son empreinte.
+
+        Raises:
+            BackupCorruptedError: Si le morceau manque ou a été altéré
+        """
+        try:
+            data = self._object_path(digest).read_bytes()
+        except FileNotFoundError:
+            raise BackupCorruptedError(f"Morceau de sauvegarde manquant : {digest}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BackupCorruptedError(f"Morceau de sauvegarde altéré : {digest}")
+        return data
+
+    def store(self, chunks: Iterable[bytes]) -> Dict:
+        """
+        Range les morceaux d'un fichier.
+
+        Returns:
+            Description du fichier : taille, empreintes des morceaux et
+            nombre d'octets réellement écrits
+        """
+        digests = []
+        size = written = 0
+        for chunk in chunks:
+            digest, is_new = self.put(chunk)
+            digests.append(digest)
+            size += len(chunk)
+            written += len(chunk) if is_new else 0
+        return {"size": size, "chunks": digests, "written": written}
+
+    def write_to(self, description: Dict, out: BinaryIO) -> None:
+        """Reconstitue un fichier décrit par ``store`` dans ``out``."""
+        for digest in description["chunks"]:
+            out.write(self.get(digest))
+
+    def read(self, description: Dict) -> bytes:
+        return b"".join(self.get(digest) for digest in description["chunks"])
+
+    def verify(self, manifest: Dict) -> List[str]:
+        """Empreintes des morceaux manquants ou altérés d'une sauvegarde."""
+        damaged = []
+        for description in manifest["files"].values():
+            for digest in description["chunks"]:
+                try:
+                    self.get(digest)
+                except BackupCorruptedError:
+                    damaged.append(digest)
+        return damaged
+
+    def add_snapshot(self, files: Dict[str, Dict], version: int) -> Dict:
+        """
+        Écrit le manifeste d'une sauvegarde dont les morceaux sont rangés.
+
+        Args:
+            files: Description de chaque fichier (voir ``store``), par nom
+            version: Compteur de version du coffre sauvegardé
+
+        Returns:
+            Manifeste de la sauvegarde
+        """
+        now = datetime.now()
+        manifest = {
+            "id": now.strftime("%Y%m%dT%H%M%S%f"),
+            "date": now.strftime(DATE_FORMAT),
+            "version": version,
+            "files": files,
+        }
+        atomic_write(self.snapshots_dir / f"{manifest['id']}.json",
+                     json.dumps(manifest, indent=2).encode("utf-8"))
+        return manifest
+
+    def snapshots(self) -> List[Dict]:
+        """Manifestes des sauvegardes, de la plus ancienne à la plus récente."""
+        return [json.loads(path.read_text(encoding="utf-8"))
+                for path in sorted(self.snapshots_dir.glob("*.json"))]
+
+    def find(self, snapshot_id: Optional[str] = None, before: Optional[datetime] = None) -> Dict:
+        """
+        Choisit une sauvegarde.
+
+        Args:
+            snapshot_id: Identifiant exact de la sauvegarde
+            before: Dernière sauvegarde faite au plus tard à cette date
+                (la plus récente si ``snapshot_id`` et ``before`` sont None)
+
+        Raises:
+            FileNotFoundError: Si aucune sauvegarde ne correspond
+        """
+        if snapshot_id is not None:
+            path = self.snapshots_dir / f"{snapshot_id}.json"
+            if not path.exists():
+                raise FileNotFoundError(f"Sauvegarde introuvable : {snapshot_id}")
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        candidates = [m for m in self.snapshots()
+                      if before is None or datetime.strptime(m["date"], DATE_FORMAT) <= before]
+        if not candidates:
+            raise FileNotFoundError("Aucune sauvegarde ne correspond")
+        return candidates[-1]
+
+    def prune(self, keep: int) -> Tuple[int, int]:
+        """
+        Ne garde que les ``keep`` sauvegardes les plus récentes et supprime
+        les morceaux qu'aucune sauvegarde restante ne référence.
+
+        Returns:
+            Tuple (sauvegardes supprimées, morceaux supprimés)
+
+        Raises:
+            ValueError: Si ``keep`` est inférieur à 1 (tout serait supprimé)
+        """
+        if keep < 1:
+            raise ValueError(f"Au moins une sauvegarde doit être gardée (keep={keep})")
+
+        with self.lock.exclusive():
+            paths = sorted(self.snapshots_dir.glob("*.json"))
+            removed = paths[:max(len(paths) - keep, 0)]
+            for path in removed:
+                path.unlink()
+
+            referenced = set()
+            for manifest in self.snapshots():
+                for description in manifest["files"].values():
+                    referenced.update(description["chunks"])
+
+            orphans = 0
+            for path in self.objects_dir.glob("*/*"):
+                if path.name not in referenced and not path.name.startswith("."):
+                    path.unlink()
+                    orphans += 1
+        return len(removed), orphans
@@ -0,0 +1,107 @@
+"""
+Empreintes d'intégrité du coffre : arbre de Merkle des segments chiffrés.
+
+L'en-tête d'un instantané liste l'empreinte SHA-256 de chaque segment
+(``leaves``) et porte, chiffrée avec la clé du coffre, la racine de l'arbre
+de Merkle de ces empreintes avec la séquence et le nombre d'entrées par
+segment (``merkle``). La vérification relit le fichier au fil de l'eau et
+hache les segments en parallèle, sans les déchiffrer :
+
+- sans mot de passe, elle détecte toute corruption accidentelle et
+  désigne les segments (donc les enregistrements) atteints ;
+- avec le mot de passe maître (une dérivation de clé, aucun déchiffrement
+  de segment), elle authentifie en plus l'en-tête : une liste d'empreintes
+  réécrite pour masquer une modification est détectée.
+
+Les feuilles et les nœuds sont préfixés (``0x00`` / ``0x01``) pour qu'une
+feuille ne puisse pas se faire passer pour un nœud interne.
+"""
+
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Segments en cours de hachage par thread (mémoire bornée)
+PENDING_PER_WORKER = 4
+
+
+def segment_digest(segment: bytes) -> bytes:
+    """Empreinte d'un segment chiffré (feuille de l'arbre)."""
+    return hashlib.sha256(b"\x00" + segment).digest()
+
+
+def merkle_root(leaves: List[bytes]) -> bytes:
+    """Racine de l'arbre de Merkle (un nœud impair remonte tel quel)."""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+
+    level = list(leaves)
+    while len(level) > 1:
+        paired = [hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+                  for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def integrity_payload(leaves: List[bytes], sequence: int, counts: List[int]) -> bytes:
+    """Données authentifiées de l'en-tête : racine, séquence et nombre d'entrées par segment."""
+    return json.dumps({
+        "root": merkle_root(leaves).hex(),
+        "seq": sequence,
+        "counts": counts,
+    }, separators=(",", ":")).encode("utf-8")
+
+
+def iter_digests(segments: Iterable[bytes], workers: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Empreintes des segments, dans l'ordre.
+
+    ``hashlib`` libère le GIL sur les gros blocs : les threads hachent en
+    parallèle pendant que le fil principal lit la suite du fichier.
+
+    Args:
+        segments: Segments chiffrés (lus au fil de l'eau)
+        workers: Nombre de threads (tous les cœurs si None ; 1 : séquentiel)
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for segment in segments:
+            yield segment_digest(segment)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for segment in segments:
+            pending.append(pool.submit(segment_digest, segment))
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def record_ranges(counts: List[Optional[int]]) -> List[Optional[range]]:
+    """Enregistrements contenus dans chaque segment (None après un segment non dénombré)."""
+    ranges = []
+    start = 0
+    for count in counts:
+        if start is None or count is None:
+            start = None
+            ranges.append(None)
+            continue
+        ranges.append(range(start, start + count))
+        start += count
+    return ranges
+
+
+def describe_segment(index: int, ranges: List[Optional[range]]) -> Dict:
+    """Segment corrompu, avec les enregistrements qu'il contient quand ils sont connus."""
+    records = ranges[index] if index < len(ranges) else None
+    return {
+        "segment": index,
+        "records": [records.start, records.stop] if records is not None else None,
+    }
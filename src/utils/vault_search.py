@@ -0,0 +1,175 @@
+"""
+Index aveugle pour rechercher dans le coffre sans le déchiffrer.
+
+Le nom et la description de chaque entrée sont découpés en trigrammes
+(en minuscules, précédés d'un marqueur de début de champ pour la recherche
+par préfixe). Chaque trigramme devient un jeton HMAC-SHA256 tronqué, calculé
+avec une clé de recherche aléatoire : l'index ne contient ni texte ni mot de
+passe, et ses jetons ne sont comparables qu'avec la clé.
+
+Il y a un index par segment de l'instantané, lui aussi chiffré, rangé dans
+un fichier voisin (``passwords.idx``) sous l'empreinte du segment qu'il
+décrit (voir ``vault_integrity``). Une recherche ne déchiffre que les
+index puis les segments où figure un candidat ; les candidats sont vérifiés
+sur le texte, les collisions de jetons ou de trigrammes ne donnent donc
+jamais de faux résultats.
+
+Un index de segment est une table triée des jetons, chacun suivi des
+positions des entrées qui le contiennent :
+
+    <II>         nombre d'entrées, nombre de jetons
+    jetons       TOKEN_BYTES octets chacun, triés
+    décalages    (jetons + 1) × uint32, début des positions de chaque jeton
+    positions    uint32, positions des entrées dans le segment
+"""
+
+import hmac
+import struct
+from array import array
+from typing import Dict, Iterable, List, Optional, Set
+
+# Longueur des n-grammes indexés
+NGRAM = 3
+
+# Longueur des jetons (octets de HMAC-SHA256 conservés)
+TOKEN_BYTES = 8
+
+# Marqueur de début de champ : « \x02git » donne le jeton du préfixe « gi »
+FIELD_START = "\x02"
+
+# Champs indexés et leur étiquette dans les jetons
+SEARCH_FIELDS = (("name", b"n\x00"), ("description", b"d\x00"))
+
+_INDEX_HEADER = struct.Struct("<II")
+
+
+def _grams(text: str) -> Set[str]:
+    """Trigrammes d'un champ, et bigramme de début pour les préfixes d'un caractère."""
+    padded = FIELD_START + text.lower()
+    grams = {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+    if len(padded) >= 2:
+        grams.add(padded[:2])
+    return grams
+
+
+def query_grams(query: str, prefix: bool = False) -> Optional[Set[str]]:
+    """
+    N-grammes qu'une entrée doit contenir pour correspondre à ``query``.
+
+    Returns:
+        Les n-grammes, ou None si la requête est vide ou trop courte pour
+        l'index (sous-chaîne de moins de ``NGRAM`` caractères) : toutes les
+        entrées sont alors candidates
+    """
+    text = query.lower()
+    if not text:
+        return None
+    if prefix:
+        padded = FIELD_START + text
+        if len(padded) <= NGRAM:
+            return {padded}
+        return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+    if len(text) < NGRAM:
+        return None
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def entry_matches(entry: Dict, query: str, prefix: bool = False) -> bool:
+    """Vérifie sur le texte qu'une entrée correspond à la recherche."""
+    text = query.lower()
+    for field, _ in SEARCH_FIELDS:
+        value = (entry.get(field) or "").lower()
+        if value.startswith(text) if prefix else text in value:
+            return True
+    return False
+
+
+class Tokenizer:
+    """Calcule les jetons HMAC des n-grammes (mémorisés, un même n-gramme revient souvent)."""
+
+    def __init__(self, key: bytes):
+        self._hmac = hmac.new(key, digestmod="sha256")
+        self._tokens: Dict[bytes, bytes] = {}
+
+    def token(self, tag: bytes, gram: str) -> bytes:
+        message = tag + gram.encode("utf-8")
+        token = self._tokens.get(message)
+        if token is None:
+            mac = self._hmac.copy()
+            mac.update(message)
+            token = self._tokens[message] = mac.digest()[:TOKEN_BYTES]
+        return token
+
+    def query_tokens(self, query: str, prefix: bool = False) -> Optional[List[List[bytes]]]:
+        """Jetons de la requête pour chaque champ (None : requête trop courte pour l'index)."""
+        grams = query_grams(query, prefix)
+        if grams is None:
+            return None
+        return [[self.token(tag, gram) for gram in grams] for _, tag in SEARCH_FIELDS]
+
+
+def build_segment_index(tokenizer: Tokenizer, entries: Iterable[Dict]) -> bytes:
+    """Index (en clair) des entrées d'un segment, dans l'ordre du segment."""
+    postings: Dict[bytes, List[int]] = {}
+    count = 0
+    for position, entry in enumerate(entries):
+        count += 1
+        tokens = set()
+        for field, tag in SEARCH_FIELDS:
+            tokens.update(tokenizer.token(tag, gram) for gram in _grams(entry.get(field) or ""))
+        for token in tokens:
+            postings.setdefault(token, []).append(position)
+
+    tokens = sorted(postings)
+    offsets = array("I", [0])
+    positions = array("I")
+    for token in tokens:
+        positions.extend(postings[token])
+        offsets.append(len(positions))
+    return b"".join((_INDEX_HEADER.pack(count, len(tokens)), *tokens,
+                     offsets.tobytes(), positions.tobytes()))
+
+
+class SegmentIndex:
+    """Index d'un segment, interrogé sans être décodé entrée par entrée."""
+
+    def __init__(self, data: bytes):
+        self.count, token_count = _INDEX_HEADER.unpack_from(data)
+        start = _INDEX_HEADER.size
+        end = start + token_count * TOKEN_BYTES
+        self._tokens = data[start:end]
+        self._token_count = token_count
+        self._offsets = array("I")
+        self._offsets.frombytes(data[end:end + (token_count + 1) * self._offsets.itemsize])
+        self._positions = array("I")
+        self._positions.frombytes(data[end + (token_count + 1) * self._offsets.itemsize:])
+
+    def _lookup(self, token: bytes) -> Set[int]:
+        # Recherche dichotomique dans la table triée des jetons
+        low, high = 0, self._token_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._tokens[middle * TOKEN_BYTES:(middle + 1) * TOKEN_BYTES] < token:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self._token_count or self._tokens[low * TOKEN_BYTES:(low + 1) * TOKEN_BYTES] != token:
+            return set()
+        return set(self._positions[self._offsets[low]:self._offsets[low + 1]])
+
+    def candidates(self, field_tokens: List[List[bytes]]) -> Set[int]:
+        """
+        Positions des entrées dont un champ contient tous ses jetons.
+
+        Args:
+            field_tokens: Jetons de la requête par champ (``Tokenizer.query_tokens``)
+        """
+        found: Set[int] = set()
+        for tokens in field_tokens:
+            matches: Optional[Set[int]] = None
+            for token in tokens:
+                matches = self._lookup(token) if matches is None else matches & self._lookup(token)
+                if not matches:
+                    break
+            found |= matches or set()
+        return found
@@ -0,0 +1,301 @@
+"""
+Statistiques du coffre maintenues au fil des écritures.
+
+L'instantané du coffre porte dans son en-tête un résumé chiffré de ses
+entrées (``VaultStats``) et chaque trame du journal suffit à le mettre à
+jour : un ajout apporte son entrée et son niveau de force, mesuré à
+l'écriture ; une suppression porte le résumé des entrées qu'elle retire et
+les dates extrêmes du coffre après elle. ``get_statistics`` n'a donc plus à
+déchiffrer les segments ni à mesurer de mot de passe ; le checkpoint écrit
+le résumé à jour dans le nouvel instantané.
+
+Le résumé ne contient aucun mot de passe et sa taille ne dépend pas du
+nombre d'entrées : nombre d'entrées, somme des longueurs, répartition par
+niveau de force, dates extrêmes et nombre d'entrées par jour
+d'enregistrement (pour les tranches d'âge).
+"""
+
+import json
+import re
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Niveaux de ``PasswordStrengthAnalyzer``, du plus faible au plus fort
+STRENGTH_LEVELS = ("Très faible", "Faible", "Moyen", "Fort", "Très fort")
+
+# Tranches d'âge : (libellé, âge maximal en jours, exclu ; None : sans limite)
+AGE_BUCKETS = (("0-30", 30), ("30-90", 90), ("90-365", 365), ("365+", None))
+
+# Clé des opérations ``put`` du journal portant le niveau de force de l'entrée
+STRENGTH_KEY = "_strength"
+
+# Clé des opérations ``delete`` du journal portant le résumé des entrées retirées
+REMOVED_STATS_KEY = "_stats"
+
+# Clé des opérations ``delete`` du journal portant les dates extrêmes restantes
+DATE_RANGE_KEY = "_dates"
+
+# Date au format ``DATE_FORMAT`` (le jour est vérifié par ``_parse_day``)
+_DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}) (?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d")
+
+_analyzer = None
+
+
+def password_strength(password: str) -> str:
+    """Niveau de force d'un mot de passe (analyseur partagé, créé au premier appel)."""
+    global _analyzer
+    if _analyzer is None:
+        from core.password_strength import PasswordStrengthAnalyzer
+        _analyzer = PasswordStrengthAnalyzer()
+    return _analyzer.analyze_password(password)['strength']
+
+
+@lru_cache(maxsize=4096)
+def _parse_day(text: str) -> Optional[date]:
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _day(text: str) -> str:
+    """Jour d'une date d'enregistrement (chaîne vide si la date est illisible)."""
+    match = _DATE_PATTERN.fullmatch(text)
+    if match is None or _parse_day(match.group(1)) is None:
+        return ""
+    return match.group(1)
+
+
+def _bump(counter: Counter, key: str, value: int) -> None:
+    counter[key] += value
+    if not counter[key]:
+        del counter[key]
+
+
+class VaultStats:
+    """Résumé additif d'un ensemble d'entrées du coffre."""
+
+    def __init__(self):
+        self.count = 0
+        self.length_sum = 0
+        self.strengths: Counter = Counter()
+        self.days: Counter = Counter()  # Jour d'enregistrement ("" : illisible) -> nombre d'entrées
+        self.oldest: Optional[str] = None
+        self.newest: Optional[str] = None
+
+    @classmethod
+    def of(cls, entries: Iterable[Dict]) -> "VaultStats":
+        stats = cls()
+        for entry in entries:
+            stats.add(entry)
+        return stats
+
+    def _extend(self, oldest: Optional[str], newest: Optional[str]) -> None:
+        """Élargit les dates extrêmes."""
+        if oldest is not None:
+            self.oldest = oldest if self.oldest is None else min(self.oldest, oldest)
+        if newest is not None:
+            self.newest = newest if self.newest is None else max(self.newest, newest)
+
+    def add(self, entry: Dict, sign: int = 1) -> None:
+        """
+        Compte une entrée (``sign=-1`` : la retire ; les dates extrêmes ne
+        sont alors plus exactes, voir ``apply_operations``).
+
+        Le niveau de force est repris de ``STRENGTH_KEY`` s'il est présent.
+        """
+        password = entry.get('password') or ""
+        text = entry.get('date') or ""
+        day = _day(text)
+        self.count += sign
+        self.length_sum += sign * len(password)
+        _bump(self.strengths, entry.get(STRENGTH_KEY) or password_strength(password), sign)
+        _bump(self.days, day, sign)
+        if sign > 0 and day:
+            self._extend(text, text)
+        if not self.count:
+            self.oldest = self.newest = None
+
+    def update(self, other: "VaultStats", sign: int = 1) -> None:
+        """Ajoute (ou retire, ``sign=-1``, voir ``add``) un autre résumé."""
+        self.count += sign * other.count
+        self.length_sum += sign * other.length_sum
+        for counter, values in ((self.strengths, other.strengths), (self.days, other.days)):
+            for key, value in values.items():
+                _bump(counter, key, sign * value)
+        if sign > 0:
+            self._extend(other.oldest, other.newest)
+        if not self.count:
+            self.oldest = self.newest = None
+
+    def apply_operations(self, operations: List[Dict]) -> bool:
+        """
+        Met à jour le résumé avec des opérations du journal.
+
+        Returns:
+            False si une suppression ne porte pas le résumé de ce qu'elle
+            retire (journal écrit par une version antérieure) : le résumé
+            est alors à recalculer
+        """
+        for operation in operations:
+            if operation["_op"] == "put":
+                self.add(operation)
+            elif REMOVED_STATS_KEY in operation and DATE_RANGE_KEY in operation:
+                self.update(VaultStats.from_json(operation[REMOVED_STATS_KEY]), -1)
+                self.oldest, self.newest = operation[DATE_RANGE_KEY]
+            else:
+                return False
+        return True
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'count': self.count,
+            'length_sum': self.length_sum,
+            'strengths': self.strengths,
+            'days': self.days,
+            'oldest': self.oldest,
+            'newest': self.newest,
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "VaultStats":
+        data = json.loads(text)
+        stats = cls()
+        stats.count = data['count']
+        stats.length_sum = data['length_sum']
+        stats.strengths = Counter(data['strengths'])
+        if 'dates' in data:
+            # Résumé antérieur, compté par date complète : regroupé par jour
+            for text, count in data['dates'].items():
+                day = _day(text)
+                _bump(stats.days, day, count)
+                if day and count > 0:
+                    stats._extend(text, text)
+        else:
+            stats.days = Counter(data['days'])
+            stats.oldest, stats.newest = data['oldest'], data['newest']
+        return stats
+
+    def report(self, now: Optional[datetime] = None) -> Dict:
+        """
+        Statistiques présentées par ``PasswordFileManager.get_statistics``.
+
+        Args:
+            now: Date de référence des tranches d'âge (maintenant si None)
+
+        Returns:
+            Dictionnaire : total, dates extrêmes, longueur moyenne,
+            répartition par force et par âge en jours (``unknown`` : date
+            illisible)
+        """
+        today = (now or datetime.now()).date()
+        ages = {label: 0 for label, _ in AGE_BUCKETS}
+        ages["unknown"] = 0
+
+        for day, count in self.days.items():
+            parsed = _parse_day(day) if day else None
+            if parsed is None:
+                ages["unknown"] += count
+                continue
+            days = (today - parsed).days
+            for label, limit in AGE_BUCKETS:
+                if limit is None or days < limit:
+                    ages[label] += count
+                    break
+
+        strengths = {level: self.strengths.get(level, 0) for level in STRENGTH_LEVELS}
+        for level, count in self.strengths.items():
+            strengths.setdefault(level, count)
+
+        return {
+            "total": self.count,
+            "oldest_date": self.oldest,
+            "newest_date": self.newest,
+            "average_length": round(self.length_sum / self.count, 1) if self.count else 0,
+            "strength_distribution": strengths,
+            "age_buckets": ages,
+        }
+
+
+class _DateRange:
+    """
+    Dates extrêmes d'un ensemble d'entrées qui change, parmi des dates
+    connues d'avance (celles des entrées et des ajouts d'une transaction).
+    """
+
+    def __init__(self, dates: Iterable[str]):
+        self._dates = sorted(set(dates))
+        self._index = {text: i for i, text in enumerate(self._dates)}
+        self._counts = [0] * len(self._dates)
+        self._low, self._high = len(self._dates), -1
+
+    def add(self, text: str, sign: int = 1) -> None:
+        index = self._index.get(text)
+        if index is None:
+            return  # Date illisible
+        self._counts[index] += sign
+        if sign > 0:
+            self._low = min(self._low, index)
+            self._high = max(self._high, index)
+
+    def bounds(self) -> Tuple[Optional[str], Optional[str]]:
+        while self._low <= self._high and not self._counts[self._low]:
+            self._low += 1
+        while self._high >= self._low and not self._counts[self._high]:
+            self._high -= 1
+        if self._low > self._high:
+            return None, None
+        return self._dates[self._low], self._dates[self._high]
+
+
+def annotate_operations(entries: Optional[List[Dict]], operations: List[Dict]) -> List[Dict]:
+    """
+    Annote des opérations pour que le résumé se mette à jour sans relire le
+    coffre ni mesurer de mot de passe.
+
+    Chaque ajout reçoit son niveau de force ; chaque suppression reçoit le
+    résumé des entrées qu'elle retire et les dates extrêmes du coffre après
+    elle.
+
+    Args:
+        entries: Entrées du coffre avant les opérations (None si elles n'ont
+            pas été lues : les suppressions restent sans annotation et le
+            résumé sera recalculé)
+        operations: Opérations ``put`` / ``delete``, dans l'ordre
+
+    Returns:
+        Opérations annotées
+    """
+    annotated = [
+        {**op, STRENGTH_KEY: password_strength(op.get('password') or "")}
+        if op["_op"] == "put" and STRENGTH_KEY not in op else op
+        for op in operations
+    ]
+    names = {op["name"] for op in annotated if op["_op"] == "delete"}
+    if entries is None or not names:
+        return annotated
+
+    puts = [op for op in annotated if op["_op"] == "put"]
+    dates = _DateRange(text for text in (e.get('date') or "" for e in [*entries, *puts]) if _day(text))
+    current: Dict[str, List[Dict]] = {}
+    for entry in entries:
+        dates.add(entry.get('date') or "")
+        if entry['name'] in names:
+            current.setdefault(entry['name'], []).append(entry)
+
+    for index, operation in enumerate(annotated):
+        if operation["_op"] == "delete":
+            removed = current.pop(operation["name"], [])
+            for entry in removed:
+                dates.add(entry.get('date') or "", -1)
+            annotated[index] = {**operation, REMOVED_STATS_KEY: VaultStats.of(removed).to_json(),
+                                DATE_RANGE_KEY: list(dates.bounds())}
+        else:
+            dates.add(operation.get('date') or "")
+            if operation["name"] in names:
+                current.setdefault(operation["name"], []).append(operation)
+    return annotated
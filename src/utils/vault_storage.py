@@ -0,0 +1,425 @@
+"""
+Primitives de stockage durable pour le coffre de mots de passe.
+
+Ce module ne connaît rien du chiffrement : il fournit
+
+- ``atomic_write`` : écriture via un fichier temporaire, ``fsync`` puis
+  renommage atomique, de sorte qu'un arrêt brutal laisse soit l'ancien
+  fichier, soit le nouveau, jamais un mélange des deux ;
+- le conteneur du coffre (``write_container`` / ``read_container_header``
+  / ``iter_container_segments``) : un en-tête JSON en clair suivi des
+  segments chiffrés, lisible et inscriptible segment par segment
+  (``iter_container_chunks`` le découpe tel quel pour les sauvegardes) ;
+- ``VaultJournal`` : un journal d'écriture anticipée (write-ahead log) où
+  chaque transaction est ajoutée sous forme d'une trame protégée par un
+  CRC32. Une trame incomplète (arrêt pendant l'écriture) est ignorée à la
+  relecture puis écrasée par l'écriture suivante ;
+- ``VaultLock`` : un verrou consultatif ``fcntl.flock`` partagé par les
+  lecteurs et exclusif pour les écrivains, entre threads comme entre
+  processus.
+"""
+
+import io
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple, Union
+
+from utils import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrous consultatifs POSIX
+    fcntl = None
+
+CONTAINER_MAGIC = b"SPGV"
+CONTAINER_VERSION = 2
+
+_CONTAINER_HEADER = struct.Struct("<4sBI")
+_SEGMENT_LENGTH = struct.Struct("<I")
+
+# Trame de journal : longueur de la charge, CRC32 (séquence + charge), séquence
+_FRAME_HEADER = struct.Struct("<IIQ")
+
+# Durée des entrées/sorties du coffre, par opération
+VAULT_IO_SECONDS = metrics.histogram(
+    "securepassgen_vault_io_seconds",
+    "Durée des lectures et écritures durables du coffre",
+    ("op",)
+)
+
+
+class VaultFormatError(ValueError):
+    """Erreur levée lorsqu'un fichier de coffre est illisible."""
+
+
+class VaultLockTimeout(TimeoutError):
+    """Erreur levée lorsque le verrou du coffre n'a pas pu être obtenu à temps."""
+
+
+def fsync_directory(directory: Union[str, Path]) -> None:
+    """
+    Force l'écriture sur disque d'une entrée de répertoire (après un renommage).
+
+    Args:
+        directory: Répertoire à synchroniser
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows : les répertoires ne peuvent pas être ouverts
+
+    fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_writer(path: Union[str, Path]) -> Iterator[BinaryIO]:
+    """
+    Ouvre un fichier temporaire qui remplacera ``path`` de manière atomique.
+
+    Le remplacement (``fsync`` puis renommage) n'a lieu qu'à la sortie du
+    bloc ``with`` sans exception ; sinon le fichier temporaire est supprimé
+    et ``path`` reste intact.
+
+    Args:
+        path: Fichier de destination
+
+    Yields:
+        Fichier binaire ouvert en écriture
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            started = metrics.start()
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    fsync_directory(path.parent)
+    metrics.observe_since(VAULT_IO_SECONDS, started, ("sync",))
+
+
+def atomic_write(path: Union[str, Path], data: bytes) -> None:
+    """
+    Remplace le contenu d'un fichier de manière atomique et durable.
+
+    Args:
+        path: Fichier de destination
+        data: Nouveau contenu
+    """
+    with atomic_writer(path) as f:
+        f.write(data)
+
+
+def is_container(data: bytes) -> bool:
+    """Indique si ``data`` est un conteneur de coffre (et non l'ancien format)."""
+    return data[:len(CONTAINER_MAGIC)] == CONTAINER_MAGIC
+
+
+def write_container(f: BinaryIO, header: Dict, segments: Iterable[bytes]) -> None:
+    """
+    Écrit l'en-tête puis les segments chiffrés d'un coffre, au fil de l'eau.
+
+    Args:
+        f: Fichier binaire ouvert en écriture
+        header: En-tête (sérialisable en JSON, non chiffré)
+        segments: Segments chiffrés, dans l'ordre
+    """
+    raw_header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    f.write(_CONTAINER_HEADER.pack(CONTAINER_MAGIC, CONTAINER_VERSION, len(raw_header)))
+    f.write(raw_header)
+    for segment in segments:
+        f.write(_SEGMENT_LENGTH.pack(len(segment)))
+        f.write(segment)
+
+
+def read_container_header(f: BinaryIO) -> Dict:
+    """
+    Lit l'en-tête d'un coffre et positionne ``f`` sur le premier segment.
+
+    Args:
+        f: Fichier binaire positionné au début du coffre
+
+    Returns:
+        En-tête du coffre
+
+    Raises:
+        VaultFormatError: Si le conteneur est invalide
+    """
+    try:
+        magic, version, header_length = _CONTAINER_HEADER.unpack(f.read(_CONTAINER_HEADER.size))
+    except struct.error:
+        raise VaultFormatError("En-tête de coffre tronqué")
+
+    if magic != CONTAINER_MAGIC:
+        raise VaultFormatError("Fichier de coffre non reconnu")
+    if version != CONTAINER_VERSION:
+        raise VaultFormatError(f"Version de coffre non supportée: {version}")
+
+    try:
+        return json.loads(f.read(header_length))
+    except ValueError as e:
+        raise VaultFormatError(f"En-tête de coffre illisible: {e}")
+
+
+def iter_container_segments(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Lit les segments chiffrés un par un (après ``read_container_header``).
+
+    Args:
+        f: Fichier binaire positionné sur le premier segment
+
+    Yields:
+        Segments chiffrés, dans l'ordre
+
+    Raises:
+        VaultFormatError: Si un segment est tronqué
+    """
+    while True:
+        prefix = f.read(_SEGMENT_LENGTH.size)
+        if not prefix:
+            return
+        if len(prefix) != _SEGMENT_LENGTH.size:
+            raise VaultFormatError("Segment tronqué")
+        (length,) = _SEGMENT_LENGTH.unpack(prefix)
+        segment = f.read(length)
+        if len(segment) != length:
+            raise VaultFormatError("Segment tronqué")
+        yield segment
+
+
+def iter_container_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """
+    Découpe brute d'un conteneur : l'en-tête, puis chaque segment précédé de
+    sa longueur. La concaténation des morceaux redonne le fichier.
+
+    Un checkpoint recopie tels quels les segments qu'il ne modifie pas : d'un
+    instantané à l'autre, seuls l'en-tête et les segments modifiés changent.
+
+    Args:
+        f: Fichier binaire positionné au début du coffre
+
+    Yields:
+        Morceaux du fichier, dans l'ordre
+    """
+    start = f.tell()
+    read_container_header(f)
+    end = f.tell()
+    f.seek(start)
+    yield f.read(end - start)
+    for segment in iter_container_segments(f):
+        yield _SEGMENT_LENGTH.pack(len(segment)) + segment
+
+
+def encode_container(header: Dict, segments: List[bytes]) -> bytes:
+    """
+    Assemble l'en-tête et les segments chiffrés d'un coffre.
+
+    Args:
+        header: En-tête (sérialisable en JSON, non chiffré)
+        segments: Segments chiffrés, dans l'ordre
+
+    Returns:
+        Contenu du fichier de coffre
+    """
+    buffer = io.BytesIO()
+    write_container(buffer, header, segments)
+    return buffer.getvalue()
+
+
+def decode_container(data: bytes) -> Tuple[Dict, List[bytes]]:
+    """
+    Sépare l'en-tête et les segments chiffrés d'un coffre.
+
+    Args:
+        data: Contenu du fichier de coffre
+
+    Returns:
+        Tuple (en-tête, segments)
+
+    Raises:
+        VaultFormatError: Si le conteneur est invalide
+    """
+    buffer = io.BytesIO(data)
+    header = read_container_header(buffer)
+    return header, list(iter_container_segments(buffer))
+
+
+class VaultJournal:
+    """
+    Journal d'écriture anticipée du coffre.
+
+    Chaque appel à ``append`` ajoute une trame (séquence + charge chiffrée)
+    puis la rend durable avec ``fsync`` : c'est le point de validation d'une
+    transaction. Les trames sont rejouées au chargement au-dessus du dernier
+    instantané, puis intégrées à un nouvel instantané lors d'un checkpoint.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def _scan(self) -> Tuple[List[Tuple[int, bytes]], int]:
+        """
+        Lit les trames valides du journal.
+
+        Returns:
+            Tuple (liste de (séquence, charge), longueur valide du fichier)
+        """
+        started = metrics.start()
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return [], 0
+        metrics.observe_since(VAULT_IO_SECONDS, started, ("journal_read",))
+
+        frames = []
+        position = 0
+        while position + _FRAME_HEADER.size <= len(data):
+            length, checksum, sequence = _FRAME_HEADER.unpack_from(data, position)
+            start = position + _FRAME_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) != length:
+                break  # Trame tronquée : transaction jamais validée
+            if zlib.crc32(payload, zlib.crc32(struct.pack("<Q", sequence))) != checksum:
+                break
+            frames.append((sequence, payload))
+            position = start + length
+
+        return frames, position
+
+    def frames(self) -> List[Tuple[int, bytes]]:
+        """
+        Retourne les trames validées, dans l'ordre d'écriture.
+
+        Returns:
+            Liste de tuples (séquence, charge)
+        """
+        return self._scan()[0]
+
+    def inspect(self) -> Tuple[List[Tuple[int, bytes]], int]:
+        """
+        Trames validées et octets ignorés en fin de journal (trame tronquée
+        par un arrêt brutal, ou altérée).
+
+        Returns:
+            Tuple (liste de (séquence, charge), nombre d'octets ignorés)
+        """
+        frames, valid_length = self._scan()
+        return frames, self.size() - valid_length
+
+    def size(self) -> int:
+        """Retourne la taille du journal en octets (0 s'il n'existe pas)."""
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def append(self, sequence: int, payload: bytes) -> None:
+        """
+        Ajoute une trame et la rend durable.
+
+        Args:
+            sequence: Numéro de séquence de la transaction
+            payload: Charge (déjà chiffrée)
+        """
+        checksum = zlib.crc32(payload, zlib.crc32(struct.pack("<Q", sequence)))
+        frame = _FRAME_HEADER.pack(len(payload), checksum, sequence) + payload
+
+        _, valid_length = self._scan()
+        created = not self.path.exists()
+
+        started = metrics.start()
+        with open(self.path, "r+b" if not created else "wb") as f:
+            # Écraser une éventuelle trame incomplète laissée par un arrêt brutal
+            f.seek(valid_length)
+            f.truncate()
+            f.write(frame)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if created:
+            fsync_directory(self.path.parent)
+        metrics.observe_since(VAULT_IO_SECONDS, started, ("journal_append",))
+
+    def clear(self) -> None:
+        """Vide le journal (après un checkpoint)."""
+        self.path.unlink(missing_ok=True)
+
+
+# Sans fcntl, un verrou par fichier protège au moins les threads du processus
+_LOCAL_LOCKS: Dict[str, threading.Lock] = {}
+_LOCAL_LOCKS_GUARD = threading.Lock()
+
+
+class VaultLock:
+    """
+    Verrou consultatif du coffre, posé sur un fichier dédié.
+
+    ``shared()`` est pris par les lecteurs : plusieurs lecteurs avancent en
+    parallèle sans jamais se bloquer. ``exclusive()`` est pris par les
+    écrivains et exclut lecteurs et autres écrivains. Chaque acquisition
+    ouvre son propre descripteur, de sorte que ``flock`` sépare aussi les
+    threads d'un même processus (par exemple Flask lancé dans un thread).
+
+    Les verrous ne sont pas réentrants : ne jamais prendre le verrou
+    alors qu'on le détient déjà.
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+
+    @contextmanager
+    def _acquire(self, exclusive: bool) -> Iterator[None]:
+        if fcntl is None:
+            with _LOCAL_LOCKS_GUARD:
+                lock = _LOCAL_LOCKS.setdefault(str(self.path.resolve()), threading.Lock())
+            if not lock.acquire(timeout=self.timeout):
+                raise VaultLockTimeout(f"Coffre verrouillé: {self.path}")
+            try:
+                yield
+            finally:
+                lock.release()
+            return
+
+        mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+        with open(self.path, "a+b") as f:
+            deadline = time.monotonic() + self.timeout
+            delay = 0.001
+            while True:
+                try:
+                    fcntl.flock(f.fileno(), mode | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise VaultLockTimeout(f"Coffre verrouillé: {self.path}")
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.05)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def shared(self):
+        """Verrou de lecture (partagé)."""
+        return self._acquire(exclusive=False)
+
+    def exclusive(self):
+        """Verrou d'écriture (exclusif)."""
+        return self._acquire(exclusive=True)
@@ -0,0 +1,308 @@
+/*
+ * SecurePassGen - moteur d'analyse de force exécuté dans le navigateur.
+ *
+ * Reproduit côté client :
+ *   - PasswordStrengthAnalyzer.analyze_password  -> engine.analyze()
+ *   - core.web_api.analyze_password_strength     -> engine.webStrength()
+ *   - asgi_app._analyze (réponse de /analyze)    -> engine.analyzeDetailed()
+ *
+ * Le dictionnaire, les motifs, la table de log2 et les classes Unicode
+ * viennent du blob produit par src/core/strength_blob.py : ils ne sont pas
+ * recopiés ici. La parité avec Python est vérifiée par
+ * tests/test_strength_engine.py.
+ *
+ * Utilisable dans une page (SecurePassGenStrength.load(url)) ou sous Node
+ * (require('./strength_engine.js').fromBuffer(buffer)).
+ */
+(function (root, factory) {
+    const api = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = api;
+    } else {
+        root.SecurePassGenStrength = api;
+    }
+}(typeof self !== 'undefined' ? self : this, function () {
+    'use strict';
+
+    const MAGIC = 'SPGS';
+    const VERSION = 1;
+    const TAG_COMMON = 1;
+    const TAG_PATTERNS = 2;
+    const TAG_LOG2 = 3;
+    const TAG_LOWER = 4;
+    const TAG_UPPER = 5;
+    const TAG_DIGIT = 6;
+    const TAG_DECIMAL = 7;
+    const TAG_SPECIAL = 8;
+
+    const utf8 = new TextDecoder('utf-8');
+
+    function readVarint(bytes, offset) {
+        let value = 0;
+        let scale = 1;
+        for (;;) {
+            const byte = bytes[offset++];
+            value += (byte & 0x7f) * scale;
+            if (!(byte & 0x80)) {
+                return [value, offset];
+            }
+            scale *= 128;
+        }
+    }
+
+    // Ensemble de points de code décrit par des plages triées
+    class CharClass {
+        constructor(bytes) {
+            let [count, offset] = readVarint(bytes, 0);
+            this.starts = new Uint32Array(count);
+            this.ends = new Uint32Array(count);
+            let previousEnd = 0;
+            for (let i = 0; i < count; i++) {
+                let gap, length;
+                [gap, offset] = readVarint(bytes, offset);
+                [length, offset] = readVarint(bytes, offset);
+                this.starts[i] = previousEnd + gap;
+                this.ends[i] = this.starts[i] + length;
+                previousEnd = this.ends[i];
+            }
+        }
+
+        has(codePoint) {
+            let low = 0;
+            let high = this.starts.length - 1;
+            while (low <= high) {
+                const mid = (low + high) >> 1;
+                if (codePoint < this.starts[mid]) {
+                    high = mid - 1;
+                } else if (codePoint >= this.ends[mid]) {
+                    low = mid + 1;
+                } else {
+                    return true;
+                }
+            }
+            return false;
+        }
+
+        any(chars) {
+            return chars.some(c => this.has(c.codePointAt(0)));
+        }
+    }
+
+    function parseBlob(buffer) {
+        const bytes = new Uint8Array(buffer);
+        const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+        if (String.fromCharCode(...bytes.subarray(0, 4)) !== MAGIC || bytes[4] !== VERSION) {
+            throw new Error("Blob de données du moteur d'analyse non reconnu");
+        }
+
+        const sections = {};
+        let offset = 5;
+        while (offset < bytes.length) {
+            const tag = bytes[offset];
+            const length = view.getUint32(offset + 1, true);
+            offset += 5;
+            sections[tag] = bytes.subarray(offset, offset + length);
+            offset += length;
+        }
+
+        const log2Bytes = sections[TAG_LOG2];
+        const log2View = new DataView(log2Bytes.buffer, log2Bytes.byteOffset, log2Bytes.byteLength);
+        const log2 = [];
+        for (let i = 0; i < log2Bytes.length / 8; i++) {
+            log2.push(log2View.getFloat64(i * 8, true));
+        }
+
+        return {
+            common: new Set(utf8.decode(sections[TAG_COMMON]).split('\0')),
+            patterns: utf8.decode(sections[TAG_PATTERNS]).split('\0').map(source => new RegExp(source, 'u')),
+            log2: log2,
+            lower: new CharClass(sections[TAG_LOWER]),
+            upper: new CharClass(sections[TAG_UPPER]),
+            digit: new CharClass(sections[TAG_DIGIT]),
+            decimal: new CharClass(sections[TAG_DECIMAL]),
+            special: new Set(Array.from(utf8.decode(sections[TAG_SPECIAL])))
+        };
+    }
+
+    class StrengthEngine {
+        constructor(data) {
+            this.data = data;
+        }
+
+        // PasswordStrengthAnalyzer.analyze_password
+        analyze(password) {
+            if (!password) {
+                return {
+                    score: 0,
+                    strength: 'Très faible',
+                    feedback: ['Le mot de passe ne peut pas être vide'],
+                    entropy: 0,
+                    time_to_crack: '0 secondes'
+                };
+            }
+
+            const d = this.data;
+            const chars = Array.from(password);
+            let score = 0;
+            const feedback = [];
+
+            // Longueur
+            const length = chars.length;
+            if (length < 8) {
+                feedback.push('Trop court (minimum 8 caractères recommandé)');
+            } else if (length < 12) {
+                feedback.push('Longueur acceptable, mais 12+ caractères seraient mieux');
+                score += 20;
+            } else if (length < 16) {
+                score += 30;
+            } else {
+                score += 40;
+            }
+
+            // Complexité
+            const hasLower = /[a-z]/.test(password);
+            const hasUpper = /[A-Z]/.test(password);
+            const hasDigit = d.decimal.any(chars);
+            const hasSpecial = chars.some(c => d.special.has(c));
+            const complexity = hasLower + hasUpper + hasDigit + hasSpecial;
+
+            if (complexity === 1) {
+                feedback.push('Utilisez différents types de caractères');
+                score += 5;
+            } else if (complexity === 2) {
+                feedback.push('Ajoutez plus de variété dans les caractères');
+                score += 15;
+            } else if (complexity === 3) {
+                score += 25;
+            } else {
+                score += 35;
+            }
+            if (!hasLower) feedback.push('Ajoutez des lettres minuscules');
+            if (!hasUpper) feedback.push('Ajoutez des lettres majuscules');
+            if (!hasDigit) feedback.push('Ajoutez des chiffres');
+            if (!hasSpecial) feedback.push('Ajoutez des caractères spéciaux');
+
+            // Motifs dangereux
+            const lowered = password.toLowerCase();
+            if (d.patterns.some(pattern => pattern.test(lowered))) {
+                feedback.push('Évitez les séquences et répétitions');
+                score -= 10;
+            }
+
+            // Mots de passe courants
+            if (d.common.has(lowered)) {
+                feedback.push('Ce mot de passe est trop commun');
+                score -= 50;
+            }
+
+            // Entropie (log2 calculé par Python : résultat identique au bit près)
+            const mask = hasLower | (hasUpper << 1) | (hasDigit << 2) | (hasSpecial << 3);
+            const entropy = length * d.log2[mask];
+
+            return {
+                score: Math.min(100, Math.max(0, score)),
+                strength: strengthLabel(score),
+                feedback: feedback.length ? feedback : ['Excellent mot de passe !'],
+                entropy: Number(entropy.toFixed(2)),
+                time_to_crack: crackTime(entropy)
+            };
+        }
+
+        // core.web_api.analyze_password_strength
+        webStrength(password) {
+            const d = this.data;
+            const chars = Array.from(password);
+            let score = 0;
+            const feedback = [];
+
+            if (chars.length >= 12) {
+                score += 2;
+                feedback.push('✓ Longueur excellente (12+ caractères)');
+            } else if (chars.length >= 8) {
+                score += 1;
+                feedback.push('✓ Longueur correcte (8+ caractères)');
+            } else {
+                feedback.push('✗ Longueur insuffisante (moins de 8 caractères)');
+            }
+
+            if (d.lower.any(chars)) {
+                score += 1;
+                feedback.push('✓ Contient des minuscules');
+            }
+            if (d.upper.any(chars)) {
+                score += 1;
+                feedback.push('✓ Contient des majuscules');
+            }
+            if (d.digit.any(chars)) {
+                score += 1;
+                feedback.push('✓ Contient des chiffres');
+            }
+            if (chars.some(c => d.special.has(c))) {
+                score += 1;
+                feedback.push('✓ Contient des caractères spéciaux');
+            }
+
+            let strength, color;
+            if (score >= 5) {
+                strength = 'Très fort';
+                color = 'success';
+            } else if (score >= 3) {
+                strength = 'Fort';
+                color = 'warning';
+            } else if (score >= 2) {
+                strength = 'Moyen';
+                color = 'info';
+            } else {
+                strength = 'Faible';
+                color = 'danger';
+            }
+
+            return {strength: strength, score: score, max_score: 6, color: color, feedback: feedback};
+        }
+
+        // asgi_app._analyze : réponse de /analyze
+        analyzeDetailed(password) {
+            const analysis = this.webStrength(password);
+            const detailed = this.analyze(password);
+            analysis.entropy = detailed.entropy;
+            analysis.time_to_crack = detailed.time_to_crack;
+            if (this.data.common.has(password.toLowerCase())) {
+                analysis.feedback.push('✗ Mot de passe courant (dictionnaire)');
+            }
+            return analysis;
+        }
+    }
+
+    function crackTime(entropy) {
+        if (entropy < 30) return 'Quelques secondes';
+        if (entropy < 40) return 'Quelques minutes';
+        if (entropy < 50) return 'Quelques heures';
+        if (entropy < 60) return 'Quelques jours';
+        if (entropy < 70) return 'Quelques mois';
+        if (entropy < 80) return 'Quelques années';
+        return 'Plusieurs siècles';
+    }
+
+    function strengthLabel(score) {
+        if (score < 20) return 'Très faible';
+        if (score < 40) return 'Faible';
+        if (score < 60) return 'Moyen';
+        if (score < 80) return 'Fort';
+        return 'Très fort';
+    }
+
+    function fromBuffer(buffer) {
+        return new StrengthEngine(parseBlob(buffer));
+    }
+
+    function load(url) {
+        return fetch(url).then(response => {
+            if (!response.ok) {
+                throw new Error(`Chargement du moteur d'analyse impossible (${response.status})`);
+            }
+            return response.arrayBuffer();
+        }).then(fromBuffer);
+    }
+
+    return {fromBuffer: fromBuffer, load: load, StrengthEngine: StrengthEngine};
+}));
@@ -0,0 +1,149 @@
+"""
+Tests de l'API web asynchrone (ASGI)
+"""
+
+import sys
+import os
+import asyncio
+import json
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from asgi_app import SecurePassGenAPI, MAX_BODY_BYTES
+from utils.rate_limit import TokenBucketLimiter
+
+
+async def call(app, method, path, body=None, headers=()):
+    """Envoie une requête à l'application ASGI et retourne (statut, en-têtes, JSON)."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    received = []
+
+    async def receive():
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message):
+        received.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": list(headers),
+             "client": ("127.0.0.1", 50000)}
+    await app(scope, receive, send)
+    start, response = received
+    headers = dict(start["headers"])
+    content = response["body"]
+    if headers[b"content-type"].startswith(b"application/json"):
+        content = json.loads(content)
+    return start["status"], headers, content
+
+
+class TestAsgiApp:
+    """Tests de SecurePassGenAPI"""
+
+    def setup_method(self):
+        self.app = SecurePassGenAPI(batch_workers=1, max_pending_batches=1)
+
+    def teardown_method(self):
+        self.app.shutdown()
+
+    def run(self, *args):
+        return asyncio.run(call(self.app, *args))
+
+    def test_healthz_and_index(self):
+        """Sonde de disponibilité et page d'accueil statique"""
+        assert self.run("GET", "/healthz")[2] == {'status': 'ok'}
+        status, headers, page = self.run("GET", "/")
+        assert status == 200
+        assert b"/analyze" in page
+        assert b'name="securepassgen-analyzer" content="detailed"' in page
+
+    def test_metrics(self):
+        """Les métriques sont exportées au format Prometheus"""
+        self.run("POST", "/analyze", {'password': 'azerty'}, [(b"x-client-id", b"onglet")])
+        status, headers, body = self.run("GET", "/metrics")
+        assert status == 200
+        assert headers[b"content-type"].startswith(b"text/plain; version=0.0.4")
+        assert b'securepassgen_coalesced_requests_total{route="/analyze",outcome="started"} 1' in body
+
+    def test_static_engine(self):
+        """Le moteur d'analyse et ses données sont servis ; les autres fichiers non"""
+        status, headers, script = self.run("GET", "/static/strength_engine.js")
+        assert status == 200
+        assert headers[b"content-type"].startswith(b"text/javascript")
+        status, _, blob = self.run("GET", "/static/strength_data.bin")
+        assert status == 200 and blob[:4] == b"SPGS"
+        assert self.run("GET", "/static/../asgi_app.py")[0] == 404
+
+    def test_generate_single(self):
+        """Un mot de passe unique garde le format de web_app.py"""
+        status, _, data = self.run("POST", "/generate", {'length': 20, 'special': False})
+        assert status == 200
+        assert len(data['password']) == 20
+        assert data['strength']['max_score'] == 6
+
+    def test_generate_batch_offloaded(self):
+        """Un grand lot est généré dans le pool de processus"""
+        status, _, data = self.run("POST", "/generate", {'length': 12, 'count': 1000})
+        assert status == 200
+        assert data['count'] == 1000
+        assert len(set(data['passwords'])) == 1000
+        assert self.app.batches.executor is not None
+
+    def test_analyze_uses_dictionary(self):
+        """L'analyse signale les mots de passe courants et donne l'entropie"""
+        status, _, data = self.run("POST", "/analyze", {'password': 'password123'})
+        assert status == 200
+        assert 'entropy' in data
+        assert any("courant" in line for line in data['feedback'])
+
+    def test_invalid_requests(self):
+        """Les erreurs de paramètres donnent des statuts 4xx"""
+        assert self.run("POST", "/analyze", {})[0] == 400
+        assert self.run("POST", "/generate", {'length': 2})[0] == 400
+        assert self.run("POST", "/generate", {'count': 0})[0] == 400
+        assert self.run("GET", "/inconnue")[0] == 404
+        assert self.run("POST", "/analyze", {'password': 'x' * MAX_BODY_BYTES})[0] == 413
+
+    def test_small_requests_not_starved(self):
+        """Les requêtes interactives passent pendant un grand lot ; un lot de trop est refusé"""
+        async def scenario():
+            batch = asyncio.ensure_future(call(self.app, "POST", "/generate", {'length': 64, 'count': 100000}))
+            await asyncio.sleep(0.05)
+
+            started = time.perf_counter()
+            analysis = await call(self.app, "POST", "/analyze", {'password': 'Tr0ub4dor&3'})
+            small = await call(self.app, "POST", "/generate", {'length': 16})
+            interactive_time = time.perf_counter() - started
+
+            rejected = await call(self.app, "POST", "/generate", {'count': 5000})
+            assert not batch.done()
+            result = await batch
+            return analysis, small, interactive_time, rejected, result
+
+        analysis, small, interactive_time, rejected, result = asyncio.run(scenario())
+        assert analysis[0] == 200 and small[0] == 200
+        assert interactive_time < 0.5
+        assert rejected[0] == 503
+        assert rejected[1][b"retry-after"] == b"1"
+        assert result[2]['count'] == 100000
+
+    def test_analyze_rate_limited(self):
+        """Au-delà de la rafale, /analyze répond 429 avec Retry-After"""
+        self.app.analyze_limiter = TokenBucketLimiter(rate=1.0, burst=2)
+        statuses = [self.run("POST", "/analyze", {'password': 'abc'})[0] for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        assert self.run("POST", "/analyze", {'password': 'abc'})[1][b"retry-after"] == b"1"
+        assert self.app.analyze_limiter.stats()['dropped'] == 2
+
+    def test_keystrokes_coalesced(self):
+        """Des frappes rapprochées d'un même onglet : seule la dernière est analysée"""
+        tab = [(b"x-client-id", b"onglet-1")]
+
+        async def scenario():
+            return await asyncio.gather(*(
+                call(self.app, "POST", "/analyze", {'password': 'Secret'[:n]}, tab) for n in range(1, 7)
+            ))
+
+        responses = asyncio.run(scenario())
+        assert [status for status, _, _ in responses] == [409] * 5 + [200]
+        assert responses[0][2]['superseded']
+        assert self.app.analyze_coalescer.stats() == {'started': 6, 'merged': 5, 'in_flight': 0}
@@ -0,0 +1,130 @@
+"""
+Tests de l'audit parallèle et des index de mots de passe compromis
+"""
+
+import sys
+import os
+import hashlib
+import io
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.audit import AuditPipeline, AuditSummary, mask, split_ranges
+from utils.breach_index import BreachIndex, build_breach_index, password_key
+
+
+class TestBreachIndex:
+    """Tests de BreachIndex"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_plain_and_hibp_lines(self):
+        """Mots de passe en clair et empreintes HIBP dans la même source"""
+        hibp = hashlib.sha1("motdepasse".encode()).hexdigest().upper()
+        source = Path(self.temp_dir) / "source.txt"
+        source.write_text(f"azerty\r\n123456\n\n{hibp}:42\nazerty\nmot de passe\n", encoding="utf-8")
+        path = Path(self.temp_dir) / "breached.idx"
+
+        assert build_breach_index(source, path) == 4
+        with BreachIndex(path) as index:
+            assert len(index) == 4
+            assert "azerty" in index
+            assert "motdepasse" in index
+            assert "mot de passe" in index
+            assert "Azerty" not in index
+            assert index.contains_key(password_key(b"123456"))
+
+    def test_empty_and_invalid(self):
+        """Index vide utilisable ; fichier étranger ou tronqué refusé"""
+        source = Path(self.temp_dir) / "vide.txt"
+        source.write_text("", encoding="utf-8")
+        path = Path(self.temp_dir) / "vide.idx"
+        build_breach_index(source, path)
+        with BreachIndex(path) as index:
+            assert len(index) == 0
+            assert "azerty" not in index
+
+        other = Path(self.temp_dir) / "autre.idx"
+        other.write_bytes(b"PAS UN INDEX" * 4)
+        with pytest.raises(ValueError):
+            BreachIndex(other)
+        other.write_bytes(path.read_bytes() + b"\0" * 3)
+        with pytest.raises(ValueError):
+            BreachIndex(other)
+
+
+class TestAuditPipeline:
+    """Tests d'AuditPipeline"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.index = Path(self.temp_dir) / "commun.idx"
+        source = Path(self.temp_dir) / "commun.txt"
+        source.write_text("password\nazerty\n", encoding="utf-8")
+        build_breach_index(source, self.index)
+
+        self.passwords = ["K9#vLq!2pZ@7", "azerty", "", "Tr0ub4dor&3", "password", "abc"] * 50
+        self.input = Path(self.temp_dir) / "liste.txt"
+        self.input.write_text("\n".join(self.passwords) + "\n", encoding="utf-8")
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_split_ranges_cover_whole_lines(self):
+        """Les plages couvrent le fichier et finissent en fin de ligne"""
+        data = self.input.read_bytes()
+        ranges = list(split_ranges(self.input, chunk_bytes=37))
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+
+    def test_parallel_matches_sequential(self):
+        """Même résumé dans ce processus et sur plusieurs processus"""
+        options = dict(dictionaries={"commun": self.index}, worst=5, chunk_bytes=64)
+        sequential = AuditPipeline(workers=1, **options).run(self.input)
+        parallel = AuditPipeline(workers=2, **options).run(self.input)
+
+        assert sequential.to_dict() == parallel.to_dict()
+        assert sequential.lines == 300
+        assert sequential.analyzed == 250
+        assert sequential.dictionary_hits == {"commun": 100}
+        assert sum(sequential.strengths.values()) == 250
+
+    def test_worst_offenders(self):
+        """Compromis d'abord, puis scores croissants ; lignes numérotées depuis 1"""
+        summary = AuditPipeline(workers=1, dictionaries={"commun": self.index}, worst=3,
+                                chunk_bytes=50).run(self.input)
+
+        assert [(o.line, o.preview, o.dictionaries) for o in summary.worst] == [
+            (2, "a****y", ("commun",)), (5, "p******d", ("commun",)), (8, "a****y", ("commun",))]
+        assert summary.count_below(101) == 250
+
+    def test_stream_and_progress(self):
+        """Entrée en flux (entrée standard) et résumés cumulés au fil de l'eau"""
+        progress = []
+        summary = AuditPipeline(workers=1, chunk_bytes=100).run(
+            io.BytesIO(self.input.read_bytes()), on_progress=lambda s: progress.append(s.analyzed))
+
+        assert summary.analyzed == 250
+        assert len(progress) > 1 and progress == sorted(progress) and progress[-1] == 250
+        assert "abc" not in str(summary.to_dict())
+
+    def test_summary_histogram(self):
+        """Histogramme par classes de 10 points"""
+        summary = AuditSummary()
+        summary.add(1, "x", {'score': 100, 'strength': 'Très fort'}, ())
+        summary.add(2, "y", {'score': 7, 'strength': 'Très faible'}, ())
+
+        histogram = summary.score_histogram()
+        assert histogram["0-9"] == 1 and histogram["100"] == 1 and len(histogram) == 11
+        assert mask("ab") == "**"
@@ -0,0 +1,53 @@
+"""
+Tests de la suite de benchmarks (comparaison à la référence)
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from bench_suite import HIGHER, LOWER, Settings, compare, main, run_suites
+
+
+def results(**metrics):
+    return {"metrics": {name: {"value": value, "unit": "", "better": better}
+                        for name, (value, better) in metrics.items()}}
+
+
+class TestBenchSuite:
+    """Tests de bench_suite"""
+
+    def test_compare_directions(self):
+        """Une régression dépend du sens d'amélioration de la mesure"""
+        baseline = results(debit=(1000, HIGHER), latence=(10, LOWER), absente=(5, LOWER))
+        current = results(debit=(700, HIGHER), latence=(9, LOWER))
+
+        comparisons = {c.name: c for c in compare(baseline, current, threshold=0.25)}
+        assert set(comparisons) == {"debit", "latence"}
+        assert comparisons["debit"].regressed
+        assert round(comparisons["debit"].change, 2) == -0.30
+        assert not comparisons["latence"].regressed
+        assert round(comparisons["latence"].change, 2) == 0.10
+
+        slower = results(latence=(13, LOWER))
+        assert compare(baseline, slower, threshold=0.25)[0].regressed
+        assert not compare(baseline, slower, threshold=0.5)[0].regressed
+
+    def test_run_and_baseline_round_trip(self, tmp_path):
+        """Une référence enregistrée puis comparée à elle-même ne signale rien"""
+        run = run_suites(["generator"], Settings(repeat=1, quick=True), log=lambda *args: None)
+        assert run["metrics"]["generator.batch.ops_per_s"]["better"] == HIGHER
+        assert all(c.change == 0 for c in compare(run, run))
+
+        baseline = tmp_path / "baseline.json"
+        assert main(["--only", "generator", "--quick", "--repeat", "1", "--save-baseline", str(baseline)]) == 0
+        saved = json.loads(baseline.read_text(encoding="utf-8"))
+        assert "cpus" in saved["machine"]
+
+        # Référence irréaliste : la comparaison doit échouer
+        for metric in saved["metrics"].values():
+            metric["value"] *= 100
+        baseline.write_text(json.dumps(saved), encoding="utf-8")
+        assert main(["--only", "generator", "--quick", "--repeat", "1", "--baseline", str(baseline)]) == 1
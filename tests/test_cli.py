@@ -0,0 +1,209 @@
+"""
+Tests de l'outil en ligne de commande (securepassgen.py)
+"""
+
+import sys
+import os
+import io
+import json
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT))
+
+import securepassgen
+
+
+class TestCli:
+    """Tests des commandes gen, audit et vault"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_gen_stdout(self, capsys):
+        """Génération sur la sortie standard, débit sur la sortie d'erreur"""
+        assert securepassgen.main(["gen", "-n", "25", "--length", "20", "--no-special"]) == 0
+        captured = capsys.readouterr()
+
+        lines = captured.out.splitlines()
+        assert len(lines) == 25
+        assert all(len(line) == 20 and line.isalnum() for line in lines)
+        assert "25 secrets générés" in captured.err
+
+    def test_gen_passphrase_to_file(self, capsys):
+        """Phrases de passe écrites dans un fichier"""
+        output = os.path.join(self.temp_dir, "phrases.txt")
+        assert securepassgen.main(["-q", "gen", "-n", "3", "--passphrase", "--words", "3",
+                                   "--separator", ".", "-o", output]) == 0
+
+        lines = Path(output).read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert all(len(line.split(".")) == 4 for line in lines)
+        assert capsys.readouterr().err == ""
+
+    def test_audit_order_and_fail_under(self, capsys):
+        """Résultats dans l'ordre d'entrée, avec plusieurs processus, et seuil de score"""
+        source = os.path.join(self.temp_dir, "mots.txt")
+        passwords = ["password", "Tr0ub4dor&3xY!", "123456"] * 5
+        Path(source).write_text("\n".join(passwords) + "\n", encoding="utf-8")
+
+        code = securepassgen.main(["audit", source, "--workers", "2", "--chunk-size", "2",
+                                   "--output-format", "ndjson", "--fail-under", "40"])
+        captured = capsys.readouterr()
+
+        results = [json.loads(line) for line in captured.out.splitlines()]
+        assert [r['name'] for r in results] == [str(i) for i in range(1, 16)]
+        assert results[1]['score'] > results[0]['score']
+        assert code == 1
+        assert "10 mot(s) de passe sous le score 40" in captured.err
+
+    def test_audit_vault_export_from_stdin(self, capsys, monkeypatch):
+        """Analyse d'un export NDJSON lu sur l'entrée standard"""
+        export = "".join(json.dumps({'name': name, 'password': pw}) + "\n"
+                         for name, pw in (("mail", "azerty"), ("banque", "K9#vLq!2pZ@7")))
+        monkeypatch.setattr(sys, "stdin", io.StringIO(export))
+
+        assert securepassgen.main(["-q", "audit", "--input-format", "ndjson", "--workers", "1"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split()[-1] for line in lines] == ["mail", "banque"]
+
+    def test_index_and_audit_summary(self, capsys):
+        """Construction d'un index puis audit résumé avec ce dictionnaire"""
+        leaked = os.path.join(self.temp_dir, "fuites.txt")
+        Path(leaked).write_text("azerty\npassword\n", encoding="utf-8")
+        index = os.path.join(self.temp_dir, "fuites.idx")
+        assert securepassgen.main(["-q", "index", leaked, "-o", index]) == 0
+
+        source = os.path.join(self.temp_dir, "mots.txt")
+        Path(source).write_text("azerty\nK9#vLq!2pZ@7\npassword\n" * 4, encoding="utf-8")
+        code = securepassgen.main(["-q", "audit", source, "--summary", "--dictionary", index,
+                                   "--workers", "2", "--worst", "2", "--output-format", "ndjson",
+                                   "--fail-under", "10"])
+        summary = json.loads(capsys.readouterr().out)
+
+        assert code == 1
+        assert summary['analyzed'] == 12
+        assert summary['dictionary_hits'] == {"fuites": 8}
+        assert [o['line'] for o in summary['worst']] == [1, 3]
+        assert "azerty" not in json.dumps(summary)
+
+    def test_vault_export_and_list(self, capsys, monkeypatch):
+        """Export et liste du coffre avec le mot de passe maître de l'environnement"""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+        manager.save_password("mail", "s3cret", "boîte perso")
+        manager.save_password("banque", "k9#vLq")
+        monkeypatch.setenv(securepassgen.MASTER_PASSWORD_ENV_VAR, "maître")
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "export",
+                                   "--include-passwords"]) == 0
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert {e['name']: e['password'] for e in entries} == {"mail": "s3cret", "banque": "k9#vLq"}
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "export"]) == 0
+        assert "s3cret" not in capsys.readouterr().out
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "list"]) == 0
+        assert sorted(capsys.readouterr().out.split()) == ["banque", "mail"]
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "search", "PERSO"]) == 0
+        assert capsys.readouterr().out.split() == ["mail"]
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "search", "ail",
+                                   "--prefix"]) == 1
+
+    def test_vault_backup_and_restore(self, capsys):
+        """Sauvegarde incrémentale, liste et restauration sans mot de passe maître"""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+        manager.save_password("a", "1")
+        backups = os.path.join(self.temp_dir, "sauvegardes")
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "backup", backups]) == 0
+        first = capsys.readouterr().out.strip()
+        manager.save_password("b", "2")
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "backup", backups,
+                                   "--keep", "1"]) == 0
+        capsys.readouterr()
+
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "backups", backups]) == 0
+        listing = capsys.readouterr().out.splitlines()
+        assert len(listing) == 1 and not listing[0].startswith(first)
+
+        manager.delete_password("a")
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "restore", backups]) == 0
+        assert "restaurée" in capsys.readouterr().err
+        assert [p["name"] for p in manager.load_passwords()] == ["a", "b"]
+
+    def test_vault_verify(self, capsys):
+        """Vérification d'intégrité : code de sortie et segment désigné"""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+        manager.save_many({"name": f"n{i}", "password": "p"} for i in range(3))
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "verify",
+                                   "--no-authenticate"]) == 0
+
+        data = bytearray(manager.passwords_file.read_bytes())
+        data[-1] ^= 1
+        manager.passwords_file.write_bytes(bytes(data))
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "verify",
+                                   "--no-authenticate"]) == 1
+        assert "Segment 0 corrompu (enregistrements 0 à 2)" in capsys.readouterr().out
+
+    def test_vault_passwd_and_recovery_key(self, capsys, monkeypatch):
+        """Changement de mot de passe et clé de récupération"""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître").save_password("a", "b")
+        monkeypatch.setenv(securepassgen.MASTER_PASSWORD_ENV_VAR, "maître")
+        monkeypatch.setenv(securepassgen.NEW_MASTER_PASSWORD_ENV_VAR, "nouveau")
+
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "passwd"]) == 0
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "list"]) == 2
+        capsys.readouterr()
+
+        monkeypatch.setenv(securepassgen.MASTER_PASSWORD_ENV_VAR, "nouveau")
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "recovery-key"]) == 0
+        recovery_key = capsys.readouterr().out.strip()
+        monkeypatch.setenv(securepassgen.MASTER_PASSWORD_ENV_VAR, recovery_key)
+        assert securepassgen.main(["-q", "vault", "--data-dir", self.temp_dir, "list"]) == 0
+        assert capsys.readouterr().out.split() == ["a"]
+
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "slots"]) == 0
+        assert [line.split("\t")[0] for line in capsys.readouterr().out.splitlines()] == ["master", "recovery"]
+
+    def test_vault_wrong_password(self, capsys, monkeypatch):
+        """Un mauvais mot de passe maître donne une erreur lisible"""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître").save_password("a", "b")
+        monkeypatch.setenv(securepassgen.MASTER_PASSWORD_ENV_VAR, "autre")
+
+        assert securepassgen.main(["vault", "--data-dir", self.temp_dir, "list"]) == 2
+        assert "❌" in capsys.readouterr().err
+
+    def test_gen_does_not_import_cryptography(self):
+        """gen démarre sans charger la cryptographie ni Tk"""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(ROOT / "securepassgen.py"), "-q", "gen", "-n", "1"],
+            capture_output=True, text=True, check=True
+        )
+        assert len(result.stdout.strip()) == 16
+        assert "cryptography" not in result.stderr
+        assert "tkinter" not in result.stderr
@@ -0,0 +1,151 @@
+"""
+Tests des fournisseurs du mot de passe maître.
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+import io
+import os
+import subprocess
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.credentials import (
+    CachedProvider, ChainProvider, CredentialProvider, EnvironmentProvider, FileProvider, StdinProvider,
+    TkDialogProvider, MASTER_PASSWORD_ENV_VAR, PASSWORD_FILE_ENV_VAR, default_provider
+)
+
+
+class TestProviders:
+    """
+    Tests des fournisseurs sans interface graphique.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_environment(self, monkeypatch):
+        """Test de la lecture dans une variable d'environnement."""
+        monkeypatch.setenv(MASTER_PASSWORD_ENV_VAR, "maître")
+        assert EnvironmentProvider()() == "maître"
+        monkeypatch.delenv(MASTER_PASSWORD_ENV_VAR)
+        assert EnvironmentProvider()() is None
+
+    def test_file(self):
+        """Test du fichier de mot de passe et de ses droits."""
+        provider = FileProvider(Path(self.temp_dir) / "master")
+        provider.store("maître")
+        assert provider() == "maître"
+
+        if os.name == "posix":
+            os.chmod(provider.path, 0o644)
+            with pytest.raises(PermissionError):
+                provider()
+            provider.store("nouveau")  # Rétablit les droits
+            assert provider() == "nouveau"
+
+    def test_stdin(self):
+        """Test de la lecture d'une ligne sur un flux redirigé."""
+        assert StdinProvider(io.StringIO("maître\r\nreste\n"))() == "maître"
+        assert StdinProvider(io.StringIO(""))() is None
+
+    def test_cached_and_chain(self):
+        """Test du cache de session, de son expiration et de l'oubli."""
+        calls = []
+
+        def source():
+            calls.append(1)
+            return "maître"
+
+        cached = CachedProvider(ChainProvider(lambda: None, source))
+        assert cached() == "maître"
+        assert cached() == "maître"
+        assert len(calls) == 1
+
+        cached.forget()
+        assert cached() == "maître"
+        assert len(calls) == 2
+
+        expiring = CachedProvider(source, ttl=0)
+        expiring()
+        expiring()
+        assert len(calls) == 4
+
+    def test_provider_must_implement_call(self):
+        """Test qu'un fournisseur incomplet est refusé dès sa création."""
+        class Incomplete(CredentialProvider):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_default_headless(self, monkeypatch):
+        """Test du fournisseur par défaut sans affichage : jamais de Tk."""
+        monkeypatch.delenv(MASTER_PASSWORD_ENV_VAR, raising=False)
+        monkeypatch.delenv("DISPLAY", raising=False)
+        monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+        path = Path(self.temp_dir) / "master"
+        FileProvider(path).store("fichier")
+
+        provider = default_provider(stream=io.StringIO("saisie\n"))
+        assert not any(isinstance(p, TkDialogProvider) for p in provider.providers)
+        assert provider() == "saisie"
+
+        monkeypatch.setenv(PASSWORD_FILE_ENV_VAR, str(path))
+        assert default_provider(stream=io.StringIO(""))() == "fichier"
+        monkeypatch.setenv(MASTER_PASSWORD_ENV_VAR, "env")
+        assert default_provider(stream=io.StringIO(""))() == "env"
+
+
+class TestFileManagerProvider:
+    """
+    Tests du coffre avec les fournisseurs.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_wrong_password_is_forgotten(self):
+        """Test de l'oubli d'un mot de passe refusé par le cache."""
+        from utils.file_manager import PasswordFileManager
+
+        PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître").save_password(
+            "compte", "Secret-123!")
+
+        answers = iter(["faux", "maître"])
+        manager = PasswordFileManager(self.temp_dir, password_prompt=CachedProvider(lambda: next(answers)))
+        with pytest.raises(Exception, match="incorrect"):
+            manager.load_passwords()
+        assert [entry['name'] for entry in manager.load_passwords()] == ["compte"]
+
+    def test_headless_does_not_load_tk(self):
+        """Test que le coffre par défaut ne charge pas Tk sans affichage."""
+        src = Path(__file__).parent.parent / "src"
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from utils.file_manager import PasswordFileManager\n"
+            "manager = PasswordFileManager(sys.argv[2])\n"
+            "manager.save_password('compte', 'Secret-123!')\n"
+            "assert [e['name'] for e in manager.load_passwords()] == ['compte']\n"
+            "assert 'tkinter' not in sys.modules\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k not in ("DISPLAY", "WAYLAND_DISPLAY")}
+        env[MASTER_PASSWORD_ENV_VAR] = "maître"
+        result = subprocess.run([sys.executable, "-c", code, str(src), self.temp_dir],
+                                env=env, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
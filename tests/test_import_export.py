@@ -0,0 +1,198 @@
+"""
+Tests unitaires pour l'import et l'export au fil de l'eau.
+"""
+
+import io
+import json
+import pytest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.import_export import (
+    detect_csv_layout, detect_format, read_csv, read_ndjson, read_json,
+    write_csv, write_json, write_ndjson
+)
+
+
+class TestImportExportFormats:
+    """
+    Tests pour les lecteurs et écrivains de chaque format.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.entries = [
+            {"name": "gmail", "password": "Abc,123\"é", "description": "perso", "date": "2024-01-01 10:00:00"},
+            {"name": "github", "password": "x" * 32, "description": "", "date": "2024-02-01 11:30:00",
+             "username": "alice", "url": "https://github.com"},
+        ]
+
+    def test_detect_format(self):
+        """Test de détection du format d'après l'extension."""
+        assert detect_format("export.ndjson") == "ndjson"
+        assert detect_format("export.JSONL") == "ndjson"
+        assert detect_format("export.csv") == "csv"
+        assert detect_format("export.json") == "json"
+
+    def test_detect_csv_layout(self):
+        """Test de reconnaissance des exports des gestionnaires courants."""
+        assert detect_csv_layout(["name", "url", "username", "password", "note"]) == "chrome"
+        assert detect_csv_layout(["url", "username", "password", "httpRealm", "formActionOrigin",
+                                  "guid", "timeCreated", "timeLastUsed"]) == "firefox"
+        assert detect_csv_layout(["folder", "favorite", "type", "name", "notes", "fields",
+                                  "login_uri", "login_username", "login_password"]) == "bitwarden"
+        assert detect_csv_layout(["url", "username", "password", "totp", "extra",
+                                  "name", "grouping", "fav"]) == "lastpass"
+        assert detect_csv_layout(["name", "password", "description", "date"]) == "securepassgen"
+
+        with pytest.raises(ValueError):
+            detect_csv_layout(["foo", "bar"])
+
+    def test_ndjson_roundtrip(self):
+        """Test d'aller-retour NDJSON."""
+        buffer = io.StringIO()
+        assert write_ndjson(iter(self.entries), buffer) == 2
+
+        buffer.seek(0)
+        assert list(read_ndjson(buffer)) == self.entries
+
+    def test_ndjson_invalid_line(self):
+        """Une ligne invalide est signalée avec son numéro."""
+        with pytest.raises(ValueError, match="Ligne 2"):
+            list(read_ndjson(io.StringIO('{"name": "a", "password": "b"}\n{oups\n')))
+
+    def test_csv_roundtrip(self):
+        """Test d'aller-retour CSV (virgules et guillemets échappés)."""
+        buffer = io.StringIO(newline="")
+        assert write_csv(iter(self.entries), buffer) == 2
+
+        buffer.seek(0)
+        assert list(read_csv(buffer)) == self.entries
+
+    def test_browser_csv(self):
+        """Un export Firefox sans nom prend le nom du site."""
+        data = ("url,username,password,httpRealm,formActionOrigin,guid,timeCreated\n"
+                "https://www.example.com/login,bob,s3cret,,,{x},1700000000000\n"
+                "https://nopass.example.com,bob,,,,{y},1700000000000\n")
+
+        entries = list(read_csv(io.StringIO(data, newline="")))
+
+        assert len(entries) == 1
+        assert entries[0]["name"] == "www.example.com (bob)"
+        assert entries[0]["password"] == "s3cret"
+        assert entries[0]["url"] == "https://www.example.com/login"
+        assert entries[0]["date"].startswith("2023-11-")
+
+    def test_json_streaming_writer(self):
+        """L'export JSON écrit au fil de l'eau reste un document valide."""
+        for entries in ([], self.entries):
+            buffer = io.StringIO()
+            write_json(iter(entries), buffer, "2024-03-01 00:00:00")
+
+            data = json.loads(buffer.getvalue())
+            assert data["passwords"] == entries
+            assert data["total_passwords"] == len(entries)
+
+            buffer.seek(0)
+            assert list(read_json(buffer)) == entries
+
+
+class TestStreamingVault:
+    """
+    Tests de l'import par lots, de l'export et du checkpoint par segments.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir)
+        self.prompt = patch.object(PasswordFileManager, '_get_master_password', return_value="maître")
+        self.prompt.start()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.prompt.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_import_in_batches(self):
+        """L'import est validé par lots, sans doublons, avec une seule dérivation de clé."""
+        from utils.file_manager import PasswordFileManager
+
+        self.manager.save_password("site-3", "déjà là")
+        entries = [{"name": f"site-{i}", "password": f"p{i}"} for i in range(10)]
+
+        with patch.object(PasswordFileManager, '_generate_key', autospec=True,
+                          side_effect=PasswordFileManager._generate_key) as generate_key:
+            assert self.manager.import_entries(entries + entries[:2], batch_size=4) == 9
+            assert generate_key.call_count == 1
+
+        passwords = self.manager.load_passwords()
+        assert len(passwords) == 10
+        assert len(self.manager.journal.frames()) == 3  # Un lot par transaction
+
+    def test_export_import_csv_and_ndjson(self):
+        """Test d'aller-retour CSV et NDJSON à travers le coffre."""
+        self.manager.save_many([{"name": "a", "password": "pa"}, {"name": "b", "password": "pb"}])
+
+        for suffix in ("csv", "ndjson"):
+            export_path = Path(self.temp_dir) / f"export.{suffix}"
+            assert self.manager.export_passwords(str(export_path), include_passwords=True) == 2
+
+            other = type(self.manager)(str(Path(self.temp_dir) / suffix))
+            assert other.import_passwords(str(export_path)) == 2
+            assert other.load_passwords() == self.manager.load_passwords()
+
+    def test_export_masks_passwords(self):
+        """Sans ``include_passwords``, les mots de passe exportés sont masqués."""
+        self.manager.save_password("a", "secret")
+        export_path = Path(self.temp_dir) / "export.ndjson"
+
+        self.manager.export_passwords(str(export_path))
+
+        assert json.loads(export_path.read_text(encoding="utf-8"))["password"] == "******"
+        assert self.manager.load_passwords()[0]["password"] == "secret"
+
+    def test_iter_pages(self):
+        """Le coffre est parcouru par pages, journal compris."""
+        self.manager.save_many({"name": f"site-{i}", "password": "p"} for i in range(5))
+        self.manager.save_password("dernier", "p")
+
+        pages = list(self.manager.iter_pages(page_size=2))
+
+        assert [len(page) for page in pages] == [2, 2, 2]
+        assert pages[-1][-1]["name"] == "dernier"
+
+    def test_checkpoint_reuses_segments(self):
+        """Le checkpoint recopie les segments intacts sans les rechiffrer."""
+        from utils.file_manager import SEGMENT_RECORDS
+        from utils.vault_storage import decode_container
+
+        self.manager.save_many({"name": f"site-{i}", "password": "p"}
+                               for i in range(2 * SEGMENT_RECORDS + 10))
+        _, before = decode_container(self.manager.passwords_file.read_bytes())
+
+        self.manager.delete_password("site-5")
+        self.manager.save_password("nouveau", "p")
+        assert self.manager.checkpoint() is True
+
+        header, after = decode_container(self.manager.passwords_file.read_bytes())
+        assert after[1] == before[1]  # Segment intact recopié tel quel
+        assert after[0] != before[0]  # Segment contenant la suppression
+        assert header["counts"] == [SEGMENT_RECORDS - 1, SEGMENT_RECORDS, 11]
+
+        names = [p["name"] for p in self.manager.load_passwords()]
+        assert len(names) == 2 * SEGMENT_RECORDS + 10
+        assert "site-5" not in names and names[-1] == "nouveau"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,171 @@
+"""
+Tests de l'instrumentation des chemins critiques
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils import metrics
+from utils.metrics import Registry
+from utils.rate_limit import RequestCoalescer, TokenBucketLimiter, metric_families
+from core.password_generator import PasswordGenerator
+from core.password_strength import PasswordStrengthAnalyzer
+
+
+class TestRegistry:
+    """Tests du registre et du format d'export"""
+
+    def setup_method(self):
+        self.was_enabled = metrics.is_enabled()
+        metrics.enable()
+        self.registry = Registry()
+
+    def teardown_method(self):
+        if not self.was_enabled:
+            metrics.disable()
+
+    def test_counter_render(self):
+        """Compteur étiqueté au format Prometheus"""
+        counter = self.registry.counter("demo_total", "Démo", ("kind",))
+        counter.inc(labels=("a",))
+        counter.inc(2, ("b\"c",))
+
+        text = self.registry.render()
+
+        assert "# HELP demo_total Démo\n# TYPE demo_total counter\n" in text
+        assert 'demo_total{kind="a"} 1\n' in text
+        assert 'demo_total{kind="b\\"c"} 2\n' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Les effectifs des bornes sont cumulés, +Inf compte tout"""
+        histogram = self.registry.histogram("demo_seconds", "Démo", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+
+        lines = self.registry.render().splitlines()
+
+        assert 'demo_seconds_bucket{le="0.1"} 1' in lines
+        assert 'demo_seconds_bucket{le="1"} 3' in lines
+        assert 'demo_seconds_bucket{le="+Inf"} 4' in lines
+        assert 'demo_seconds_sum 6.05' in lines
+        assert 'demo_seconds_count 4' in lines
+
+    def test_same_name_other_type_rejected(self):
+        """Un nom ne peut pas désigner deux types de métriques"""
+        self.registry.counter("demo", "Démo")
+        assert self.registry.counter("demo", "Démo") is self.registry.counter("demo", "Démo")
+        with pytest.raises(ValueError):
+            self.registry.histogram("demo", "Démo")
+
+    def test_disabled_is_noop(self):
+        """Désactivée, l'instrumentation n'enregistre rien"""
+        counter = self.registry.counter("demo_total", "Démo")
+        histogram = self.registry.histogram("demo_seconds", "Démo")
+        metrics.disable()
+
+        counter.inc()
+        histogram.observe(1.0)
+        metrics.observe_since(histogram, metrics.start())
+
+        assert metrics.start() is None
+        assert counter.value() == 0
+        assert histogram.count() == 0
+
+    def test_extra_families(self):
+        """Les compteurs du limiteur et du regroupeur sont exportés"""
+        limiter = TokenBucketLimiter(rate=1.0, burst=1)
+        limiter.allow("a")
+        limiter.allow("a")
+        coalescer = RequestCoalescer()
+        coalescer.begin("a")
+
+        text = self.registry.render(metric_families('/analyze', limiter, coalescer))
+
+        assert 'securepassgen_rate_limit_requests_total{route="/analyze",outcome="dropped"} 1' in text
+        assert 'securepassgen_coalesced_requests_total{route="/analyze",outcome="started"} 1' in text
+        assert 'securepassgen_coalesced_in_flight{route="/analyze"} 1' in text
+
+
+class TestInstrumentation:
+    """Tests des points de mesure du générateur, de l'analyseur et du coffre"""
+
+    def setup_method(self):
+        self.was_enabled = metrics.is_enabled()
+        metrics.REGISTRY.reset()
+        metrics.enable()
+
+    def teardown_method(self):
+        if not self.was_enabled:
+            metrics.disable()
+        metrics.REGISTRY.reset()
+
+    def test_generator(self):
+        """Appels de génération et lectures d'aléa comptés"""
+        from core import password_generator
+
+        generator = PasswordGenerator()
+        generator.generate_password(length=16)
+        passwords = list(generator.iter_passwords(5, length=12))
+
+        assert len(passwords) == 5
+        assert password_generator.PASSWORDS_GENERATED.value(("generate_password",)) == 1
+        assert password_generator.PASSWORDS_GENERATED.value(("iter_passwords",)) == 5
+        assert password_generator.GENERATION_SECONDS.count(("iter_passwords",)) == 1
+        assert password_generator.ENTROPY_DRAWS.value() >= 2
+        assert password_generator.ENTROPY_BYTES.value() >= 32
+
+    def test_analyzer_phases(self):
+        """Chaque phase de l'analyse est observée une fois"""
+        from core import password_strength
+
+        PasswordStrengthAnalyzer().analyze_password("Tr0ub4dor&3")
+
+        for phase in ("length", "complexity", "patterns", "common", "entropy"):
+            assert password_strength.ANALYZER_PHASE_SECONDS.count((phase,)) == 1
+
+    def test_vault(self):
+        """Dérivation de clé, chiffrement et entrées/sorties du coffre mesurés"""
+        pytest.importorskip("cryptography")
+        from utils import file_manager, vault_storage
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = file_manager.PasswordFileManager(temp_dir)
+            with patch.object(file_manager.PasswordFileManager, '_get_master_password', return_value="maître"):
+                manager.save_password("a", "1")
+                manager.save_password("b", "2")
+                assert len(manager.load_passwords()) == 2
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        assert file_manager.VAULT_KDF_SECONDS.count() >= 3
+        assert file_manager.VAULT_CRYPTO_SECONDS.count(("encrypt",)) >= 2
+        assert file_manager.VAULT_CRYPTO_SECONDS.count(("decrypt",)) >= 1
+        assert file_manager.VAULT_CRYPTO_BYTES.value(("decrypt",)) > 0
+        for op in ("journal_append", "journal_read", "snapshot_read"):
+            assert vault_storage.VAULT_IO_SECONDS.count((op,)) >= 1
+
+    def test_web_metrics_route(self):
+        """La route /metrics de web_app.py exporte le registre"""
+        pytest.importorskip("flask")
+        import web_app
+
+        PasswordStrengthAnalyzer().analyze_password("azerty")
+        with web_app.app.test_client() as client:
+            client.post('/analyze', json={'password': 'azerty'})
+            response = client.get('/metrics')
+
+        text = response.get_data(as_text=True)
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain; version=0.0.4")
+        assert 'securepassgen_analyzer_phase_seconds_count{phase="common"} 1' in text
+        if web_app.analyze_limiter is not None:
+            assert 'securepassgen_rate_limit_requests_total{route="/analyze",outcome="allowed"}' in text
@@ -142,6 +142,34 @@ class TestPasswordGenerator:
         # Vérifier que tous les mots de passe sont différents
         assert len(set(passwords)) == 5
     
+    def test_iter_passwords(self):
+        """Test de génération en flux (grands lots)."""
+        passwords = list(self.generator.iter_passwords(2000, length=8, use_special=False,
+                                                       exclude_ambiguous=True))
+        
+        assert len(passwords) == 2000
+        assert all(len(p) == 8 for p in passwords)
+        assert all(any(c.isdigit() for c in p) and any(c.isupper() for c in p) for p in passwords)
+        assert not any(c in "0O1lI" for p in passwords for c in p)
+        
+        with pytest.raises(ValueError):
+            next(self.generator.iter_passwords(1, length=2))
+    
+    def test_character_distribution(self):
+        """Les caractères sont tirés uniformément (tirage par rejet sans biais)."""
+        charset = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+        passwords = self.generator.iter_passwords(2000, length=31, use_uppercase=False,
+                                                  use_digits=False, use_special=False,
+                                                  custom_chars=charset[26:])
+        counts = {}
+        for password in passwords:
+            for c in password:
+                counts[c] = counts.get(c, 0) + 1
+        
+        expected = sum(counts.values()) / len(charset)
+        assert set(counts) == set(charset)
+        assert all(abs(count - expected) < 0.2 * expected for count in counts.values())
+    
     def test_password_uniqueness(self):
         """Test d'unicité des mots de passe générés."""
         passwords = [self.generator.generate_password() for _ in range(100)]
@@ -0,0 +1,59 @@
+"""
+Tests unitaires pour l'index des mots de passe affichés par l'interface.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("cryptography")
+
+from gui.password_index import PasswordIndex
+
+
+class TestPasswordIndex:
+    """
+    Tests pour la recherche incrémentale et le scellement des mots de passe.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.index = PasswordIndex()
+        self.page = [
+            {"name": "GitHub", "password": "gh-secret", "description": "travail", "date": "2024-01-01 10:00:00"},
+            {"name": "gmail", "password": "gm-secret", "description": "perso", "date": "2024-01-02 10:00:00"},
+            {"name": "banque", "password": "bq-secret", "description": "Compte GitLab", "date": "2024-01-03 10:00:00"},
+        ]
+
+    def test_passwords_are_sealed(self):
+        """Les mots de passe ne sont pas conservés en clair."""
+        rows = self.index.seal(self.page)
+
+        assert all(b"secret" not in row.sealed_password for row in rows)
+        assert self.index.extend(rows) == [0, 1, 2]
+        assert self.index.reveal(2) == "bq-secret"
+
+    def test_search(self):
+        """Recherche sans casse dans le nom et la description."""
+        self.index.extend(self.index.seal(self.page))
+
+        assert self.index.search("git") == [0, 2]
+        assert self.index.search("gith") == [0]
+        assert self.index.search("g") == [0, 1, 2]
+        assert self.index.search("perso") == [1]
+        assert self.index.search("") == [0, 1, 2]
+
+    def test_search_while_loading(self):
+        """Les pages chargées après la recherche sont filtrées elles aussi."""
+        self.index.extend(self.index.seal(self.page[:1]))
+        assert self.index.search("git") == [0]
+
+        assert self.index.extend(self.index.seal(self.page[1:])) == [2]
+        assert self.index.search("gitl") == [2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
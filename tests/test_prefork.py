@@ -0,0 +1,59 @@
+"""
+Tests du serveur web de production (pre-fork)
+"""
+
+import sys
+import os
+import json
+import signal
+import subprocess
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.readiness import wait_for_http
+
+pytest.importorskip("flask")
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="pre-fork POSIX uniquement")
+class TestPreforkServer:
+    """Tests de serve.py avec le serveur pre-fork"""
+
+    def setup_method(self):
+        self.process = subprocess.Popen(
+            [sys.executable, str(ROOT / "serve.py"), "--host", "127.0.0.1", "--port", "0",
+             "--workers", "2", "--backend", "prefork"],
+            cwd=ROOT, stdout=subprocess.PIPE, text=True
+        )
+        banner = self.process.stdout.readline()
+        self.base_url = banner.strip().rsplit(" ", 1)[-1]
+
+    def teardown_method(self):
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def _post(self, route, body):
+        request = urllib.request.Request(self.base_url + route, data=json.dumps(body).encode(),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+
+    def test_serves_and_stops_gracefully(self):
+        """Les routes répondent et SIGTERM arrête tous les processus"""
+        assert wait_for_http(self.base_url + "/healthz", timeout=10, process=self.process).ready
+
+        generated = self._post("/generate", {"length": 20})
+        assert len(generated["password"]) == 20
+        assert self._post("/analyze", {"password": generated["password"]})["score"] >= 1
+
+        self.process.send_signal(signal.SIGTERM)
+        assert self.process.wait(timeout=10) == 0
+        assert "arrêté" in self.process.stdout.read()
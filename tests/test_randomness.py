@@ -0,0 +1,128 @@
+"""
+Tests du banc statistique des générateurs (benchmarks/randomness.py)
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from randomness import (
+    Engine, PassphraseModel, PasswordModel, chi2_sf, chi_square, collect, compare_tables,
+    failures, goodness_of_fit, main, poisson_binomial
+)
+from core.password_generator import PasswordGenerator
+
+ALPHA = 0.001
+
+
+def modulo_biased(count, options):
+    """Moteur biaisé : réduction modulo sans rejet, pas de mélange."""
+    charset, required_sets = PasswordGenerator()._prepare_charset(**options)
+    rng = random.Random(42)
+    passwords = []
+    for _ in range(count):
+        data = [rng.randrange(256) for _ in range(options["length"])]
+        chars = [s[b % len(s)] for s, b in zip(required_sets, data)]
+        chars += [charset[b % len(charset)] for b in data[len(required_sets):]]
+        passwords.append("".join(chars))
+    return passwords
+
+
+class TestStatistics:
+    """Tests des lois et des tests statistiques"""
+
+    def test_chi2_sf_reference_values(self):
+        """Quantiles connus de la loi du khi-deux"""
+        assert chi2_sf(3.841458820694124, 1) == pytest.approx(0.05, rel=1e-9)
+        assert chi2_sf(18.307038053275146, 10) == pytest.approx(0.05, rel=1e-9)
+        assert chi2_sf(1.0, 100) == pytest.approx(1.0)
+        assert chi2_sf(10000.0, 8000) == pytest.approx(5.56e-49, rel=1e-2)
+        assert chi2_sf(float("inf"), 3) == 0.0
+
+    def test_chi_square_pools_and_rejects_impossible(self):
+        """Petites cases regroupées ; symbole impossible rejeté"""
+        statistic, df = chi_square({"a": 50, "b": 50}, {"a": 0.5, "b": 0.5})
+        assert (statistic, df) == (0.0, 1)
+        statistic, df = chi_square({"a": 98, "b": 1, "c": 1}, {"a": 0.98, "b": 0.01, "c": 0.01})
+        assert df == 1
+        assert chi_square({"a": 10, "z": 1}, {"a": 1.0})[0] == float("inf")
+
+    def test_poisson_binomial(self):
+        """Loi du nombre de succès d'épreuves de probabilités différentes"""
+        distribution = poisson_binomial([1.0, 0.5])
+        assert distribution == {1: 0.5, 2: 0.5}
+        assert sum(poisson_binomial([0.1, 0.7, 0.3]).values()) == pytest.approx(1.0)
+
+
+class TestModels:
+    """Tests des lois attendues"""
+
+    def test_password_model_is_consistent(self):
+        """Marges des paires égales à la loi d'une position, sommes à 1"""
+        model = PasswordModel(length=6)
+        pairs = model.expected["serial.adjacent"]
+
+        assert sum(model.position.values()) == pytest.approx(1.0)
+        assert sum(pairs.values()) == pytest.approx(1.0)
+        for c in ("a", "0", "!"):
+            assert sum(p for (x, _), p in pairs.items() if x == c) == pytest.approx(model.position[c])
+        # Les chiffres, classe la plus petite, sont sur-représentés
+        assert model.position["0"] > model.position["a"]
+        assert model.expected["class.chiffres"].get(0, 0.0) == 0.0
+
+    def test_password_model_counts(self):
+        """Comptage par position, par classe et couverture"""
+        model = PasswordModel(length=4)
+        tables = model.count(["aB3!", "Zz9?", "abcd"])
+
+        assert tables["position.0"] == {"a": 2, "Z": 1}
+        assert tables["class.minuscules"] == {1: 2, 4: 1}
+        assert tables["coverage"]["incomplet"] == 1
+        assert tables["serial.successive"] == {("!", "Z"): 1, ("?", "a"): 1}
+        with pytest.raises(ValueError):
+            model.count(["trop long"])
+
+
+class TestEngines:
+    """Tests des moteurs réels et d'un moteur biaisé"""
+
+    def test_real_engines_pass(self):
+        """generate_password et iter_passwords suivent la loi attendue"""
+        model = PasswordModel(length=8)
+        engine = Engine("password", lambda count, options: list(PasswordGenerator().iter_passwords(count, **options)))
+        results = goodness_of_fit(model, collect(engine, model, 20000, chunk_size=7000))
+
+        assert {r.name for r in results} >= {"position.0", "class.spéciaux", "serial.adjacent",
+                                             "serial.successive", "serial.correlation", "coverage"}
+        assert failures(results, ALPHA) == []
+
+    def test_passphrase_engine_passes(self):
+        """generate_passphrase suit la loi attendue"""
+        model = PassphraseModel(word_count=3)
+        engine = Engine("passphrase", lambda count, options: [
+            PasswordGenerator().generate_passphrase(**options) for _ in range(count)])
+
+        assert failures(goodness_of_fit(model, collect(engine, model, 10000)), ALPHA) == []
+
+    def test_biased_engine_detected(self):
+        """Un biais de réduction modulo et l'absence de mélange sont détectés"""
+        model = PasswordModel(length=8)
+        biased = collect(Engine("password", modulo_biased), model, 20000)
+        rejected = {r.name for r in failures(goodness_of_fit(model, biased), ALPHA)}
+
+        assert "position.0" in rejected
+        assert "position.7" in rejected
+
+        reference = collect(Engine("password", lambda count, options: list(
+            PasswordGenerator().iter_passwords(count, **options))), model, 20000)
+        assert {r.name for r in failures(compare_tables(reference, biased), ALPHA)} >= {"position.0"}
+
+    def test_main_exit_code(self, capsys):
+        """Le code de sortie signale un moteur biaisé"""
+        assert main(["--engine", "batch", "--samples", "5000", "--length", "8"]) == 0
+        assert main(["--engine", f"{__name__}:modulo_biased", "--samples", "20000", "--length", "8"]) == 1
+        assert "rejeté" in capsys.readouterr().out
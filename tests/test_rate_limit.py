@@ -0,0 +1,99 @@
+"""
+Tests de la limitation de débit et du regroupement des requêtes
+"""
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.rate_limit import (
+    RequestCoalescer, TokenBucketLimiter, analyze_limiter_from_environment, retry_after_header
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    """Tests de TokenBucketLimiter"""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.limiter = TokenBucketLimiter(rate=2.0, burst=3, clock=self.clock)
+
+    def test_burst_then_refill(self):
+        """La rafale est consommée puis les jetons reviennent au débit prévu"""
+        assert [self.limiter.allow("a") for _ in range(4)] == [True, True, True, False]
+        allowed, delay = self.limiter.acquire("a")
+        assert not allowed
+        assert delay == 0.5
+        self.clock.now += 0.5
+        assert self.limiter.allow("a")
+        assert self.limiter.stats() == {'allowed': 4, 'dropped': 2, 'clients': 1}
+
+    def test_clients_are_independent(self):
+        """Chaque client a son propre seau"""
+        for _ in range(3):
+            self.limiter.allow("a")
+        assert not self.limiter.allow("a")
+        assert self.limiter.allow("b")
+
+    def test_idle_clients_evicted(self):
+        """Au-delà de max_clients, les clients inactifs sont oubliés"""
+        limiter = TokenBucketLimiter(rate=1.0, burst=1, max_clients=16, clock=self.clock)
+        for i in range(1000):
+            limiter.allow(f"client-{i}")
+            self.clock.now += 0.01
+        assert limiter.stats()['clients'] <= 16
+
+    def test_concurrent_clients(self):
+        """Les décomptes restent exacts sous accès concurrent"""
+        limiter = TokenBucketLimiter(rate=1e-9, burst=100)
+
+        def hammer(client):
+            for _ in range(150):
+                limiter.allow(client)
+
+        threads = [threading.Thread(target=hammer, args=(f"c{i % 4}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert limiter.stats() == {'allowed': 400, 'dropped': 800, 'clients': 4}
+
+    def test_environment(self, monkeypatch):
+        """Le débit vient de l'environnement ; 0 désactive la limitation"""
+        monkeypatch.setenv("SECUREPASSGEN_ANALYZE_RATE", "0")
+        assert analyze_limiter_from_environment() is None
+        monkeypatch.setenv("SECUREPASSGEN_ANALYZE_RATE", "5")
+        assert analyze_limiter_from_environment().burst == 10
+        assert retry_after_header(0.2) == "1"
+        assert retry_after_header(2.5) == "3"
+
+
+class TestRequestCoalescer:
+    """Tests de RequestCoalescer"""
+
+    def test_newer_request_supersedes(self):
+        """Seule la dernière requête d'un client reste valable"""
+        coalescer = RequestCoalescer()
+        first = coalescer.begin("tab")
+        second = coalescer.begin("tab")
+        other = coalescer.begin("other-tab")
+
+        assert not coalescer.is_latest("tab", first)
+        assert coalescer.is_latest("tab", second)
+        assert coalescer.is_latest("other-tab", other)
+
+        coalescer.finish("tab", first)
+        assert coalescer.stats()['in_flight'] == 2
+        coalescer.finish("tab", second)
+        coalescer.finish("other-tab", other)
+        assert coalescer.stats() == {'started': 3, 'merged': 1, 'in_flight': 0}
@@ -0,0 +1,141 @@
+"""
+Tests de la sonde de disponibilité du lanceur
+"""
+
+import pytest
+import sys
+import os
+import socket
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.readiness import backoff_delays, wait_for_http
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    ready_at = 0.0
+
+    def do_GET(self):
+        status = 200 if time.monotonic() >= self.ready_at else 503
+        self.send_response(status)
+        self.end_headers()
+        self.wfile.write(b'{"status": "ok"}')
+
+    def log_message(self, *args):
+        pass
+
+
+class _ExitedProcess:
+    returncode = 1
+
+    def poll(self):
+        return self.returncode
+
+
+class _StuckProcess:
+    """Processus de serveur qui ne devient jamais prêt"""
+
+    def __init__(self, stops_on_terminate=True):
+        self.stops_on_terminate = stops_on_terminate
+        self.returncode = None
+        self.calls = []
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.calls.append("terminate")
+        if self.stops_on_terminate:
+            self.returncode = -15
+
+    def kill(self):
+        self.calls.append("kill")
+        self.returncode = -9
+
+    def wait(self, timeout=None):
+        self.calls.append("wait")
+        if self.returncode is None:
+            raise subprocess.TimeoutExpired("web_app.py", timeout)
+        return self.returncode
+
+
+class TestReadiness:
+    """Tests de wait_for_http"""
+
+    def setup_method(self):
+        _HealthHandler.ready_at = 0.0
+        self.server = HTTPServer(('127.0.0.1', 0), _HealthHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/healthz"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_backoff_delays(self):
+        """Les délais doublent jusqu'au plafond"""
+        delays = backoff_delays(0.01, 2.0, 0.05)
+        assert [round(next(delays), 3) for _ in range(5)] == [0.01, 0.02, 0.04, 0.05, 0.05]
+
+    def test_ready_immediately(self):
+        """Un serveur prêt répond dès la première sonde"""
+        result = wait_for_http(self.url, timeout=5)
+        assert result.ready
+        assert result.attempts == 1
+
+    def test_waits_until_healthy(self):
+        """Les réponses 503 sont ignorées jusqu'à la disponibilité"""
+        _HealthHandler.ready_at = time.monotonic() + 0.1
+        result = wait_for_http(self.url, timeout=5)
+        assert result.ready
+        assert result.attempts > 1
+        assert result.elapsed < 1.0
+
+    def test_timeout(self):
+        """Un serveur jamais prêt donne un échec après le délai"""
+        _HealthHandler.ready_at = time.monotonic() + 60
+        result = wait_for_http(self.url, timeout=0.2)
+        assert not result.ready
+        assert result.reason == "délai dépassé"
+
+    def test_process_exited(self):
+        """L'attente s'arrête si le processus du serveur s'est terminé"""
+        self.server.shutdown()
+        result = wait_for_http("http://127.0.0.1:9/healthz", timeout=5, process=_ExitedProcess())
+        assert not result.ready
+        assert result.attempts == 1
+        assert "code 1" in result.reason
+
+
+class TestLauncher:
+    """Tests du lancement de l'application web"""
+
+    def launch(self, monkeypatch, process):
+        launcher = pytest.importorskip("launcher")
+
+        with socket.socket() as sock:  # Port libre : aucune réponse
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        monkeypatch.setattr(launcher, "WEB_PORT", port)
+        monkeypatch.setattr(launcher, "WEB_READY_TIMEOUT", 0.2)
+        monkeypatch.setattr(launcher.subprocess, "Popen", lambda *args, **kwargs: process)
+        monkeypatch.setattr(launcher.webbrowser, "open", lambda url: pytest.fail("navigateur ouvert"))
+        return launcher.SecurePassGenLauncher().launch_web_app()
+
+    def test_unready_server_is_stopped(self, monkeypatch):
+        """Un serveur qui ne répond pas est arrêté avant l'abandon"""
+        process = _StuckProcess()
+        assert self.launch(monkeypatch, process) is False
+        assert process.calls == ["terminate", "wait"]
+
+    def test_unready_server_is_killed(self, monkeypatch):
+        """Un serveur qui ignore terminate() est tué"""
+        process = _StuckProcess(stops_on_terminate=False)
+        assert self.launch(monkeypatch, process) is False
+        assert process.calls == ["terminate", "wait", "kill", "wait"]
+        assert process.poll() is not None
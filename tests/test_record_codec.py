@@ -0,0 +1,122 @@
+"""
+Tests unitaires pour le codec binaire du coffre.
+"""
+
+import json
+import pytest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.record_codec import (
+    encode_records, decode_records, is_binary_payload, RecordCodecError
+)
+
+
+class TestRecordCodec:
+    """
+    Tests pour l'encodage et le décodage des enregistrements.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.records = [
+            {"name": "gmail", "password": "Abc!123é", "description": "", "date": "2024-01-01 10:00:00"},
+            {"name": "github", "password": "x" * 64, "description": "travail", "date": "2024-02-01 11:30:00"},
+        ]
+
+    def test_roundtrip(self):
+        """Test d'aller-retour encodage/décodage."""
+        payload = encode_records(self.records)
+
+        assert is_binary_payload(payload)
+        assert decode_records(payload) == self.records
+
+    def test_empty(self):
+        """Test avec une liste vide et des valeurs vides."""
+        assert decode_records(encode_records([])) == []
+        assert decode_records(encode_records([{"a": ""}])) == [{"a": ""}]
+        assert decode_records(encode_records([{}, {}])) == [{}, {}]
+
+    def test_missing_and_extra_fields(self):
+        """Test avec des enregistrements hétérogènes."""
+        records = [{"name": "a"}, {"name": "b", "notes": "x"}, {"id": 3, "name": "c"}]
+
+        assert decode_records(encode_records(records)) == records
+
+    def test_separator_in_values(self):
+        """Test avec le séparateur interne présent dans une valeur."""
+        records = [{"name": "a\x1fb", "password": "\x1f"}, {"name": "", "password": "p"}]
+
+        assert decode_records(encode_records(records)) == records
+
+    def test_lone_surrogates(self):
+        """Test avec des surrogates isolés (import JSON), chaînes et autres valeurs."""
+        records = [{"name": "a\ud800", "tags": ["\udfff"], "id": 1}, {"name": "b", "tags": []}]
+
+        assert decode_records(encode_records(records)) == records
+
+    def test_smaller_than_json(self):
+        """Le format binaire doit être plus compact que l'ancien JSON."""
+        records = self.records * 100
+
+        assert len(encode_records(records)) < len(json.dumps(records, indent=2).encode())
+
+    def test_legacy_json(self):
+        """Les anciens coffres JSON restent lisibles."""
+        payload = json.dumps(self.records, indent=2).encode()
+
+        assert not is_binary_payload(payload)
+        assert decode_records(payload) == self.records
+
+    def test_corrupted_payload(self):
+        """Test avec des données tronquées ou invalides."""
+        payload = encode_records(self.records)
+
+        for size in range(5, len(payload) - 1, 7):
+            with pytest.raises(RecordCodecError):
+                decode_records(payload[:size])
+
+        with pytest.raises(RecordCodecError):
+            decode_records(b"pas du json")
+
+
+class TestVaultMigration:
+    """
+    Tests de migration d'un coffre JSON vers le format binaire.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir)
+        self.prompt = patch.object(PasswordFileManager, '_get_master_password', return_value="maître")
+        self.prompt.start()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.prompt.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_migrate_legacy_vault(self):
+        """Un coffre JSON est lu puis réécrit au format binaire."""
+        entries = [{"name": "site", "password": "secret", "description": "", "date": "2024-01-01 10:00:00"}]
+        encrypted = self.manager._encrypt_data(json.dumps(entries, indent=2))
+        self.manager.passwords_file.write_bytes(encrypted)
+
+        assert self.manager.load_passwords() == entries
+        assert self.manager.migrate_vault() is True
+        assert self.manager.migrate_vault() is False
+        assert self.manager.load_passwords() == entries
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
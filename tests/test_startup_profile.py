@@ -0,0 +1,85 @@
+"""
+Tests unitaires pour l'instrumentation du démarrage et les imports différés.
+"""
+
+import io
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.startup_profile import StartupProfiler, summarize_importtime
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+class TestStartupProfiler:
+    """
+    Tests pour le chronomètre des phases de démarrage.
+    """
+
+    def test_phase_records_time_and_imports(self):
+        """Une phase enregistre sa durée et les modules importés."""
+        ticks = iter([0.0, 1.0, 1.25])
+        profiler = StartupProfiler(enabled=True, clock=lambda: next(ticks))
+        sys.modules.pop("colorsys", None)
+
+        with profiler.phase("widgets"):
+            import colorsys  # noqa: F401
+
+        assert profiler.phases[0].name == "widgets"
+        assert profiler.phases[0].seconds == 0.25
+        assert "colorsys" in profiler.phases[0].modules
+
+        output = io.StringIO()
+        profiler.report(output)
+        assert "widgets" in output.getvalue()
+
+    def test_disabled(self):
+        """Désactivé, le profileur n'enregistre rien."""
+        profiler = StartupProfiler(enabled=False)
+
+        with profiler.phase("widgets"):
+            pass
+        profiler.mark("first_frame")
+
+        assert profiler.phases == [] and profiler.marks == []
+
+    def test_summarize_importtime(self):
+        """Résumé de la sortie de ``python -X importtime``."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      3000 |       9000 | cryptography\n"
+            "import time:       500 |        700 |   json\n"
+            "autre ligne\n"
+        )
+
+        assert summarize_importtime(output, top=2) == [("cryptography", 3000, 9000), ("json", 500, 700)]
+
+
+class TestLazyImports:
+    """
+    Les modules coûteux ne doivent pas être importés au démarrage de l'interface.
+    """
+
+    def test_main_window_import_is_light(self):
+        """Importer la fenêtre principale n'importe ni le coffre ni le presse-papiers."""
+        pytest.importorskip("tkinter")
+        code = (
+            f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); import gui.main_window; "
+            "heavy = ('cryptography', 'pyperclip', 'utils.file_manager', 'core.password_strength'); "
+            "print([m for m in heavy if m in sys.modules])"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "[]"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,128 @@
+"""
+Tests du moteur d'analyse JavaScript : données et parité avec Python
+"""
+
+import sys
+import os
+import json
+import random
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from asgi_app import _analyze
+from core.password_strength import PasswordStrengthAnalyzer
+from core.strength_blob import (
+    DEFAULT_BLOB_PATH, build_strength_blob, char_ranges, decode_strength_blob, log2_table, to_js_regex
+)
+from core.web_api import SPECIAL_CHARS, analyze_password_strength
+
+ENGINE_PATH = Path(__file__).parent.parent / "static" / "strength_engine.js"
+
+NODE_RUNNER = """
+const fs = require('fs');
+const engine = require(process.argv[2]).fromBuffer(fs.readFileSync(process.argv[3]));
+const passwords = JSON.parse(fs.readFileSync(process.argv[4], 'utf8'));
+const results = passwords.map(p => [engine.analyze(p), engine.webStrength(p), engine.analyzeDetailed(p)]);
+process.stdout.write(JSON.stringify(results));
+"""
+
+# Caractères non ASCII dont la classe diffère selon le prédicat Python
+UNICODE_POOL = "éÉßçÇΩωΣσςİıÅå٣३²³¹⁴①ⅣⅷＡａ１中文😀🔐 "
+
+
+def corpus():
+    """Mots de passe de test : cas limites, dictionnaire, motifs, aléatoires."""
+    analyzer = PasswordStrengthAnalyzer()
+    passwords = ["", "a", "Aa1!", "aaaa", "abcdefgh", "Password123", "P@ssw0rd!2024",
+                 "Tr0ub4dor&3", "correct horse battery staple", "x\r\r\ry", "x\n\n\ny", "ABCabc123",
+                 "qwertyuiop", "Zz9" * 10, "ÉTÉ-été", "PASSWORD", "AdMiN123", "٣٣٣Aa!",
+                 "²³¹aA!", "😀😀😀😀😀😀😀😀", " " * 12]
+    passwords += sorted(analyzer.common_passwords)
+    passwords += [p.upper() for p in sorted(analyzer.common_passwords)]
+
+    rng = random.Random(1234)
+    alphabet = "abcxyzABCXYZ0123789" + SPECIAL_CHARS + " " + UNICODE_POOL
+    for _ in range(1500):
+        passwords.append("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 24))))
+    return passwords
+
+
+class TestStrengthBlob:
+    """Tests du blob de données"""
+
+    def test_round_trip(self):
+        """Le blob décodé contient les données de l'analyseur"""
+        analyzer = PasswordStrengthAnalyzer()
+        data = decode_strength_blob(build_strength_blob(analyzer))
+        assert data['common'] == analyzer.common_passwords
+        assert data['patterns'] == [to_js_regex(p) for p in analyzer.dangerous_patterns]
+        assert data['log2'] == log2_table()
+        assert data['special'] == SPECIAL_CHARS
+        assert data['digit'] == char_ranges(str.isdigit)
+
+    def test_shipped_blob_matches_analyzer(self):
+        """Le blob livré dans static/ est à jour (hors tables Unicode, propres à la version de Python)"""
+        shipped = decode_strength_blob(DEFAULT_BLOB_PATH.read_bytes())
+        fresh = decode_strength_blob(build_strength_blob())
+        for key in ('common', 'patterns', 'log2', 'special'):
+            assert shipped[key] == fresh[key], f"régénérer le blob : python src/core/strength_blob.py ({key})"
+
+    def test_unsupported_pattern(self):
+        """Un motif utilisant « . » hors de (.) est refusé"""
+        with pytest.raises(ValueError):
+            to_js_regex(r'a.b')
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js non disponible")
+class TestStrengthEngineParity:
+    """Parité entre static/strength_engine.js et les analyseurs Python"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parity(self):
+        """Le moteur JavaScript donne exactement les résultats de Python"""
+        blob_path = Path(self.temp_dir) / "strength_data.bin"
+        blob_path.write_bytes(build_strength_blob())
+        passwords = corpus()
+        corpus_path = Path(self.temp_dir) / "corpus.json"
+        corpus_path.write_text(json.dumps(passwords), encoding="utf-8")
+        runner_path = Path(self.temp_dir) / "runner.js"
+        runner_path.write_text(NODE_RUNNER, encoding="utf-8")
+
+        output = subprocess.run(
+            ["node", str(runner_path), str(ENGINE_PATH), str(blob_path), str(corpus_path)],
+            check=True, capture_output=True, text=True, encoding="utf-8"
+        ).stdout
+        results = json.loads(output)
+        assert len(results) == len(passwords)
+
+        analyzer = PasswordStrengthAnalyzer()
+        for password, (js_core, js_web, js_detailed) in zip(passwords, results):
+            assert js_core == analyzer.analyze_password(password), password
+            if password:
+                assert js_web == analyze_password_strength(password), password
+                assert js_detailed == _analyze(password), password
+
+
+class TestPageRenderer:
+    """La page choisit l'analyse locale correspondant au serveur qui la sert"""
+
+    def test_flask_page_uses_web_strength(self):
+        pytest.importorskip("flask")
+        import web_app
+
+        with web_app.app.test_client() as client:
+            page = client.get('/').get_data(as_text=True)
+        assert '<meta name="securepassgen-analyzer" content="web">' in page
+        assert "strengthEngine.webStrength(password)" in page
@@ -0,0 +1,185 @@
+"""
+Tests unitaires pour l'exécution des tâches de l'interface en arrière-plan.
+"""
+
+import pytest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gui.task_executor import TaskCancelled, TaskExecutor
+
+
+class FakeRoot:
+    """Boucle d'événements minimale : ``after`` sans Tk ni affichage."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.errors = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def report_callback_exception(self, exc_type, value, traceback):
+        self.errors.append(value)
+
+    def pump(self, until, timeout=5.0):
+        """Exécute les rappels planifiés jusqu'à ce que ``until()`` soit vrai."""
+        deadline = time.monotonic() + timeout
+        while not until():
+            assert time.monotonic() < deadline, "délai dépassé"
+            callbacks, self.callbacks = self.callbacks, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.001)
+
+
+class TestTaskExecutor:
+    """
+    Tests pour le pool de tâches et le retour au thread principal.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.root = FakeRoot()
+        self.progress = []
+        self.executor = TaskExecutor(self.root, on_progress=lambda *args: self.progress.append(args))
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.executor.shutdown(wait=True)
+
+    def test_result_in_main_thread(self):
+        """Le rappel reçoit le résultat dans le thread qui a soumis la tâche."""
+        results = []
+        worker_threads = []
+
+        def work(task):
+            worker_threads.append(threading.current_thread())
+            return 42
+
+        self.executor.submit(work, on_done=lambda value: results.append((value, threading.current_thread())))
+        self.root.pump(lambda: results)
+
+        assert results == [(42, threading.current_thread())]
+        assert worker_threads[0] is not threading.current_thread()
+
+    def test_error_callback(self):
+        """Une exception de la tâche est transmise à ``on_error``."""
+        errors = []
+
+        def work(task):
+            raise ValueError("Mot de passe maître incorrect")
+
+        self.executor.submit(work, on_error=errors.append)
+        self.root.pump(lambda: errors)
+
+        assert str(errors[0]) == "Mot de passe maître incorrect"
+
+    def test_progress_and_cancel(self):
+        """La progression est rapportée et une tâche annulée n'a pas de résultat."""
+        started = threading.Event()
+        results = []
+
+        def work(task):
+            task.report_progress(0.5, "moitié")
+            started.set()
+            while True:
+                task.check_cancelled()
+                time.sleep(0.001)
+
+        task = self.executor.submit(work, on_done=results.append, description="Chargement")
+        started.wait(5)
+        self.root.pump(lambda: any(text == "moitié" for _, _, text in self.progress))
+        assert task.cancel() is True
+        self.root.pump(lambda: self.progress[-1][0] is None)
+
+        assert results == []
+        assert self.progress[0] == (task, None, "Chargement")
+
+    def test_not_cancellable(self):
+        """Une écriture marquée non annulable ignore ``cancel``."""
+        results = []
+        task = self.executor.submit(lambda task: "écrit", on_done=results.append, cancellable=False)
+
+        assert task.cancel() is False
+        self.root.pump(lambda: results)
+        assert results == ["écrit"]
+
+    def test_call_in_main_thread(self):
+        """Une tâche peut faire exécuter une boîte de dialogue par le thread principal."""
+        results = []
+        main_thread = threading.current_thread()
+
+        def work(task):
+            return self.executor.call_in_main_thread(
+                lambda: threading.current_thread() is main_thread
+            )
+
+        self.executor.submit(work, on_done=results.append)
+        self.root.pump(lambda: results)
+
+        assert results == [True]
+
+    def test_failing_callback_does_not_stop_polling(self):
+        """Un rappel en erreur est signalé ; les rappels suivants sont livrés."""
+        results = []
+
+        def broken(result):
+            raise RuntimeError("widget détruit")
+
+        self.executor.submit(lambda task: 1, on_done=broken)
+        self.executor.submit(
+            lambda task: self.executor.call_in_main_thread(lambda: "dialogue"),
+            on_done=results.append
+        )
+        self.root.pump(lambda: results)
+
+        assert results == ["dialogue"]
+        assert [str(e) for e in self.root.errors] == ["widget détruit"]
+        self.root.pump(lambda: self.executor._pending == 0)
+
+    def test_cancelled_after_start_is_finished(self):
+        """Une tâche annulée alors qu'elle démarre est quand même comptée comme terminée."""
+        started = threading.Event()
+        release = threading.Event()
+        self.executor.submit(lambda task: (started.set(), release.wait(5)))
+        self.executor.submit(lambda task: (started.set(), release.wait(5)))
+        started.wait(5)
+
+        # La troisième tâche attend un thread ; l'annulation arrive sans que
+        # son futur soit annulé (course avec le passage à RUNNING)
+        task = self.executor.submit(lambda task: "jamais")
+        task._cancel_event.set()
+        release.set()
+        self.root.pump(lambda: self.executor._pending == 0)
+        assert self.progress[-1] == (None, None, "")
+
+    def test_shutdown_releases_waiting_task(self):
+        """L'arrêt débloque une tâche qui attend le thread principal."""
+        errors = []
+        waiting = threading.Event()
+
+        def work(task):
+            waiting.set()
+            try:
+                return self.executor.call_in_main_thread(lambda: "jamais")
+            except TaskCancelled as e:
+                errors.append(e)
+                raise
+
+        self.executor.submit(work)
+        waiting.wait(5)
+        while not self.executor._main_calls:
+            time.sleep(0.001)
+        self.executor.shutdown(wait=True)
+
+        assert len(errors) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
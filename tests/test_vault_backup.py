@@ -0,0 +1,162 @@
+"""
+Tests des sauvegardes incrémentales du coffre.
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.vault_backup import BackupCorruptedError, BackupStore
+
+
+class TestBackupStore:
+    """
+    Tests du dépôt de morceaux.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = BackupStore(self.temp_dir / "backups")
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_deduplication(self):
+        """Un morceau déjà présent n'est pas réécrit."""
+        first = self.store.store([b"abc", b"def"])
+        second = self.store.store([b"abc", b"xyz"])
+
+        assert (first["size"], first["written"]) == (6, 6)
+        assert second["written"] == 3
+        assert first["chunks"][0] == second["chunks"][0]
+        assert self.store.read(second) == b"abcxyz"
+
+    def test_corruption_detected(self):
+        """Un morceau altéré ou manquant est signalé."""
+        description = self.store.store([b"contenu"])
+        path = next(p for p in self.store.objects_dir.glob("*/*"))
+        path.write_bytes(b"autre")
+
+        with pytest.raises(BackupCorruptedError):
+            self.store.read(description)
+        path.unlink()
+        with pytest.raises(BackupCorruptedError):
+            self.store.read(description)
+
+    def test_find_and_prune(self):
+        """Choix d'une sauvegarde et suppression des morceaux orphelins."""
+        old = self.store.add_snapshot({"a": self.store.store([b"ancien", b"commun"])}, 1)
+        new = self.store.add_snapshot({"a": self.store.store([b"commun"])}, 2)
+
+        assert self.store.find()["id"] == new["id"]
+        assert self.store.find(snapshot_id=old["id"])["version"] == 1
+        assert self.store.find(before=datetime.strptime(new["date"], "%Y-%m-%d %H:%M:%S"))["id"] == new["id"]
+        with pytest.raises(FileNotFoundError):
+            self.store.find(before=datetime(2000, 1, 1))
+
+        assert self.store.prune(keep=1) == (1, 1)
+        assert [m["id"] for m in self.store.snapshots()] == [new["id"]]
+        assert self.store.read(new["files"]["a"]) == b"commun"
+
+    def test_prune_keeps_at_least_one(self):
+        """``keep`` inférieur à 1 est refusé sans rien supprimer."""
+        description = self.store.store([b"contenu"])
+        self.store.add_snapshot({"a": description}, 1)
+
+        for keep in (0, -1):
+            with pytest.raises(ValueError):
+                self.store.prune(keep=keep)
+        assert len(self.store.snapshots()) == 1
+        assert self.store.read(description) == b"contenu"
+
+
+class TestIncrementalBackups:
+    """
+    Tests des sauvegardes incrémentales de ``PasswordFileManager``.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils import file_manager
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.backups = str(self.temp_dir / "backups")
+        self.segment_records = file_manager.SEGMENT_RECORDS
+        file_manager.SEGMENT_RECORDS = 10
+        self.manager = PasswordFileManager(str(self.temp_dir / "data"), password_prompt=lambda: "maître")
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        from utils import file_manager
+
+        file_manager.SEGMENT_RECORDS = self.segment_records
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def names(self):
+        return [p["name"] for p in self.manager.load_passwords()]
+
+    def test_only_changed_segments_are_written(self):
+        """Après un checkpoint, seuls l'en-tête et les segments modifiés sont écrits."""
+        self.manager.save_many({"name": f"site{i:03}", "password": "p" * 20} for i in range(100))
+        first = self.manager.backup_incremental(self.backups)
+        vault = first["files"]["passwords.enc"]
+        assert len(vault["chunks"]) == 11 and vault["written"] == vault["size"]
+
+        self.manager.delete_password("site055")
+        self.manager.checkpoint()
+        second = self.manager.backup_incremental(self.backups)
+        vault = second["files"]["passwords.enc"]
+
+        assert len(set(vault["chunks"]) - set(first["files"]["passwords.enc"]["chunks"])) == 2
+        assert vault["written"] < vault["size"] / 4
+
+        unchanged = self.manager.backup_incremental(self.backups)
+        assert unchanged["files"]["passwords.enc"]["written"] == 0
+
+    def test_point_in_time_restore(self):
+        """Restauration d'une sauvegarde donnée, journal compris."""
+        self.manager.save_password("a", "x")
+        self.manager.save_password("b", "y")  # Dans le journal
+        first = self.manager.backup_incremental(self.backups)
+        assert "passwords.journal" in first["files"]
+
+        self.manager.save_password("c", "z")
+        self.manager.checkpoint()
+        self.manager.backup_incremental(self.backups)
+        self.manager.delete_password("a")
+
+        self.manager.restore_incremental(self.backups, snapshot_id=first["id"])
+        assert self.names() == ["a", "b"]
+
+        restored = self.manager.restore_incremental(self.backups)
+        assert self.names() == ["a", "b", "c"]
+        assert self.manager.journal.frames() == []
+        assert restored["id"] == self.manager.list_backups(self.backups)[-1]["id"]
+
+    def test_corrupted_backup_leaves_vault_intact(self):
+        """Une sauvegarde altérée n'écrase pas le coffre."""
+        self.manager.save_password("a", "x")
+        self.manager.backup_incremental(self.backups)
+        self.manager.save_password("b", "y")
+
+        for path in Path(self.backups, "objects").glob("*/*"):
+            path.write_bytes(b"corrompu")
+        with pytest.raises(BackupCorruptedError):
+            self.manager.restore_incremental(self.backups)
+
+        assert self.names() == ["a", "b"]
+
+    def test_missing_vault(self):
+        """Rien à sauvegarder sans coffre."""
+        with pytest.raises(FileNotFoundError):
+            self.manager.backup_incremental(self.backups)
@@ -0,0 +1,142 @@
+"""
+Tests de la vérification d'intégrité du coffre (arbre de Merkle des segments).
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.vault_integrity import iter_digests, merkle_root, record_ranges, segment_digest
+
+
+class TestMerkle:
+    """
+    Tests des empreintes.
+    """
+
+    def test_merkle_root(self):
+        """La racine dépend de chaque feuille et de leur ordre."""
+        leaves = [segment_digest(bytes([i])) for i in range(5)]
+
+        assert merkle_root(leaves) != merkle_root(leaves[::-1])
+        assert merkle_root(leaves) != merkle_root(leaves[:4])
+        assert merkle_root(leaves[:1]) == leaves[0]
+        assert len(merkle_root([])) == 32
+
+    def test_parallel_digests_keep_order(self):
+        """Le hachage parallèle rend les empreintes dans l'ordre."""
+        segments = [bytes([i]) * 5000 for i in range(50)]
+        assert list(iter_digests(segments, workers=4)) == [segment_digest(s) for s in segments]
+
+    def test_record_ranges(self):
+        """Enregistrements de chaque segment."""
+        assert record_ranges([3, 2, None, 4]) == [range(0, 3), range(3, 5), None, None]
+
+
+class TestVaultVerify:
+    """
+    Tests de ``PasswordFileManager.verify``.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils import file_manager
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.segment_records = file_manager.SEGMENT_RECORDS
+        file_manager.SEGMENT_RECORDS = 10
+        self.manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+        self.manager.save_many({"name": f"site{i:02}", "password": "p" * 12} for i in range(35))
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        from utils import file_manager
+
+        file_manager.SEGMENT_RECORDS = self.segment_records
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def segments(self):
+        from utils.vault_storage import decode_container
+        return decode_container(self.manager.passwords_file.read_bytes())
+
+    def rewrite(self, header, segments):
+        from utils.vault_storage import encode_container
+        self.manager.passwords_file.write_bytes(encode_container(header, segments))
+
+    def test_intact_vault(self):
+        """Un coffre intact est vérifié, avec ou sans mot de passe."""
+        self.manager.delete_password("site03")
+        self.manager.save_password("nouveau", "x")
+        self.manager.checkpoint()
+        self.manager.save_password("journal", "y")
+
+        report = self.manager.verify(workers=2)
+        assert report["ok"] and report["header"] == "authenticated"
+        assert (report["segments"], report["journal_frames"]) == (4, 1)
+        assert self.manager.verify(authenticate=False)["header"] == "unchecked"
+
+    def test_corrupted_segment_is_located(self):
+        """Un octet modifié désigne son segment et ses enregistrements."""
+        header, segments = self.segments()
+        segments[2] = segments[2][:-1] + bytes([segments[2][-1] ^ 1])
+        self.rewrite(header, segments)
+
+        report = self.manager.verify(authenticate=False)
+        assert not report["ok"]
+        assert report["corrupted"] == [{"segment": 2, "records": [20, 30]}]
+
+    def test_rewritten_leaves_are_detected(self):
+        """Des empreintes réécrites passent la vérification simple, pas l'authentification."""
+        header, segments = self.segments()
+        segments[0] = segments[1]
+        header["leaves"][0] = header["leaves"][1]
+        self.rewrite(header, segments)
+
+        assert self.manager.verify(authenticate=False)["ok"]
+        report = self.manager.verify()
+        assert report["header"] == "tampered" and not report["ok"]
+
+    def test_truncated_file_and_forged_frame(self):
+        """Segments manquants et trame de journal signée avec une autre clé."""
+        from cryptography.fernet import Fernet
+
+        self.manager.journal.append(99, Fernet(Fernet.generate_key()).encrypt(b"x"))
+        data = self.manager.passwords_file.read_bytes()
+        self.manager.passwords_file.write_bytes(data[:-100])
+
+        report = self.manager.verify()
+        assert [c["segment"] for c in report["corrupted"]] == [3]
+        assert report["journal_corrupted"] == [99]
+
+    def test_vault_without_leaves(self):
+        """Un coffre antérieur aux empreintes les reçoit au checkpoint."""
+        header, segments = self.segments()
+        del header["leaves"], header["merkle"]
+        self.rewrite(header, segments)
+
+        with pytest.raises(ValueError):
+            self.manager.verify()
+        assert self.manager.checkpoint() is True
+        assert self.manager.verify()["ok"]
+
+    def test_full_backup_file(self):
+        """Vérification d'une sauvegarde complète et d'une sauvegarde incrémentale."""
+        from utils.vault_backup import BackupStore
+
+        backup = str(Path(self.temp_dir) / "copie.enc")
+        self.manager.backup_passwords(backup)
+        assert self.manager.verify(path=backup)["ok"]
+
+        manifest = self.manager.backup_incremental(str(Path(self.temp_dir) / "backups"))
+        store = BackupStore(Path(self.temp_dir) / "backups")
+        assert store.verify(manifest) == []
+        digest = manifest["files"]["passwords.enc"]["chunks"][1]
+        store._object_path(digest).write_bytes(b"corrompu")
+        assert store.verify(manifest) == [digest]
@@ -0,0 +1,144 @@
+"""
+Tests du chiffrement par enveloppe du coffre (emplacements de clé).
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+import base64
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestKeySlots:
+    """
+    Tests de la rotation du mot de passe maître et des emplacements de clé.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.password = "maître"
+        self.manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: self.password)
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def names(self):
+        return [p["name"] for p in self.manager.load_passwords()]
+
+    def segments(self):
+        from utils.vault_storage import decode_container
+        return decode_container(self.manager.passwords_file.read_bytes())
+
+    def test_rotation_rewrites_header_only(self):
+        """Changer le mot de passe ne rechiffre ni les segments ni le journal."""
+        self.manager.save_many({"name": f"n{i}", "password": "p"} for i in range(20))
+        self.manager.save_password("journal", "x")
+        _, segments = self.segments()
+        journal = self.manager.journal.path.read_bytes()
+
+        self.manager.change_master_password("nouveau")
+
+        assert self.segments()[1] == segments
+        assert self.manager.journal.path.read_bytes() == journal
+        with pytest.raises(Exception):
+            self.manager.load_passwords()
+        self.password = "nouveau"
+        assert len(self.names()) == 21
+        assert self.manager.verify()["ok"]
+
+    def test_single_kdf_per_unlock(self):
+        """Le mot de passe maître n'ouvre qu'un emplacement : une seule dérivation."""
+        from utils.file_manager import PasswordFileManager
+
+        self.manager.save_password("a", "x")
+        self.manager.add_recovery_key()
+        with patch.object(PasswordFileManager, '_generate_key', autospec=True,
+                          side_effect=PasswordFileManager._generate_key) as kdf:
+            self.manager.load_passwords()
+        assert kdf.call_count == 1
+
+    def test_recovery_key(self):
+        """Une clé de récupération ouvre le coffre et redéfinit le mot de passe maître."""
+        self.manager.save_password("a", "x")
+        recovery_key = self.manager.add_recovery_key()
+        assert len(recovery_key.replace("-", "")) == 32
+        assert [s["label"] for s in self.manager.key_slots()] == ["master", "recovery"]
+
+        self.password = recovery_key
+        assert self.names() == ["a"]
+        self.manager.change_master_password("oublié puis changé", label="master")
+
+        self.password = "oublié puis changé"
+        assert self.names() == ["a"]
+        self.manager.remove_key_slot("recovery")
+        assert [s["label"] for s in self.manager.key_slots()] == ["master"]
+
+        self.password = recovery_key
+        with pytest.raises(Exception):
+            self.manager.load_passwords()
+
+    def test_recovery_key_survives_emptied_vault(self):
+        """Vider le coffre par suppressions garde la clé et ses emplacements."""
+        self.manager.save_many({"name": n, "password": "x"} for n in "ab")
+        recovery_key = self.manager.add_recovery_key()
+
+        assert self.manager.delete_many(["a", "b"]) == 2
+        self.manager.save_password("c", "y")
+        assert [s["label"] for s in self.manager.key_slots()] == ["master", "recovery"]
+
+        self.password = recovery_key
+        assert self.names() == ["c"]
+
+    def test_slot_errors(self):
+        """Libellé en double, emplacement inconnu, dernier emplacement."""
+        self.manager.save_password("a", "x")
+
+        with pytest.raises(ValueError):
+            self.manager.add_key_slot("autre", "master")
+        with pytest.raises(ValueError):
+            self.manager.remove_key_slot("inconnu")
+        with pytest.raises(ValueError):
+            self.manager.remove_key_slot("master")
+        with pytest.raises(ValueError):
+            self.manager.change_master_password("")
+
+    def test_vault_without_slots_is_converted(self):
+        """Un coffre dont la clé dérive du mot de passe est converti sans rechiffrement."""
+        from utils.file_manager import _fernet
+
+        salt = b"0123456789abcdef"
+        key, _ = self.manager._generate_key(self.password, salt)
+        self.manager._write_snapshot(_fernet(key), {"salt": base64.b64encode(salt).decode('ascii')},
+                                     [{"name": "a", "password": "x", "description": "", "date": ""}], 1)
+        self.manager.save_password("b", "y")
+        _, segments = self.segments()
+        assert self.manager.key_slots() == [{"label": "master", "date": None}]
+
+        self.manager.add_key_slot("second", "secondaire")
+
+        header, converted = self.segments()
+        assert "salt" not in header and converted == segments
+        assert self.names() == ["a", "b"]
+        self.password = "second"
+        assert self.names() == ["a", "b"]
+
+    def test_legacy_vault_is_converted(self):
+        """Ancien format (salt + jeton unique) : conversion puis nouveau mot de passe."""
+        entries = [{"name": "ancien", "password": "x", "description": "", "date": ""}]
+        self.manager.passwords_file.write_bytes(self.manager._encrypt_data(json.dumps(entries)))
+
+        self.manager.change_master_password("nouveau")
+
+        self.password = "nouveau"
+        assert self.names() == ["ancien"]
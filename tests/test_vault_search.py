@@ -0,0 +1,143 @@
+"""
+Tests de la recherche dans le coffre par index aveugle.
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.vault_search import SegmentIndex, Tokenizer, build_segment_index, entry_matches, query_grams
+
+
+class TestSegmentIndex:
+    """
+    Tests de l'index d'un segment.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.entries = [
+            {'name': "GitHub", 'description': "code"},
+            {'name': "banque", 'description': "Compte GitHub pro"},
+            {'name': "mail", 'description': ""},
+        ]
+        self.tokenizer = Tokenizer(b"k" * 32)
+        self.index = SegmentIndex(build_segment_index(self.tokenizer, self.entries))
+
+    def candidates(self, query, prefix=False):
+        return self.index.candidates(self.tokenizer.query_tokens(query, prefix))
+
+    def test_substring_and_prefix(self):
+        """Test des candidats par sous-chaîne et par préfixe."""
+        assert self.index.count == 3
+        assert self.candidates("github") == {0, 1}
+        assert self.candidates("HUB") == {0, 1}
+        assert self.candidates("git", prefix=True) == {0}
+        assert self.candidates("m", prefix=True) == {2}
+        assert self.candidates("ba", prefix=True) == {1}
+        assert self.candidates("inconnu") == set()
+
+    def test_short_queries(self):
+        """Test des requêtes trop courtes pour l'index."""
+        assert query_grams("gi") is None
+        assert query_grams("") is None
+        assert query_grams("g", prefix=True) == {"\x02g"}
+
+    def test_entry_matches(self):
+        """Test de la vérification sur le texte."""
+        assert entry_matches(self.entries[1], "github")
+        assert not entry_matches(self.entries[1], "github", prefix=True)
+        assert entry_matches(self.entries[1], "COMPTE", prefix=True)
+
+    def test_tokens_depend_on_key(self):
+        """Test que les jetons ne sont comparables qu'avec la clé."""
+        other = Tokenizer(b"x" * 32)
+        assert not self.index.candidates(other.query_tokens("github"))
+
+
+class TestVaultSearch:
+    """
+    Tests de ``PasswordFileManager.search_passwords``.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+        self.entries = [
+            {'name': f"compte-{i}", 'password': f"Secret-{i}!",
+             'description': "GitHub perso" if i % 10 == 0 else "divers"}
+            for i in range(50)
+        ]
+        with patch("utils.file_manager.SEGMENT_RECORDS", 8):
+            self.manager.save_many(self.entries)
+            self.manager.checkpoint()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir)
+
+    def names(self, query, prefix=False):
+        return [entry['name'] for entry in self.manager.search_passwords(query, prefix)]
+
+    def expected(self, query, prefix=False):
+        return [entry['name'] for entry in self.manager.load_passwords()
+                if entry_matches(entry, query, prefix)]
+
+    def test_results_match_full_scan(self):
+        """Test que la recherche donne les mêmes résultats qu'un parcours complet."""
+        for query, prefix in [("github", False), ("compte-4", True), ("compte-49", False),
+                              ("c", True), ("e-", False), ("", False), ("absent", False)]:
+            assert self.names(query, prefix) == self.expected(query, prefix)
+        assert self.manager.search_passwords("compte-7")[0]['password'] == "Secret-7!"
+
+    def test_only_candidate_segments_are_decrypted(self):
+        """Test que les segments sans candidat ne sont pas déchiffrés."""
+        import utils.file_manager as file_manager
+
+        self.names("github")  # Première recherche : construit l'index
+        assert self.manager.index_file.exists()
+        assert b"compte" not in self.manager.index_file.read_bytes()
+
+        decoded = []
+        original = file_manager.decode_records
+
+        def counting(data):
+            decoded.append(1)
+            return original(data)
+
+        with patch("utils.file_manager.decode_records", counting):
+            assert self.names("compte-42") == ["compte-42"]
+        assert len(decoded) == 1
+
+    def test_journal_and_checkpoint(self):
+        """Test de la recherche avec le journal, puis après un checkpoint."""
+        self.names("github")
+        self.manager.delete_password("compte-10")
+        self.manager.save_password("Nouveau", "x", "github pro")
+        assert self.names("github") == self.expected("github")
+        assert "compte-10" not in self.names("github")
+
+        self.manager.checkpoint()
+        # Le checkpoint indexe les segments qu'il réécrit
+        from utils.vault_storage import read_container_header
+        with open(self.manager.passwords_file, 'rb') as f, open(self.manager.index_file, 'rb') as index:
+            assert read_container_header(index)["leaves"] == read_container_header(f)["leaves"]
+        assert self.names("github") == self.expected("github")
+        assert self.names("nouv", prefix=True) == ["Nouveau"]
+
+    def test_clear_removes_index(self):
+        """Test que la suppression du coffre supprime l'index."""
+        self.names("github")
+        self.manager.clear_passwords()
+        assert not self.manager.index_file.exists()
+        assert self.manager.search_passwords("github") == []
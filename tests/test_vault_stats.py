@@ -0,0 +1,176 @@
+"""
+Tests des statistiques du coffre tenues à jour au fil des écritures.
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.vault_stats import STRENGTH_KEY, VaultStats, annotate_operations
+
+
+class TestVaultStats:
+    """
+    Tests du résumé statistique.
+    """
+
+    def test_add_update_and_report(self):
+        """Résumé additif et rapport (dates extrêmes, force, âge)."""
+        entries = [
+            {"name": "a", "password": "abc", "date": "2024-01-10 08:00:00"},
+            {"name": "b", "password": "K9#vLq!2pZ@7xY", "date": "2024-06-01 12:00:00"},
+            {"name": "c", "password": "motdepasse", "date": "hier"},
+        ]
+        stats = VaultStats.from_json(VaultStats.of(entries).to_json())
+        assert stats.apply_operations(annotate_operations(entries, [{"_op": "delete", "name": "a"}]))
+        report = stats.report(now=datetime(2024, 6, 20))
+
+        assert report["total"] == 2
+        assert report["oldest_date"] == report["newest_date"] == "2024-06-01 12:00:00"
+        assert report["average_length"] == 12.0
+        assert report["strength_distribution"]["Très faible"] == 0
+        assert sum(report["strength_distribution"].values()) == 2
+        assert report["age_buckets"] == {"0-30": 1, "30-90": 0, "90-365": 0, "365+": 0, "unknown": 1}
+
+    def test_empty_report(self):
+        """Rapport d'un coffre vide."""
+        report = VaultStats().report()
+        assert (report["total"], report["oldest_date"], report["average_length"]) == (0, None, 0)
+
+    def test_summary_is_bounded(self):
+        """Le résumé est compté par jour : sa taille ne suit pas le nombre d'entrées."""
+        entries = [{"name": f"site{i}", "password": "x", STRENGTH_KEY: "Très faible",
+                    "date": f"2024-03-0{i % 3 + 1} {i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}"}
+                   for i in range(3000)]
+        stats = VaultStats.of(entries)
+
+        assert len(stats.days) == 3
+        assert len(stats.to_json()) < 300
+        assert (stats.oldest, stats.newest) == (min(e["date"] for e in entries), max(e["date"] for e in entries))
+
+    def test_legacy_summary(self):
+        """Un résumé compté par date complète (version antérieure) est regroupé par jour."""
+        stats = VaultStats.from_json('{"count":3,"length_sum":9,"strengths":{"Faible":3},'
+                                     '"dates":{"2024-01-10 08:00:00":2,"2024-01-10 09:00:00":1}}')
+        assert stats.days == {"2024-01-10": 3}
+        assert (stats.oldest, stats.newest) == ("2024-01-10 08:00:00", "2024-01-10 09:00:00")
+
+    def test_annotate_operations(self):
+        """Ajouts annotés de leur force ; suppressions du résumé retiré et des dates restantes."""
+        entries = [{"name": "a", "password": "x", "date": "2024-01-01 00:00:00"},
+                   {"name": "b", "password": "yy", "date": "2024-02-01 00:00:00"}]
+        operations = annotate_operations(entries, [
+            {"_op": "put", "name": "a", "password": "zzz", "date": "2023-12-01 00:00:00"},
+            {"_op": "delete", "name": "a"},
+            {"_op": "delete", "name": "a"},
+        ])
+
+        assert STRENGTH_KEY in operations[0]
+        stats = VaultStats.of(entries)
+        with patch("utils.vault_stats.password_strength", side_effect=AssertionError):
+            assert stats.apply_operations(operations)
+        assert (stats.count, stats.length_sum) == (1, 2)
+        assert (stats.oldest, stats.newest) == ("2024-02-01 00:00:00", "2024-02-01 00:00:00")
+        assert not VaultStats().apply_operations([{"_op": "delete", "name": "a"}])
+        assert annotate_operations(None, [{"_op": "delete", "name": "a"}]) == [{"_op": "delete", "name": "a"}]
+
+
+class TestVaultStatistics:
+    """
+    Tests de ``PasswordFileManager.get_statistics``.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir, password_prompt=lambda: "maître")
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def expected(self):
+        """Statistiques recalculées à partir des entrées déchiffrées."""
+        return VaultStats.of(self.manager.load_passwords()).report()
+
+    def test_statistics_follow_writes(self):
+        """Ajouts, suppressions, transactions et checkpoint gardent le résumé exact."""
+        self.manager.save_password("a", "abc")
+        self.manager.save_many({"name": n, "password": "Tr0ub4dor&3" + n} for n in "bcd")
+        self.manager.delete_password("b")
+        with self.manager.transaction() as tx:
+            tx.save("e", "K9#vLq!2pZ@7")
+            tx.delete("a")
+            tx.save("a", "azerty")
+
+        stats = self.manager.get_statistics()
+        assert stats == self.expected()
+        assert stats["total"] == 4
+
+        assert self.manager.checkpoint() is True
+        assert self.manager.get_statistics() == stats
+
+        self.manager.delete_many(["a", "c"])
+        assert self.manager.get_statistics() == self.expected()
+
+    def test_statistics_track_deleted_extremes(self):
+        """Supprimer l'entrée la plus ancienne ou la plus récente garde des dates exactes."""
+        self.manager.import_entries({"name": n, "password": "secret", "description": "",
+                                     "date": f"2024-05-0{i + 1} 10:00:00"} for i, n in enumerate("abcd"))
+
+        self.manager.delete_many(["a", "d"])
+        stats = self.manager.get_statistics()
+        assert (stats["oldest_date"], stats["newest_date"]) == ("2024-05-02 10:00:00", "2024-05-03 10:00:00")
+        assert stats == self.expected()
+
+    def test_statistics_do_not_read_segments(self):
+        """Seuls l'en-tête et le journal sont lus."""
+        self.manager.save_many({"name": f"site{i}", "password": "p" * i} for i in range(1, 50))
+        self.manager.checkpoint()
+        self.manager.save_password("dernier", "x")
+
+        with patch("utils.file_manager.iter_container_segments", side_effect=AssertionError), \
+                patch("utils.vault_stats.password_strength", side_effect=AssertionError):
+            stats = self.manager.get_statistics()
+
+        assert stats["total"] == 50
+        assert stats["average_length"] == round((sum(range(1, 50)) + 1) / 50, 1)
+
+    def test_vault_without_stats_is_upgraded(self):
+        """Un coffre sans résumé (version antérieure) est lu sans écriture, puis complété au checkpoint."""
+        from utils.vault_storage import decode_container, encode_container
+
+        self.manager.save_many({"name": n, "password": "secret-" + n} for n in "abc")
+        header, segments = decode_container(self.manager.passwords_file.read_bytes())
+        del header["stats"]
+        self.manager.passwords_file.write_bytes(encode_container(header, segments))
+        # Suppression écrite sans résumé par une version antérieure
+        self.manager._update(lambda _: ([{"_op": "delete", "name": "b"}], None), needs_entries=False)
+
+        snapshot = self.manager.passwords_file.read_bytes()
+        assert self.manager.get_statistics() == self.expected()
+        assert self.manager.passwords_file.read_bytes() == snapshot
+        assert len(self.manager.journal.frames()) == 1
+
+        assert self.manager.checkpoint() is True
+        assert "stats" in decode_container(self.manager.passwords_file.read_bytes())[0]
+        assert self.manager.journal.frames() == []
+        assert self.manager.get_statistics() == self.expected()
+
+    def test_missing_vault_and_wrong_password(self):
+        """Coffre absent ou illisible : statistiques vides."""
+        assert self.manager.get_statistics()["total"] == 0
+
+        self.manager.save_password("a", "b")
+        self.manager.password_prompt = lambda: "autre"
+        assert self.manager.get_statistics()["total"] == 0
@@ -0,0 +1,380 @@
+"""
+Tests unitaires pour le stockage durable du coffre (écriture atomique, journal).
+"""
+
+import pytest
+import tempfile
+import shutil
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+# Ajouter le dossier src au path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.vault_storage import (
+    VaultJournal, VaultFormatError, VaultLock, VaultLockTimeout,
+    atomic_write, decode_container, encode_container
+)
+
+
+class TestVaultStorage:
+    """
+    Tests pour les primitives de stockage.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_atomic_write(self):
+        """Test d'écriture atomique (aucun fichier temporaire résiduel)."""
+        target = self.temp_dir / "vault.enc"
+        atomic_write(target, b"v1")
+        atomic_write(target, b"v2")
+
+        assert target.read_bytes() == b"v2"
+        assert [p.name for p in self.temp_dir.iterdir()] == ["vault.enc"]
+
+    def test_atomic_write_failure_keeps_old_file(self):
+        """Une écriture interrompue laisse l'ancien contenu intact."""
+        target = self.temp_dir / "vault.enc"
+        atomic_write(target, b"ancien")
+
+        with patch("utils.vault_storage.os.replace", side_effect=OSError("disque plein")):
+            with pytest.raises(OSError):
+                atomic_write(target, b"nouveau")
+
+        assert target.read_bytes() == b"ancien"
+        assert len(list(self.temp_dir.iterdir())) == 1
+
+    def test_container_roundtrip(self):
+        """Test d'aller-retour du conteneur."""
+        data = encode_container({"seq": 3}, [b"abc", b"", b"defg"])
+
+        assert decode_container(data) == ({"seq": 3}, [b"abc", b"", b"defg"])
+
+        with pytest.raises(VaultFormatError):
+            decode_container(data[:-1])
+
+    def test_journal_append_and_read(self):
+        """Test d'ajout et de relecture des trames."""
+        journal = VaultJournal(self.temp_dir / "journal")
+        assert journal.frames() == []
+
+        journal.append(1, b"un")
+        journal.append(2, b"deux")
+
+        assert journal.frames() == [(1, b"un"), (2, b"deux")]
+
+        journal.clear()
+        assert journal.frames() == []
+        assert journal.size() == 0
+
+    def test_journal_torn_tail(self):
+        """Une trame incomplète est ignorée puis écrasée."""
+        journal = VaultJournal(self.temp_dir / "journal")
+        journal.append(1, b"valide")
+        journal.append(2, b"interrompue")
+
+        # Simuler un arrêt brutal au milieu de la seconde trame
+        data = journal.path.read_bytes()
+        journal.path.write_bytes(data[:-4])
+        assert journal.frames() == [(1, b"valide")]
+
+        journal.append(3, b"suivante")
+        assert journal.frames() == [(1, b"valide"), (3, b"suivante")]
+
+    def test_journal_corrupted_frame(self):
+        """Une trame dont le CRC est faux arrête la relecture."""
+        journal = VaultJournal(self.temp_dir / "journal")
+        journal.append(1, b"premiere")
+        journal.append(2, b"seconde")
+
+        data = bytearray(journal.path.read_bytes())
+        data[-1] ^= 0xFF
+        journal.path.write_bytes(bytes(data))
+
+        assert journal.frames() == [(1, b"premiere")]
+
+    def test_shared_locks_do_not_block(self):
+        """Plusieurs lecteurs détiennent le verrou en même temps."""
+        lock = VaultLock(self.temp_dir / "lock", timeout=0.2)
+
+        with lock.shared():
+            with lock.shared():
+                pass
+
+    def test_exclusive_lock_excludes(self):
+        """Un écrivain exclut les lecteurs et les autres écrivains."""
+        lock = VaultLock(self.temp_dir / "lock", timeout=0.1)
+
+        with lock.exclusive():
+            with pytest.raises(VaultLockTimeout):
+                with lock.shared():
+                    pass
+            with pytest.raises(VaultLockTimeout):
+                with lock.exclusive():
+                    pass
+
+        with lock.exclusive():
+            pass
+
+
+class TestJournaledVault:
+    """
+    Tests du coffre avec journal d'écriture anticipée.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir)
+        self.prompt = patch.object(PasswordFileManager, '_get_master_password', return_value="maître")
+        self.prompt.start()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.prompt.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_appends_to_journal(self):
+        """Une sauvegarde n'ajoute qu'une trame au journal."""
+        self.manager.save_password("a", "1")
+        snapshot = self.manager.passwords_file.read_bytes()
+
+        self.manager.save_password("b", "2")
+
+        assert self.manager.passwords_file.read_bytes() == snapshot
+        assert len(self.manager.journal.frames()) == 1
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a", "b"]
+
+    def test_checkpoint(self):
+        """Le checkpoint intègre le journal dans l'instantané."""
+        for name in "abc":
+            self.manager.save_password(name, "x")
+        self.manager.delete_password("b")
+
+        assert self.manager.checkpoint() is True
+        assert self.manager.journal.frames() == []
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a", "c"]
+        assert self.manager.checkpoint() is False
+
+    def test_crash_between_snapshot_and_journal_cleanup(self):
+        """Des trames déjà intégrées à l'instantané ne sont pas rejouées."""
+        self.manager.save_password("a", "x")
+        self.manager.save_password("b", "x")
+        journal = self.manager.journal.path.read_bytes()
+
+        self.manager.checkpoint()
+        # Simuler un arrêt avant la suppression du journal
+        self.manager.journal.path.write_bytes(journal)
+
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a", "b"]
+
+    def test_torn_transaction_is_discarded(self):
+        """Une transaction interrompue n'est pas visible."""
+        self.manager.save_password("a", "x")
+        self.manager.save_password("b", "x")
+
+        data = self.manager.journal.path.read_bytes()
+        self.manager.journal.path.write_bytes(data[:-10])
+
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a"]
+        self.manager.save_password("c", "x")
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a", "c"]
+
+    def test_wrong_master_password_does_not_overwrite(self):
+        """Un mauvais mot de passe maître ne doit jamais écraser le coffre."""
+        self.manager.save_password("a", "x")
+        snapshot = self.manager.passwords_file.read_bytes()
+
+        with patch.object(type(self.manager), '_get_master_password', return_value="faux"):
+            with pytest.raises(ValueError):
+                self.manager.save_password("b", "y")
+
+        assert self.manager.passwords_file.read_bytes() == snapshot
+        assert self.manager.journal.frames() == []
+
+    def test_backup_includes_journal(self):
+        """La sauvegarde inclut les transactions encore dans le journal."""
+        self.manager.save_password("a", "x")
+        self.manager.save_password("b", "x")
+        backup = str(Path(self.temp_dir) / "backup.enc")
+
+        self.manager.backup_passwords(backup)
+        self.manager.save_password("c", "x")
+        self.manager.restore_passwords(backup)
+
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a", "b"]
+
+
+class TestVaultTransactions:
+    """
+    Tests des opérations groupées sur le coffre.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir)
+        self.prompt = patch.object(PasswordFileManager, '_get_master_password', return_value="maître")
+        self.prompt.start()
+        self.kdf = patch.object(PasswordFileManager, '_generate_key', autospec=True,
+                                side_effect=PasswordFileManager._generate_key)
+        self.kdf_mock = self.kdf.start()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.kdf.stop()
+        self.prompt.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_save_many_single_kdf(self):
+        """Un ajout groupé ne dérive la clé qu'une fois."""
+        self.manager.save_password("existant", "x")
+        self.kdf_mock.reset_mock()
+
+        count = self.manager.save_many({"name": f"site{i}", "password": "p"} for i in range(500))
+
+        assert count == 500
+        assert self.kdf_mock.call_count == 1
+        assert len(self.manager.journal.frames()) == 1
+        assert len(self.manager.load_passwords()) == 501
+
+    def test_delete_many(self):
+        """Suppression groupée avec noms absents et doublons."""
+        self.manager.save_many({"name": n, "password": "p"} for n in "abcd")
+        self.kdf_mock.reset_mock()
+
+        assert self.manager.delete_many(["a", "c", "c", "inconnu"]) == 2
+        assert self.kdf_mock.call_count == 1
+        assert [p["name"] for p in self.manager.load_passwords()] == ["b", "d"]
+        assert self.manager.delete_many(["inconnu"]) == 0
+
+    def test_delete_many_all(self):
+        """Supprimer toutes les entrées laisse un instantané vide, même clé."""
+        self.manager.save_many({"name": n, "password": "p"} for n in "ab")
+        key_id = self.manager._snapshot(with_segments=False)[0].get("key_id")
+
+        assert self.manager.delete_many(["a", "b"]) == 2
+        assert self.manager.load_passwords() == []
+        assert self.manager._snapshot(with_segments=False)[0].get("key_id") == key_id
+
+    def test_transaction(self):
+        """Les opérations d'une transaction sont validées ensemble et dans l'ordre."""
+        self.manager.save_password("ancien", "x")
+
+        with self.manager.transaction() as tx:
+            tx.save("nouveau", "y")
+            tx.delete("ancien")
+            tx.save("ancien", "z")
+
+        passwords = self.manager.load_passwords()
+        assert [(p["name"], p["password"]) for p in passwords] == [("nouveau", "y"), ("ancien", "z")]
+
+    def test_transaction_rollback(self):
+        """Une exception dans le bloc annule la transaction."""
+        self.manager.save_password("a", "x")
+
+        with pytest.raises(RuntimeError):
+            with self.manager.transaction() as tx:
+                tx.save("b", "y")
+                raise RuntimeError("abandon")
+
+        assert [p["name"] for p in self.manager.load_passwords()] == ["a"]
+
+
+class TestConcurrentVault:
+    """
+    Tests d'accès concurrents au coffre.
+    """
+
+    def setup_method(self):
+        """Configuration avant chaque test."""
+        pytest.importorskip("cryptography")
+        from utils.file_manager import PasswordFileManager
+
+        self.manager_class = PasswordFileManager
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = PasswordFileManager(self.temp_dir)
+        self.prompt = patch.object(PasswordFileManager, '_get_master_password', return_value="maître")
+        self.prompt.start()
+
+    def teardown_method(self):
+        """Nettoyage après chaque test."""
+        self.prompt.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_concurrent_writers_lose_nothing(self):
+        """Des écritures simultanées depuis plusieurs threads sont toutes conservées."""
+        self.manager.save_password("initial", "x")
+        errors = []
+
+        def writer(worker):
+            try:
+                manager = self.manager_class(self.temp_dir)
+                for i in range(5):
+                    manager.save_password(f"w{worker}-{i}", "p")
+            except Exception as e:  # pragma: no cover - remonté par l'assertion
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(self.manager.load_passwords()) == 21
+        assert self.manager.get_version() == 21
+
+    def test_optimistic_retry(self):
+        """Une modification concurrente entre lecture et écriture provoque une relecture."""
+        self.manager.save_many({"name": n, "password": "p"} for n in "ab")
+        other = self.manager_class(self.temp_dir)
+        original = self.manager._read_entries
+        calls = []
+
+        def read_entries(*args):
+            entries = original(*args)
+            if not calls:
+                # Un autre écrivain supprime "b" juste après notre lecture
+                other.delete_password("b")
+            calls.append(len(entries))
+            return entries
+
+        with patch.object(self.manager, '_read_entries', side_effect=read_entries):
+            assert self.manager.delete_many(["a", "b"]) == 1
+
+        assert calls[:2] == [2, 1]
+        assert self.manager.load_passwords() == []
+
+    def test_version_counter(self):
+        """Le compteur de version augmente à chaque transaction."""
+        assert self.manager.get_version() == 0
+
+        self.manager.save_password("a", "x")
+        self.manager.save_password("b", "x")
+        version = self.manager.get_version()
+        assert version == 2
+        self.manager.checkpoint()
+
+        assert self.manager.get_version() == version
+        self.manager.delete_password("a")
+        assert self.manager.get_version() == version + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
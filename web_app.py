@@ -4,16 +4,48 @@ SecurePassGen - Version Web
 Générateur de Mots de Passe Sécurisé
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 import random
 import string
 import os
+import sys
+from pathlib import Path
+
+# Ajouter le répertoire src au path
+sys.path.append(str(Path(__file__).parent / "src"))
+from core.web_api import analyze_password_strength
+from utils import metrics
+from utils.rate_limit import analyze_limiter_from_environment, metric_families, retry_after_header
 
 app = Flask(__name__)
 
+# /analyze : débit par adresse IP (le regroupement des frappes, qui demande
+# une attente non bloquante, est fait par asgi_app.py)
+analyze_limiter = analyze_limiter_from_environment()
+
+# Port d'écoute (le lanceur peut en imposer un autre)
+PORT = int(os.environ.get('SECUREPASSGEN_PORT', 8080))
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    # Analyse locale du navigateur identique à /analyze (engine.webStrength)
+    return render_template('index.html', analyzer='web')
+
+@app.route('/healthz')
+def healthz():
+    """Sonde de disponibilité interrogée par le lanceur."""
+    return jsonify({'status': 'ok'})
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """
+    Métriques du processus au format Prometheus.
+
+    Les compteurs des chemins critiques ne sont alimentés que si
+    SECUREPASSGEN_METRICS=1 ; ceux du limiteur de débit le sont toujours.
+    """
+    body = metrics.render(metric_families('/analyze', analyze_limiter))
+    return Response(body, content_type=metrics.CONTENT_TYPE)
 
 @app.route('/generate', methods=['POST'])
 def generate_password():
@@ -66,71 +98,34 @@ def analyze_password():
         if not password:
             return jsonify({'error': 'Mot de passe requis'}), 400
         
+        allowed, delay = analyze_limiter.acquire(request.remote_addr) if analyze_limiter else (True, 0.0)
+        if not allowed:
+            return jsonify({'error': 'Trop de requêtes'}), 429, {'Retry-After': retry_after_header(delay)}
+        
         analysis = analyze_password_strength(password)
         return jsonify(analysis)
         
     except Exception as e:
         return jsonify({'error': f'Erreur lors de l\'analyse: {str(e)}'}), 500
 
-def analyze_password_strength(password):
-    """Analyse la force d'un mot de passe"""
-    score = 0
-    feedback = []
-    
-    # Longueur
-    if len(password) >= 12:
-        score += 2
-        feedback.append("✓ Longueur excellente (12+ caractères)")
-    elif len(password) >= 8:
-        score += 1
-        feedback.append("✓ Longueur correcte (8+ caractères)")
-    else:
-        feedback.append("✗ Longueur insuffisante (moins de 8 caractères)")
-    
-    # Types de caractères
-    if any(c.islower() for c in password):
-        score += 1
-        feedback.append("✓ Contient des minuscules")
-    
-    if any(c.isupper() for c in password):
-        score += 1
-        feedback.append("✓ Contient des majuscules")
-    
-    if any(c.isdigit() for c in password):
-        score += 1
-        feedback.append("✓ Contient des chiffres")
-    
-    if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-        score += 1
-        feedback.append("✓ Contient des caractères spéciaux")
-    
-    # Évaluation finale
-    if score >= 5:
-        strength = "Très fort"
-        color = "success"
-    elif score >= 3:
-        strength = "Fort"
-        color = "warning"
-    elif score >= 2:
-        strength = "Moyen"
-        color = "info"
-    else:
-        strength = "Faible"
-        color = "danger"
-    
-    return {
-        'strength': strength,
-        'score': score,
-        'max_score': 6,
-        'color': color,
-        'feedback': feedback
-    }
+def warm_up():
+    """
+    Préchauffe l'application dans le processus courant.
+
+    Appelée dans chaque processus de travail après le fork : le premier
+    appel de chaque route (table de routage, sérialisation JSON, analyse)
+    n'est pas payé par la première requête d'un client.
+    """
+    with app.test_client() as client:
+        client.get('/healthz')
+        generated = client.post('/generate', json={'length': 16}).get_json()
+        client.post('/analyze', json={'password': generated.get('password', 'warm-up')})
 
 if __name__ == '__main__':
     # Créer le dossier templates s'il n'existe pas
     os.makedirs('templates', exist_ok=True)
     
     print("🔐 SecurePassGen Web - Démarrage...")
-    print("📱 Accédez à l'application sur: http://localhost:8080")
+    print(f"📱 Accédez à l'application sur: http://localhost:{PORT}")
     
-    app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=PORT)
\ No newline at end of file